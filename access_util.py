@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+
+"""Door access event ingestion and daily per-member rollups.
+
+Controllers send events in batches.  A batch is split into hour buckets,
+and each bucket is written as one AccessEventBucket with its events packed
+into a blob, so a batch costs one put per hour it spans rather than one per
+event.  A cron task folds new buckets into AccessRollups, which is what
+usage reports read.
+"""
+
+import datetime
+import struct
+import time
+
+from google.appengine.ext import db
+
+import activity_util
+import datastore_util
+import door_util
+import freesidemodels
+import timezones
+
+
+# Per event: seconds into the bucket, rfid, member id (0 for unknown
+# cards) and flags.
+EVENT = struct.Struct('>IQQB')
+FLAG_GRANTED = 1
+BUCKET_SECONDS = 60 * 60
+# Most events accepted in one batch.
+MAX_EVENTS = 1000
+# Controllers may send old events after an outage, but a timestamp ahead
+# of the server by more than clock drift is wrong.
+MAX_CLOCK_SKEW = 5 * 60
+# Oldest event accepted, in seconds before the batch arrives.
+MAX_EVENT_AGE = 30 * 24 * 60 * 60
+# Buckets may commit a little after their received time, so the rollup
+# task reads this far back each time.  Buckets it already counted are
+# skipped.
+WATERMARK_LAG = datetime.timedelta(seconds=60)
+
+_STATE_KEY_NAME = 'rollups'
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+class Error(Exception):
+    """Base error class for this module."""
+
+
+class EventError(Error):
+    """Raised when a batch of events can't be accepted."""
+
+
+def PackEvents(events):
+    """Packs events of one bucket.
+
+    Args:
+      events: list of (offset, rfid, member id, flags) tuples.
+    Returns:
+      str
+    """
+    return ''.join([EVENT.pack(*event) for event in events])
+
+
+def UnpackEvents(data):
+    """Unpacks events packed by PackEvents.
+
+    Args:
+      data: str
+    Returns:
+      list of (offset, rfid, member id, flags) tuples.
+    """
+    data = data or ''
+    if len(data) % EVENT.size:
+        raise Error('Truncated event data.')
+    return [EVENT.unpack(data[start:start + EVENT.size])
+            for start in xrange(0, len(data), EVENT.size)]
+
+
+def Ingest(events, now=None):
+    """Stores a batch of door access events.
+
+    Cards are resolved to members through the door index, as of when the
+    batch arrives.
+
+    Args:
+      events: list of (timestamp, rfid, granted), with the timestamp in
+        seconds since the epoch.
+      now: float, seconds since the epoch.  Defaults to the current time.
+    Returns:
+      int, the number of AccessEventBuckets written.
+    Raises:
+      EventError: if the batch is too large or an event is invalid.  No
+        events are stored.
+    """
+    if now is None:
+        now = time.time()
+    if len(events) > MAX_EVENTS:
+        raise EventError('At most %d events per batch.' % MAX_EVENTS)
+
+    parsed = []
+    for event in events:
+        try:
+            timestamp, rfid, granted = event
+            timestamp, rfid = int(timestamp), int(rfid)
+        except (TypeError, ValueError):
+            raise EventError('Invalid event: %r' % (event,))
+        if (not now - MAX_EVENT_AGE <= timestamp <= now + MAX_CLOCK_SKEW
+            or rfid < 0):
+            raise EventError('Invalid event: %r' % (event,))
+        parsed.append((timestamp, rfid, granted))
+
+    buckets = {}
+    for timestamp, rfid, granted in parsed:
+        member_id = 0
+        entry = door_util.LookupRfid(rfid)
+        if entry is not None:
+            member_key = db.Key(entry['member_key'])
+            member_id = member_key.id()
+            if granted:
+                activity_util.RecordSeen(member_key, timestamp)
+        flags = 0
+        if granted:
+            flags |= FLAG_GRANTED
+        start = timestamp - timestamp % BUCKET_SECONDS
+        buckets.setdefault(start, []).append(
+            (timestamp - start, rfid, member_id, flags))
+
+    entities = []
+    for start, bucket_events in buckets.iteritems():
+        bucket_events.sort()
+        entities.append(freesidemodels.AccessEventBucket(
+            bucket=datetime.datetime.utcfromtimestamp(start),
+            count=len(bucket_events),
+            events=db.Blob(PackEvents(bucket_events))))
+    datastore_util.PutBatched(entities)
+    return len(entities)
+
+
+def _Day(when):
+    """Gets the Eastern-time day of a naive UTC datetime."""
+    return when.replace(tzinfo=timezones.UTC()).astimezone(
+        timezones.Eastern()).date()
+
+
+def _RollupKeyName(day, member_id):
+    return 'd%s-m%d' % (day.strftime('%Y%m%d'), member_id)
+
+
+def _ApplyBuckets(buckets):
+    """Adds the events of buckets to their rollups.
+
+    Returns:
+      int, the number of rollups written.
+    """
+    # Rollup key name to bucket id to [member id, day, granted, denied,
+    # first, last].
+    contributions = {}
+    for bucket in buckets:
+        bucket_id = bucket.key().id()
+        for offset, _, member_id, flags in UnpackEvents(bucket.events):
+            if not member_id:
+                continue
+            when = bucket.bucket + datetime.timedelta(seconds=offset)
+            day = _Day(when)
+            by_bucket = contributions.setdefault(
+                _RollupKeyName(day, member_id), {})
+            counts = by_bucket.setdefault(
+                bucket_id, [member_id, day, 0, 0, when, when])
+            if flags & FLAG_GRANTED:
+                counts[2] += 1
+            else:
+                counts[3] += 1
+            counts[4] = min(counts[4], when)
+            counts[5] = max(counts[5], when)
+
+    key_names = contributions.keys()
+    rollups = datastore_util.GetBatched(
+        [db.Key.from_path('AccessRollup', name) for name in key_names])
+    changed = []
+    for key_name, rollup in zip(key_names, rollups):
+        applied = False
+        for bucket_id, counts in contributions[key_name].iteritems():
+            member_id, day, granted, denied, first, last = counts
+            if rollup is None:
+                rollup = freesidemodels.AccessRollup(
+                    key_name=key_name, day=day,
+                    member=db.Key.from_path('Member', member_id))
+            elif bucket_id in rollup.buckets:
+                continue
+            rollup.granted += granted
+            rollup.denied += denied
+            if rollup.first is None or first < rollup.first:
+                rollup.first = first
+            if rollup.last is None or last > rollup.last:
+                rollup.last = last
+            rollup.buckets.append(bucket_id)
+            applied = True
+        if applied:
+            changed.append(rollup)
+    datastore_util.PutBatched(changed)
+    return len(changed)
+
+
+def RollUp():
+    """Folds buckets received since the last run into daily rollups.
+
+    Returns:
+      int, the number of rollups written.
+    """
+    state = freesidemodels.AccessRollupState.get_or_insert(_STATE_KEY_NAME)
+    watermark = state.watermark or _EPOCH
+    query = freesidemodels.AccessEventBucket.all().filter(
+        'received >', watermark).order('received')
+    written = 0
+    for page in datastore_util.IterQueryPages(query, batch_size=50):
+        written += _ApplyBuckets(page)
+        # Save progress after each page, in case the task runs out of time.
+        state.watermark = max(watermark, min(
+            page[-1].received, datetime.datetime.utcnow() - WATERMARK_LAG))
+        state.put()
+    return written
+
+
+def GetDailyRollups(day):
+    """Gets every member's door accesses on a day.
+
+    Args:
+      day: datetime.date, an Eastern-time day.
+    Returns:
+      list of freesidemodels.AccessRollup
+    """
+    return list(datastore_util.IterQuery(
+        freesidemodels.AccessRollup.all().filter('day =', day)))
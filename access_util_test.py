@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+"""Unittest for access_util.py"""
+
+import datetime
+import unittest
+
+import access_util
+import door_util
+import freesidemodels
+import member_util
+import random_util
+import test_util
+
+
+class AccessUtilTest(test_util.AppEngineTestBase):
+
+    def setUp(self):
+        test_util.AppEngineTestBase.setUp(self)
+        door_util._index = None
+        self.member = random_util.Member()
+        self.member.rfid = 1234
+        member_util.SaveMember(self.member)
+        # 2010-06-01 16:00 UTC is noon in Eastern daylight time.
+        self.noon = 1275408000
+
+    def testPackRoundTrip(self):
+        events = [(0, 1, 2, 1), (3599, 2 ** 40, 0, 0)]
+        self.assertEquals(
+            events, access_util.UnpackEvents(access_util.PackEvents(events)))
+
+    def testIngestBuckets(self):
+        events = [(self.noon + 10, 1234, True),
+                  (self.noon + 20, 1234, True),
+                  (self.noon + 3600, 99, False)]
+        self.assertEquals(2, access_util.Ingest(events, now=self.noon + 3600))
+        buckets = freesidemodels.AccessEventBucket.all().order('bucket').fetch(2)
+        self.assertEquals([2, 1], [bucket.count for bucket in buckets])
+        self.assertEquals(
+            [(10, 1234, self.member.key().id(), access_util.FLAG_GRANTED),
+             (20, 1234, self.member.key().id(), access_util.FLAG_GRANTED)],
+            access_util.UnpackEvents(buckets[0].events))
+        self.assertEquals(0, access_util.UnpackEvents(buckets[1].events)[0][2])
+
+    def testInvalidEvents(self):
+        self.assertRaises(access_util.EventError, access_util.Ingest,
+                          [(self.noon, 'card', True)], now=self.noon)
+        self.assertRaises(access_util.EventError, access_util.Ingest,
+                          [(self.noon + 600, 1234, True)], now=self.noon)
+        self.assertRaises(access_util.EventError, access_util.Ingest,
+                          [(self.noon - 31 * 86400, 1234, True)], now=self.noon)
+        # A little clock drift is allowed.
+        self.assertEquals(
+            1, access_util.Ingest([(self.noon + 60, 1234, True)], now=self.noon))
+        self.assertEquals(1, freesidemodels.AccessEventBucket.all().count())
+
+    def testRollUp(self):
+        access_util.Ingest([(self.noon, 1234, True),
+                            (self.noon + 60, 1234, False)], now=self.noon)
+        access_util.Ingest([(self.noon + 3600, 1234, True)],
+                           now=self.noon + 3600)
+        self.assertEquals(1, access_util.RollUp())
+        # Recent buckets are read again, but not counted again.
+        self.assertEquals(0, access_util.RollUp())
+
+        rollups = access_util.GetDailyRollups(datetime.date(2010, 6, 1))
+        self.assertEquals(1, len(rollups))
+        self.assertEquals(2, rollups[0].granted)
+        self.assertEquals(1, rollups[0].denied)
+        self.assertEquals(datetime.datetime(2010, 6, 1, 16), rollups[0].first)
+        self.assertEquals(datetime.datetime(2010, 6, 1, 17), rollups[0].last)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+
+"""Last seen tracking for members, with writes coalesced through memcache.
+
+Recording activity only touches memcache, at most once per member per
+GRANULARITY_SECONDS.  Recorded times are queued in numbered memcache slots,
+and a cron task writes them to LastSeen entities in batched puts.  Slots
+are only ever added, never overwritten: a flush claims the empty slots it
+passes, so a RecordSeen that was about to fill one takes the next slot
+instead of writing where no flush will look again.
+"""
+
+import datetime
+import time
+
+from google.appengine.api import memcache
+from google.appengine.ext import db
+
+import datastore_util
+import freesidemodels
+
+
+# Activity closer together than this is only recorded once.
+GRANULARITY_SECONDS = 15 * 60
+
+_QUEUE_KEY = 'last_seen:queue'
+_FLUSHED_KEY = 'last_seen:flushed'
+# Left by Flush in slots it found empty.  It outlives any RecordSeen that
+# was between taking the slot and filling it.
+_EMPTY_SLOT = 'empty'
+_EMPTY_SLOT_SECONDS = 60 * 60
+# Slots RecordSeen tries before giving up on queueing a write.
+_MAX_SLOT_ATTEMPTS = 3
+
+# Member key to when this instance last recorded its activity.
+_recorded = {}
+
+
+def _SlotKey(slot):
+    return 'last_seen:slot:%d' % slot
+
+
+def _MarkKey(member_key, window):
+    return 'last_seen:mark:%s:%d' % (member_key, window)
+
+
+def _KeyName(member_key):
+    return 'm%d' % member_key.id()
+
+
+def RecordSeen(member_key, now=None):
+    """Notes that a member was active.
+
+    Args:
+      member_key: db.Key or str, the member.
+      now: float, seconds since the epoch.  Defaults to the current time.
+    Returns:
+      bool, whether the activity was queued to be written.
+    """
+    if now is None:
+        now = time.time()
+    member_key = str(member_key)
+    if now - _recorded.get(member_key, 0) < GRANULARITY_SECONDS:
+        return False
+    _recorded[member_key] = now
+
+    # Instances share the window mark, so only one of them queues a write.
+    window = int(now // GRANULARITY_SECONDS)
+    if not memcache.add(_MarkKey(member_key, window), 1, GRANULARITY_SECONDS):
+        return False
+    memcache.add(_QUEUE_KEY, 0)
+    for _ in xrange(_MAX_SLOT_ATTEMPTS):
+        slot = memcache.incr(_QUEUE_KEY)
+        if slot is None:
+            return False
+        # Fails if a flush already claimed the slot as empty.
+        if memcache.add(_SlotKey(slot), (member_key, now)):
+            return True
+    return False
+
+
+def Flush():
+    """Writes queued activity to datastore in batched puts.
+
+    Returns:
+      int, the number of LastSeen entities written.
+    """
+    last = memcache.get(_QUEUE_KEY) or 0
+    flushed = memcache.get(_FLUSHED_KEY) or 0
+    if last < flushed:
+        # The queue counter was evicted and started over.
+        flushed = 0
+    if last == flushed:
+        return 0
+
+    slot_keys = [_SlotKey(slot) for slot in xrange(flushed + 1, last + 1)]
+    queued = memcache.get_multi(slot_keys)
+    # Claim the slots that are still empty.  Ones a RecordSeen filled in
+    # the meantime can't be claimed, and are read again.
+    empty = dict([(key, _EMPTY_SLOT) for key in slot_keys
+                  if key not in queued])
+    filled = memcache.add_multi(empty, _EMPTY_SLOT_SECONDS)
+    if filled:
+        queued.update(memcache.get_multi(filled))
+
+    seen = {}
+    for value in queued.itervalues():
+        if value == _EMPTY_SLOT:
+            continue
+        member_key, when = value
+        seen[member_key] = max(seen.get(member_key, 0), when)
+
+    entities = []
+    for member_key, when in seen.iteritems():
+        member_key = db.Key(member_key)
+        entities.append(freesidemodels.LastSeen(
+            key_name=_KeyName(member_key), member=member_key,
+            seen=datetime.datetime.utcfromtimestamp(when)))
+    datastore_util.PutBatched(entities)
+    memcache.set(_FLUSHED_KEY, last)
+    # Claimed slots are left to expire, so they stay claimed.
+    memcache.delete_multi([key for key, value in queued.iteritems()
+                           if value != _EMPTY_SLOT])
+    return len(entities)
+
+
+def LastSeenKey(member_key):
+    """Gets the key of a member's LastSeen, e.g. to batch it with other gets.
+
+    Args:
+      member_key: db.Key
+    Returns:
+      db.Key
+    """
+    return db.Key.from_path('LastSeen', _KeyName(member_key))
+
+
+def GetLastSeen(member_key):
+    """Gets when a member was last active, as of the last flush.
+
+    Args:
+      member_key: db.Key
+    Returns:
+      datetime.datetime in UTC, or None if never seen.
+    """
+    last_seen = db.get(LastSeenKey(member_key))
+    if last_seen is None:
+        return None
+    return last_seen.seen
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+"""Unittest for activity_util.py"""
+
+import datetime
+import unittest
+
+from google.appengine.api import memcache
+
+import activity_util
+import freesidemodels
+import member_util
+import random_util
+import test_util
+
+
+class ActivityUtilTest(test_util.AppEngineTestBase):
+
+    def setUp(self):
+        test_util.AppEngineTestBase.setUp(self)
+        activity_util._recorded = {}
+        self.members = [member_util.SaveMember(random_util.Member())
+                        for _ in range(3)]
+
+    def testFlush(self):
+        for member in self.members:
+            self.assertTrue(activity_util.RecordSeen(member.key(), 1000.0))
+        self.assertEquals(3, activity_util.Flush())
+        self.assertEquals(
+            datetime.datetime.utcfromtimestamp(1000),
+            activity_util.GetLastSeen(self.members[0].key()))
+        self.assertEquals(0, activity_util.Flush())
+
+    def testGranularity(self):
+        key = self.members[0].key()
+        self.assertTrue(activity_util.RecordSeen(key, 1000.0))
+        self.assertFalse(activity_util.RecordSeen(key, 1010.0))
+        # Another instance in the same window is deduplicated by memcache.
+        activity_util._recorded = {}
+        self.assertFalse(activity_util.RecordSeen(key, 1020.0))
+        later = 1000.0 + activity_util.GRANULARITY_SECONDS
+        self.assertTrue(activity_util.RecordSeen(key, later))
+        self.assertEquals(1, activity_util.Flush())
+        self.assertEquals(datetime.datetime.utcfromtimestamp(later),
+                          activity_util.GetLastSeen(key))
+        self.assertEquals(1, freesidemodels.LastSeen.all().count())
+
+    def testFlushClaimsEmptySlots(self):
+        # A RecordSeen has taken slot 1 but not yet filled it.
+        memcache.add(activity_util._QUEUE_KEY, 0)
+        memcache.incr(activity_util._QUEUE_KEY)
+        self.assertEquals(0, activity_util.Flush())
+
+        # Filling it late moves on to a slot the next flush reads.
+        key = self.members[0].key()
+        self.assertTrue(activity_util.RecordSeen(key, 1000.0))
+        self.assertEquals(1, activity_util.Flush())
+        self.assertEquals(datetime.datetime.utcfromtimestamp(1000),
+                          activity_util.GetLastSeen(key))
+
+    def testNeverSeen(self):
+        self.assertEquals(None,
+                          activity_util.GetLastSeen(self.members[0].key()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,9 +25,7 @@ ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
 SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
-import os
 import Cookie
-from time import strftime
 
 from django.utils import simplejson
 
@@ -39,6 +37,50 @@ except:
 
 COOKIE_NAME = settings.flash["COOKIE_NAME"]
 
+# Headers that stop the browser caching a page.
+NO_CACHE_HEADERS = [
+    ("Expires", "Tue, 03 Jul 2001 06:00:00 GMT"),
+    ("Cache-Control", "no-store, no-cache, must-revalidate, max-age=0"),
+    ("Pragma", "no-cache"),
+]
+
+
+def load_cookie(request):
+    """
+    Parses the cookies sent with a request.
+
+    Args:
+      request: webapp.Request
+
+    Returns a Cookie.SimpleCookie.
+    """
+    cookie = Cookie.SimpleCookie()
+    cookie.load(request.headers.get("Cookie", ""))
+    return cookie
+
+
+def write_cookie(response, cookie):
+    """
+    Adds a Set-Cookie header to the response for each value in cookie.
+
+    Args:
+      response: webapp.Response
+      cookie: Cookie.SimpleCookie
+    """
+    for morsel in cookie.values():
+        response.headers.add_header("Set-Cookie", morsel.OutputString())
+
+
+def write_no_cache_headers(response):
+    """
+    Sets headers on the response that stop the browser caching the page.
+
+    Args:
+      response: webapp.Response
+    """
+    for name, value in NO_CACHE_HEADERS:
+        response.headers[name] = value
+
 
 class Flash(object):
     """
@@ -50,10 +92,13 @@ class Flash(object):
 
     To set a flash message for the next page, simply set the 'msg' attribute.
 
+    Everything is read from the request and written to the response it is
+    given, so concurrent requests never share any state.
+
     Example psuedocode:
 
         if new_entity.put():
-            flash = Flash()
+            flash = Flash(self.request, self.response)
             flash.msg = 'Your new entity has been created!'
             return redirect_to_entity_list()
 
@@ -64,16 +109,23 @@ class Flash(object):
         {% endif %}
     """
 
-    def __init__(self, cookie=None):
+    def __init__(self, request, response, cookie=None, no_cache=True):
         """
         Load the flash message and clear the cookie.
+
+        Args:
+          request: webapp.Request the cookie is read from.
+          response: webapp.Response headers are written to.
+          cookie: Cookie.SimpleCookie already parsed from the request.
+          no_cache: True sends headers that stop the browser caching the
+              page, as Session does.
         """
-        print self.no_cache_headers()
-       # load cookie
+        self.__dict__['response'] = response
+        if no_cache:
+            write_no_cache_headers(response)
+        # load cookie
         if cookie is None:
-            browser_cookie = os.environ.get('HTTP_COOKIE', '')
-            self.cookie = Cookie.SimpleCookie()
-            self.cookie.load(browser_cookie)
+            self.cookie = load_cookie(request)
         else:
             self.cookie = cookie
         # check for flash data
@@ -89,10 +141,11 @@ class Flash(object):
                 # the next request, and only blanks out the content.
                 pass
             # clear the cookie
-            self.cookie[COOKIE_NAME] = ''
-            self.cookie[COOKIE_NAME]['path'] = '/'
-            self.cookie[COOKIE_NAME]['expires'] = 0
-            print self.cookie[COOKIE_NAME]
+            clear = Cookie.SimpleCookie()
+            clear[COOKIE_NAME] = ''
+            clear[COOKIE_NAME]['path'] = '/'
+            clear[COOKIE_NAME]['expires'] = 0
+            write_cookie(response, clear)
         else:
             # default 'msg' attribute to None
             self.__dict__['msg'] = None
@@ -105,9 +158,10 @@ class Flash(object):
             self.__dict__['cookie'] = value
         elif name == 'msg':
             self.__dict__['msg'] = value
-            self.__dict__['cookie'][COOKIE_NAME] = simplejson.dumps(value)
-            self.__dict__['cookie'][COOKIE_NAME]['path'] = '/'
-            print self.cookie
+            output = Cookie.SimpleCookie()
+            output[COOKIE_NAME] = simplejson.dumps(value)
+            output[COOKIE_NAME]['path'] = '/'
+            write_cookie(self.response, output)
         else:
             raise ValueError('You can only set the "msg" attribute.')
 
@@ -116,11 +170,6 @@ class Flash(object):
         Generates headers to avoid any page caching in the browser.
         Useful for highly dynamic sites.
 
-        Returns a unicode string of headers.
+        Returns a list of (name, value) header tuples.
         """
-        return u"".join([u"Expires: Tue, 03 Jul 2001 06:00:00 GMT",
-            strftime("Last-Modified: %a, %d %b %y %H:%M:%S %Z").decode("utf-8"),
-            u"Cache-Control: no-store, no-cache, must-revalidate, max-age=0",
-            u"Cache-Control: post-check=0, pre-check=0",
-            u"Pragma: no-cache",
-        ])
+        return list(NO_CACHE_HEADERS)
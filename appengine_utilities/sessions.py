@@ -27,7 +27,6 @@ SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 # main python imports
-import os
 import time
 import datetime
 import random
@@ -35,7 +34,6 @@ import hashlib
 import Cookie
 import pickle
 import __main__
-from time import strftime
 
 # google appengine imports
 from google.appengine.ext import db
@@ -45,6 +43,8 @@ from django.utils import simplejson
 
 # appengine_utilities import
 from rotmodel import ROTModel
+from flash import load_cookie, write_cookie, write_no_cache_headers
+from flash import NO_CACHE_HEADERS
 
 # settings
 try:
@@ -52,6 +52,39 @@ try:
 except:
     import settings_default as settings
 
+# number of entities fetched per datastore call when paging a query
+QUERY_PAGE_SIZE = 100
+
+
+def _query_pages(query, page_size=QUERY_PAGE_SIZE):
+    """
+    Runs a query one page at a time, using cursors so results aren't cut
+    off at 1000 entities.
+
+    Args:
+        query: the db.Query to run. Its cursor is advanced in place.
+        page_size: maximum number of results per page
+
+    Yields lists of entities (or keys for keys only queries).
+    """
+    while True:
+        page = query.fetch(page_size)
+        if page:
+            yield page
+        if len(page) < page_size:
+            return
+        query.with_cursor(query.cursor())
+
+
+def _query_all(query):
+    """
+    Returns every result of a query as a list, fetched a page at a time.
+    """
+    results = []
+    for page in _query_pages(query):
+        results.extend(page)
+    return results
+
 
 class _AppEngineUtilities_Session(ROTModel):
     """
@@ -171,7 +204,7 @@ class _AppEngineUtilities_Session(ROTModel):
 
         query = _AppEngineUtilities_SessionData.all()
         query.filter(u"session_key", self.session_key)
-        results = query.fetch(1000)
+        results = _query_all(query)
         return results
 
     def get_item(self, keyname = None):
@@ -211,7 +244,7 @@ class _AppEngineUtilities_Session(ROTModel):
         """
         query = _AppEngineUtilities_SessionData.all()
         query.filter(u"session_key", self.session_key)
-        results = query.fetch(1000)
+        results = _query_all(query)
         return results
 
     def delete(self):
@@ -222,10 +255,10 @@ class _AppEngineUtilities_Session(ROTModel):
         Returns True
         """
         try:
-            query = _AppEngineUtilities_SessionData.all()
+            query = db.Query(_AppEngineUtilities_SessionData, keys_only=True)
             query.filter(u"session_key = ", self.session_key)
-            results = query.fetch(1000)
-            db.delete(results)
+            for keys in _query_pages(query):
+                db.delete(keys)
             db.delete(self)
             memcache.delete_multi([u"_AppEngineUtilities_Session_%s" % \
                 (unicode(self.session_key)), \
@@ -374,7 +407,7 @@ class _DatastoreWriter(object):
             del(session.cookie_vals[keyname])
             session.output_cookie["%s_data" % (session.cookie_name)] = \
                 simplejson.dumps(session.cookie_vals)
-            print session.output_cookie.output()
+            session.write_cookie()
 
         sessdata = session._get(keyname=keyname)
         if sessdata is None:
@@ -417,7 +450,7 @@ class _CookieWriter(object):
         # so let it raise exceptions
         session.output_cookie["%s_data" % (session.cookie_name)] = \
             simplejson.dumps(session.cookie_vals)
-        print session.output_cookie.output()
+        session.write_cookie()
         return True
 
 class Session(object):
@@ -430,10 +463,15 @@ class Session(object):
     values are "datastore" or "cookie".
 
     Session can be used as a standard dictionary object.
-        session = appengine_utilities.sessions.Session()
+        session = appengine_utilities.sessions.Session(request, response)
         session["keyname"] = "value" # sets keyname to value
         print session["keyname"] # will print value
 
+    Cookies are read from the request and headers are set on the response
+    the session is created with; nothing is read from os.environ or printed.
+    A session is only valid for the request it was created for, so any
+    number of requests can be handled at once, each with its own Session.
+
     Datastore Writer:
         The datastore writer was written with the focus being on security,
         reliability, and performance. In that order.
@@ -481,21 +519,13 @@ class Session(object):
         it's streamlined for pure performance. If you need to make sure data
         is not tampered with, use the datastore writer which stores the data
         server side.
-
-    django-middleware:
-        Included with the GAEUtilties project is a
-        django-middleware.middleware.SessionMiddleware which can be included in
-        your settings file. This uses the cookie writer for anonymous requests,
-        and you can switch to the datastore writer on user login. This will
-        require an extra set in your login process of calling
-        request.session.save() once you validated the user information. This
-        will convert the cookie writer based session to a datastore writer.
     """
 
     # cookie name declaration for class methods
     COOKIE_NAME = settings.session["COOKIE_NAME"]
 
-    def __init__(self, cookie_path=settings.session["DEFAULT_COOKIE_PATH"],
+    def __init__(self, request, response,
+            cookie_path=settings.session["DEFAULT_COOKIE_PATH"],
             cookie_name=settings.session["COOKIE_NAME"],
             session_expire_time=settings.session["SESSION_EXPIRE_TIME"],
             clean_check_percent=settings.session["CLEAN_CHECK_PERCENT"],
@@ -505,11 +535,13 @@ class Session(object):
             set_cookie_expires=settings.session["SET_COOKIE_EXPIRES"],
             session_token_ttl=settings.session["SESSION_TOKEN_TTL"],
             last_activity_update=settings.session["UPDATE_LAST_ACTIVITY"],
-            writer=settings.session["WRITER"]):
+            writer=settings.session["WRITER"], no_cache=True):
         """
         Initializer
 
         Args:
+          request: webapp.Request the session cookie is read from.
+          response: webapp.Response cookies and headers are written to.
           cookie_name: The name for the session cookie stored in the browser.
           session_expire_time: The amount of time between requests before the
               session expires.
@@ -524,8 +556,12 @@ class Session(object):
               it saves even if the browser is closed.
           session_token_ttl: Number of sessions a session token is valid
               for before it should be regenerated.
+          no_cache: True sends headers that stop the browser caching the
+              page. Handlers that set their own caching headers pass False.
         """
 
+        self.request = request
+        self.response = response
         self.cookie_path = cookie_path
         self.cookie_name = cookie_name
         self.session_expire_time = session_expire_time
@@ -536,15 +572,15 @@ class Session(object):
         self.session_token_ttl = session_token_ttl
         self.last_activity_update = last_activity_update
         self.writer = writer
+        self.no_cache = no_cache
 
         # make sure the page is not cached in the browser
-        print self.no_cache_headers()
+        if no_cache:
+            write_no_cache_headers(response)
         # Check the cookie and, if necessary, create a new one.
         self.cache = {}
-        string_cookie = os.environ.get(u"HTTP_COOKIE", u"")
-        self.cookie = Cookie.SimpleCookie()
+        self.cookie = load_cookie(request)
         self.output_cookie = Cookie.SimpleCookie()
-        self.cookie.load(string_cookie)
         try:
             self.cookie_vals = \
                 simplejson.loads(self.cookie["%s_data" % (self.cookie_name)].value)
@@ -582,14 +618,8 @@ class Session(object):
                 self.session = _AppEngineUtilities_Session()
                 self.session.put()
                 self.sid = self.new_sid()
-                if u"HTTP_USER_AGENT" in os.environ:
-                    self.session.ua = os.environ[u"HTTP_USER_AGENT"]
-                else:
-                    self.session.ua = None
-                if u"REMOTE_ADDR" in os.environ:
-                    self.session.ip = os.environ["REMOTE_ADDR"]
-                else:
-                    self.session.ip = None
+                self.session.ua = request.headers.get(u"User-Agent")
+                self.session.ip = request.remote_addr or None
                 self.session.sid = [self.sid]
                 # do put() here to get the session key
                 self.session.put()
@@ -629,18 +659,26 @@ class Session(object):
                 self.output_cookie["%s_data" % (cookie_name)] = u""
             self.output_cookie["%s_data" % (cookie_name)]["expires"] = \
                 self.session_expire_time
-        print self.output_cookie.output()
+        self.write_cookie()
 
         # fire up a Flash object if integration is enabled
         if self.integrate_flash:
             import flash
-            self.flash = flash.Flash(cookie=self.cookie)
+            # The no-cache headers, if any, were already set above.
+            self.flash = flash.Flash(request, response, cookie=self.cookie,
+                                     no_cache=False)
 
         # randomly delete old stale sessions in the datastore (see
         # CLEAN_CHECK_PERCENT variable)
         if random.randint(1, 100) < clean_check_percent:
             self._clean_old_sessions() 
 
+    def write_cookie(self):
+        """
+        Adds the output cookie to the response's headers.
+        """
+        write_cookie(self.response, self.output_cookie)
+
     def new_sid(self):
         """
         Create a new session id.
@@ -730,7 +768,7 @@ class Session(object):
         self.cache = {}
         self.output_cookie["%s_data" % (self.cookie_name)] = \
             simplejson.dumps(self.cookie_vals)
-        print self.output_cookie.output()
+        self.write_cookie()
         # if the event class has been loaded, fire off the sessionDelete event
         if u"AEU_Events" in __main__.__dict__:
             __main__.AEU_Events.fire_event(u"sessionDelete")
@@ -811,7 +849,7 @@ class Session(object):
         Returns True
         """
         self._delete_session()
-        self.__init__()
+        self.__init__(self.request, self.response, no_cache=self.no_cache)
         return True
 
     def no_cache_headers(self):
@@ -819,14 +857,9 @@ class Session(object):
         Generates headers to avoid any page caching in the browser.
         Useful for highly dynamic sites.
 
-        Returns a unicode string of headers.
+        Returns a list of (name, value) header tuples.
         """
-        return u"".join([u"Expires: Tue, 03 Jul 2001 06:00:00 GMT",
-            strftime("Last-Modified: %a, %d %b %y %H:%M:%S %Z").decode("utf-8"),
-            u"Cache-Control: no-store, no-cache, must-revalidate, max-age=0",
-            u"Cache-Control: post-check=0, pre-check=0",
-            u"Pragma: no-cache",
-        ])
+        return list(NO_CACHE_HEADERS)
 
     def clear(self):
         """
@@ -844,9 +877,9 @@ class Session(object):
         # delete from memcache
         self.cache = {}
         self.cookie_vals = {}
-        self.output_cookie["%s_data" %s (self.cookie_name)] = \
+        self.output_cookie["%s_data" % (self.cookie_name)] = \
             simplejson.dumps(self.cookie_vals)
-        print self.output_cookie.output()
+        self.write_cookie()
         return True
 
     def has_key(self, keyname):
@@ -939,7 +972,8 @@ class Session(object):
             return None
 
     @classmethod
-    def check_token(cls, cookie_name=COOKIE_NAME, delete_invalid=True):
+    def check_token(cls, request, response, cookie_name=COOKIE_NAME,
+                    delete_invalid=True):
         """
         Retrieves the token from a cookie and validates that it is
         a valid token for an existing cookie. Cookie validation is based
@@ -949,6 +983,8 @@ class Session(object):
         should be used in hybrid implementations.
 
         Args:
+            request: webapp.Request the cookie is read from.
+            response: webapp.Response an invalid cookie is deleted through.
             cookie_name: Name of the cookie to check for a token.
             delete_invalid: If the token is not valid, delete the session
                             cookie, to avoid datastore queries on future
@@ -957,9 +993,7 @@ class Session(object):
         Returns True/False
         """
 
-        string_cookie = os.environ.get(u"HTTP_COOKIE", u"")
-        cookie = Cookie.SimpleCookie()
-        cookie.load(string_cookie)
+        cookie = load_cookie(request)
         if cookie.has_key(cookie_name):
             query = _AppEngineUtilities_Session.all()
             query.filter(u"sid", cookie[cookie_name].value)
@@ -971,7 +1005,7 @@ class Session(object):
                     output_cookie = Cookie.SimpleCookie()
                     output_cookie[cookie_name] = cookie[cookie_name]
                     output_cookie[cookie_name][u"expires"] = 0
-                    print output_cookie.output()
+                    write_cookie(response, output_cookie)
         return False
 
     def get_ds_entity(self):
@@ -1074,7 +1108,7 @@ class Session(object):
             bad_key = False
             self.output_cookie["%s_data" % (self.cookie_name)] = \
                 simplejson.dumps(self.cookie_vals)
-            print self.output_cookie.output()
+            self.write_cookie()
         if bad_key:
             raise KeyError(unicode(keyname))
         if keyname in self.cache:
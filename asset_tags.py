@@ -0,0 +1,20 @@
+#!/usr/bin/env python
+
+"""Template tags for the static assets built by asset_util.py.
+
+Usage: <link rel="stylesheet" href="{% asset "freeside.css" %}" />
+"""
+
+from google.appengine.ext import webapp
+
+import asset_util
+
+
+register = webapp.template.create_template_register()
+
+
+def asset(name):
+    """Gets the fingerprinted URL of a bundle or file."""
+    return asset_util.AssetUrl(name)
+
+register.simple_tag(asset)
@@ -0,0 +1,373 @@
+#!/usr/bin/env python
+
+"""Bundles, minifies and fingerprints the static assets.
+
+Each bundle is built from its sources and written to static/ under a name
+carrying a hash of its content, so app.yaml can let browsers cache it
+forever and a deploy that changes it changes its URL.  Templates find the
+current URL through the {% asset %} tag in asset_tags.py.
+
+Run this after changing anything under scripts/, stylesheets/ or images/:
+
+  python asset_util.py
+
+Nothing in here needs the App Engine SDK.
+"""
+
+import hashlib
+import os
+import posixpath
+import re
+import sys
+
+
+STATIC_DIR = 'static'
+STATIC_URL = '/static/'
+# Kept outside static/, since files under a static_dir handler can't be
+# read by the application.
+MANIFEST_NAME = 'asset_manifest.txt'
+HASH_LENGTH = 10
+
+# Bundle name to its sources, in the order they are concatenated.
+BUNDLES = {
+    'freeside.css': ('stylesheets/style.css',),
+    'freeside.js': ('scripts/freeside.js',),
+    'admin.css': ('stylesheets/third_party/closure/inputdatepicker.css',),
+    'admin.js': ('scripts/add-election-bin.js',),
+}
+
+# Sources already minified by the Closure compiler, concatenated as they are.
+PRECOMPILED = frozenset(['scripts/add-election-bin.js'])
+
+# Files that are fingerprinted but otherwise served as they are.
+FILES = (
+    'images/freeside_login.png',
+    'images/freeside_txt.png',
+)
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+_manifest = None
+
+
+class Error(Exception):
+    """Base error class for this module."""
+
+
+class UnknownAssetError(Error):
+    """Raised when an asset is not in the manifest."""
+
+
+def _Read(root, path):
+    f = open(os.path.join(root, *path.split('/')), 'rb')
+    try:
+        return f.read()
+    finally:
+        f.close()
+
+
+def Fingerprint(name, data):
+    """Gets the file name of an asset with a hash of its content.
+
+    Args:
+      name: str, e.g. 'freeside.css' or 'images/freeside_txt.png'.
+      data: str, the asset's content.
+    Returns:
+      str, e.g. 'freeside-0123456789.css'.
+    """
+    base, ext = posixpath.splitext(posixpath.basename(name))
+    digest = hashlib.sha1(data).hexdigest()[:HASH_LENGTH]
+    return '%s-%s%s' % (base, digest, ext)
+
+
+_CSS_TOKEN = re.compile(
+    r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|(/\*.*?\*/)|(\s+)', re.S)
+_CSS_PUNCTUATION = re.compile(r' ?([{};,>]) ?')
+
+
+def _MinifyCssCode(code):
+    code = _CSS_PUNCTUATION.sub(r'\1', re.sub(' +', ' ', code))
+    return code.replace(': ', ':').replace(';}', '}')
+
+
+def MinifyCss(css):
+    """Strips comments and needless whitespace from a stylesheet.
+
+    Comments starting with /*! are kept, for licenses.
+    """
+    chunks = []
+    code = []
+    pos = 0
+    for match in _CSS_TOKEN.finditer(css):
+        code.append(css[pos:match.start()])
+        string, comment = match.group(1), match.group(2)
+        if string or (comment and comment.startswith('/*!')):
+            chunks.append(_MinifyCssCode(''.join(code)))
+            chunks.append(match.group(0))
+            code = []
+        else:
+            code.append(' ')
+        pos = match.end()
+    code.append(css[pos:])
+    chunks.append(_MinifyCssCode(''.join(code)))
+    return ''.join(chunks).strip()
+
+
+_CSS_IMPORT = re.compile(
+    r'@import\s+(?:url\(\s*)?["\']?([^"\')\s]+)["\']?\s*\)?\s*;')
+_CSS_URL = re.compile(r'url\(\s*(["\']?)([^"\')]+)\1\s*\)')
+
+
+def InlineCss(root, path, urls, seen=None):
+    """Reads a stylesheet with its @imports inlined.
+
+    Relative url()s are made absolute, and point at the fingerprinted copy
+    of any file in urls.
+
+    Args:
+      root: str, directory the paths are relative to.
+      path: str, e.g. 'stylesheets/style.css'.
+      urls: dict of path to fingerprinted URL.
+      seen: set of paths already inlined, which are not inlined again.
+    Returns:
+      str
+    """
+    if seen is None:
+        seen = set()
+    seen.add(path)
+    directory = posixpath.dirname(path)
+
+    def Resolve(url):
+        if url.startswith('/'):
+            return url[1:]
+        return posixpath.normpath(posixpath.join(directory, url))
+
+    def Import(match):
+        imported = Resolve(match.group(1))
+        if imported in seen:
+            return ''
+        return InlineCss(root, imported, urls, seen)
+
+    def Url(match):
+        url = match.group(2)
+        if url.startswith('data:') or ':' in url.split('/')[0] or (
+                url.startswith('//')):
+            return match.group(0)
+        resolved = Resolve(url)
+        return 'url(%s)' % urls.get(resolved, '/' + resolved)
+
+    return _CSS_URL.sub(Url, _CSS_IMPORT.sub(Import, _Read(root, path)))
+
+
+_JS_IDENTIFIER = re.compile(r'[\w$\\]')
+# A / after one of these starts a regular expression, not a division.
+_JS_REGEX_AFTER = '(,=:[!&|?{};+-*%<>~^'
+_JS_REGEX_KEYWORDS = ('return', 'typeof', 'instanceof', 'in', 'new',
+                      'delete', 'void', 'throw', 'case', 'do', 'else')
+
+
+def _JsStringEnd(js, start):
+    """Gets the index just past the string or regex literal at start."""
+    quote = js[start]
+    pos = start + 1
+    in_class = False
+    while pos < len(js):
+        c = js[pos]
+        if c == '\\':
+            pos += 2
+            continue
+        if quote == '/':
+            if c == '[':
+                in_class = True
+            elif c == ']':
+                in_class = False
+            elif c == '/' and not in_class:
+                break
+        elif c == quote:
+            break
+        pos += 1
+    return pos + 1
+
+
+def MinifyJs(js):
+    """Strips comments and indentation from a script.
+
+    This is deliberately conservative: line breaks are kept so automatic
+    semicolon insertion is unaffected, and names are not touched.
+    Comments starting with /*! are kept, for licenses.
+    """
+    out = []
+    pos = 0
+    end = len(js)
+    space = ''
+
+    def LastWord():
+        match = re.search(r'[\w$]+$', ''.join(out[-12:]))
+        return match and match.group(0)
+
+    while pos < end:
+        c = js[pos]
+        if c in ' \t\r\n\f\v':
+            if c == '\n':
+                space = '\n'
+            elif not space:
+                space = ' '
+            pos += 1
+            continue
+        if js.startswith('//', pos):
+            newline = js.find('\n', pos)
+            pos = newline == -1 and end or newline
+            continue
+        if js.startswith('/*', pos):
+            close = js.find('*/', pos + 2)
+            close = close == -1 and end or close + 2
+            comment = js[pos:close]
+            pos = close
+            if comment.startswith('/*!'):
+                out.append(space + comment)
+                space = '\n'
+            elif '\n' in comment:
+                space = '\n'
+            elif not space:
+                space = ' '
+            continue
+
+        last = out and out[-1][-1:] or ''
+        if space == '\n' and out:
+            out.append('\n')
+        elif space and (
+                (_JS_IDENTIFIER.match(last) and _JS_IDENTIFIER.match(c)) or
+                (last + c in ('++', '--'))):
+            out.append(' ')
+        space = ''
+
+        if c in '"\'' or (c == '/' and (
+                not last or last in _JS_REGEX_AFTER or
+                LastWord() in _JS_REGEX_KEYWORDS)):
+            literal_end = _JsStringEnd(js, pos)
+            if c == '/':
+                while (literal_end < end and
+                       _JS_IDENTIFIER.match(js[literal_end])):
+                    literal_end += 1
+            out.append(js[pos:literal_end])
+            pos = literal_end
+        else:
+            out.append(c)
+            pos += 1
+    return ''.join(out).strip() + '\n'
+
+
+def BuildAssets(root=_ROOT):
+    """Builds every asset in memory.
+
+    Args:
+      root: str, the application directory.
+    Returns:
+      (files, urls): dict of file name under static/ to its content, and
+      dict of asset name to its URL, which is what the manifest holds.
+    """
+    files = {}
+    urls = {}
+    for path in FILES:
+        data = _Read(root, path)
+        name = Fingerprint(path, data)
+        files[name] = data
+        urls[path] = STATIC_URL + name
+    for bundle, sources in sorted(BUNDLES.items()):
+        if bundle.endswith('.css'):
+            data = MinifyCss('\n'.join(
+                [InlineCss(root, source, urls) for source in sources]))
+        else:
+            # A leading ( in one script can't call the end of the last.
+            data = ';\n'.join([_ReadScript(root, source) for source in sources])
+        name = Fingerprint(bundle, data)
+        files[name] = data
+        urls[bundle] = STATIC_URL + name
+    return files, urls
+
+
+def _ReadScript(root, path):
+    data = _Read(root, path)
+    if path in PRECOMPILED:
+        return data
+    return MinifyJs(data)
+
+
+def FormatManifest(urls):
+    """Formats the manifest: one 'name url' line per asset, sorted."""
+    return ''.join(['%s %s\n' % item for item in sorted(urls.items())])
+
+
+def ParseManifest(data):
+    """Parses a manifest written by FormatManifest.
+
+    Returns:
+      dict of asset name to URL.
+    """
+    return dict([line.split(' ', 1) for line in data.splitlines() if line])
+
+
+def WriteAssets(root=_ROOT):
+    """Builds the assets into static/ and removes ones no longer built.
+
+    The manifest is written next to this module.
+
+    Args:
+      root: str, the application directory.
+    Returns:
+      dict of asset name to URL.
+    """
+    files, urls = BuildAssets(root)
+    static_dir = os.path.join(root, STATIC_DIR)
+    if not os.path.isdir(static_dir):
+        os.makedirs(static_dir)
+    for name in os.listdir(static_dir):
+        if name not in files:
+            os.remove(os.path.join(static_dir, name))
+    for name, data in files.items():
+        f = open(os.path.join(static_dir, name), 'wb')
+        try:
+            f.write(data)
+        finally:
+            f.close()
+    f = open(os.path.join(root, MANIFEST_NAME), 'wb')
+    try:
+        f.write(FormatManifest(urls))
+    finally:
+        f.close()
+    return urls
+
+
+def GetManifest():
+    """Gets the deployed manifest, read once per instance.
+
+    Returns:
+      dict of asset name to URL.
+    """
+    global _manifest
+    if _manifest is None:
+        _manifest = ParseManifest(_Read(_ROOT, MANIFEST_NAME))
+    return _manifest
+
+
+def AssetUrl(name):
+    """Gets the fingerprinted URL of an asset.
+
+    Args:
+      name: str, a bundle name or a path in FILES.
+    Returns:
+      str
+    """
+    try:
+        return GetManifest()[name]
+    except KeyError:
+        raise UnknownAssetError('No such asset: %r' % name)
+
+
+def main(argv):
+    urls = WriteAssets()
+    for name, url in sorted(urls.items()):
+        print '%-28s %s' % (name, url)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+"""Unittest for asset_util.py"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import asset_util
+
+
+class MinifyTest(unittest.TestCase):
+
+    def testMinifyCss(self):
+        css = ('/* gone */\n/*! kept */\na , b  >  c {\n  color: red;\n'
+               '  content: "a  ;  b";\n}\n')
+        self.assertEquals(
+            '/*! kept */ a,b>c{color:red;content:"a  ;  b"}',
+            asset_util.MinifyCss(css))
+
+    def testMinifyJs(self):
+        js = ('// gone\nvar a = b / 2 / c;  /* gone */\n'
+              'var r = /[/]+\\//g.test("a // b");\n'
+              'function f(x) {\n  return /x y/.test(x) + x++ + +x;\n}\n')
+        self.assertEquals(
+            'var a=b/2/c;\nvar r=/[/]+\\//g.test("a // b");\n'
+            'function f(x){\nreturn/x y/.test(x)+x++ + +x;\n}\n',
+            asset_util.MinifyJs(js))
+
+
+class BuildTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.root, 'css', 'lib'))
+        self.Write('css/main.css', '@import url(lib/a.css);\n'
+                   'b { background: url("../img/x.png"); }')
+        self.Write('css/lib/a.css', '@import "../main.css";\n'
+                   'a { background: url(/img/y.png); }')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def Write(self, path, data):
+        f = open(os.path.join(self.root, path), 'w')
+        f.write(data)
+        f.close()
+
+    def testInlineCss(self):
+        css = asset_util.InlineCss(
+            self.root, 'css/main.css', {'img/y.png': '/static/y-1.png'})
+        self.assertEquals(
+            '\na { background: url(/static/y-1.png); }\n'
+            'b { background: url(/img/x.png); }', css)
+
+    def testFingerprint(self):
+        self.assertEquals(
+            'x-da39a3ee5e.png',
+            asset_util.Fingerprint('img/x.png', ''))
+
+    def testManifestRoundTrip(self):
+        urls = {'a.css': '/static/a-1.css', 'b.js': '/static/b-2.js'}
+        self.assertEquals(urls, asset_util.ParseManifest(
+            asset_util.FormatManifest(urls)))
+
+
+class DeployedAssetsTest(unittest.TestCase):
+
+    def testAssetsAreCurrent(self):
+        # Fails when a source changed without rerunning asset_util.py.
+        files, urls = asset_util.BuildAssets()
+        self.assertEquals(urls, asset_util.GetManifest())
+        static_dir = os.path.join(
+            os.path.dirname(os.path.abspath(asset_util.__file__)),
+            asset_util.STATIC_DIR)
+        self.assertEquals(sorted(files.keys()), sorted(os.listdir(static_dir)))
+
+    def testUnknownAsset(self):
+        self.assertRaises(asset_util.UnknownAssetError,
+                          asset_util.AssetUrl, 'missing.js')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+"""Sharded counters for values that are incremented under contention."""
+
+import random
+
+from google.appengine.api import memcache
+from google.appengine.ext import db
+
+import freesidemodels
+
+
+NUM_SHARDS = 20
+# How long a summed count may be served from memcache before the shards
+# are read again.
+CACHE_SECONDS = 60
+# How long an Increment that found no cached sum keeps one from being
+# cached, which is longer than GetCount takes to read the shards.
+LOCK_SECONDS = 5
+
+
+def _CacheKey(name):
+    return 'counter:%s' % name
+
+
+def _ShardKeyName(name, index):
+    return '%s:%d' % (name, index)
+
+
+def Increment(name, delta=1):
+    """Adds to a counter by updating one randomly chosen shard.
+
+    Args:
+      name: str, the counter name.
+      delta: int, the amount to add.
+    """
+    key_name = _ShardKeyName(name, random.randint(0, NUM_SHARDS - 1))
+
+    def DoIncrement():
+        shard = freesidemodels.CounterShard.get_by_key_name(key_name)
+        if shard is None:
+            shard = freesidemodels.CounterShard(key_name=key_name, name=name)
+        shard.count += delta
+        shard.put()
+
+    db.run_in_transaction(DoIncrement)
+    if memcache.incr(_CacheKey(name), delta) is None:
+        # A GetCount may have read the shards before this increment and be
+        # about to cache that sum, so keep it from being cached for now.
+        memcache.delete(_CacheKey(name), seconds=LOCK_SECONDS)
+
+
+def GetCount(name):
+    """Gets the value of a counter.
+
+    Args:
+      name: str, the counter name.
+    Returns:
+      int
+    """
+    count = memcache.get(_CacheKey(name))
+    if count is None:
+        keys = [db.Key.from_path('CounterShard', _ShardKeyName(name, i))
+                for i in xrange(NUM_SHARDS)]
+        count = sum([shard.count for shard in db.get(keys) if shard])
+        # Fails while an Increment has the key locked, so a sum read
+        # before that increment is never cached.
+        memcache.add(_CacheKey(name), count, CACHE_SECONDS)
+    return count
+
+
+def GetCounts(names):
+    """Gets the values of several counters with one memcache round trip.
+
+    Args:
+      names: list of str, counter names.
+    Returns:
+      dict of str to int
+    """
+    cached = memcache.get_multi([_CacheKey(name) for name in names])
+    counts = {}
+    for name in names:
+        if _CacheKey(name) in cached:
+            counts[name] = cached[_CacheKey(name)]
+        else:
+            counts[name] = GetCount(name)
+    return counts
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+
+"""Unittest for counter_util.py"""
+
+import unittest
+
+from google.appengine.api import memcache
+
+import counter_util
+import test_util
+
+
+class CounterUtilTest(test_util.AppEngineTestBase):
+
+    def testIncrement(self):
+        self.assertEquals(0, counter_util.GetCount('foo'))
+        for _ in range(25):
+            counter_util.Increment('foo')
+        counter_util.Increment('bar', delta=3)
+        self.assertEquals(25, counter_util.GetCount('foo'))
+        self.assertEquals(3, counter_util.GetCount('bar'))
+
+    def testGetCountsUncached(self):
+        counter_util.Increment('foo')
+        counter_util.Increment('foo')
+        memcache.flush_all()
+        self.assertEquals({'foo': 2, 'bar': 0},
+                          counter_util.GetCounts(['foo', 'bar']))
+
+    def testIncrementBlocksStaleSum(self):
+        # A GetCount that read the shards before this increment...
+        stale = counter_util.GetCount('foo')
+        memcache.flush_all()
+        counter_util.Increment('foo')
+        # ...can't cache what it read.
+        self.assertFalse(
+            memcache.add(counter_util._CacheKey('foo'), stale))
+        self.assertEquals(1, counter_util.GetCount('foo'))
+
+
+if __name__ == '__main__':
+    unittest.main()
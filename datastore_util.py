@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+
+"""Helpers for batching datastore RPCs and issuing them concurrently."""
+
+import time
+
+from google.appengine.ext import db
+
+
+# Upper bound on entities per batch RPC.
+MAX_BATCH_SIZE = 100
+RETRY_ATTEMPTS = 3
+RETRY_INTERVAL = .2
+
+
+class QueryFuture(object):
+    """A query whose first page has been requested but not yet waited on.
+
+    Query.run() sends the RunQuery RPC immediately and only blocks once the
+    iterator is consumed, so several of these can be in flight at once.
+    Pages after the first are fetched with cursors, so results are not cut
+    off at any fixed size.
+    """
+
+    def __init__(self, query, limit=None, batch_size=MAX_BATCH_SIZE):
+        self._query = query
+        self._limit = limit
+        self._batch_size = _PageSize(batch_size, limit, 0)
+        self._results = None
+        self._first_page = query.run(limit=self._batch_size,
+                                     batch_size=self._batch_size)
+
+    def get_result(self):
+        """Blocks until every page of the query has been fetched.
+
+        Returns:
+          list of db.Model
+        """
+        if self._results is None:
+            results = list(self._first_page)
+            self._first_page = None
+            if len(results) == self._batch_size:
+                results.extend(IterQuery(
+                    self._query, batch_size=self._batch_size,
+                    limit=self._limit, start_cursor=self._query.cursor(),
+                    offset=len(results)))
+            self._results = results
+        return self._results
+
+
+class GetFuture(object):
+    """A batch get by key that is already in flight."""
+
+    def __init__(self, keys):
+        self._keys = list(keys)
+        self._rpc = None
+        if self._keys:
+            self._rpc = db.get_async(self._keys)
+
+    def get_result(self):
+        """Blocks until the get has finished.
+
+        Returns:
+          dict of db.Key to db.Model, with missing entities left out.
+        """
+        if self._rpc is None:
+            return {}
+        return dict((entity.key(), entity)
+                    for entity in self._rpc.get_result() if entity is not None)
+
+
+def QueryAsync(query, limit=None):
+    """Starts a query without waiting for its results.
+
+    Args:
+      query: db.Query, the query to run.
+      limit: int, maximum number of results, or None for all of them.
+    Returns:
+      QueryFuture
+    """
+    return QueryFuture(query, limit=limit)
+
+
+def GetAsync(keys):
+    """Starts a batch get of unique keys without waiting for the results.
+
+    Args:
+      keys: iterable of db.Key, duplicates are only fetched once.
+    Returns:
+      GetFuture
+    """
+    seen = set()
+    unique = []
+    for key in keys:
+        if key not in seen:
+            seen.add(key)
+            unique.append(key)
+    return GetFuture(unique)
+
+
+def WaitAll(futures):
+    """Joins a list of futures.
+
+    Args:
+      futures: list of QueryFuture or GetFuture.
+    Returns:
+      list of results, in the same order as futures.
+    """
+    return [future.get_result() for future in futures]
+
+
+def _PageSize(batch_size, limit, count):
+    """Gets the size of the next page given how many results were seen."""
+    if limit is None:
+        return batch_size
+    return max(0, min(batch_size, limit - count))
+
+
+def IterQueryPages(query, batch_size=MAX_BATCH_SIZE, limit=None,
+                   start_cursor=None, offset=0):
+    """Runs a query one cursor-delimited page at a time.
+
+    Only one page is held in memory at a time, and results are not cut off
+    at 1000 entities.
+
+    Args:
+      query: db.Query, the query to run.  Its cursor is advanced in place.
+      batch_size: int, maximum results per page.
+      limit: int, maximum total results, or None for all of them.
+      start_cursor: str, a cursor to resume from.
+      offset: int, results already consumed toward limit.
+    Yields:
+      lists of db.Model (or db.Key for keys-only queries)
+    """
+    cursor = start_cursor
+    count = offset
+    while True:
+        page_size = _PageSize(batch_size, limit, count)
+        if page_size == 0:
+            return
+        if cursor is not None:
+            query.with_cursor(cursor)
+        page = _WithRetries(query.fetch, page_size)
+        if page:
+            yield page
+        count += len(page)
+        if len(page) < page_size:
+            return
+        cursor = query.cursor()
+
+
+def IterQuery(query, batch_size=MAX_BATCH_SIZE, limit=None,
+              start_cursor=None, offset=0):
+    """Runs a query with cursors, yielding results one at a time.
+
+    See IterQueryPages for the arguments.
+
+    Yields:
+      db.Model (or db.Key for keys-only queries)
+    """
+    for page in IterQueryPages(query, batch_size=batch_size, limit=limit,
+                               start_cursor=start_cursor, offset=offset):
+        for result in page:
+            yield result
+
+
+def _Batches(items, batch_size):
+    for start in xrange(0, len(items), batch_size):
+        yield items[start:start + batch_size]
+
+
+def _WithRetries(fn, *args):
+    """Calls fn, retrying on datastore timeouts like ROTModel does."""
+    count = 0
+    while True:
+        try:
+            return fn(*args)
+        except db.Timeout:
+            count += 1
+            if count >= RETRY_ATTEMPTS:
+                raise
+            time.sleep(count * RETRY_INTERVAL)
+
+
+def PutBatched(entities, batch_size=MAX_BATCH_SIZE):
+    """Writes entities with as few batch puts as possible.
+
+    No transaction is used, so entities in the same batch are not written
+    atomically with one another.
+
+    Args:
+      entities: list of db.Model
+      batch_size: int, maximum entities per put.
+    Returns:
+      list of db.Key, in the same order as entities.
+    """
+    keys = []
+    for batch in _Batches(list(entities), batch_size):
+        keys.extend(_WithRetries(db.put, batch))
+    return keys
+
+
+def DeleteBatched(keys, batch_size=MAX_BATCH_SIZE):
+    """Deletes entities with as few batch deletes as possible.
+
+    Args:
+      keys: list of db.Key or db.Model
+      batch_size: int, maximum entities per delete.
+    """
+    for batch in _Batches(list(keys), batch_size):
+        _WithRetries(db.delete, batch)
+
+
+def GetBatched(keys, batch_size=MAX_BATCH_SIZE):
+    """Gets entities by key in batches.
+
+    Args:
+      keys: list of db.Key
+      batch_size: int, maximum keys per get.
+    Returns:
+      list of db.Model or None, in the same order as keys.
+    """
+    entities = []
+    for batch in _Batches(list(keys), batch_size):
+        entities.extend(_WithRetries(db.get, batch))
+    return entities
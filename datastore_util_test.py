@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+"""Unittest for datastore_util.py"""
+
+import unittest
+
+import datastore_util
+import freesidemodels
+import member_util
+import random_util
+import test_util
+
+
+class AsyncTest(test_util.AppEngineTestBase):
+
+    def setUp(self):
+        test_util.AppEngineTestBase.setUp(self)
+        self.members = [member_util.SaveMember(random_util.Member())
+                        for _ in range(5)]
+
+    def testQueryAsync(self):
+        future = datastore_util.QueryAsync(freesidemodels.Member.all())
+        self.assertEquals(
+            sorted([m.key() for m in self.members]),
+            sorted([m.key() for m in future.get_result()]))
+
+    def testGetAsyncDuplicates(self):
+        keys = [m.key() for m in self.members]
+        result = datastore_util.GetAsync(keys + keys).get_result()
+        self.assertEquals(sorted(keys), sorted(result.keys()))
+
+    def testGetAsyncEmpty(self):
+        self.assertEquals({}, datastore_util.GetAsync([]).get_result())
+
+    def testWaitAll(self):
+        first, second = datastore_util.WaitAll([
+            datastore_util.QueryAsync(freesidemodels.Member.all(), limit=2),
+            datastore_util.GetAsync([self.members[0].key()])])
+        self.assertEquals(2, len(first))
+        self.assertEquals([self.members[0].key()], second.keys())
+
+
+class IterQueryTest(test_util.AppEngineTestBase):
+
+    def setUp(self):
+        test_util.AppEngineTestBase.setUp(self)
+        self.keys = datastore_util.PutBatched(
+            [random_util.Member() for _ in range(25)])
+
+    def testIterQuery(self):
+        results = list(datastore_util.IterQuery(
+            freesidemodels.Member.all(), batch_size=10))
+        self.assertEquals(sorted(self.keys), sorted([m.key() for m in results]))
+
+    def testIterQueryLimit(self):
+        results = list(datastore_util.IterQuery(
+            freesidemodels.Member.all(), batch_size=10, limit=15))
+        self.assertEquals(15, len(results))
+        self.assertEquals(15, len(set([m.key() for m in results])))
+
+    def testIterQueryPages(self):
+        query = freesidemodels.Member.all(keys_only=True)
+        pages = list(datastore_util.IterQueryPages(query, batch_size=10))
+        self.assertEquals([10, 10, 5], [len(page) for page in pages])
+
+    def testQueryAsyncPastFirstPage(self):
+        future = datastore_util.QueryFuture(
+            freesidemodels.Member.all(), batch_size=10)
+        self.assertEquals(25, len(future.get_result()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+"""Card lookups for door controllers.
+
+Each instance keeps an index of rfid to member in memory, shared with other
+instances through memcache and keyed by the roster generation, so a swipe
+is answered without any datastore access.
+"""
+
+import hashlib
+import logging
+import os
+import time
+
+from google.appengine.api import memcache
+
+import datastore_util
+import freesidemodels
+import member_util
+import payload_util
+
+
+# How often an instance checks whether the roster generation moved on.
+GENERATION_CHECK_SECONDS = 5
+# How long an index stays in memcache after its generation was replaced.
+INDEX_CACHE_SECONDS = 24 * 60 * 60
+# How long an instance trusts a controller key before checking it again.
+CONTROLLER_CACHE_SECONDS = 5 * 60
+# Fields of each index entry, in order.
+ENTRY_FIELDS = ('member_key', 'username', 'active', 'starving', 'doormusic')
+
+# (generation, index) of the last index this instance loaded.
+_index = None
+_index_checked = 0
+# SHA-256 of known controller keys, mapped to when to check them again.
+_controllers = {}
+
+
+def _IndexCacheKey(generation):
+    return 'door_index:%d' % generation
+
+
+def _SecretHash(secret):
+    return hashlib.sha256(secret).hexdigest()
+
+
+def BuildIndex():
+    """Builds the rfid index from datastore.
+
+    Returns:
+      dict of int rfid to a tuple of ENTRY_FIELDS, where doormusic is the
+      SHA-1 of the member's door music or None.
+    """
+    members = []
+    for page in datastore_util.IterQueryPages(freesidemodels.Member.all()):
+        members.extend([member for member in page if member.rfid is not None])
+    infos = payload_util.GetPayloadInfos(members, 'doormusic')
+
+    index = {}
+    for member, info in zip(members, infos):
+        previous = index.get(member.rfid)
+        if previous is not None:
+            logging.warning('Card %d belongs to %s and %s.',
+                            member.rfid, previous[1], member.username)
+            if previous[2] and not member.active:
+                continue
+        doormusic = None
+        if info is not None:
+            doormusic = info.sha1
+        index[member.rfid] = (str(member.key()), member.username,
+                              member.active, member.starving, doormusic)
+    return index
+
+
+def GetIndex():
+    """Gets the rfid index for the current roster generation.
+
+    The generation is only checked every GENERATION_CHECK_SECONDS, so a
+    warm instance answers from memory alone.
+
+    Returns:
+      dict, as returned by BuildIndex.
+    """
+    global _index, _index_checked
+    now = time.time()
+    if _index is not None and now - _index_checked < GENERATION_CHECK_SECONDS:
+        return _index[1]
+
+    generation = member_util.GetRosterGeneration()
+    _index_checked = now
+    if _index is None or _index[0] != generation:
+        index = memcache.get(_IndexCacheKey(generation))
+        if index is None:
+            index = BuildIndex()
+            memcache.set(_IndexCacheKey(generation), index,
+                         INDEX_CACHE_SECONDS)
+        _index = (generation, index)
+    return _index[1]
+
+
+def LookupRfid(rfid):
+    """Looks up the member holding a card.
+
+    Args:
+      rfid: int, the card number.
+    Returns:
+      dict with ENTRY_FIELDS as keys, or None for an unknown card.
+    """
+    entry = GetIndex().get(rfid)
+    if entry is None:
+        return None
+    return dict(zip(ENTRY_FIELDS, entry))
+
+
+def AddController(name):
+    """Registers a door controller.
+
+    Args:
+      name: str, describes the controller, e.g. 'front door'.
+    Returns:
+      str, the controller's secret key.  Only its hash is stored, so this
+      is the only chance to see it.
+    """
+    secret = os.urandom(16).encode('hex')
+    freesidemodels.DoorController(key_name=_SecretHash(secret), name=name).put()
+    return secret
+
+
+def IsController(secret):
+    """Determines if a secret key belongs to an active door controller.
+
+    Args:
+      secret: str, the key presented by the controller, or None.
+    Returns:
+      bool
+    """
+    if not secret:
+        return False
+    secret_hash = _SecretHash(secret)
+    if _controllers.get(secret_hash, 0) > time.time():
+        return True
+    controller = freesidemodels.DoorController.get_by_key_name(secret_hash)
+    if controller is None or not controller.active:
+        _controllers.pop(secret_hash, None)
+        return False
+    _controllers[secret_hash] = time.time() + CONTROLLER_CACHE_SECONDS
+    return True
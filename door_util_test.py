@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+"""Unittest for door_util.py"""
+
+import unittest
+
+import door_util
+import member_util
+import payload_util
+import random_util
+import test_util
+
+
+class DoorUtilTest(test_util.AppEngineTestBase):
+
+    def setUp(self):
+        test_util.AppEngineTestBase.setUp(self)
+        door_util._index = None
+        door_util._controllers = {}
+        self.orig_check_seconds = door_util.GENERATION_CHECK_SECONDS
+        door_util.GENERATION_CHECK_SECONDS = 0
+        self.member = random_util.Member()
+        self.member.rfid = 1234
+        member_util.SaveMember(self.member)
+
+    def tearDown(self):
+        door_util.GENERATION_CHECK_SECONDS = self.orig_check_seconds
+        test_util.AppEngineTestBase.tearDown(self)
+
+    def testLookup(self):
+        entry = door_util.LookupRfid(1234)
+        self.assertEquals(str(self.member.key()), entry['member_key'])
+        self.assertEquals(self.member.username, entry['username'])
+        self.assertEquals(None, entry['doormusic'])
+        self.assertEquals(None, door_util.LookupRfid(4321))
+
+    def testRosterChangesRebuildIndex(self):
+        door_util.LookupRfid(1234)
+        self.member.active = False
+        member_util.SaveMember(self.member)
+        self.assertEquals(False, door_util.LookupRfid(1234)['active'])
+
+        info = payload_util.PutPayload(self.member, 'doormusic', 'music')
+        self.assertEquals(info.sha1, door_util.LookupRfid(1234)['doormusic'])
+
+    def testUnrelatedChangesKeepGeneration(self):
+        generation = member_util.GetRosterGeneration()
+        self.member.firstname = 'Someone'
+        member_util.SaveMember(self.member)
+        self.assertEquals(generation, member_util.GetRosterGeneration())
+
+    def testWarmIndexSkipsDatastore(self):
+        door_util.GENERATION_CHECK_SECONDS = 60
+        door_util.LookupRfid(1234)
+        self.member.rfid = 99
+        member_util.SaveMember(self.member)
+        self.assertNotEquals(None, door_util.LookupRfid(1234))
+
+    def testControllers(self):
+        secret = door_util.AddController('front door')
+        self.assertTrue(door_util.IsController(secret))
+        self.assertTrue(door_util.IsController(secret))
+        self.assertFalse(door_util.IsController('bogus'))
+        self.assertFalse(door_util.IsController(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
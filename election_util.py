@@ -3,12 +3,17 @@
 """Utility functions for doing board elections."""
 
 import datetime
+import operator
 import random
+import struct
 
 from google.appengine.ext import db
 
+import counter_util
+import datastore_util
 import freesidemodels
 import member_util
+import tally_util
 
 
 class Error(Exception):
@@ -31,6 +36,36 @@ class ElectionDateError(ElectionError):
     """Raised when an election has an invalid date range."""
 
 
+class IneligibleVoterError(ElectionError):
+    """Raised when someone not on the voter roll tries to vote."""
+
+
+# Shown in results in place of a candidate who has since been deleted.
+DELETED_USERNAME = '(deleted member)'
+
+# Decoded voter rolls, keyed by election key.  Rolls never change once
+# taken, so this cache only needs to be bounded, not invalidated.
+_VOTER_ROLLS = {}
+_MAX_CACHED_ROLLS = 50
+# Moves on whenever an election is added or changes in a way the elections
+# page shows.
+_ELECTIONS_GENERATION = 'elections_generation'
+
+
+def GetElectionsGeneration():
+    """Gets a number that changes whenever any election does.
+
+    Returns:
+      int
+    """
+    return counter_util.GetCount(_ELECTIONS_GENERATION)
+
+
+def BumpElectionsGeneration():
+    """Marks elections as changed, e.g. after one is added."""
+    counter_util.Increment(_ELECTIONS_GENERATION)
+
+
 def _IsOfficerElection(election):
     """Determines if an election is an officer election.
 
@@ -53,6 +88,171 @@ def _IsBoardElection(election):
     return isinstance(election, freesidemodels.BoardElection)
 
 
+def PackVoterRoll(member_ids):
+    """Packs member ids into a voter roll blob.
+
+    Args:
+      member_ids: iterable of int.
+    Returns:
+      str, the ids sorted and packed as big-endian unsigned 64-bit integers.
+    """
+    member_ids = sorted(set(member_ids))
+    return struct.pack('>%dQ' % len(member_ids), *member_ids)
+
+
+def UnpackVoterRoll(packed):
+    """Unpacks a voter roll blob from PackVoterRoll.
+
+    Args:
+      packed: str
+    Returns:
+      tuple of int, sorted.
+    """
+    packed = packed or ''
+    return struct.unpack('>%dQ' % (len(packed) // 8), packed)
+
+
+def SnapshotVoterRoll(election):
+    """Freezes the list of eligible voters for an election.
+
+    Every active member at the time of the snapshot may vote, even if they
+    are deactivated before voting ends.  Taking a snapshot twice is a no-op.
+
+    Args:
+      election: freesidemodels.Election
+    Returns:
+      freesidemodels.Election
+    """
+    if election.voter_roll is not None:
+        return election
+
+    query = db.Query(freesidemodels.Member, keys_only=True)
+    member_ids = [key.id() for key in
+                  datastore_util.IterQuery(query.filter('active =', True))]
+    roll = db.Blob(PackVoterRoll(member_ids))
+
+    def DoSnapshot():
+        # Another request may have taken the snapshot since election was
+        # read; the first one taken is kept.
+        fresh = db.get(election.key())
+        if fresh.voter_roll is None:
+            fresh.voter_roll = roll
+            fresh.put()
+        return fresh.voter_roll
+
+    election.voter_roll = db.run_in_transaction(DoSnapshot)
+    return election
+
+
+def SnapshotOpenVoterRolls():
+    """Takes voter roll snapshots for every election that has opened voting.
+
+    Returns:
+      int, the number of snapshots taken.
+    """
+    now = datetime.datetime.now()
+    taken = 0
+    for election_type in freesidemodels.GetAllElectionTypes():
+        query = getattr(freesidemodels, election_type).all()
+        query.filter('vote_end >', now)
+        for election in datastore_util.IterQuery(query):
+            if election.vote_start <= now and election.voter_roll is None:
+                SnapshotVoterRoll(election)
+                taken += 1
+    return taken
+
+
+def IsEligibleVoter(election, person):
+    """Determines if a person is on an election's voter roll.
+
+    Args:
+      election: freesidemodels.Election, an election with a voter roll.
+      person: freesidemodels.Person
+    Returns:
+      bool
+    """
+    return person.key().id() in _GetVoterRoll(election)
+
+
+def _GetVoterRoll(election):
+    """Gets an election's decoded voter roll, cached per instance."""
+    key = election.key()
+    roll = _VOTER_ROLLS.get(key)
+    if roll is None:
+        if len(_VOTER_ROLLS) >= _MAX_CACHED_ROLLS:
+            _VOTER_ROLLS.clear()
+        roll = frozenset(UnpackVoterRoll(election.voter_roll))
+        _VOTER_ROLLS[key] = roll
+    return roll
+
+
+def _CheckVoter(election, current_user):
+    """Raises if the current user may not cast a ballot in the election."""
+    if election.voter_roll is None:
+        # The snapshot task hasn't run since voting opened.
+        SnapshotVoterRoll(election)
+
+    if not IsEligibleVoter(election, current_user):
+        raise IneligibleVoterError(
+            'You were not an active member when voting opened.')
+
+    if current_user.key() in election.voters:
+        raise ElectionError('You can only vote once per election.')
+
+
+def _TurnoutCounterName(election_key):
+    return 'turnout:%s' % election_key
+
+
+def GetTurnout(election_keys):
+    """Gets the number of ballots cast in elections.
+
+    Reads only the sharded turnout counters, never the elections.
+
+    Args:
+      election_keys: list of db.Key
+    Returns:
+      dict of db.Key to int
+    """
+    names = dict((_TurnoutCounterName(key), key) for key in election_keys)
+    counts = counter_util.GetCounts(names.keys())
+    return dict((names[name], count) for name, count in counts.iteritems())
+
+
+def GetOpenElectionKeys():
+    """Gets the keys of elections whose voting has not closed yet.
+
+    Returns:
+      list of db.Key
+    """
+    now = datetime.datetime.now()
+    keys = []
+    for election_type in freesidemodels.GetAllElectionTypes():
+        query = db.Query(getattr(freesidemodels, election_type), keys_only=True)
+        keys.extend(datastore_util.IterQuery(query.filter('vote_end >', now)))
+    return keys
+
+
+def PrimeOpenElections():
+    """Loads what voting in the open elections needs into the caches.
+
+    Decodes the voter rolls of elections whose voting has opened into this
+    instance, and reads their turnout counters into memcache.
+
+    Returns:
+      int, the number of open elections.
+    """
+    keys = GetOpenElectionKeys()
+    elections = [election for election in datastore_util.GetBatched(keys)
+                 if election is not None]
+    for election in elections:
+        if election.voter_roll is not None:
+            _GetVoterRoll(election)
+    GetTurnout(keys)
+    GetElectionsGeneration()
+    return len(elections)
+
+
 def Nominate(election, nominee, current_user):
     """Nominate a Person for an election.
 
@@ -97,6 +297,7 @@ def Nominate(election, nominee, current_user):
         raise NomineeError('Invalid nominee.')
 
     db.run_in_transaction(DoNomination)
+    BumpElectionsGeneration()
 
 
 def Vote(election, candidate, current_user):
@@ -108,17 +309,25 @@ def Vote(election, candidate, current_user):
       current_user: freesidemodels.Person, the current user.
     """
     def DoVote():
-        election.votes.append(candidate.key())
-        election.voters.append(current_user.key())
+        # Start from the stored election so a concurrent vote isn't lost.
+        fresh = db.get(election.key())
+        if current_user.key() in fresh.voters:
+            raise ElectionError('You can only vote once per election.')
+        fresh.votes.append(candidate.key())
+        fresh.voters.append(current_user.key())
         # Shuffle teh voters so they are anonymous.
-        random.shuffle(election.voters)
-        election.put()
+        random.shuffle(fresh.voters)
+        fresh.put()
+        return fresh
 
     try:
         election.key()
     except db.NotSavedError:
         raise InvalidElectionError('Invalid election.')
 
+    if election.ranked:
+        raise InvalidElectionError('Election takes ranked ballots.')
+
     now = datetime.datetime.now()
     if not election.vote_start < now < election.vote_end:
         raise ElectionDateError('Election is not accepting votes.')
@@ -126,7 +335,237 @@ def Vote(election, candidate, current_user):
     if candidate.key() not in election.nominees:
         raise NomineeError('Candidate has not been nominated.')
 
-    if current_user.key() in election.voters:
-        raise ElectionError('You can only vote once per election.')
+    _CheckVoter(election, current_user)
+
+    fresh = db.run_in_transaction(DoVote)
+    election.votes = fresh.votes
+    election.voters = fresh.voters
+    counter_util.Increment(_TurnoutCounterName(election.key()))
+    BumpElectionsGeneration()
+
+
+def VoteRanked(election, candidates, current_user):
+    """Cast a ranked ballot.
+
+    Args:
+      election: freesidemodels.Election, a ranked election to vote in.
+      candidates: list of freesidemodels.Person, in order of preference.
+      current_user: freesidemodels.Person, the current user.
+    """
+    try:
+        election.key()
+    except db.NotSavedError:
+        raise InvalidElectionError('Invalid election.')
+
+    if not election.ranked:
+        raise InvalidElectionError('Election does not take ranked ballots.')
+
+    now = datetime.datetime.now()
+    if not election.vote_start < now < election.vote_end:
+        raise ElectionDateError('Election is not accepting votes.')
+
+    ranking = []
+    for candidate in candidates:
+        if candidate.key() not in election.nominees:
+            raise NomineeError('Candidate has not been nominated.')
+        ranking.append(election.nominees.index(candidate.key()))
+    if not ranking:
+        raise NomineeError('You have not ranked any candidates.')
+
+    _CheckVoter(election, current_user)
+
+    try:
+        ballot = tally_util.PackBallot(ranking, len(election.nominees))
+    except tally_util.BallotError, e:
+        raise NomineeError(str(e))
+
+    def DoVote():
+        # Ballots are appended to one blob, so start from the stored
+        # election or a concurrent vote's ballot would be overwritten.
+        fresh = db.get(election.key())
+        if current_user.key() in fresh.voters:
+            raise ElectionError('You can only vote once per election.')
+        fresh.ranked_ballots = db.Blob((fresh.ranked_ballots or '') + ballot)
+        fresh.voters.append(current_user.key())
+        # Shuffle the voters so they are anonymous.
+        random.shuffle(fresh.voters)
+        fresh.put()
+        return fresh
+
+    fresh = db.run_in_transaction(DoVote)
+    election.ranked_ballots = fresh.ranked_ballots
+    election.voters = fresh.voters
+    counter_util.Increment(_TurnoutCounterName(election.key()))
+    BumpElectionsGeneration()
+
+
+def _Username(people, key):
+    """Gets the username of a person, or a label if they were deleted."""
+    person = people.get(key)
+    if person is None:
+        return DELETED_USERNAME
+    return person.username
+
+
+def _CountVotes(votes, people):
+    """Tallies a list of vote keys by username.
+
+    Args:
+      votes: list of db.Key, one per ballot.
+      people: dict of db.Key to freesidemodels.Person.  Votes for people
+        missing from it are counted under DELETED_USERNAME.
+    Returns:
+      list of (username, count) tuples sorted by descending count.
+    """
+    vote_totals = {}
+    for vote in votes:
+        username = _Username(people, vote)
+        vote_totals[username] = vote_totals.get(username, 0) + 1
+    return sorted(vote_totals.iteritems(),
+                  key=operator.itemgetter(1),
+                  reverse=True)
+
+
+def GetTotals(election, people=None):
+    """Gets the vote totals of an election.
+
+    Materialized results are returned as stored; otherwise the votes are
+    counted on the fly.
 
-    db.run_in_transaction(DoVote)
+    Args:
+      election: freesidemodels.Election, the election.
+      people: dict of db.Key to freesidemodels.Person, an optional
+        already-fetched map of the election's vote keys.
+    Returns:
+      list of (username, count) tuples sorted by descending count.
+    """
+    if election.results_final:
+        return zip(election.result_usernames, election.result_counts)
+    if people is None:
+        people = datastore_util.GetAsync(election.votes).get_result()
+    return _CountVotes(election.votes, people)
+
+
+def _CountRankedBallots(election):
+    """Runs the ranked count of an election.
+
+    Args:
+      election: freesidemodels.Election, a ranked election.
+    Returns:
+      (totals, winners): first-preference totals as a list of
+      (username, count) tuples sorted by descending count, and the list of
+      elected usernames in order of election.
+    """
+    nominees = election.nominees
+    result = tally_util.SingleTransferableVote(
+        tally_util.UnpackBallots(election.ranked_ballots),
+        len(nominees), seats=election.seats or 1)
+    people = datastore_util.GetAsync(nominees).get_result()
+    usernames = [_Username(people, key) for key in nominees]
+    totals = zip(usernames, result.first_preferences)
+    totals.sort(key=operator.itemgetter(1), reverse=True)
+    return totals, [usernames[i] for i in result.winners]
+
+
+def MaterializeResults(election):
+    """Stores the final totals of a closed election on the election itself.
+
+    Ranked elections are counted with tally_util here, so the elections page
+    never runs a count.
+
+    Args:
+      election: freesidemodels.Election, an election whose voting has ended.
+    Returns:
+      freesidemodels.Election
+    """
+    if election.results_final:
+        return election
+    if datetime.datetime.now() < election.vote_end:
+        raise ElectionDateError('Election is still accepting votes.')
+
+    if election.ranked:
+        totals, winners = _CountRankedBallots(election)
+        total_votes = len(election.voters)
+    else:
+        totals, winners = GetTotals(election), []
+        total_votes = len(election.votes)
+
+    def DoMaterialize():
+        election.result_usernames = [username for username, _ in totals]
+        election.result_counts = [count for _, count in totals]
+        election.total_votes = total_votes
+        election.winners = winners
+        election.results_final = True
+        election.put()
+
+    db.run_in_transaction(DoMaterialize)
+    BumpElectionsGeneration()
+    return election
+
+
+def GetArchive(election):
+    """Gets the archived ballot lists of a compacted election.
+
+    Args:
+      election: freesidemodels.Election
+    Returns:
+      freesidemodels.ElectionArchive or None
+    """
+    return freesidemodels.ElectionArchive.get_by_key_name(
+        freesidemodels.ElectionArchive.KEY_NAME, parent=election)
+
+
+def CompactElection(election):
+    """Moves the ballot lists of a finished election into an ElectionArchive.
+
+    Results are materialized first so the election keeps everything the
+    elections page needs.
+
+    Args:
+      election: freesidemodels.Election, an election whose voting has ended.
+    Returns:
+      freesidemodels.Election
+    """
+    if election.compacted:
+        return election
+    MaterializeResults(election)
+
+    def DoCompact():
+        archive = freesidemodels.ElectionArchive(
+            parent=election,
+            key_name=freesidemodels.ElectionArchive.KEY_NAME,
+            nominees=election.nominees,
+            votes=election.votes,
+            nominators=election.nominators,
+            voters=election.voters,
+            ranked_ballots=election.ranked_ballots)
+        election.ranked_ballots = None
+        election.nominees = []
+        election.votes = []
+        election.nominators = []
+        election.voters = []
+        election.compacted = True
+        db.put([archive, election])
+
+    db.run_in_transaction(DoCompact)
+    return election
+
+
+def CompactFinishedElections():
+    """Compacts every election whose voting has ended.
+
+    Returns:
+      int, the number of elections compacted.
+    """
+    now = datetime.datetime.now()
+    compacted = 0
+    for election_type in freesidemodels.GetAllElectionTypes():
+        # Elections saved before compaction existed have no 'compacted'
+        # property at all, so filter on it here rather than in the query.
+        query = getattr(freesidemodels, election_type).all()
+        for election in datastore_util.IterQuery(
+                query.filter('vote_end <', now)):
+            if not election.compacted:
+                CompactElection(election)
+                compacted += 1
+    return compacted
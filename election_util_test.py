@@ -6,10 +6,13 @@ import datetime
 import random
 import unittest
 
+from google.appengine.ext import db
+
 import freesidemodels
 import member_util
 import election_util
 import random_util
+import tally_util
 import test_util
 
 
@@ -38,11 +41,18 @@ class FunctionsTest(unittest.TestCase):
         self.assertTrue(election_util._IsBoardElection(self.board_election))
         self.assertFalse(election_util._IsBoardElection(self.officer_election))
 
+    def testPackVoterRoll(self):
+        packed = election_util.PackVoterRoll([5, 2 ** 40, 3, 5])
+        self.assertEquals(24, len(packed))
+        self.assertEquals((3, 5, 2 ** 40), election_util.UnpackVoterRoll(packed))
+        self.assertEquals((), election_util.UnpackVoterRoll(None))
+
 
 class ElectionUtilTest(test_util.AppEngineTestBase):
 
     def setUp(self):
         test_util.AppEngineTestBase.setUp(self)
+        election_util._VOTER_ROLLS.clear()
         self.people = []
         self.members = []
         self.SeedPeople()
@@ -181,15 +191,203 @@ class ElectionUtilTest(test_util.AppEngineTestBase):
         el.put()
 
         # Successful vote
+        generation = election_util.GetElectionsGeneration()
         election_util.Vote(el, self.members[0], self.members[1])
         self.assertEquals([self.members[0].key()], el.votes)
         self.assertEquals([self.members[1].key()], el.voters)
+        self.assertNotEquals(generation,
+                             election_util.GetElectionsGeneration())
 
         # Another successful vote
         election_util.Vote(el, self.members[0], self.members[2])
         self.assertEquals([self.members[0].key()] * 2, el.votes)
         self.assertTrue(self.members[2].key() in el.voters)
 
+    def MakeFinishedElection(self):
+        now = datetime.datetime.now()
+        delta = datetime.timedelta(days=1)
+        el = self.MakeElection(freesidemodels.BoardElection)
+        el.vote_end = now - delta
+        el.nominees = [self.members[0].key(), self.members[1].key()]
+        el.votes = [self.members[0].key()] * 3 + [self.members[1].key()]
+        el.voters = [m.key() for m in self.members[2:6]]
+        el.put()
+        return el
+
+    def testMaterializeResults(self):
+        el = self.MakeElection(freesidemodels.BoardElection)
+        el.put()
+        self.assertRaises(
+            election_util.ElectionDateError,
+            election_util.MaterializeResults, el)
+
+        el = self.MakeFinishedElection()
+        election_util.MaterializeResults(el)
+        el = db.get(el.key())
+        self.assertTrue(el.results_final)
+        self.assertEquals(4, el.total_votes)
+        self.assertEquals(
+            [(self.members[0].username, 3), (self.members[1].username, 1)],
+            election_util.GetTotals(el))
+
+    def testMaterializeResultsDeletedCandidate(self):
+        el = self.MakeFinishedElection()
+        self.members[1].delete()
+        election_util.MaterializeResults(el)
+        self.assertEquals(
+            [(self.members[0].username, 3),
+             (election_util.DELETED_USERNAME, 1)],
+            election_util.GetTotals(el))
+
+    def testCompactElection(self):
+        el = self.MakeFinishedElection()
+        votes = list(el.votes)
+        election_util.CompactElection(el)
+
+        el = db.get(el.key())
+        self.assertTrue(el.compacted)
+        self.assertEquals([], el.votes)
+        self.assertEquals([], el.voters)
+        self.assertEquals(4, el.total_votes)
+        self.assertEquals(votes, election_util.GetArchive(el).votes)
+
+    def testCompactFinishedElections(self):
+        self.MakeFinishedElection()
+        self.MakeElection(freesidemodels.OfficerElection).put()
+        self.assertEquals(1, election_util.CompactFinishedElections())
+        self.assertEquals(0, election_util.CompactFinishedElections())
+
+    def testVoteRanked(self):
+        el = self.MakeElection(freesidemodels.BoardElection)
+        el.nominees = [m.key() for m in self.members[:3]]
+        el.put()
+
+        # Not a ranked election
+        self.assertRaises(
+            election_util.InvalidElectionError,
+            election_util.VoteRanked,
+            el, self.members[:2], self.members[5])
+
+        el.ranked = True
+        el.put()
+        self.assertRaises(
+            election_util.InvalidElectionError,
+            election_util.Vote,
+            el, self.members[0], self.members[5])
+
+        # Candidate ranked twice
+        self.assertRaises(
+            election_util.NomineeError,
+            election_util.VoteRanked,
+            el, [self.members[0], self.members[0]], self.members[5])
+
+        election_util.VoteRanked(
+            el, [self.members[2], self.members[0]], self.members[5])
+        self.assertEquals([(2, 0)], tally_util.UnpackBallots(el.ranked_ballots))
+        self.assertEquals([self.members[5].key()], el.voters)
+
+        self.assertRaises(
+            election_util.ElectionError,
+            election_util.VoteRanked,
+            el, [self.members[1]], self.members[5])
+
+    def testVoteStaleElection(self):
+        el = self.MakeElection(freesidemodels.BoardElection)
+        el.nominees = [m.key() for m in self.members[:2]]
+        el.put()
+        stale = db.get(el.key())
+
+        election_util.Vote(el, self.members[0], self.members[5])
+        election_util.Vote(stale, self.members[1], self.members[6])
+        self.assertEquals(2, len(db.get(el.key()).votes))
+        self.assertEquals(2, len(stale.voters))
+
+        self.assertRaises(
+            election_util.ElectionError,
+            election_util.Vote,
+            el, self.members[0], self.members[6])
+
+    def testVoteRankedStaleElection(self):
+        el = self.MakeElection(freesidemodels.BoardElection)
+        el.nominees = [m.key() for m in self.members[:3]]
+        el.ranked = True
+        el.put()
+        stale = db.get(el.key())
+
+        election_util.VoteRanked(el, [self.members[0]], self.members[5])
+        election_util.VoteRanked(stale, [self.members[1]], self.members[6])
+        self.assertEquals([(0,), (1,)], tally_util.UnpackBallots(
+            db.get(el.key()).ranked_ballots))
+        self.assertEquals(2, len(stale.voters))
+
+        self.assertRaises(
+            election_util.ElectionError,
+            election_util.VoteRanked,
+            el, [self.members[2]], self.members[6])
+
+    def testMaterializeRankedResults(self):
+        el = self.MakeFinishedElection()
+        el.ranked = True
+        el.seats = 1
+        el.votes = []
+        el.nominees = [m.key() for m in self.members[:3]]
+        el.ranked_ballots = db.Blob(tally_util.PackBallots(
+            [(0,)] * 4 + [(1,)] * 3 + [(2, 1)] * 2, 3))
+        el.put()
+
+        election_util.MaterializeResults(el)
+        self.assertEquals([self.members[1].username], el.winners)
+        self.assertEquals(4, el.result_counts[0])
+
+    def testVoterRoll(self):
+        el = self.MakeElection(freesidemodels.BoardElection)
+        el.nominees.append(self.members[0].key())
+        el.put()
+        late_member = random_util.Member()
+        self.members[2].active = False
+        self.members[2].put()
+
+        election_util.SnapshotVoterRoll(el)
+        late_member.put()
+        self.members[2].active = True
+        self.members[2].put()
+
+        self.assertTrue(election_util.IsEligibleVoter(el, self.members[1]))
+        self.assertFalse(election_util.IsEligibleVoter(el, self.members[2]))
+        self.assertFalse(election_util.IsEligibleVoter(el, late_member))
+        self.assertRaises(
+            election_util.IneligibleVoterError,
+            election_util.Vote,
+            el, self.members[0], late_member)
+
+        election_util.Vote(el, self.members[0], self.members[1])
+        self.assertEquals([self.members[1].key()], el.voters)
+
+    def testSnapshotOpenVoterRolls(self):
+        self.MakeElection(freesidemodels.BoardElection).put()
+        self.assertEquals(1, election_util.SnapshotOpenVoterRolls())
+        self.assertEquals(0, election_util.SnapshotOpenVoterRolls())
+
+    def testSnapshotVoterRollKeepsFirst(self):
+        el = self.MakeElection(freesidemodels.BoardElection)
+        el.put()
+        stale = db.get(el.key())
+        election_util.SnapshotVoterRoll(el)
+        self.members[0].active = False
+        self.members[0].put()
+
+        election_util.SnapshotVoterRoll(stale)
+        self.assertEquals(el.voter_roll, stale.voter_roll)
+        self.assertTrue(election_util.IsEligibleVoter(stale, self.members[0]))
+
+    def testPrimeOpenElections(self):
+        el = self.MakeElection(freesidemodels.BoardElection)
+        el.put()
+        election_util.SnapshotVoterRoll(el)
+        election_util._VOTER_ROLLS.clear()
+        self.assertEquals(1, election_util.PrimeOpenElections())
+        self.assertEquals([el.key()], election_util._VOTER_ROLLS.keys())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+"""Caches page fragments that are the same for every user.
+
+A fragment is cached under its name and the generation of the data it
+shows, so nothing is ever invalidated: when the data changes, pages ask for
+a new generation and the old entry simply expires.
+"""
+
+import hashlib
+
+from google.appengine.api import memcache
+
+
+CACHE_SECONDS = 24 * 60 * 60
+
+
+def _CacheKey(name, generation):
+    return 'fragment:%s:%s' % (name, generation)
+
+
+def Generation(*parts):
+    """Makes a generation from the values a fragment is built from.
+
+    Args:
+      parts: values with a stable repr(), e.g. strings, numbers, dates and
+        lists of those.
+    Returns:
+      str
+    """
+    return hashlib.sha1(repr(parts)).hexdigest()
+
+
+def GetFragments(specs):
+    """Gets several fragments with one memcache round trip.
+
+    Args:
+      specs: list of (name, generation, build) where build is a callable
+        that returns the fragment (usually rendered HTML, but any value
+        memcache can store) when it isn't cached.
+    Returns:
+      list of fragments, in the same order as specs.
+    """
+    keys = [_CacheKey(name, generation) for name, generation, _ in specs]
+    cached = memcache.get_multi(keys)
+    fragments = []
+    built = {}
+    for key, (_, _, build) in zip(keys, specs):
+        if key in cached:
+            fragments.append(cached[key])
+        else:
+            fragment = build()
+            built[key] = fragment
+            fragments.append(fragment)
+    if built:
+        memcache.set_multi(built, time=CACHE_SECONDS)
+    return fragments
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+
+"""Unittest for fragment_util.py"""
+
+import unittest
+
+import fragment_util
+import test_util
+
+
+class FragmentUtilTest(test_util.AppEngineTestBase):
+
+    def setUp(self):
+        test_util.AppEngineTestBase.setUp(self)
+        self.builds = []
+
+    def Build(self, value):
+        def DoBuild():
+            self.builds.append(value)
+            return value
+        return DoBuild
+
+    def testCachedUntilGenerationChanges(self):
+        first = fragment_util.Generation('a', [1, 2])
+        self.assertEquals(first, fragment_util.Generation('a', [1, 2]))
+        self.assertEquals(['x'], fragment_util.GetFragments(
+            [('f', first, self.Build('x'))]))
+        self.assertEquals(['x'], fragment_util.GetFragments(
+            [('f', first, self.Build('y'))]))
+        self.assertEquals(['x'], self.builds)
+
+        second = fragment_util.Generation('a', [1, 2, 3])
+        self.assertEquals(['z', 'x'], fragment_util.GetFragments(
+            [('f', second, self.Build('z')), ('f', first, self.Build('w'))]))
+        self.assertEquals(['x', 'z'], self.builds)
+
+
+if __name__ == '__main__':
+    unittest.main()
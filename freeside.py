@@ -2,32 +2,155 @@
 
 """Main web handlers."""
 
+import import_util
+# Must come before the imports it is meant to time.
+if import_util.ENABLED:
+  import_util.Install()
+
+import calendar
 import datetime
+import email.utils
 import logging
-import operator
 import os
-import random
+import re
 import sys
+import time
 import urllib
 
-from google.appengine.api import mail
 from google.appengine.ext import webapp
 from google.appengine.ext import db
 from google.appengine.ext.webapp import template
 from google.appengine.ext.webapp import util
 
+from django.utils import simplejson
+
 from appengine_utilities.sessions import Session
 
-import election_util
+import activity_util
+import asset_util
+import datastore_util
+import fragment_util
 import freesidemodels
 import member_util
+import route_util
 import timezones
 
+# Only needed by mail, door, upload, election and admin requests, so they are
+# imported by the first request that uses them rather than on every cold
+# start.  Warmup loads them all.
+mail = import_util.LazyModule('google.appengine.api.mail')
+access_util = import_util.LazyModule('access_util')
+door_util = import_util.LazyModule('door_util')
+election_util = import_util.LazyModule('election_util')
+payload_util = import_util.LazyModule('payload_util')
+picture_util = import_util.LazyModule('picture_util')
+roster_util = import_util.LazyModule('roster_util')
+LAZY_MODULES = (mail, access_util, door_util, election_util, payload_util,
+                picture_util, roster_util)
+
+
+# Provides {% asset %} and {% route %} to every template.
+template.register_template_library('asset_tags')
+template.register_template_library('route_tags')
+
 
 class Error(Exception):
   """Base error class for this module."""
 
 
+class RangeNotSatisfiableError(Error):
+  """Raised when a requested byte range lies past the end of the content."""
+
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def ParseRange(header, size):
+  """Parses a single-range HTTP Range header.
+
+  Args:
+    header: str, the Range header, or None.
+    size: int, length of the content in bytes.
+  Returns:
+    (start, end) with end inclusive, or None if the whole content should be
+    sent, e.g. when the header is missing, malformed or asks for several
+    ranges.
+  Raises:
+    RangeNotSatisfiableError: if the range starts past the end.
+  """
+  match = _RANGE_RE.match((header or '').strip())
+  if not match:
+    return None
+  first, last = match.groups()
+  if not first:
+    if not last:
+      return None
+    suffix = int(last)
+    if suffix == 0:
+      raise RangeNotSatisfiableError(header)
+    start, end = max(0, size - suffix), size - 1
+  else:
+    start = int(first)
+    end = size - 1
+    if last:
+      end = min(int(last), end)
+      if int(last) < start:
+        return None
+  if start >= size:
+    raise RangeNotSatisfiableError(header)
+  return start, end
+
+
+def HttpDate(dt):
+  """Formats a UTC datetime for Last-Modified and similar headers."""
+  return email.utils.formatdate(calendar.timegm(dt.utctimetuple()),
+                                usegmt=True)
+
+
+def GetTemplate(template_name):
+  """Gets a compiled template from the templates directory.
+
+  template.load keeps compiled templates for the life of the instance, so
+  each one is only parsed once.
+
+  Args:
+    template_name: str, e.g. 'vote.html'
+  Returns:
+    compiled template, see RenderCompiled.
+  """
+  return template.load(os.path.join('templates', template_name))
+
+
+def RenderCompiled(compiled, template_values):
+  """Renders a template from GetTemplate with a dict of values."""
+  return compiled.render(template.Context(template_values))
+
+
+def TemplateNames():
+  """Lists every template, relative to the templates directory."""
+  names = []
+  for directory, _, files in os.walk('templates'):
+    for name in files:
+      if name.endswith('.html'):
+        names.append(os.path.join(directory, name)[len('templates') + 1:])
+  names.sort()
+  return names
+
+
+def RenderFragment(template_name, template_values):
+  """Renders a template from templates/fragments without page chrome."""
+  return RenderCompiled(
+    GetTemplate(os.path.join('fragments', template_name)), template_values)
+
+
+def ParseHttpDate(value):
+  """Parses an HTTP date into seconds since the epoch, or None."""
+  parsed = email.utils.parsedate_tz(value or '')
+  if parsed is None:
+    return None
+  return email.utils.mktime_tz(parsed)
+
+
 def set_trace():
   """Hack to make pdb work with AppEngine SDK."""
   for attr in ('stdin', 'stdout', 'stderr'):
@@ -46,7 +169,7 @@ def RedirectIfUnauthorized(fn):
   """
   def MaybeRedirect(self, *args, **kwargs):
     if not self.CheckAuth():
-      self.redirect('/login')
+      self.redirect(route_util.Url('login'))
     else:
       return fn(self, *args, **kwargs)
 
@@ -65,7 +188,7 @@ def RedirectIfNotAdmin(fn):
   """
   def MaybeRedirect(self, *args, **kwargs):
     if not self.CheckAdmin():
-      self.redirect('/home')
+      self.redirect(route_util.Url('home'))
     else:
       return fn(self, *args, **kwargs)
 
@@ -74,12 +197,26 @@ def RedirectIfNotAdmin(fn):
   return MaybeRedirect
 
 
+# Cache policies for FreesideHandler.cache_policy.  Pages with forms and
+# one-off error messages are never stored; pages with an ETag may be stored
+# but are revalidated on every view.
+NO_STORE = 'no-store'
+REVALIDATE = 'private, no-cache'
+
+
 class FreesideHandler(webapp.RequestHandler):
   """Request Handler with some common functions."""
 
-  def __init__(self):
-    super(FreesideHandler, self).__init__()
-    self.session = Session()
+  # Cache-Control policy of the handler's pages, or None for handlers that
+  # set their own caching headers.
+  cache_policy = NO_STORE
+
+  def initialize(self, request, response):
+    super(FreesideHandler, self).initialize(request, response)
+    # The session reads its cookies from this request and sets headers on
+    # this response only, so handlers keep no state between requests.
+    self.session = Session(request, response,
+                           no_cache=self.cache_policy == NO_STORE)
 
   user = property(lambda self: self.session['user'])
 
@@ -97,14 +234,15 @@ class FreesideHandler(webapp.RequestHandler):
   def GetSideBar(self):
     """Generate the sidebar list."""
     sidebar = [
-        {'name': 'Home', 'path': '/home'},
-        {'name': 'Members', 'path': '/members'},
-        {'name': 'Elections', 'path': '/elections'},
-        {'name': 'Dues', 'path': '/dues'},
+        {'name': 'Home', 'path': route_util.Url('home')},
+        {'name': 'Members', 'path': route_util.Url('members')},
+        {'name': 'Elections', 'path': route_util.Url('elections')},
+        {'name': 'Dues', 'path': route_util.Url('dues')},
     ]
     if self.CheckAdmin():
-      sidebar.append({'name': 'Admin', 'path': '/admin'})
-      sidebar.append({'name': 'Admin Dues', 'path': '/admindues'})
+      sidebar.append({'name': 'Admin', 'path': route_util.Url('admin')})
+      sidebar.append({'name': 'Admin Dues',
+                      'path': route_util.Url('admindues')})
 
     for page in sidebar:
       page['selected'] = page['path'] in self.request.path
@@ -124,12 +262,36 @@ class FreesideHandler(webapp.RequestHandler):
     if 'error' in self.session: del self.session['error']
 
     if self.CheckAuth():
+      activity_util.RecordSeen(self.session['user'].key())
       template_values['admin'] = self.CheckAdmin()
       template_values['sidebar'] = self.GetSideBar()
       template_values['user'] = self.session['user']
 
-    template_path = os.path.join('templates', template_name)
-    self.response.out.write(template.render(template_path, template_values))
+    self.response.out.write(
+      RenderCompiled(GetTemplate(template_name), template_values))
+
+  def NotModified(self, *parts):
+    """Sets an ETag for the page and checks the browser's copy against it.
+
+    The ETag covers the deployed version, the user and anything else the
+    page chrome shows, plus parts, which should identify the data the page
+    is built from.  Call it before doing any work the page needs.
+
+    Args:
+      parts: values with a stable repr(), e.g. data generations.
+    Returns:
+      bool, True if the browser's copy is current and a 304 was set.
+    """
+    user = self.session['user']
+    etag = '"%s"' % fragment_util.Generation(
+      os.environ.get('CURRENT_VERSION_ID'), str(user.key()), user.admin,
+      self.error_msg, *parts)
+    self.response.headers['ETag'] = etag
+    self.response.headers['Cache-Control'] = self.cache_policy
+    if etag in self.request.headers.get('If-None-Match', ''):
+      self.response.set_status(304)
+      return True
+    return False
 
   def CheckAuth(self):
     """Determines if the current user has logged in.
@@ -155,11 +317,7 @@ class LoginPage(FreesideHandler):
     self.RenderTemplate('login.html', {})
 
   def post(self):
-    username = self.request.get('username')
-    user = member_util.GetMemberByUsername(username)
-    if not user:
-      # Try finding user by email.
-      user = member_util.GetMemberByEmail(self.request.get(username))
+    user = member_util.GetMemberByLogin(self.request.get('username'))
 
     hashedpass = freesidemodels.Person.EncryptPassword(
       self.request.get('password'))
@@ -167,13 +325,13 @@ class LoginPage(FreesideHandler):
     if user:
       if hashedpass == user.password:
         self.session['user'] = user
-        self.redirect('/home')
+        self.redirect(route_util.Url('home'))
       else:
         self.error_msg = 'Incorrect password.'
-        self.redirect('/login')
+        self.redirect(route_util.Url('login'))
     else:
       self.error_msg = 'Invalid username.'
-      self.redirect('/login')
+      self.redirect(route_util.Url('login'))
 
 
 class AdminPage(FreesideHandler):
@@ -183,6 +341,7 @@ class AdminPage(FreesideHandler):
     'AddMember': 'Add Member',
     'AddElection': 'Add Election',
     'ResetPassword': 'Reset Password',
+    'AddDoorController': 'Add Door Controller',
   }
   electiontypes = freesidemodels.GetAllElectionTypes()
   positions = ['President', 'Treasurer', 'Secretary', 'Board Member']
@@ -202,21 +361,37 @@ class AdminPage(FreesideHandler):
       self.RenderTemplate('error.html', template_values)
       return
     member_util.ResetAndEmailPassword(member)
-    self.redirect('/admin?&task=ResetPassword')
+    self.redirect(route_util.Url('admin') + '?&task=ResetPassword')
 
   def AddMember(self):
     """Add a new member to the database."""
     #member_dict = dict(
     #  (p, self.request.get(p)) for p, cls in freesidemodels.Member._properties)
-    member = member_util.SaveMember(
-      member_util.MakeMember(
-        username=self.request.get('username'),
-        firstname=self.request.get('firstname'),
-        lastname=self.request.get('lastname'),
-        email=self.request.get('email'),
-        password=self.request.get('password'),
-        starving=self.request.get('starving') == 'True'))
-    self.redirect('/admin')
+    try:
+      member = member_util.SaveMember(
+        member_util.MakeMember(
+          username=self.request.get('username'),
+          firstname=self.request.get('firstname'),
+          lastname=self.request.get('lastname'),
+          email=self.request.get('email'),
+          password=self.request.get('password'),
+          starving=self.request.get('starving') == 'True'))
+    except member_util.DuplicateError, e:
+      self.RenderTemplate('error.html', {'errortxt': str(e)})
+      return
+    self.redirect(route_util.Url('admin'))
+
+  def AddDoorController(self):
+    """Registers a door controller and shows its key once."""
+    name = self.request.get('name')
+    if not name:
+      self.RenderTemplate('error.html', {'errortxt': 'A name is required.'})
+      return
+    self.RenderTemplate('admin.html', {
+      'admintask': 'AddDoorController',
+      'controller_name': name,
+      'controller_key': door_util.AddController(name),
+      })
 
   def _ParseDate(self, date_str, tzinfo=timezones.Eastern()):
     """Parses a date string in format "MM/DD/YYYY".
@@ -252,9 +427,12 @@ class AdminPage(FreesideHandler):
       nominate_end=nominate_end,
       vote_start=vote_start,
       vote_end=vote_end,
+      ranked=self.request.get('ranked') == 'True',
+      seats=int(self.request.get('seats') or 1),
       description=self.request.get('description'))
     new_election.put()
-    self.redirect('/admin')
+    election_util.BumpElectionsGeneration()
+    self.redirect(route_util.Url('admin'))
 
   @RedirectIfUnauthorized
   @RedirectIfNotAdmin
@@ -266,8 +444,7 @@ class AdminPage(FreesideHandler):
       'positions': self.positions,
       }
     if template_values['admintask'] == 'ResetPassword':
-      members = sorted(member_util.GetActiveMembers(), key=lambda m: m.username)
-      template_values['members'] = members
+      template_values['members'] = member_util.GetActiveSummaries()
     self.RenderTemplate('admin.html', template_values)
 
   @RedirectIfUnauthorized
@@ -305,30 +482,53 @@ class HomePage(FreesideHandler):
 class MembersList(FreesideHandler):
   """The Members List."""
 
+  cache_policy = REVALIDATE
+
   @RedirectIfUnauthorized
   def get(self):
-    members = sorted(member_util.GetActiveMembers(), key=lambda m: m.username)
-    self.RenderTemplate('members.html', {'members': members})
+    generation = member_util.GetSummaryGeneration()
+    if self.NotModified('members', generation):
+      return
+    table = fragment_util.GetFragments([self.TableSpec(generation)])[0]
+    self.RenderTemplate('members.html', {'members_table': table})
+
+  @staticmethod
+  def TableSpec(generation):
+    """Gets the fragment_util spec of the members table."""
+    return ('members', generation, lambda: RenderFragment(
+      'members_table.html', {'members': member_util.GetActiveSummaries()}))
 
 
 class Profile(FreesideHandler):
   """Display the details about a member."""
 
+  cache_policy = REVALIDATE
+
   @RedirectIfUnauthorized
   def get(self, username):
     """Shows details about a member."""
-    member = member_util.GetMemberByUsername(urllib.unquote(username))
-    if not member:
-      self.redirect('/members')
+    member = last_seen = None
+    member_key = member_util.GetMemberKeyByUsername(urllib.unquote(username))
+    if member_key is not None:
+      member, last_seen = db.get(
+        [member_key, activity_util.LastSeenKey(member_key)])
+    if not member or not member.active:
+      self.redirect(route_util.Url('members'))
       return
+    if last_seen is not None:
+      last_seen = last_seen.seen
 
-    user = self.session['user']
     edit = self.request.get('mode') == 'edit'
+    if self.NotModified('profile', member.updated, last_seen, edit):
+      return
+
+    user = self.session['user']
     canedit = user.key() == member.key() or user.admin
 
     self.RenderTemplate(
       'profile.html',
-      {'member': member, 'canedit': canedit, 'edit': edit})
+      {'member': member, 'canedit': canedit, 'edit': edit,
+       'last_seen': last_seen})
 
   @RedirectIfUnauthorized
   def post(self, username):
@@ -357,107 +557,481 @@ class Profile(FreesideHandler):
 
     newusername = self.request.get('username')
     if newusername != member.username:
-      if member_util.GetMemberByUsername(newusername) is None:
+      if member_util.IsUsernameAvailable(newusername, member):
         member.username = newusername
       else:
         template_values = {'errortxt': 'Requested username is already in use.'}
         self.RenderTemplate('error.html', template_values)
         return
 
-    member_util.SaveIfChanged(member)
-    self.redirect('/members/%s' % member.username)
+    picture = self.request.get('picture')
+    if picture:
+      try:
+        picture_util.SavePicture(member, picture)
+      except picture_util.InvalidPictureError, e:
+        self.RenderTemplate('error.html', {'errortxt': str(e)})
+        return
+
+    try:
+      member_util.SaveIfChanged(member)
+    except member_util.DuplicateError, e:
+      self.RenderTemplate('error.html', {'errortxt': str(e)})
+      return
+    self.redirect(route_util.Url('profile', member.username))
+
+
+class MemberPicture(FreesideHandler):
+  """Serves a member's picture or one of its thumbnails."""
+
+  cache_policy = None
+  # Picture URLs that carry the content hash never change.
+  VERSIONED_MAX_AGE = 365 * 24 * 60 * 60
+  MAX_AGE = 60 * 60
+
+  @RedirectIfUnauthorized
+  def get(self, username):
+    size = self.request.get('size') or 'full'
+    if size not in picture_util.SIZE_PAYLOADS:
+      self.error(400)
+      return
+
+    member_key = member_util.GetMemberKeyByUsername(urllib.unquote(username))
+    info = None
+    if member_key is not None:
+      info = picture_util.GetPictureInfo(member_key, size)
+    if info is None:
+      self.error(404)
+      return
+
+    etag = '"%s"' % info.sha1
+    if self.request.get('v') == info.sha1:
+      max_age = self.VERSIONED_MAX_AGE
+    else:
+      max_age = self.MAX_AGE
+    self.response.headers['ETag'] = etag
+    self.response.headers['Cache-Control'] = 'private, max-age=%d' % max_age
+    if etag in self.request.headers.get('If-None-Match', ''):
+      self.response.set_status(304)
+      return
+
+    self.response.headers['Content-Type'] = str(info.content_type)
+    for chunk in payload_util.GetChunks(info):
+      self.response.out.write(chunk)
+
+
+class MemberFile(FreesideHandler):
+  """Downloads and chunked uploads of a member's door music or waiver.
+
+  GET serves the file, honoring Range, If-Range, If-None-Match and
+  If-Modified-Since.  Door controllers may fetch door music by sending
+  their key in an X-Door-Key header instead of logging in.  Files are
+  served as attachments with a fixed type per file.  Uploads take several
+  requests, so no single request carries the whole file:
+
+    POST                          -> {"upload": id, "chunk_size": bytes}
+    PUT ?upload=id&chunk=i        body is chunk i, chunk_size bytes except
+                                  for the last one
+    POST ?upload=id&chunks=n      -> {"size": bytes, "sha1": hex}
+  """
+
+  cache_policy = None
+  # Files are always served as these types, whatever the uploader claimed,
+  # so an upload can't be served back as a page that runs script.
+  CONTENT_TYPES = {
+    'doormusic': 'audio/mpeg',
+    'liabilitypdf': 'application/pdf',
+  }
+  FILE_NAMES = {
+    'doormusic': 'doormusic.mp3',
+    'liabilitypdf': 'liability.pdf',
+  }
+
+  def _GetMemberKey(self, username, name=None):
+    """Gets the member owning the file, if the user may access it."""
+    member_key = member_util.GetMemberKeyByUsername(urllib.unquote(username))
+    if member_key is None:
+      self.error(404)
+      return None
+    if (name in payload_util.ROSTER_PAYLOAD_NAMES and
+        door_util.IsController(self.request.headers.get('X-Door-Key'))):
+      return member_key
+    if not self.CheckAuth():
+      self.redirect(route_util.Url('login'))
+      return None
+    user = self.session['user']
+    if member_key != user.key() and not user.admin:
+      self.error(403)
+      return None
+    return member_key
+
+  def _NotModified(self, info, etag):
+    if_none_match = self.request.headers.get('If-None-Match')
+    if if_none_match:
+      return etag in if_none_match or if_none_match.strip() == '*'
+    since = ParseHttpDate(self.request.headers.get('If-Modified-Since'))
+    return (since is not None and
+            calendar.timegm(info.updated.utctimetuple()) <= since)
+
+  def _WriteJson(self, values):
+    self.response.headers['Content-Type'] = 'application/json'
+    self.response.out.write(simplejson.dumps(values))
+
+  def get(self, username, name):
+    member_key = self._GetMemberKey(username, name)
+    if member_key is None:
+      return
+    info = payload_util.GetPayloadInfo(member_key, name)
+    if info is None:
+      self.error(404)
+      return
+
+    etag = '"%s"' % info.sha1
+    self.response.headers['ETag'] = etag
+    self.response.headers['Last-Modified'] = HttpDate(info.updated)
+    self.response.headers['Cache-Control'] = 'private, max-age=0'
+    self.response.headers['Accept-Ranges'] = 'bytes'
+    if self._NotModified(info, etag):
+      self.response.set_status(304)
+      return
+
+    byte_range = None
+    if_range = self.request.headers.get('If-Range')
+    if not if_range or if_range == etag:
+      try:
+        byte_range = ParseRange(self.request.headers.get('Range'), info.size)
+      except RangeNotSatisfiableError:
+        self.response.set_status(416)
+        self.response.headers['Content-Range'] = 'bytes */%d' % info.size
+        return
+
+    self.response.headers['Content-Type'] = self.CONTENT_TYPES[name]
+    self.response.headers['Content-Disposition'] = (
+      'attachment; filename="%s"' % self.FILE_NAMES[name])
+    self.response.headers['X-Content-Type-Options'] = 'nosniff'
+    if byte_range is None:
+      chunks = payload_util.GetChunks(info)
+    else:
+      start, end = byte_range
+      self.response.set_status(206)
+      self.response.headers['Content-Range'] = 'bytes %d-%d/%d' % (
+          start, end, info.size)
+      chunks = payload_util.GetRange(info, start, end)
+    for chunk in chunks:
+      self.response.out.write(chunk)
+
+  @RedirectIfUnauthorized
+  def post(self, username, name):
+    """Starts an upload, or finishes one if given its id."""
+    member_key = self._GetMemberKey(username)
+    if member_key is None:
+      return
+    if not self.request.get('upload'):
+      generation = payload_util.StartUpload(member_key, name)
+      self._WriteJson(
+        {'upload': generation, 'chunk_size': payload_util.CHUNK_SIZE})
+      return
+
+    try:
+      info = payload_util.FinishUpload(
+          member_key, name, int(self.request.get('upload')),
+          int(self.request.get('chunks')), self.CONTENT_TYPES[name])
+    except ValueError:
+      self.error(400)
+      return
+    except payload_util.StaleUploadError:
+      self.error(409)
+      return
+    except payload_util.UploadError, e:
+      self.error(400)
+      self.response.out.write(str(e))
+      return
+    self._WriteJson({'size': info.size, 'sha1': info.sha1})
+
+  @RedirectIfUnauthorized
+  def put(self, username, name):
+    """Stores one chunk of an upload."""
+    member_key = self._GetMemberKey(username)
+    if member_key is None:
+      return
+    try:
+      payload_util.PutUploadChunk(
+          member_key, name, int(self.request.get('upload')),
+          int(self.request.get('chunk')), self.request.body)
+    except ValueError:
+      self.error(400)
+    except payload_util.UploadError, e:
+      self.error(400)
+      self.response.out.write(str(e))
+
+
+class RfidLookup(webapp.RequestHandler):
+  """JSON card lookup for door controllers, which send an X-Door-Key."""
+
+  def get(self, rfid):
+    if not door_util.IsController(self.request.headers.get('X-Door-Key')):
+      self.error(403)
+      return
+    entry = door_util.LookupRfid(int(rfid))
+    if entry is None:
+      self.error(404)
+      return
+    activity_util.RecordSeen(entry['member_key'])
+    if entry['doormusic']:
+      entry['doormusic'] = '%s?v=%s' % (
+          route_util.Url('memberfile', entry['username'], 'doormusic'),
+          entry['doormusic'])
+    entry['rfid'] = int(rfid)
+    self.response.headers['Content-Type'] = 'application/json'
+    self.response.out.write(simplejson.dumps(entry))
+
+
+class RosterSync(webapp.RequestHandler):
+  """Roster snapshots and deltas for door controllers, see roster_util.
+
+  Without parameters the whole roster is sent; with ?since=<version> only
+  the members changed after that version are.
+  """
+
+  def get(self):
+    if not door_util.IsController(self.request.headers.get('X-Door-Key')):
+      self.error(403)
+      return
+    since = self.request.get('since')
+    if since:
+      try:
+        version, data = roster_util.BuildDelta(int(since))
+      except (ValueError, OverflowError):
+        self.error(400)
+        return
+    else:
+      version, data = roster_util.GetSnapshot()
+    self.response.headers['Content-Type'] = 'application/octet-stream'
+    self.response.headers['X-Roster-Version'] = str(version)
+    self.response.out.write(data)
+
+
+class AccessEvents(webapp.RequestHandler):
+  """Batched door access events from controllers, see access_util.
+
+  The body is JSON: {"events": [[timestamp, rfid, granted], ...]}.
+  """
+
+  def post(self):
+    if not door_util.IsController(self.request.headers.get('X-Door-Key')):
+      self.error(403)
+      return
+    try:
+      events = simplejson.loads(self.request.body)['events']
+      written = access_util.Ingest(events)
+    except (ValueError, KeyError, TypeError, access_util.EventError), e:
+      self.error(400)
+      self.response.out.write(str(e))
+      return
+    self.response.headers['Content-Type'] = 'application/json'
+    self.response.out.write(simplejson.dumps(
+      {'accepted': len(events), 'buckets': written}))
+
+
+class AccessUsage(FreesideHandler):
+  """JSON door usage of every member on a day, for admins."""
+
+  @RedirectIfUnauthorized
+  @RedirectIfNotAdmin
+  def get(self):
+    try:
+      day = datetime.datetime.strptime(self.request.get('day'), '%Y-%m-%d')
+    except ValueError:
+      self.error(400)
+      return
+    rollups = access_util.GetDailyRollups(day.date())
+    summaries = member_util.GetSummaries(
+      [freesidemodels.AccessRollup.member.get_value_for_datastore(rollup)
+       for rollup in rollups])
+    usage = []
+    for rollup, summary in zip(rollups, summaries):
+      usage.append({
+        'username': summary and summary.username,
+        'granted': rollup.granted,
+        'denied': rollup.denied,
+        'first': HttpDate(rollup.first),
+        'last': HttpDate(rollup.last),
+        })
+    self.response.headers['Content-Type'] = 'application/json'
+    self.response.out.write(simplejson.dumps(
+      {'day': self.request.get('day'), 'usage': usage}))
 
 
 class Elections(FreesideHandler):
   """Serve the voting page."""
 
+  cache_policy = REVALIDATE
+
   def _GetActiveElections(self, election_type):
+    """Starts a query for elections that are still open.
+
+    Returns:
+      datastore_util.QueryFuture
+    """
     if election_type not in freesidemodels.GetAllElectionTypes():
       raise Error('Invalid election type')
 
-    return getattr(freesidemodels, election_type).all().filter(
-      'vote_end >=', datetime.datetime.now(timezones.UTC())).fetch(1000)
+    return datastore_util.QueryAsync(
+      getattr(freesidemodels, election_type).all().filter(
+        'vote_end >=', datetime.datetime.now(timezones.UTC())))
 
   def _GetPreviousElections(self, election_type):
+    """Starts a query for elections whose voting has closed.
+
+    Returns:
+      datastore_util.QueryFuture
+    """
     if election_type not in freesidemodels.GetAllElectionTypes():
       raise Error('Invalid election type')
 
-    return getattr(freesidemodels, election_type).all().filter(
-      'vote_end <', datetime.datetime.now(timezones.UTC())).fetch(1000)
+    return datastore_util.QueryAsync(
+      getattr(freesidemodels, election_type).all().filter(
+        'vote_end <', datetime.datetime.now(timezones.UTC())))
 
   @RedirectIfUnauthorized
   def get(self):
+    """Shows the elections.
+
+    Everything but the nomination and ballot forms is the same for every
+    user, so it is rendered once per generation of the election and the
+    member summaries, and served from fragment_util after that.  Nominees,
+    votes and members are only fetched to build fragments that aren't
+    cached.
+    """
     now = datetime.datetime.now(timezones.UTC())
-    current_elections = map(
-      self._GetActiveElections, freesidemodels.GetAllElectionTypes())
-    previous_elections = map(
-      self._GetPreviousElections, freesidemodels.GetAllElectionTypes())
+    summary_generation = member_util.GetSummaryGeneration()
+    # Elections change state on their dates, so the page does too.
+    if self.NotModified('elections', summary_generation,
+                        election_util.GetElectionsGeneration(),
+                        now.strftime('%Y%m%d%H')):
+      return
+    election_types = freesidemodels.GetAllElectionTypes()
+
+    # Start every independent query before waiting on any of them.
+    current_futures = map(self._GetActiveElections, election_types)
+    previous_futures = map(self._GetPreviousElections, election_types)
 
     # Flatten the elections lists
     current_elections = [
-      election for elections in current_elections for election in elections]
+      election for elections in datastore_util.WaitAll(current_futures)
+      for election in elections]
     previous_elections = [
-      election for elections in previous_elections for election in elections]
-
-    voting = []
-    nominating = []
-    ended = []
-    user = self.session['user']
-
-    # Sort current elections by voting and nominating
+      election for elections in datastore_util.WaitAll(previous_futures)
+      for election in elections]
+
+    loaded = {}
+    def GetPeople():
+      # Every nominee and every vote is resolved in a single batch get.
+      if 'people' not in loaded:
+        loaded['people'] = datastore_util.GetAsync(
+          [key for election in current_elections
+           for key in election.nominees] +
+          [key for election in previous_elections
+           if not election.results_final
+           for key in election.votes]).get_result()
+      return loaded['people']
+
+    def GetMembers():
+      if 'members' not in loaded:
+        loaded['members'] = member_util.GetActiveSummaries()
+      return loaded['members']
+
+    def Nominees(election):
+      people = GetPeople()
+      return [people[key] for key in election.nominees if key in people]
+
+    def Eligible(election):
+      return [(str(member.member_key()), member.username)
+              for member in GetMembers()
+              if member.member_key() not in election.nominees]
+
+    # Fragment specs, and for each election what the page needs of them.
+    specs = []
+    pages = []
     for election in current_elections:
+      key = str(election.key())
       nominate_start = election.nominate_start.replace(tzinfo=timezones.UTC())
       nominate_end = election.nominate_end.replace(tzinfo=timezones.UTC())
       vote_start = election.vote_start.replace(tzinfo=timezones.UTC())
       vote_end = election.vote_end.replace(tzinfo=timezones.UTC())
+      generation = fragment_util.Generation(
+        key, summary_generation, election.position, election.ranked,
+        election.nominate_end, election.vote_end, map(str, election.nominees))
 
       if nominate_start < now < nominate_end:
-        eligible = []
-        nominees = []
-        has_nominated = user.key() in election.nominators
-        for member in member_util.GetActiveMembers():
-          if member.key() not in election.nominees and member.key() != user.key():
-            eligible.append(member)
+        nominate_end = nominate_end.astimezone(timezones.Eastern())
+        specs.append(('nominating:' + key, generation,
+                      lambda e=election, end=nominate_end: RenderFragment(
+                        'election_nominating.html',
+                        {'election': e, 'nominate_end': end,
+                         'nominees': Nominees(e)})))
+        specs.append(('eligible:' + key, generation,
+                      lambda e=election: Eligible(e)))
+        pages.append(('nominating', election, 2))
+      elif vote_start < now < vote_end:
+        vote_end = vote_end.astimezone(timezones.Eastern())
+        specs.append(('voting:' + key, generation,
+                      lambda e=election, end=vote_end: RenderFragment(
+                        'election_voting.html',
+                        {'election': e, 'vote_end': end,
+                         'eligible': Nominees(e)})))
+        specs.append(('ballot:' + key, generation,
+                      lambda e=election: RenderFragment(
+                        'election_ballot.html',
+                        {'election': e, 'eligible': Nominees(e)})))
+        pages.append(('voting', election, 2))
 
-        for nomineekey in election.nominees:
-          nominees.append(db.get(nomineekey))
+    for election in previous_elections:
+      if election.ranked and not election.results_final:
+        # Ranked ballots have no totals until they are counted, so count
+        # them on the first view after voting ends rather than waiting for
+        # the compaction task.
+        election_util.MaterializeResults(election)
+      key = str(election.key())
+      vote_end = election.vote_end.replace(
+        tzinfo=timezones.UTC()).astimezone(timezones.Eastern())
+      generation = fragment_util.Generation(
+        key, summary_generation, election.position, election.vote_end,
+        election.results_final,
+        election.compacted, len(election.votes),
+        len(election.ranked_ballots or ''), election.winners)
+      specs.append(('ended:' + key, generation,
+                    lambda e=election, end=vote_end: RenderFragment(
+                      'election_ended.html',
+                      {'election': e, 'vote_end': end,
+                       'totals': election_util.GetTotals(e, GetPeople()),
+                       'winners': e.winners})))
+      pages.append(('ended', election, 1))
+
+    fragments = fragment_util.GetFragments(specs)
 
+    voting = []
+    nominating = []
+    ended = []
+    user = self.session['user']
+    position = 0
+    for status, election, count in pages:
+      shared = fragments[position:position + count]
+      position += count
+      if status == 'nominating':
         nominating.append(
             {'election': election,
-             'eligible': eligible,
-             'nominate_end': nominate_end.astimezone(timezones.Eastern()),
-             'nominees': nominees,
-             'has_nominated': has_nominated})
-      elif vote_start < now < vote_end:
-        eligible = []
-        has_voted = user.key() in election.voters
-        for nominee in election.nominees:
-            eligible.append(db.get(nominee))
-
+             'shared': shared[0],
+             'eligible': [member for member in shared[1]
+                          if member[0] != str(user.key())],
+             'has_nominated': user.key() in election.nominators})
+      elif status == 'voting':
         voting.append(
             {'election': election,
-             'eligible': eligible,
-             'has_voted': has_voted,
-             'vote_end': vote_end.astimezone(timezones.Eastern())})
-
-    for election in previous_elections:
-      vote_end = election.vote_end.replace(tzinfo=timezones.UTC())
-
-      total_votes = len(election.votes)
-      vote_totals = {}
-      for vote in election.votes:
-        member = db.get(vote)
-        if member.username in vote_totals:
-          vote_totals[member.username] += 1
-        else:
-          vote_totals[member.username] = 1
-
-      ended.append(
-          {'election': election,
-           'totals': sorted(vote_totals.iteritems(),
-                            key=operator.itemgetter(1),
-                            reverse=True),
-           'vote_end': vote_end.astimezone(timezones.Eastern())})
+             'shared': shared[0],
+             'ballot': shared[1],
+             'has_voted': user.key() in election.voters})
+      else:
+        ended.append(shared[0])
 
     template_values = {
         'voting': voting,
@@ -471,6 +1045,7 @@ class Elections(FreesideHandler):
     election = db.get(db.Key(election_key))
     nominee_key = self.request.get('nomination')
     vote_key = self.request.get('vote')
+    rank_keys = [key for key in self.request.get_all('rank') if key != '!none']
 
     ## @@ TODO: (tlilley) replace check for empty selection with a
     ## vote validity check instead of a simple string comparison
@@ -488,7 +1063,25 @@ class Elections(FreesideHandler):
       vote = db.get(db.Key(vote_key))
       election_util.Vote(election, vote, self.session['user'])
 
-    self.redirect('/elections')
+    elif election.ranked:
+      candidates = db.get([db.Key(key) for key in rank_keys])
+      election_util.VoteRanked(election, candidates, self.session['user'])
+
+    self.redirect(route_util.Url('elections'))
+
+
+class ElectionTurnout(FreesideHandler):
+  """JSON turnout of open elections, for dashboards polled during voting."""
+
+  @RedirectIfUnauthorized
+  @RedirectIfNotAdmin
+  def get(self):
+    keys = election_util.GetOpenElectionKeys()
+    turnout = election_util.GetTurnout(keys)
+    self.response.headers['Content-Type'] = 'application/json'
+    self.response.out.write(simplejson.dumps(
+      {'elections': [{'key': str(key), 'turnout': turnout[key]}
+                     for key in keys]}))
 
 
 class Dues(FreesideHandler):
@@ -504,22 +1097,157 @@ class Logout(FreesideHandler):
   """Log the user out."""
   def get(self):
     self.session.delete()
-    self.redirect('/login')
+    self.redirect(route_util.Url('login'))
+
+
+class CompactElections(webapp.RequestHandler):
+  """Cron task that archives the ballots of finished elections."""
+
+  def get(self):
+    compacted = election_util.CompactFinishedElections()
+    logging.info('Compacted %d finished elections.', compacted)
+
+
+class SnapshotVoterRolls(webapp.RequestHandler):
+  """Cron task that freezes voter rolls of elections that opened voting."""
+
+  def get(self):
+    taken = election_util.SnapshotOpenVoterRolls()
+    logging.info('Took %d voter roll snapshots.', taken)
+
+
+class RollUpAccessEvents(webapp.RequestHandler):
+  """Cron task that folds new door access events into daily rollups."""
+
+  def get(self):
+    written = access_util.RollUp()
+    logging.info('Updated %d door access rollups.', written)
+
+
+class FlushLastSeen(webapp.RequestHandler):
+  """Cron task that writes buffered member activity to datastore."""
+
+  def get(self):
+    written = activity_util.Flush()
+    logging.info('Wrote last seen times of %d members.', written)
+
+
+class Warmup(webapp.RequestHandler):
+  """Primes this instance's caches before it is sent any traffic.
+
+  The first step imports the modules freeside.py loads lazily.  Each step
+  is timed and logged, and the timings are written out one step per line,
+  followed by import times when import_util is profiling.  A step that
+  fails is logged and the rest still run, since a partly warm instance is
+  better than a cold one.
+  """
+
+  def _Steps(self):
+    """Gets (name, step) pairs, where step() returns how much it loaded."""
+    return [
+      ('modules', lambda: len([m.Load() for m in LAZY_MODULES])),
+      ('templates', lambda: len(map(GetTemplate, TemplateNames()))),
+      ('assets', lambda: len(asset_util.GetManifest())),
+      ('door index', lambda: len(door_util.GetIndex())),
+      ('roster', lambda: len(roster_util.GetSnapshot()[1])),
+      ('members table', lambda: len(fragment_util.GetFragments([
+        MembersList.TableSpec(member_util.GetSummaryGeneration())])[0])),
+      ('open elections', election_util.PrimeOpenElections),
+      ]
+
+  def get(self):
+    lines = []
+    for name, step in self._Steps():
+      start = time.time()
+      try:
+        loaded = step()
+      except Exception:
+        logging.exception('Warmup step %r failed.', name)
+        loaded = -1
+      elapsed = (time.time() - start) * 1000.0
+      logging.info('Warmup %s: loaded %d in %.1f ms', name, loaded, elapsed)
+      lines.append('%-16s %8d %8.1f ms\n' % (name, loaded, elapsed))
+    if import_util.IsInstalled():
+      lines.append('\n' + import_util.FormatTimings())
+    self.response.headers['Content-Type'] = 'text/plain'
+    self.response.out.write(''.join(lines))
+
+
+class MigrateMemberPayloads(webapp.RequestHandler):
+  """Task that moves inline member blobs into MemberPayload entities."""
+
+  def get(self):
+    migrated = payload_util.MigrateAllInlinePayloads()
+    logging.info('Migrated payloads of %d members.', migrated)
+
+
+class RebuildMemberSummaries(webapp.RequestHandler):
+  """Task that writes roster summaries for bulk-loaded members."""
+
+  def get(self):
+    written = member_util.RebuildSummaries()
+    logging.info('Wrote %d member summaries.', written)
+
+
+class RebuildMemberLookups(webapp.RequestHandler):
+  """Task that claims username and email lookups for bulk-loaded members."""
+
+  def get(self):
+    conflicts = member_util.RebuildLookups()
+    for member in conflicts:
+      logging.warning('Lookup conflict for member %s (%s).',
+                      member.username, member.email)
+
+
+# Tried in this order, so more specific patterns come first.  Names are
+# for building URLs with route_util.Url and the {% route %} tag.
+ROUTES = [
+  route_util.Route(r'/', HomePage, 'root'),
+  route_util.Route(r'/login', LoginPage, 'login'),
+  route_util.Route(r'/logout', Logout, 'logout'),
+  route_util.Route(r'/home/?', HomePage, 'home'),
+  route_util.Route(r'/dues/?', Dues, 'dues'),
+  route_util.Route(r'/admindues/?', AdminDues, 'admindues'),
+  route_util.Route(r'/admin/?', AdminPage, 'admin'),
+  route_util.Route(r'/members/?', MembersList, 'members'),
+  route_util.Route(r'/members/([^/]+)/picture', MemberPicture, 'picture'),
+  route_util.Route(r'/members/([^/]+)/(doormusic|liabilitypdf)', MemberFile,
+                   'memberfile'),
+  route_util.Route(r'/members/([^/]+)', Profile, 'profile'),
+  route_util.Route(r'/elections/?', Elections, 'elections'),
+  route_util.Route(r'/elections/turnout', ElectionTurnout, 'turnout'),
+  route_util.Route(r'/door/rfid/(\d+)', RfidLookup, 'rfid'),
+  route_util.Route(r'/door/roster', RosterSync, 'roster'),
+  route_util.Route(r'/door/events', AccessEvents, 'events'),
+  route_util.Route(r'/door/usage', AccessUsage, 'usage'),
+  route_util.Route(r'/tasks/compact_elections', CompactElections,
+                   'compact_elections'),
+  route_util.Route(r'/tasks/snapshot_voter_rolls', SnapshotVoterRolls,
+                   'snapshot_voter_rolls'),
+  route_util.Route(r'/tasks/flush_last_seen', FlushLastSeen,
+                   'flush_last_seen'),
+  route_util.Route(r'/tasks/rollup_access_events', RollUpAccessEvents,
+                   'rollup_access_events'),
+  route_util.Route(r'/tasks/rebuild_member_lookups', RebuildMemberLookups,
+                   'rebuild_member_lookups'),
+  route_util.Route(r'/tasks/rebuild_member_summaries', RebuildMemberSummaries,
+                   'rebuild_member_summaries'),
+  route_util.Route(r'/tasks/migrate_member_payloads', MigrateMemberPayloads,
+                   'migrate_member_payloads'),
+  route_util.Route(r'/_ah/warmup', Warmup, 'warmup'),
+  ]
+ROUTER = route_util.Router(ROUTES)
+route_util.SetRouter(ROUTER)
+
+# Built once per instance; App Engine reuses the module and calls main().
+application = route_util.WSGIApplication(ROUTER, debug=True)
+
+if import_util.IsInstalled():
+  logging.info('Import times:\n%s', import_util.FormatTimings(limit=40))
 
 
 def main():
-  url_map = {
-    r'/': HomePage,
-    r'/login': LoginPage,
-    r'/home/?': HomePage,
-    r'/dues/?': Dues,
-    r'/admindues/?': AdminDues,
-    r'/admin/?': AdminPage,
-    r'/members/?': MembersList,
-    r'/members/(.*)': Profile,
-    r'/logout': Logout,
-    r'/elections/?': Elections}
-  util.run_wsgi_app(webapp.WSGIApplication(url_map.items(), debug=True))
+  util.run_wsgi_app(application)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+"""Unittest for freeside.py"""
+
+import StringIO
+import unittest
+
+import freeside
+import member_util
+import random_util
+import route_util
+import test_util
+
+
+class HandlerTest(test_util.AppEngineTestBase):
+
+    def Request(self, path, method='GET'):
+        """Runs a request through the application.
+
+        Returns:
+          (status line, dict of headers, body)
+        """
+        environ = {
+            'REQUEST_METHOD': method,
+            'PATH_INFO': path,
+            'QUERY_STRING': '',
+            'SERVER_NAME': 'localhost',
+            'SERVER_PORT': '80',
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'REMOTE_ADDR': '127.0.0.1',
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': StringIO.StringIO(''),
+            'wsgi.errors': StringIO.StringIO(),
+            }
+        started = []
+        def StartResponse(status, headers):
+            started.append((status, dict(headers)))
+        body = ''.join(freeside.application(environ, StartResponse))
+        status, headers = started[0]
+        return status, headers, body
+
+    def testLoginPageRenders(self):
+        status, headers, body = self.Request('/login')
+        self.assertTrue(status.startswith('200'), status)
+        self.assertTrue('<form action="/login"' in body)
+        # Blocks from base.html are filled in.
+        self.assertTrue('Freeside members portal' in body)
+
+    def testMembersTableFragmentRenders(self):
+        member = member_util.SaveMember(random_util.Member())
+        table = freeside.RenderFragment(
+            'members_table.html',
+            {'members': member_util.GetActiveSummaries()})
+        self.assertTrue(member.username in table)
+
+    def testEveryRouteIsNamed(self):
+        for route in freeside.ROUTES:
+            self.assertTrue(route.name, route.pattern)
+        self.assertEquals(
+            '/members/bender/doormusic',
+            route_util.Url('memberfile', 'bender', 'doormusic'))
+
+    def testUnknownPath(self):
+        status, headers, body = self.Request('/no/such/page')
+        self.assertTrue(status.startswith('404'), status)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,6 +26,36 @@ class Person(db.Model):
   joined = db.DateProperty()
   left = db.DateProperty()
 
+  def __init__(self, *args, **kwargs):
+    super(Person, self).__init__(*args, **kwargs)
+    # Entities loaded from datastore are built through __init__ as well, so
+    # anything assigned from here on is a change since load.
+    self._changed = set()
+
+  def __setattr__(self, name, value):
+    prop = self.properties().get(name)
+    if prop is not None and '_changed' in self.__dict__:
+      # Compare Python values, since e.g. a DateProperty stores a datetime.
+      # References are always recorded rather than fetched to compare.
+      if (isinstance(prop, db.ReferenceProperty)
+          or getattr(self, name) != prop.validate(value)):
+        self._changed.add(name)
+    super(Person, self).__setattr__(name, value)
+
+  def ChangedFields(self):
+    """Gets the properties assigned new values since load or last save.
+
+    Returns:
+      frozenset of str; every property if the entity was never saved.
+    """
+    if not self.is_saved():
+      return frozenset(self.properties())
+    return frozenset(self.__dict__.get('_changed', ()))
+
+  def ClearChanges(self):
+    """Forgets recorded changes, e.g. after the entity was written."""
+    self._changed = set()
+
   @staticmethod
   def EncryptPassword(password):
     """Encrypts a password using SHA-256 encoding.
@@ -43,11 +73,86 @@ class Member(Person):
 
   starving = db.BooleanProperty(default=False)
   rfid = db.IntegerProperty()
-  doormusic = db.BlobProperty()
   liability = db.BooleanProperty(default=False)
+  website = db.StringProperty()
+  # Content hash of the member's picture payload, or None without one.
+  picture_version = db.StringProperty(indexed=False)
+  # Legacy inline payloads.  New data goes to MemberPayload through
+  # payload_util, which also empties these when migrating old rows.
+  doormusic = db.BlobProperty()
   liabilitypdf = db.BlobProperty()
   picture = db.BlobProperty()
-  website = db.StringProperty()
+  # Key names of the MemberLookup entities this member currently owns.
+  lookup_names = db.StringListProperty(indexed=False)
+  # Indexed so door controllers can fetch the members changed since a sync.
+  updated = db.DateTimeProperty(auto_now=True)
+
+
+class MemberSummary(db.Model):
+  """The Member fields that roster pages show, without any of the blobs.
+
+  Kept up to date by member_util whenever a member is saved.
+  """
+
+  member = db.ReferenceProperty(Member, required=True)
+  username = db.StringProperty(required=True)
+  email = db.EmailProperty()
+  joined = db.DateProperty(indexed=False)
+  active = db.BooleanProperty(default=True)
+  picture_version = db.StringProperty(indexed=False)
+
+  # Member properties copied into the summary.
+  FIELDS = ('username', 'email', 'joined', 'active', 'picture_version')
+
+  def member_key(self):
+    """Gets the key of the summarized member without fetching it."""
+    return MemberSummary.member.get_value_for_datastore(self)
+
+
+class MemberPayload(db.Model):
+  """Describes a binary payload of a Member, stored as PayloadChunks.
+
+  A child of its Member, with the payload name (e.g. 'picture') as key
+  name, so that loading a Member never loads its payloads.
+  """
+
+  content_type = db.StringProperty(indexed=False)
+  size = db.IntegerProperty(default=0, indexed=False)
+  num_chunks = db.IntegerProperty(default=0, indexed=False)
+  # Chunks of each write get a new generation, so readers never mix the
+  # chunks of two different writes.
+  generation = db.IntegerProperty(default=0, indexed=False)
+  # Every chunk but the last holds exactly this many bytes, so a byte range
+  # maps straight to the chunks holding it.  Unset means CHUNK_SIZE.
+  chunk_size = db.IntegerProperty(indexed=False)
+  sha1 = db.StringProperty(indexed=False)
+  updated = db.DateTimeProperty(auto_now=True)
+
+
+class PayloadGeneration(db.Model):
+  """Hands out chunk generations for one of a Member's payloads.
+
+  A child of the Member, with the payload name as key name, so that
+  generations can be allocated before the payload itself exists.
+  """
+
+  last = db.IntegerProperty(default=-1, indexed=False)
+
+
+class PayloadChunk(db.Model):
+  """A piece of a MemberPayload, stored as a child of the payload."""
+
+  data = db.BlobProperty(required=True)
+
+
+class MemberLookup(db.Model):
+  """Maps a normalized username or email address to its member.
+
+  Key names are built by member_util so that usernames and email addresses
+  are unique and can be resolved with a get instead of a query.
+  """
+
+  member = db.ReferenceProperty(Member, required=True)
 
 
 class Election(db.Model):
@@ -66,6 +171,41 @@ class Election(db.Model):
   # Unique list of member keys to prevent double voting.
   nominators = db.ListProperty(item_type=db.Key)
   voters = db.ListProperty(item_type=db.Key)
+  # Ids of the members eligible to vote, frozen when voting opens.  Packed
+  # by election_util.PackVoterRoll as sorted 64-bit integers.
+  voter_roll = db.BlobProperty()
+  # Ranked ballots packed by tally_util.PackBallots, as indices into
+  # nominees.  Used instead of votes when the election is ranked.
+  ranked = db.BooleanProperty(default=False)
+  ranked_ballots = db.BlobProperty()
+  seats = db.IntegerProperty(default=1)
+  # Final totals, filled in by election_util.MaterializeResults once voting
+  # has closed.  The two lists are parallel and sorted by descending count.
+  results_final = db.BooleanProperty(default=False)
+  result_usernames = db.StringListProperty(indexed=False)
+  result_counts = db.ListProperty(item_type=int, indexed=False)
+  total_votes = db.IntegerProperty(default=0)
+  # Usernames elected in a ranked election, in order of election.
+  winners = db.StringListProperty(indexed=False)
+  # Whether the raw lists above were moved into an ElectionArchive.
+  compacted = db.BooleanProperty(default=False)
+
+
+class ElectionArchive(db.Model):
+  """Cold storage for the ballot lists of a closed election.
+
+  Stored as a child of its Election with key name 'archive' so that the
+  archive and the slimmed down election can be written in one transaction.
+  """
+
+  nominees = db.ListProperty(item_type=db.Key, indexed=False)
+  votes = db.ListProperty(item_type=db.Key, indexed=False)
+  nominators = db.ListProperty(item_type=db.Key, indexed=False)
+  voters = db.ListProperty(item_type=db.Key, indexed=False)
+  ranked_ballots = db.BlobProperty()
+  archived = db.DateTimeProperty(auto_now_add=True)
+
+  KEY_NAME = 'archive'
 
 
 def GetAllElectionTypes():
@@ -81,6 +221,74 @@ class BoardElection(Election):
   """A Board Member Election."""
 
 
+class LastSeen(db.Model):
+  """When a Member was last active on the portal or at the door.
+
+  A root entity keyed like the member's summary ('m<id>'), so recording
+  activity never contends with writes to the Member.  Written in batches by
+  activity_util.
+  """
+
+  member = db.ReferenceProperty(Member, required=True)
+  seen = db.DateTimeProperty(indexed=False)
+
+
+class DoorController(db.Model):
+  """A door controller allowed to look up cards.
+
+  The key name is the SHA-256 hex digest of the controller's secret key,
+  which itself is never stored.
+  """
+
+  name = db.StringProperty(required=True)
+  active = db.BooleanProperty(default=True)
+  created = db.DateTimeProperty(auto_now_add=True)
+
+
+class AccessEventBucket(db.Model):
+  """Door access events of one hour, from one batch a controller sent.
+
+  Append-only: each batch of events is written as new buckets and never
+  changed, so ingestion doesn't contend with anything.  Events are packed
+  by access_util.
+  """
+
+  bucket = db.DateTimeProperty(required=True)
+  received = db.DateTimeProperty(auto_now_add=True)
+  count = db.IntegerProperty(default=0, indexed=False)
+  events = db.BlobProperty()
+
+
+class AccessRollup(db.Model):
+  """A member's door accesses on one Eastern-time day.
+
+  Keyed by day and member id, and built from AccessEventBuckets by a cron
+  task.  The ids of the buckets already counted are kept so that counting
+  a bucket twice is harmless.
+  """
+
+  member = db.ReferenceProperty(Member, required=True)
+  day = db.DateProperty(required=True)
+  granted = db.IntegerProperty(default=0, indexed=False)
+  denied = db.IntegerProperty(default=0, indexed=False)
+  first = db.DateTimeProperty(indexed=False)
+  last = db.DateTimeProperty(indexed=False)
+  buckets = db.ListProperty(int, indexed=False)
+
+
+class AccessRollupState(db.Model):
+  """How far the access rollup task has read AccessEventBuckets."""
+
+  watermark = db.DateTimeProperty(indexed=False)
+
+
+class CounterShard(db.Model):
+  """One shard of a counter; see counter_util."""
+
+  name = db.StringProperty(required=True, indexed=False)
+  count = db.IntegerProperty(default=0, indexed=False)
+
+
 class Payment(db.Model):
   """Base class for Payments."""
   gross = db.FloatProperty(required=True)
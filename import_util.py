@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+
+"""Lazy imports, and timing of imports to find what slows cold starts.
+
+To see what each module costs, either run
+
+  python import_util.py [module ...]
+
+with the App Engine SDK on the path, which imports freeside by default and
+prints a table, or set PROFILE_IMPORTS=1 in the environment of an instance
+to have freeside log the table once its imports are done.
+"""
+
+import os
+import sys
+import threading
+import time
+
+
+ENABLED = os.environ.get('PROFILE_IMPORTS') == '1'
+
+# Module name to [inclusive seconds, exclusive seconds].
+_timings = {}
+_local = threading.local()
+_original_import = None
+
+
+class LazyModule(object):
+    """A module that is only imported when one of its attributes is used.
+
+    Use it in place of an import of a module that only some requests need:
+
+      payload_util = import_util.LazyModule('payload_util')
+    """
+
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def Load(self):
+        """Imports the module if it hasn't been yet.
+
+        Returns:
+          module
+        """
+        module = self.__dict__['_module']
+        if module is None:
+            __import__(self._name)
+            module = sys.modules[self._name]
+            self.__dict__['_module'] = module
+        return module
+
+    def __getattr__(self, name):
+        return getattr(self.Load(), name)
+
+    def __repr__(self):
+        return '<lazy module %r>' % self._name
+
+
+def _TimedImport(name, *args, **kwargs):
+    """__import__ that records how long each first import of a module took."""
+    if name in sys.modules:
+        return _original_import(name, *args, **kwargs)
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    # Time spent importing other modules while this one is imported.
+    stack.append(0.0)
+    start = time.time()
+    try:
+        return _original_import(name, *args, **kwargs)
+    finally:
+        elapsed = time.time() - start
+        nested = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        timing = _timings.setdefault(name, [0.0, 0.0])
+        timing[0] += elapsed
+        timing[1] += elapsed - nested
+
+
+def Install():
+    """Starts timing imports."""
+    global _original_import
+    if _original_import is None:
+        import __builtin__
+        _original_import = __builtin__.__import__
+        __builtin__.__import__ = _TimedImport
+
+
+def Uninstall():
+    """Stops timing imports.  Timings taken so far are kept."""
+    global _original_import
+    if _original_import is not None:
+        import __builtin__
+        __builtin__.__import__ = _original_import
+        _original_import = None
+
+
+def IsInstalled():
+    return _original_import is not None
+
+
+def GetTimings():
+    """Gets how long each module took to import.
+
+    Returns:
+      list of (name, inclusive ms, exclusive ms), most expensive first by
+      exclusive time, which leaves out the modules it imported.
+    """
+    timings = [(name, inclusive * 1000.0, exclusive * 1000.0)
+               for name, (inclusive, exclusive) in _timings.items()]
+    timings.sort(key=lambda timing: (-timing[2], timing[0]))
+    return timings
+
+
+def FormatTimings(limit=None):
+    """Formats GetTimings as a table.
+
+    Args:
+      limit: int, the most modules to list, or None for all of them.
+    Returns:
+      str
+    """
+    timings = GetTimings()
+    lines = ['%-40s %10s %10s' % ('module', 'total ms', 'self ms')]
+    for name, inclusive, exclusive in timings[:limit]:
+        lines.append('%-40s %10.1f %10.1f' % (name, inclusive, exclusive))
+    lines.append('%-40s %10s %10.1f' % (
+        'all %d modules' % len(timings), '',
+        sum([timing[2] for timing in timings])))
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv):
+    Install()
+    for name in argv[1:] or ['freeside']:
+        __import__(name)
+    Uninstall()
+    sys.stdout.write(FormatTimings())
+
+
+if __name__ == '__main__':
+    main(sys.argv)
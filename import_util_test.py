@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+"""Unittest for import_util.py"""
+
+import sys
+import unittest
+
+import import_util
+
+
+class LazyModuleTest(unittest.TestCase):
+
+    def setUp(self):
+        sys.modules.pop('tally_util', None)
+
+    def testLoadsOnFirstUse(self):
+        lazy = import_util.LazyModule('tally_util')
+        self.assertFalse('tally_util' in sys.modules)
+        self.assertEquals(255, lazy.MAX_CANDIDATES)
+        self.assertTrue(lazy.Load() is sys.modules['tally_util'])
+
+    def testDottedName(self):
+        lazy = import_util.LazyModule('os.path')
+        self.assertTrue(lazy.Load() is sys.modules['os.path'])
+
+
+class TimingTest(unittest.TestCase):
+
+    def tearDown(self):
+        import_util.Uninstall()
+
+    def testTimesFirstImports(self):
+        sys.modules.pop('tally_util', None)
+        import_util.Install()
+        self.assertTrue(import_util.IsInstalled())
+        import tally_util
+        import_util.Uninstall()
+        self.assertTrue(tally_util is sys.modules['tally_util'])
+        names = [timing[0] for timing in import_util.GetTimings()]
+        self.assertTrue('tally_util' in names)
+        self.assertTrue('tally_util' in import_util.FormatTimings())
+
+
+if __name__ == '__main__':
+    unittest.main()
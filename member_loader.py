@@ -3,11 +3,14 @@
 """Bulk loader for loading members into datastore."""
 
 import datetime
+import logging
+import threading
 
 from google.appengine.ext import db
 from google.appengine.tools import bulkloader
 
 import freesidemodels
+import member_util
 import random_util
 
 
@@ -23,7 +26,12 @@ def str_to_bool(s):
 
 
 class MemberLoader(bulkloader.Loader):
-  """Parse CSV of members and upload it to datastore."""
+  """Parse CSV of members and upload it to datastore.
+
+  Members are saved with member_util.SaveMembers once every row is read,
+  rather than uploaded by the bulkloader, so they get their lookups and
+  summaries like members saved by the app.
+  """
 
   def __init__(self):
     bulkloader.Loader.__init__(
@@ -36,6 +44,23 @@ class MemberLoader(bulkloader.Loader):
        ('joined', lambda x: datetime.datetime.strptime(x, '%m/%d/%Y').date()),
        ('rfid', int),
        ('password', lambda x: random_util.Password())])
+    self._members = []
+    self._lock = threading.Lock()
+
+  def handle_entity(self, entity):
+    self._lock.acquire()
+    try:
+      self._members.append(entity)
+    finally:
+      self._lock.release()
+    # Nothing for the bulkloader to upload itself.
+    return None
+
+  def finalize(self):
+    for member in member_util.SaveMembers(self._members):
+      logging.error('Skipped %s: username or email already in use.',
+                    member.username)
+    self._members = []
 
 
 loaders = [MemberLoader]
@@ -3,11 +3,35 @@
 """Utility functions for dealing with members."""
 
 from google.appengine.ext import db
-from google.appengine.api import mail
 
+import counter_util
+import datastore_util
 import freesidemodels
+import import_util
 import random_util
 
+# Only needed to email a reset password.
+mail = import_util.LazyModule('google.appengine.api.mail')
+
+
+# Member fields that door controllers see.  Saving a change to any of them
+# moves the roster on to a new generation.
+ROSTER_FIELDS = ('username', 'rfid', 'active', 'starving')
+_ROSTER_GENERATION = 'roster_generation'
+# Moves on whenever any MemberSummary is written.
+_SUMMARY_GENERATION = 'summary_generation'
+# Counts full summary rebuilds; 0 until members saved before summaries
+# existed have been given theirs.
+_SUMMARIES_REBUILT = 'summaries_rebuilt'
+
+
+class Error(Exception):
+    """Base error class for this module."""
+
+
+class DuplicateError(Error):
+    """Raised when a username or email address is already in use."""
+
 
 def MakeMember(*args, **kwargs):
     """Helper function for creating a new member.
@@ -24,47 +48,477 @@ def MakeMember(*args, **kwargs):
     return freesidemodels.Member(*args, **kwargs)
 
 
+def NormalizeUsername(username):
+    """Normalizes a username so that lookups ignore case."""
+    return (username or '').strip().lower()
+
+
+def NormalizeEmail(email):
+    """Normalizes an email address so that lookups ignore case."""
+    return (email or '').strip().lower()
+
+
+def _UsernameLookupName(username):
+    return 'u:%s' % NormalizeUsername(username)
+
+
+def _EmailLookupName(email):
+    return 'e:%s' % NormalizeEmail(email)
+
+
+def _LookupNames(member):
+    """Gets the MemberLookup key names a member should own."""
+    names = [_UsernameLookupName(member.username)]
+    if member.email:
+        names.append(_EmailLookupName(member.email))
+    return names
+
+
+def _SummaryKeyName(member_key):
+    return 'm%d' % member_key.id()
+
+
+def _MakeSummary(member):
+    """Builds the MemberSummary for a saved member."""
+    values = dict((field, getattr(member, field))
+                  for field in freesidemodels.MemberSummary.FIELDS)
+    return freesidemodels.MemberSummary(
+        key_name=_SummaryKeyName(member.key()), member=member.key(), **values)
+
+
+def _NeedsSummary(changed):
+    """Determines if changed fields make a member's summary stale."""
+    for field in freesidemodels.MemberSummary.FIELDS:
+        if field in changed:
+            return True
+    return False
+
+
+def _ChangesRoster(changed):
+    """Determines if changed fields are visible to door controllers."""
+    for field in ROSTER_FIELDS:
+        if field in changed:
+            return True
+    return False
+
+
+def GetRosterGeneration():
+    """Gets a number that changes whenever the door roster does.
+
+    Returns:
+      int
+    """
+    return counter_util.GetCount(_ROSTER_GENERATION)
+
+
+def BumpRosterGeneration():
+    """Marks the door roster as changed, e.g. after new door music."""
+    counter_util.Increment(_ROSTER_GENERATION)
+
+
+def GetSummaryGeneration():
+    """Gets a number that changes whenever a member summary does.
+
+    Returns:
+      int
+    """
+    return counter_util.GetCount(_SUMMARY_GENERATION)
+
+
+def _BumpSummaryGeneration():
+    counter_util.Increment(_SUMMARY_GENERATION)
+
+
+def _ClaimLookup(key_name, member_key):
+    """Points a lookup at a member unless another member already owns it.
+
+    Raises:
+      DuplicateError: if the name belongs to another member.
+    """
+    def DoClaim():
+        lookup = freesidemodels.MemberLookup.get_by_key_name(key_name)
+        if lookup is not None:
+            owner = freesidemodels.MemberLookup.member.get_value_for_datastore(
+                lookup)
+            if owner == member_key:
+                return
+            raise DuplicateError('%s is already in use.' % key_name[2:])
+        freesidemodels.MemberLookup(key_name=key_name, member=member_key).put()
+    db.run_in_transaction(DoClaim)
+
+
+def _ReleaseLookup(key_name, member_key):
+    """Deletes a lookup if it still points at the member."""
+    def DoRelease():
+        lookup = freesidemodels.MemberLookup.get_by_key_name(key_name)
+        if lookup is not None:
+            owner = freesidemodels.MemberLookup.member.get_value_for_datastore(
+                lookup)
+            if owner == member_key:
+                lookup.delete()
+    db.run_in_transaction(DoRelease)
+
+
 def SaveMember(member):
-    """Saves a member to datastore, with a transaction.
+    """Saves a member to datastore.
+
+    This is SaveMembers for one member, raising rather than returning a
+    conflict.  Members saved without lookups are given theirs first, so
+    this member can't take one of their names.
 
     Args:
       member: freesidemodels.Member
     Returns:
       freesidemodels.Member
+    Raises:
+      DuplicateError: if the username or email address belongs to another
+        member.  The member is not saved.
     """
-    def DoPut(member):
-        member.put()
-    db.run_in_transaction(DoPut, member)
+    _BackfillLookups(member, [name for name in _LookupNames(member)
+                              if name not in member.lookup_names])
+    conflicts = _SaveMembers([member], datastore_util.MAX_BATCH_SIZE)
+    if conflicts:
+        raise DuplicateError('%s is already in use.' % conflicts[0][1][2:])
     return member
 
 
-def SaveIfChanged(new_member):
+def SaveMembers(members, batch_size=datastore_util.MAX_BATCH_SIZE):
+    """Saves many members with batched puts instead of one put each.
+
+    Lookups for every member are checked with batch gets up front, and
+    members whose username or email belongs to someone else (or to another
+    member in the same call) are skipped.  New members are put first, since
+    lookups need their keys.  Lookups live in their own entity groups, so
+    each new one is then claimed in its own transaction; a member who loses
+    a name to a concurrent save is skipped too.  The remaining members and
+    their summaries are written in batches of at most batch_size, and names
+    members no longer use are released last.
+
+    Args:
+      members: list of freesidemodels.Member
+      batch_size: int, maximum entities per datastore call.
+    Returns:
+      list of freesidemodels.Member that were not saved because of
+      duplicate usernames or email addresses, in the order given.
+    """
+    return [member for member, _ in _SaveMembers(members, batch_size)]
+
+
+def _SaveMembers(members, batch_size):
+    """Does the work of SaveMembers.
+
+    Returns:
+      list of (freesidemodels.Member, lookup key name) for each member not
+      saved and the name it conflicted on, in the order given.
+    """
+    claims = {}
+    # id() of each member not saved, to the name it conflicted on.
+    conflicts = {}
+    changed = {}
+    for member in members:
+        changed[id(member)] = member.ChangedFields()
+        wanted = [name for name in _LookupNames(member)
+                  if name not in member.lookup_names]
+        taken = [name for name in wanted if name in claims]
+        if taken:
+            conflicts[id(member)] = taken[0]
+            continue
+        for name in wanted:
+            claims[name] = member
+
+    names = claims.keys()
+    existing = datastore_util.GetBatched(
+        [db.Key.from_path('MemberLookup', name) for name in names],
+        batch_size=batch_size)
+    for name, lookup in zip(names, existing):
+        if lookup is None:
+            continue
+        member = claims[name]
+        owner = freesidemodels.MemberLookup.member.get_value_for_datastore(
+            lookup)
+        if not member.is_saved() or owner != member.key():
+            conflicts.setdefault(id(member), name)
+    to_save = [m for m in members if id(m) not in conflicts]
+
+    # New members need keys before their lookups can point at them.
+    new_members = [m for m in to_save if not m.is_saved()]
+    datastore_util.PutBatched(new_members, batch_size=batch_size)
+
+    for member in to_save:
+        claimed = []
+        try:
+            for name in _LookupNames(member):
+                if name not in member.lookup_names:
+                    _ClaimLookup(name, member.key())
+                    claimed.append(name)
+        except DuplicateError:
+            for claimed_name in claimed:
+                _ReleaseLookup(claimed_name, member.key())
+            conflicts[id(member)] = name
+    datastore_util.DeleteBatched(
+        [m.key() for m in new_members if id(m) in conflicts],
+        batch_size=batch_size)
+    to_save = [m for m in to_save if id(m) not in conflicts]
+
+    released = []
+    for member in to_save:
+        new_names = _LookupNames(member)
+        released.extend([(name, member.key()) for name in member.lookup_names
+                         if name not in new_names])
+        member.lookup_names = new_names
+
+    summaries = [_MakeSummary(member) for member in to_save
+                 if _NeedsSummary(changed[id(member)])]
+    datastore_util.PutBatched(summaries + to_save, batch_size=batch_size)
+    for member in to_save:
+        member.ClearChanges()
+    if summaries:
+        _BumpSummaryGeneration()
+    for member in to_save:
+        if _ChangesRoster(changed[id(member)]):
+            BumpRosterGeneration()
+            break
+
+    # Only drops lookups that nobody else has claimed since.
+    for name, member_key in released:
+        _ReleaseLookup(name, member_key)
+
+    return [(m, conflicts[id(m)]) for m in members if id(m) in conflicts]
+
+
+def RebuildLookups():
+    """Claims lookups for members saved without them, e.g. by bulk loads.
+
+    Returns:
+      list of freesidemodels.Member whose names are claimed by someone else.
+    """
+    conflicts = []
+    for page in datastore_util.IterQueryPages(freesidemodels.Member.all()):
+        conflicts.extend(SaveMembers(
+            [member for member in page
+             if set(member.lookup_names) != set(_LookupNames(member))]))
+    return conflicts
+
+
+def RebuildSummaries():
+    """Writes a MemberSummary for every member, e.g. after a bulk load.
+
+    Returns:
+      int, the number of summaries written.
+    """
+    written = 0
+    for page in datastore_util.IterQueryPages(freesidemodels.Member.all()):
+        written += len(datastore_util.PutBatched(map(_MakeSummary, page)))
+    _BumpSummaryGeneration()
+    # Members written without SaveMember may have left the roster stale too.
+    BumpRosterGeneration()
+    counter_util.Increment(_SUMMARIES_REBUILT)
+    return written
+
+
+def _EnsureSummaries():
+    """Rebuilds the summaries if they never have been.
+
+    Members saved before summaries existed have none, so the first read
+    after such a deploy writes them rather than listing nobody.
+    """
+    if not counter_util.GetCount(_SUMMARIES_REBUILT):
+        RebuildSummaries()
+
+
+def SaveIfChanged(member):
     """Saves the member to datastore if any of its fields have changed.
 
     Args:
-      new_member: freesidemodels.Member, possibly changed Member object.
+      member: freesidemodels.Member, possibly changed Member object.
     Returns:
-      freesidemodels.member
+      frozenset of str, the names of the changed properties.  Empty if
+      nothing was written.
     """
-    orig_member = freesidemodels.Member.get_by_key_name(str(new_member.key()))
-    def _CompareAttr(attr):
-        return getattr(orig_member, attr) != getattr(new_member, attr)
-    if any(map(_CompareAttr, dir(orig_member))):
-        return SaveMember(new_member)
-    return new_member
+    changed = member.ChangedFields()
+    if changed:
+        SaveMember(member)
+    return changed
 
 
-def GetActiveMembers():
+def GetActiveMembers(limit=None):
     """Gets all active members from datastore.
 
+    Args:
+      limit: int, maximum number of members, or None for all of them.
     Returns:
       list of freesidemodels.Member
     """
-    return freesidemodels.Member.all().filter('active =', True).fetch(1000)
+    return GetActiveMembersAsync(limit=limit).get_result()
+
+
+def GetActiveMembersAsync(limit=None):
+    """Starts fetching all active members without waiting for the results.
+
+    Args:
+      limit: int, maximum number of members, or None for all of them.
+    Returns:
+      datastore_util.QueryFuture, resolving to a list of freesidemodels.Member
+    """
+    return datastore_util.QueryAsync(
+        freesidemodels.Member.all().filter('active =', True), limit=limit)
+
+
+def IterActiveMembers(limit=None):
+    """Streams active members from datastore a page at a time.
+
+    Args:
+      limit: int, maximum number of members, or None for all of them.
+    Yields:
+      freesidemodels.Member
+    """
+    return datastore_util.IterQuery(
+        freesidemodels.Member.all().filter('active =', True), limit=limit)
+
+
+def _LookupMembers(key_names):
+    """Resolves lookup key names to member keys with one batch get.
+
+    Returns:
+      dict of key name to db.Key
+    """
+    keys = [db.Key.from_path('MemberLookup', name) for name in key_names]
+    result = {}
+    for name, lookup in zip(key_names, db.get(keys)):
+        if lookup is not None:
+            result[name] = (
+                freesidemodels.MemberLookup.member.get_value_for_datastore(
+                    lookup))
+    return result
+
+
+def _QueryMember(filters):
+    """Finds a member by query, for members saved without lookups.
+
+    Members saved before lookups existed, or by paths that skip them, have
+    none, so each (property, value) in filters is queried in turn as names
+    were resolved before lookups.  A member found that way has its lookups
+    claimed so the next resolution needs only the get.
+
+    Returns:
+      freesidemodels.Member or None
+    """
+    for prop, value in filters:
+        member = freesidemodels.Member.all().filter(prop + ' =', value).get()
+        if member is not None:
+            _ClaimMissingLookups(member)
+            return member
+    return None
+
+
+def _ClaimMissingLookups(member):
+    """Claims the lookups of a member saved without them, e.g. by a bulk load.
+
+    Names another member already owns are left to them.
+    """
+    owned = []
+    for name in _LookupNames(member):
+        try:
+            _ClaimLookup(name, member.key())
+            owned.append(name)
+        except DuplicateError:
+            pass
+    if set(owned) != set(member.lookup_names):
+        member.lookup_names = owned
+        datastore_util.PutBatched([member])
+
+
+def _BackfillLookups(member, key_names):
+    """Claims lookups for members without them who use any of key_names.
+
+    This keeps a name of a member saved without lookups from being taken.
+    """
+    found = _LookupMembers(key_names)
+    if _UsernameLookupName(member.username) in key_names and (
+            _UsernameLookupName(member.username) not in found):
+        _QueryMember([('username', member.username)])
+    if member.email and _EmailLookupName(member.email) in key_names and (
+            _EmailLookupName(member.email) not in found):
+        _QueryMember([('email', member.email)])
+
+
+def _GetMemberByLookup(key_names, active, filters):
+    """Gets the member owning the first of key_names that exists.
+
+    If none of them exists, falls back to _QueryMember(filters).
+    """
+    found = _LookupMembers(key_names)
+    if not found:
+        member = _QueryMember(filters)
+        if member is not None and (member.active or not active):
+            return member
+        return None
+    for name in key_names:
+        if name in found:
+            member = db.get(found[name])
+            if member is not None and (member.active or not active):
+                return member
+    return None
+
+
+def GetActiveSummaries(limit=None):
+    """Gets the summaries of all active members, sorted by username.
+
+    Args:
+      limit: int, maximum number of summaries, or None for all of them.
+    Returns:
+      list of freesidemodels.MemberSummary
+    """
+    return GetActiveSummariesAsync(limit=limit).get_result()
+
+
+def GetActiveSummariesAsync(limit=None):
+    """Starts fetching active member summaries sorted by username.
+
+    Args:
+      limit: int, maximum number of summaries, or None for all of them.
+    Returns:
+      datastore_util.QueryFuture, resolving to a list of
+      freesidemodels.MemberSummary
+    """
+    _EnsureSummaries()
+    query = freesidemodels.MemberSummary.all().filter('active =', True)
+    return datastore_util.QueryAsync(query.order('username'), limit=limit)
+
+
+def GetSummaries(member_keys):
+    """Gets the summaries of several members with one batch get.
+
+    Args:
+      member_keys: list of db.Key
+    Returns:
+      list of freesidemodels.MemberSummary or None, in the same order as
+      member_keys.
+    """
+    _EnsureSummaries()
+    return datastore_util.GetBatched(
+        [db.Key.from_path('MemberSummary', _SummaryKeyName(key))
+         for key in member_keys])
+
+
+def GetMemberKeyByUsername(username):
+    """Gets the key of a member by username without fetching the member.
+
+    Args:
+      username: str, the member's username.
+    Returns:
+      db.Key or None
+    """
+    name = _UsernameLookupName(username)
+    found = _LookupMembers([name])
+    if name in found:
+        return found[name]
+    member = _QueryMember([('username', username)])
+    return member and member.key()
 
 
 def GetMemberByUsername(username, active=True):
-    """Gets a member by his or her username.
+    """Gets a member by his or her username, ignoring case.
 
     Args:
       username: str, the member's username.
@@ -72,19 +526,12 @@ def GetMemberByUsername(username, active=True):
     Returns:
       freesidemodels.Member or None
     """
-    q = freesidemodels.Member.all().filter('username =', username)
-    if active:
-        q.filter('active =', True)
-
-    result = q.fetch(1)
-    if len(result) == 1:
-        return result[0]
-    else:
-        return None
+    return _GetMemberByLookup(
+        [_UsernameLookupName(username)], active, [('username', username)])
 
 
 def GetMemberByEmail(email, active=True):
-    """Gets a member by his or her email address.
+    """Gets a member by his or her email address, ignoring case.
 
     Args:
       email: str, the member's email address.
@@ -92,15 +539,38 @@ def GetMemberByEmail(email, active=True):
     Returns:
       freesidemodels.Member or None
     """
-    q = freesidemodels.Member.all().filter('email =', email)
-    if active:
-        q.filter('active =', True)
+    return _GetMemberByLookup(
+        [_EmailLookupName(email)], active, [('email', email)])
 
-    result = q.fetch(1)
-    if len(result) == 1:
-        return result[0]
-    else:
-        return None
+
+def GetMemberByLogin(login, active=True):
+    """Gets a member by username or, failing that, email address.
+
+    Both names are resolved in the same batch get.  If neither has a
+    lookup, members are queried by username and then email.
+
+    Args:
+      login: str, a username or email address.
+      active: bool, whether to fetch only an active member.
+    Returns:
+      freesidemodels.Member or None
+    """
+    return _GetMemberByLookup(
+        [_UsernameLookupName(login), _EmailLookupName(login)], active,
+        [('username', login), ('email', login)])
+
+
+def IsUsernameAvailable(username, member=None):
+    """Determines if a username is free, ignoring case.
+
+    Args:
+      username: str, the username to check.
+      member: freesidemodels.Member, a member who may already own it.
+    Returns:
+      bool
+    """
+    owner = GetMemberKeyByUsername(username)
+    return owner is None or (member is not None and owner == member.key())
 
 
 def IsActiveMember(person):
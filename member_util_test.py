@@ -2,6 +2,7 @@
 
 """Unittest for member_util.py"""
 
+import datetime
 import random
 import unittest
 
@@ -25,25 +26,36 @@ class SaveMemberTest(test_util.AppEngineTestBase):
         new_member = member_util.SaveMember(random_util.Member())
         new_member.username = 'fry'
         new_member.email = 'fry@planex.com'
-        member_util.SaveIfChanged(new_member)
+        self.assertEquals(frozenset(['username', 'email']),
+                          member_util.SaveIfChanged(new_member))
 
         [member] = freesidemodels.Member.all().fetch(1)
         self.assertEquals(member.username, new_member.username)
         self.assertEquals(member.email, new_member.email)
+        self.assertEquals(frozenset(), member.ChangedFields())
 
     def testSaveIfChangedNotChanged(self):
         member = member_util.SaveMember(random_util.Member())
+        self.assertEquals(frozenset(), member.ChangedFields())
 
-        # TODO(dknowles): Use mox instead
-        called = False
-        orig_save_member = member_util.SaveMember
-        def MockSaveMember(member):
-            called = True
-        member_util.SaveMember = MockSaveMember
+        # Assigning the current value is not a change.
+        member.username = member.username
+        self.assertEquals(frozenset(), member_util.SaveIfChanged(member))
 
-        member_util.SaveIfChanged(member)
-        member_util.SaveMember = orig_save_member
-        self.failIf(called)
+    def testSaveIfChangedDate(self):
+        member = random_util.Member()
+        member.joined = datetime.date(3000, 1, 1)
+        member_util.SaveMember(member)
+        member = freesidemodels.Member.get(member.key())
+
+        member.joined = datetime.date(3000, 1, 1)
+        self.assertEquals(frozenset(), member.ChangedFields())
+        member.joined = datetime.date(3000, 1, 2)
+        self.assertEquals(frozenset(['joined']), member.ChangedFields())
+
+    def testChangedFieldsUnsaved(self):
+        member = random_util.Member()
+        self.assertTrue('username' in member.ChangedFields())
 
 
 class MemberUtilTest(test_util.AppEngineTestBase):
@@ -78,15 +90,17 @@ class MemberUtilTest(test_util.AppEngineTestBase):
             map(GetKey, member_util.GetActiveMembers()))
 
     def testGetMemberByUsername(self):
-        member = freesidemodels.Member(
-            username='bender', password='foo', email='bender@robots.com')
-        member.put()
+        member = member_util.SaveMember(freesidemodels.Member(
+            username='bender', password='foo', email='bender@robots.com'))
         self.assertEquals(
             member.key(),
             member_util.GetMemberByUsername(member.username).key())
+        self.assertEquals(
+            member.key(),
+            member_util.GetMemberByUsername('Bender ').key())
 
         member.active = False
-        member.put()
+        member_util.SaveMember(member)
         self.assertEquals(
             None, member_util.GetMemberByUsername(member.username))
         self.assertEquals(
@@ -95,21 +109,191 @@ class MemberUtilTest(test_util.AppEngineTestBase):
                 member.username, active=False).key())
 
     def testGetMemberByEmail(self):
-        member = freesidemodels.Member(
-            username='bender', password='foo', email='bender@robots.com')
-        member.put()
+        member = member_util.SaveMember(freesidemodels.Member(
+            username='bender', password='foo', email='bender@robots.com'))
         self.assertEquals(
             member.key(),
             member_util.GetMemberByEmail(member.email).key())
 
         member.active = False
-        member.put()
+        member_util.SaveMember(member)
         self.assertEquals(
             None, member_util.GetMemberByEmail(member.email))
         self.assertEquals(
             member.key(),
             member_util.GetMemberByEmail(member.email, active=False).key())
 
+    def testGetMemberByLogin(self):
+        member = member_util.SaveMember(freesidemodels.Member(
+            username='bender', password='foo', email='bender@robots.com'))
+        self.assertEquals(
+            member.key(), member_util.GetMemberByLogin('bender').key())
+        self.assertEquals(
+            member.key(),
+            member_util.GetMemberByLogin('Bender@Robots.com').key())
+        self.assertEquals(None, member_util.GetMemberByLogin('fry'))
+
+    def testGetMemberByLoginWithoutLookups(self):
+        member = freesidemodels.Member(
+            username='bender', password='foo', email='bender@robots.com')
+        member.put()
+        self.assertEquals(
+            member.key(),
+            member_util.GetMemberByLogin('bender@robots.com').key())
+        self.assertEquals(
+            member.key(),
+            member_util.GetMemberKeyByUsername('bender'))
+        self.assertEquals(
+            ['u:bender', 'e:bender@robots.com'],
+            freesidemodels.Member.get(member.key()).lookup_names)
+
+    def testGetMemberByUsernameWithoutLookups(self):
+        member = freesidemodels.Member(
+            username='bender', password='foo', email='bender@robots.com')
+        member.put()
+        self.assertFalse(member_util.IsUsernameAvailable('bender'))
+        self.assertEquals(
+            member.key(), member_util.GetMemberByUsername('bender').key())
+        self.assertEquals(
+            member.key(),
+            member_util.GetMemberByEmail('bender@robots.com').key())
+        self.assertEquals(None, member_util.GetMemberKeyByUsername('fry'))
+
+    def testSaveMemberTakenWithoutLookups(self):
+        freesidemodels.Member(
+            username='bender', password='foo', email='bender@robots.com').put()
+        self.assertRaises(
+            member_util.DuplicateError, member_util.SaveMember,
+            freesidemodels.Member(
+                username='bender', password='foo', email='fry@planex.com'))
+        self.assertEquals(1, freesidemodels.Member.all().count())
+
+
+class SummaryTest(test_util.AppEngineTestBase):
+
+    def testSummaryFollowsMember(self):
+        member = member_util.SaveMember(random_util.Member())
+        [summary] = member_util.GetActiveSummaries()
+        self.assertEquals(member.key(), summary.member_key())
+        self.assertEquals(member.username, summary.username)
+
+        member.email = 'fry@planex.com'
+        member_util.SaveIfChanged(member)
+        [summary] = member_util.GetActiveSummaries()
+        self.assertEquals('fry@planex.com', summary.email)
+
+        member.active = False
+        member_util.SaveMember(member)
+        self.assertEquals([], member_util.GetActiveSummaries())
+
+    def testGetActiveSummariesSorted(self):
+        member_util.SaveMembers([random_util.Member() for _ in range(10)])
+        usernames = [s.username for s in member_util.GetActiveSummaries()]
+        self.assertEquals(10, len(usernames))
+        self.assertEquals(sorted(usernames), usernames)
+
+    def testRebuildSummaries(self):
+        for _ in range(3):
+            random_util.Member().put()
+        self.assertEquals(3, member_util.RebuildSummaries())
+        self.assertEquals(3, len(member_util.GetActiveSummaries()))
+
+    def testSummariesBuiltOnFirstRead(self):
+        for _ in range(3):
+            random_util.Member().put()
+        member_util.SaveMember(random_util.Member())
+        self.assertEquals(4, len(member_util.GetActiveSummaries()))
+
+
+class LookupTest(test_util.AppEngineTestBase):
+
+    def setUp(self):
+        test_util.AppEngineTestBase.setUp(self)
+        self.member = member_util.SaveMember(freesidemodels.Member(
+            username='bender', password='foo', email='bender@robots.com'))
+
+    def testDuplicateUsername(self):
+        self.assertRaises(
+            member_util.DuplicateError,
+            member_util.SaveMember,
+            freesidemodels.Member(
+                username='BENDER', password='foo', email='other@robots.com'))
+        self.assertEquals(1, freesidemodels.Member.all().count())
+
+    def testDuplicateEmail(self):
+        other = member_util.SaveMember(freesidemodels.Member(
+            username='fry', password='foo', email='fry@planex.com'))
+        other.email = 'bender@robots.com'
+        self.assertRaises(
+            member_util.DuplicateError, member_util.SaveMember, other)
+        self.assertEquals(
+            other.key(), member_util.GetMemberByUsername('fry').key())
+
+    def testRename(self):
+        self.assertFalse(member_util.IsUsernameAvailable('bender'))
+        self.assertTrue(
+            member_util.IsUsernameAvailable('bender', self.member))
+
+        self.member.username = 'bender2'
+        member_util.SaveMember(self.member)
+        self.assertTrue(member_util.IsUsernameAvailable('bender'))
+        self.assertEquals(None, member_util.GetMemberByUsername('bender'))
+        self.assertEquals(
+            self.member.key(),
+            member_util.GetMemberByUsername('bender2').key())
+
+    def testRebuildLookups(self):
+        loaded = freesidemodels.Member(
+            username='leela', password='foo', email='leela@planex.com')
+        loaded.put()
+        clash = freesidemodels.Member(
+            username='bender', password='foo', email='b2@robots.com')
+        clash.put()
+
+        conflicts = member_util.RebuildLookups()
+        self.assertEquals([clash.key()], [m.key() for m in conflicts])
+        self.assertEquals(
+            loaded.key(), member_util.GetMemberByUsername('leela').key())
+
+
+class SaveMembersTest(test_util.AppEngineTestBase):
+
+    def testSaveMembers(self):
+        members = [random_util.Member() for _ in range(25)]
+        self.assertEquals([], member_util.SaveMembers(members, batch_size=10))
+        self.assertEquals(25, freesidemodels.Member.all().count())
+        for member in members:
+            self.assertEquals(
+                member.key(),
+                member_util.GetMemberByUsername(member.username).key())
+            self.assertEquals(frozenset(), member.ChangedFields())
+
+    def testConflicts(self):
+        existing = member_util.SaveMember(random_util.Member())
+        clash = random_util.Member()
+        clash.username = existing.username
+        twin = random_util.Member()
+        twin_clash = random_util.Member()
+        twin_clash.email = twin.email
+        ok = random_util.Member()
+
+        conflicts = member_util.SaveMembers([clash, twin, twin_clash, ok])
+        self.assertEquals([clash, twin_clash], conflicts)
+        self.assertFalse(clash.is_saved())
+        self.assertTrue(twin.is_saved())
+        self.assertTrue(ok.is_saved())
+
+    def testRenameReleasesLookups(self):
+        members = [member_util.SaveMember(random_util.Member())
+                   for _ in range(3)]
+        old_username = members[0].username
+        members[0].username = 'renamed'
+        member_util.SaveMembers(members)
+        self.assertEquals(None, member_util.GetMemberByUsername(old_username))
+        self.assertEquals(
+            members[0].key(),
+            member_util.GetMemberByUsername('renamed').key())
+
 
 if __name__ == '__main__':
     unittest.main()
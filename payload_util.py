@@ -0,0 +1,389 @@
+#!/usr/bin/env python
+
+"""Utility functions for binary payloads stored outside of Members."""
+
+import hashlib
+
+from google.appengine.ext import db
+
+import datastore_util
+import freesidemodels
+import member_util
+
+
+# Payloads that used to be stored inline on Member.
+INLINE_PAYLOAD_NAMES = ('picture', 'doormusic', 'liabilitypdf')
+# Payloads a member may have, including ones derived from the above.
+PAYLOAD_NAMES = INLINE_PAYLOAD_NAMES + ('picture_small', 'picture_medium')
+# Payloads that door controllers use, which are part of the roster.
+ROSTER_PAYLOAD_NAMES = ('doormusic',)
+# Keeps each chunk, and each batch get of a few chunks, well under the
+# datastore's 1MB limits.
+CHUNK_SIZE = 256 * 1024
+
+
+class Error(Exception):
+    """Base error class for this module."""
+
+
+class InvalidPayloadError(Error):
+    """Raised when an unknown payload name is used."""
+
+
+class UploadError(Error):
+    """Raised when a chunked upload can't be accepted."""
+
+
+class StaleUploadError(UploadError):
+    """Raised when a later write of a payload was committed first."""
+
+
+def _CheckName(name):
+    if name not in PAYLOAD_NAMES:
+        raise InvalidPayloadError('Invalid payload: %s' % name)
+
+
+def _ChunkKey(payload_key, generation, index):
+    return db.Key.from_path(
+        'PayloadChunk', 'g%d-%d' % (generation, index), parent=payload_key)
+
+
+def _MemberKey(member):
+    if isinstance(member, db.Model):
+        return member.key()
+    return member
+
+
+def _PayloadKey(member_key, name):
+    return db.Key.from_path('MemberPayload', name, parent=member_key)
+
+
+def GetPayloadInfo(member, name):
+    """Gets the description of a member's payload without its data.
+
+    Args:
+      member: freesidemodels.Member or db.Key
+      name: str, one of PAYLOAD_NAMES.
+    Returns:
+      freesidemodels.MemberPayload or None
+    """
+    _CheckName(name)
+    return db.get(_PayloadKey(_MemberKey(member), name))
+
+
+def GetPayloadInfos(members, name):
+    """Gets the descriptions of a payload for many members in one batch.
+
+    Args:
+      members: list of freesidemodels.Member or db.Key
+      name: str, one of PAYLOAD_NAMES.
+    Returns:
+      list of freesidemodels.MemberPayload or None, in the same order as
+      members.
+    """
+    _CheckName(name)
+    return datastore_util.GetBatched(
+        [_PayloadKey(_MemberKey(member), name) for member in members])
+
+
+def _ChunkSize(info):
+    return info.chunk_size or CHUNK_SIZE
+
+
+def GetChunks(info, first=0, last=None):
+    """Gets a range of a payload's chunks.
+
+    Args:
+      info: freesidemodels.MemberPayload
+      first: int, index of the first chunk.
+      last: int, index of the last chunk, inclusive.  Defaults to the end.
+    Yields:
+      str, chunk data in order.
+    """
+    if last is None:
+        last = info.num_chunks - 1
+    keys = [_ChunkKey(info.key(), info.generation, i)
+            for i in xrange(first, min(last, info.num_chunks - 1) + 1)]
+    # Fetch a few chunks per RPC so large payloads stream in bounded memory.
+    for start in xrange(0, len(keys), 3):
+        for chunk in datastore_util.GetBatched(keys[start:start + 3]):
+            if chunk is None:
+                raise Error('Payload %s is missing chunks.' % info.key())
+            yield chunk.data
+
+
+def GetRange(info, start, end):
+    """Gets a byte range of a payload, loading only the chunks it spans.
+
+    Args:
+      info: freesidemodels.MemberPayload
+      start: int, offset of the first byte.
+      end: int, offset of the last byte, inclusive.
+    Yields:
+      str, pieces of the range in order.
+    """
+    end = min(end, info.size - 1)
+    if start > end:
+        return
+    chunk_size = _ChunkSize(info)
+    first = start // chunk_size
+    offset = first * chunk_size
+    for data in GetChunks(info, first, end // chunk_size):
+        yield data[max(0, start - offset):end - offset + 1]
+        offset += len(data)
+
+
+def GetPayload(member, name):
+    """Gets the data of a member's payload.
+
+    Args:
+      member: freesidemodels.Member or db.Key
+      name: str, one of PAYLOAD_NAMES.
+    Returns:
+      str, or None if the member has no such payload.
+    """
+    info = GetPayloadInfo(member, name)
+    if info is None:
+        return None
+    return ''.join(GetChunks(info))
+
+
+def _AllocateGeneration(payload_key):
+    """Reserves a chunk generation no other write of the payload will use."""
+    counter_key = db.Key.from_path(
+        'PayloadGeneration', payload_key.name(), parent=payload_key.parent())
+
+    def Txn():
+        counter, info = db.get([counter_key, payload_key])
+        if counter is None:
+            counter = freesidemodels.PayloadGeneration(key=counter_key)
+            if info is not None:
+                counter.last = info.generation
+        counter.last += 1
+        counter.put()
+        return counter.last
+    return db.run_in_transaction(Txn)
+
+
+def _CommitPayload(info):
+    """Points a payload at a fully written generation of chunks.
+
+    The chunks of the replaced generation are deleted afterwards.  If a
+    later generation has already been committed, this one's chunks are
+    deleted instead.
+
+    Args:
+      info: freesidemodels.MemberPayload, the new payload.
+    Raises:
+      StaleUploadError: if a later generation was committed first.
+    """
+    def Txn():
+        old = db.get(info.key())
+        if old is not None and old.generation > info.generation:
+            return old, False
+        info.put()
+        return old, True
+    old, committed = db.run_in_transaction(Txn)
+
+    if not committed:
+        _DeleteChunks(info)
+        raise StaleUploadError(
+            'Payload %s was replaced during the upload.' % info.key())
+    if info.key().name() in ROSTER_PAYLOAD_NAMES:
+        member_util.BumpRosterGeneration()
+    if old is not None and old.generation != info.generation:
+        _DeleteChunks(old)
+
+
+def _DeleteChunks(info):
+    datastore_util.DeleteBatched(
+        [_ChunkKey(info.key(), info.generation, i)
+         for i in xrange(info.num_chunks)])
+
+
+def PutPayload(member, name, data, content_type='application/octet-stream'):
+    """Stores a member's payload, replacing any existing one.
+
+    The new chunks are written before the payload that points at them, and
+    the old chunks are deleted afterwards, so readers always see a complete
+    payload.
+
+    Args:
+      member: freesidemodels.Member or db.Key, a saved member.
+      name: str, one of PAYLOAD_NAMES.
+      data: str, the payload.
+      content_type: str, the payload's MIME type.
+    Returns:
+      freesidemodels.MemberPayload
+    """
+    _CheckName(name)
+    payload_key = _PayloadKey(_MemberKey(member), name)
+    generation = _AllocateGeneration(payload_key)
+
+    chunks = []
+    for index, start in enumerate(xrange(0, len(data), CHUNK_SIZE)):
+        chunks.append(freesidemodels.PayloadChunk(
+            key=_ChunkKey(payload_key, generation, index),
+            data=db.Blob(data[start:start + CHUNK_SIZE])))
+    datastore_util.PutBatched(chunks, batch_size=3)
+
+    info = freesidemodels.MemberPayload(
+        key=payload_key,
+        content_type=content_type,
+        size=len(data),
+        num_chunks=len(chunks),
+        generation=generation,
+        chunk_size=CHUNK_SIZE,
+        sha1=hashlib.sha1(data).hexdigest())
+    _CommitPayload(info)
+    return info
+
+
+def StartUpload(member, name):
+    """Begins writing a payload one chunk per request.
+
+    Args:
+      member: freesidemodels.Member or db.Key, a saved member.
+      name: str, one of PAYLOAD_NAMES.
+    Returns:
+      int, the upload's generation, to pass to PutUploadChunk and
+      FinishUpload.
+    """
+    _CheckName(name)
+    return _AllocateGeneration(_PayloadKey(_MemberKey(member), name))
+
+
+def PutUploadChunk(member, name, generation, index, data):
+    """Stores one chunk of an upload begun by StartUpload.
+
+    Every chunk but the last must hold exactly CHUNK_SIZE bytes.
+
+    Args:
+      member: freesidemodels.Member or db.Key
+      name: str, one of PAYLOAD_NAMES.
+      generation: int, returned by StartUpload.
+      index: int, position of the chunk in the payload.
+      data: str, the chunk.
+    Raises:
+      UploadError: if the chunk is too large or the upload isn't open.
+    """
+    _CheckName(name)
+    if not data or len(data) > CHUNK_SIZE:
+        raise UploadError('Chunks must hold 1 to %d bytes.' % CHUNK_SIZE)
+    if index < 0:
+        raise UploadError('Invalid chunk index: %d' % index)
+    member_key = _MemberKey(member)
+    payload_key = _PayloadKey(member_key, name)
+    counter_key = db.Key.from_path(
+        'PayloadGeneration', name, parent=member_key)
+    chunk = freesidemodels.PayloadChunk(
+        key=_ChunkKey(payload_key, generation, index), data=db.Blob(data))
+
+    def Txn():
+        # Never write into the committed generation, or one not handed out.
+        counter, info = db.get([counter_key, payload_key])
+        if (counter is None or generation > counter.last or
+            (info is not None and generation <= info.generation)):
+            raise UploadError('Upload %d is not open.' % generation)
+        chunk.put()
+    db.run_in_transaction(Txn)
+
+
+def FinishUpload(member, name, generation, num_chunks,
+                 content_type='application/octet-stream'):
+    """Makes the chunks of an upload the member's payload.
+
+    Args:
+      member: freesidemodels.Member or db.Key
+      name: str, one of PAYLOAD_NAMES.
+      generation: int, returned by StartUpload.
+      num_chunks: int, number of chunks uploaded.
+      content_type: str, the payload's MIME type.
+    Returns:
+      freesidemodels.MemberPayload
+    Raises:
+      UploadError: if chunks are missing or of the wrong size.
+      StaleUploadError: if a later write finished first.
+    """
+    _CheckName(name)
+    if num_chunks < 1:
+        raise UploadError('An upload needs at least one chunk.')
+    info = freesidemodels.MemberPayload(
+        key=_PayloadKey(_MemberKey(member), name),
+        content_type=content_type,
+        num_chunks=num_chunks,
+        generation=generation,
+        chunk_size=CHUNK_SIZE)
+
+    sha1 = hashlib.sha1()
+    size = 0
+    try:
+        for index, data in enumerate(GetChunks(info)):
+            if index < num_chunks - 1 and len(data) != CHUNK_SIZE:
+                raise UploadError('Chunk %d is not %d bytes.' %
+                                  (index, CHUNK_SIZE))
+            sha1.update(data)
+            size += len(data)
+    except UploadError:
+        raise
+    except Error:
+        raise UploadError('Upload %d is missing chunks.' % generation)
+    info.size = size
+    info.sha1 = sha1.hexdigest()
+    _CommitPayload(info)
+    return info
+
+
+def DeletePayload(member, name):
+    """Deletes a member's payload and its chunks.
+
+    Args:
+      member: freesidemodels.Member or db.Key
+      name: str, one of PAYLOAD_NAMES.
+    """
+    info = GetPayloadInfo(member, name)
+    if info is not None:
+        db.delete(info)
+        _DeleteChunks(info)
+        if name in ROSTER_PAYLOAD_NAMES:
+            member_util.BumpRosterGeneration()
+
+
+def MigrateInlinePayloads(member):
+    """Moves a member's legacy inline blobs into MemberPayloads.
+
+    Args:
+      member: freesidemodels.Member
+    Returns:
+      list of str, the names of the payloads moved.
+    """
+    moved = []
+    for name in INLINE_PAYLOAD_NAMES:
+        data = getattr(member, name)
+        if data:
+            info = PutPayload(member, name, data)
+            if name == 'picture':
+                member.picture_version = info.sha1
+            setattr(member, name, None)
+            moved.append(name)
+    if moved:
+        try:
+            member_util.SaveIfChanged(member)
+        except member_util.DuplicateError:
+            # Lookups are rebuilt by their own task; still empty the blobs.
+            datastore_util.PutBatched([member])
+    return moved
+
+
+def MigrateAllInlinePayloads():
+    """Moves the inline blobs of every member into MemberPayloads.
+
+    Returns:
+      int, the number of members migrated.
+    """
+    migrated = 0
+    for member in datastore_util.IterQuery(
+            freesidemodels.Member.all(), batch_size=20):
+        if MigrateInlinePayloads(member):
+            migrated += 1
+    return migrated
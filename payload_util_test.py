@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+"""Unittest for payload_util.py"""
+
+import unittest
+
+import freesidemodels
+import member_util
+import payload_util
+import random_util
+import test_util
+
+
+class PayloadUtilTest(test_util.AppEngineTestBase):
+
+    def setUp(self):
+        test_util.AppEngineTestBase.setUp(self)
+        self.orig_chunk_size = payload_util.CHUNK_SIZE
+        payload_util.CHUNK_SIZE = 10
+        self.member = member_util.SaveMember(random_util.Member())
+
+    def tearDown(self):
+        payload_util.CHUNK_SIZE = self.orig_chunk_size
+        test_util.AppEngineTestBase.tearDown(self)
+
+    def testPutAndGet(self):
+        data = 'x' * 25 + 'y' * 10
+        info = payload_util.PutPayload(
+            self.member, 'doormusic', data, 'audio/mpeg')
+        self.assertEquals(4, info.num_chunks)
+        self.assertEquals(35, info.size)
+        self.assertEquals(data, payload_util.GetPayload(self.member, 'doormusic'))
+        self.assertEquals(
+            ['xxxxxyyyyy', 'yyyyy'],
+            list(payload_util.GetChunks(info, first=2)))
+        self.assertEquals(None, payload_util.GetPayload(self.member, 'picture'))
+
+    def testReplace(self):
+        payload_util.PutPayload(self.member, 'picture', 'a' * 30)
+        payload_util.PutPayload(self.member, 'picture', 'b' * 5)
+        self.assertEquals('b' * 5, payload_util.GetPayload(self.member, 'picture'))
+        self.assertEquals(1, freesidemodels.PayloadChunk.all().count())
+
+    def testDelete(self):
+        payload_util.PutPayload(self.member, 'picture', 'a' * 30)
+        payload_util.DeletePayload(self.member, 'picture')
+        self.assertEquals(None, payload_util.GetPayloadInfo(self.member, 'picture'))
+        self.assertEquals(0, freesidemodels.PayloadChunk.all().count())
+
+    def testGetRange(self):
+        info = payload_util.PutPayload(self.member, 'doormusic', 'abcdefghij' * 3)
+        self.assertEquals(
+            'jabcdefghija',
+            ''.join(payload_util.GetRange(info, 9, 20)))
+        self.assertEquals('hij', ''.join(payload_util.GetRange(info, 27, 99)))
+        self.assertEquals([], list(payload_util.GetRange(info, 30, 40)))
+
+    def testChunkedUpload(self):
+        payload_util.PutPayload(self.member, 'liabilitypdf', 'old')
+        generation = payload_util.StartUpload(self.member, 'liabilitypdf')
+        payload_util.PutUploadChunk(
+            self.member, 'liabilitypdf', generation, 1, 'y' * 3)
+        payload_util.PutUploadChunk(
+            self.member, 'liabilitypdf', generation, 0, 'x' * 10)
+        info = payload_util.FinishUpload(
+            self.member, 'liabilitypdf', generation, 2, 'application/pdf')
+        self.assertEquals(13, info.size)
+        self.assertEquals('x' * 10 + 'y' * 3,
+                          payload_util.GetPayload(self.member, 'liabilitypdf'))
+        self.assertEquals(2, freesidemodels.PayloadChunk.all().count())
+
+    def testUploadChecks(self):
+        generation = payload_util.StartUpload(self.member, 'doormusic')
+        self.assertRaises(payload_util.UploadError,
+                          payload_util.PutUploadChunk, self.member,
+                          'doormusic', generation + 1, 0, 'x')
+        self.assertRaises(payload_util.UploadError,
+                          payload_util.PutUploadChunk, self.member,
+                          'doormusic', generation, 0, 'x' * 11)
+        payload_util.PutUploadChunk(self.member, 'doormusic', generation, 0, 'x')
+        payload_util.PutUploadChunk(self.member, 'doormusic', generation, 1, 'y')
+        # Only the last chunk may be short.
+        self.assertRaises(payload_util.UploadError, payload_util.FinishUpload,
+                          self.member, 'doormusic', generation, 2)
+        self.assertRaises(payload_util.UploadError, payload_util.FinishUpload,
+                          self.member, 'doormusic', generation, 3)
+
+    def testStaleUpload(self):
+        generation = payload_util.StartUpload(self.member, 'doormusic')
+        payload_util.PutUploadChunk(self.member, 'doormusic', generation, 0, 'a')
+        payload_util.PutPayload(self.member, 'doormusic', 'newer')
+        self.assertRaises(payload_util.UploadError,
+                          payload_util.PutUploadChunk, self.member,
+                          'doormusic', generation, 1, 'b')
+        self.assertRaises(payload_util.StaleUploadError,
+                          payload_util.FinishUpload,
+                          self.member, 'doormusic', generation, 1)
+        self.assertEquals('newer',
+                          payload_util.GetPayload(self.member, 'doormusic'))
+
+    def testInvalidName(self):
+        self.assertRaises(payload_util.InvalidPayloadError,
+                          payload_util.PutPayload, self.member, 'foo', 'bar')
+
+    def testMigrate(self):
+        self.member.picture = 'p' * 12
+        self.member.liabilitypdf = 'pdf'
+        self.member.put()
+        self.assertEquals(1, payload_util.MigrateAllInlinePayloads())
+
+        member = freesidemodels.Member.get(self.member.key())
+        self.assertEquals(None, member.picture)
+        self.assertEquals('p' * 12, payload_util.GetPayload(member, 'picture'))
+        self.assertEquals('pdf', payload_util.GetPayload(member, 'liabilitypdf'))
+        self.assertEquals(0, payload_util.MigrateAllInlinePayloads())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+"""Utility functions for member pictures and their thumbnails."""
+
+from google.appengine.api import images
+
+import payload_util
+
+
+# Thumbnails are generated once, when a picture is uploaded, and are
+# bounded to a square of this many pixels.
+THUMBNAIL_SIZES = {
+    'small': 48,
+    'medium': 160,
+}
+# Payload holding the picture at each size that can be requested.
+SIZE_PAYLOADS = {
+    'small': 'picture_small',
+    'medium': 'picture_medium',
+    'full': 'picture',
+}
+
+_CONTENT_TYPES = {
+    images.PNG: 'image/png',
+    images.JPEG: 'image/jpeg',
+}
+
+
+class Error(Exception):
+    """Base error class for this module."""
+
+
+class InvalidPictureError(Error):
+    """Raised when an upload is not an image the images API can read."""
+
+
+def _ContentType(data):
+    """Guesses the content type of image data from its magic bytes."""
+    if data.startswith('\x89PNG'):
+        return 'image/png'
+    if data.startswith('\xff\xd8'):
+        return 'image/jpeg'
+    if data.startswith('GIF8'):
+        return 'image/gif'
+    raise InvalidPictureError('Pictures must be PNG, JPEG or GIF images.')
+
+
+def _MakeThumbnails(member, data):
+    """Stores a thumbnail payload for each of THUMBNAIL_SIZES."""
+    for size, pixels in THUMBNAIL_SIZES.iteritems():
+        try:
+            thumbnail = images.resize(
+                data, pixels, pixels, output_encoding=images.JPEG)
+        except images.Error, e:
+            raise InvalidPictureError(str(e))
+        payload_util.PutPayload(
+            member, SIZE_PAYLOADS[size], thumbnail,
+            _CONTENT_TYPES[images.JPEG])
+
+
+def SavePicture(member, data):
+    """Stores a member's picture along with its thumbnails.
+
+    Sets member.picture_version but leaves saving the member to the caller.
+
+    Args:
+      member: freesidemodels.Member, a saved member.
+      data: str, the uploaded image.
+    Returns:
+      freesidemodels.MemberPayload, the full-size picture.
+    """
+    content_type = _ContentType(data)
+    _MakeThumbnails(member, data)
+    info = payload_util.PutPayload(member, 'picture', data, content_type)
+    member.picture_version = info.sha1
+    return info
+
+
+def GetPictureInfo(member_key, size='full'):
+    """Gets the payload describing a member's picture at a given size.
+
+    Thumbnails are generated on the spot for pictures stored before
+    thumbnails existed, e.g. ones moved by the inline payload migration.
+
+    Args:
+      member_key: db.Key, the member.
+      size: str, one of SIZE_PAYLOADS.
+    Returns:
+      freesidemodels.MemberPayload or None
+    """
+    if size not in SIZE_PAYLOADS:
+        raise Error('Invalid picture size: %s' % size)
+    info = payload_util.GetPayloadInfo(member_key, SIZE_PAYLOADS[size])
+    if info is None and size != 'full':
+        data = payload_util.GetPayload(member_key, 'picture')
+        if data is not None:
+            _MakeThumbnails(member_key, data)
+            info = payload_util.GetPayloadInfo(member_key, SIZE_PAYLOADS[size])
+    return info
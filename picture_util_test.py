@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+"""Unittest for picture_util.py"""
+
+import unittest
+
+from google.appengine.api import apiproxy_stub_map
+from google.appengine.api.images import images_stub
+
+import member_util
+import payload_util
+import picture_util
+import random_util
+import test_util
+
+
+# A 2x2 transparent PNG.
+PNG = ('\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x02\x00\x00\x00\x02'
+       '\x08\x06\x00\x00\x00r\xb6\r$\x00\x00\x00\x0bIDATx\x9cc`@\x07\x00'
+       '\x00\x12\x00\x01w\xf1\xfa\x00\x00\x00\x00\x00IEND\xaeB`\x82')
+
+
+class PictureUtilTest(test_util.AppEngineTestBase):
+
+    def setUp(self):
+        test_util.AppEngineTestBase.setUp(self)
+        apiproxy_stub_map.apiproxy.RegisterStub(
+            'images', images_stub.ImagesServiceStub())
+        self.member = member_util.SaveMember(random_util.Member())
+
+    def testSavePicture(self):
+        info = picture_util.SavePicture(self.member, PNG)
+        member_util.SaveIfChanged(self.member)
+        self.assertEquals('image/png', info.content_type)
+        self.assertEquals(info.sha1, self.member.picture_version)
+        [summary] = member_util.GetActiveSummaries()
+        self.assertEquals(info.sha1, summary.picture_version)
+
+        small = picture_util.GetPictureInfo(self.member.key(), 'small')
+        self.assertEquals('image/jpeg', small.content_type)
+
+    def testThumbnailsForMigratedPictures(self):
+        payload_util.PutPayload(self.member, 'picture', PNG, 'image/png')
+        self.assertNotEquals(
+            None, picture_util.GetPictureInfo(self.member.key(), 'medium'))
+
+    def testInvalidPicture(self):
+        self.assertRaises(picture_util.InvalidPictureError,
+                          picture_util.SavePicture, self.member, 'not an image')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@
 """Utility functions for making random objects."""
 
 import datetime
+import itertools
 import random
 import string
 import hashlib
@@ -19,6 +20,9 @@ NAMES = (
     'Andrew Johnson', 'Ulysses S. Grant', 'Rutherford B. Hayes',
     'James A. Garfield', 'Chester A. Arthur', 'Grover Cleveland')
 
+# Usernames and emails must be unique, so random people get a serial suffix.
+_SERIAL = itertools.count(1)
+
 
 def _NameAttributes(name):
     """Gets attributes about a name.
@@ -63,6 +67,8 @@ def PersonDict(active=True, admin=False):
     """
     # TODO(dknowles): Populate "left" if active is False
     name_dict = _NameAttributes(random.choice(NAMES))
+    name_dict['username'] += str(_SERIAL.next())
+    name_dict['email'] = '%s@domain.com' % name_dict['username']
     name_dict.update(
         {'password': Password(),
          'active': active,
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+
+"""Compact roster snapshots and deltas for offline door controllers.
+
+A roster is a 24 byte header followed by fixed-size 64 byte records, all
+big-endian:
+
+  header: magic (4s), format (H), record size (H), version (Q),
+          record count (I), reserved (I)
+  record: rfid (Q), member id (Q), flags (B), username (47s, UTF-8,
+          NUL padded)
+
+Snapshot records are sorted by rfid, so a controller can mmap the file and
+binary search it in place; see FindRfid.  Delta records are in the order
+the members changed.  To apply one, a controller drops any record with the
+same member id and then inserts the new record unless it is flagged
+DELETED.
+
+Versions are microseconds since the epoch of Member.updated.  A delta
+since version V holds every member updated after V, so a controller
+passes the version of the last snapshot or delta it applied.
+"""
+
+import calendar
+import datetime
+import struct
+
+from google.appengine.api import memcache
+
+import datastore_util
+import freesidemodels
+import member_util
+
+
+SNAPSHOT_MAGIC = 'FSRS'
+DELTA_MAGIC = 'FSRD'
+FORMAT = 1
+HEADER = struct.Struct('>4sHHQII')
+RECORD = struct.Struct('>QQB47s')
+
+FLAG_ACTIVE = 1
+FLAG_STARVING = 2
+FLAG_DELETED = 4
+
+# Writes may commit a little after the time in their Member.updated, so
+# versions never move closer to the present than this.  Members updated
+# within the window are sent again by the next delta, which is harmless.
+VERSION_LAG = datetime.timedelta(seconds=30)
+SNAPSHOT_CACHE_SECONDS = 24 * 60 * 60
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+class Error(Exception):
+    """Base error class for this module."""
+
+
+class FormatError(Error):
+    """Raised when roster data can't be parsed."""
+
+
+def _Version(dt):
+    """Converts a naive UTC datetime to a roster version."""
+    return calendar.timegm(dt.utctimetuple()) * 1000000 + dt.microsecond
+
+
+def _Datetime(version):
+    return _EPOCH + datetime.timedelta(microseconds=version)
+
+
+def _SafeVersion(latest):
+    """Caps a version so it never gets ahead of unfinished writes."""
+    return min(latest, _Version(datetime.datetime.utcnow() - VERSION_LAG))
+
+
+def _Username(username):
+    """Encodes a username into its fixed-width field."""
+    data = (username or u'').encode('utf-8')[:RECORD.size - 17]
+    # Don't leave half of a multibyte character at the end.
+    return data.decode('utf-8', 'ignore').encode('utf-8')
+
+
+def _Record(member):
+    """Builds the record tuple of a member."""
+    if member.rfid is None:
+        return (0, member.key().id(), FLAG_DELETED, '')
+    flags = 0
+    if member.active:
+        flags |= FLAG_ACTIVE
+    if member.starving:
+        flags |= FLAG_STARVING
+    return (member.rfid, member.key().id(), flags, _Username(member.username))
+
+
+def PackRoster(magic, version, records):
+    """Packs a snapshot or delta.
+
+    Args:
+      magic: str, SNAPSHOT_MAGIC or DELTA_MAGIC.
+      version: int, the version the data brings a controller up to.
+      records: list of (rfid, member id, flags, username) tuples, with the
+        username already encoded.
+    Returns:
+      str
+    """
+    parts = [HEADER.pack(magic, FORMAT, RECORD.size, version, len(records), 0)]
+    for record in records:
+        parts.append(RECORD.pack(*record))
+    return ''.join(parts)
+
+
+def UnpackRoster(data):
+    """Unpacks a snapshot or delta packed by PackRoster.
+
+    Args:
+      data: str or mmap
+    Returns:
+      (magic, version, records) where records is a list of (rfid, member
+      id, flags, unicode username) tuples.
+    """
+    if len(data) < HEADER.size:
+        raise FormatError('Roster is too short.')
+    magic, fmt, record_size, version, count, _ = HEADER.unpack(
+        data[:HEADER.size])
+    if fmt != FORMAT or record_size != RECORD.size:
+        raise FormatError('Unsupported roster format %d.' % fmt)
+    if len(data) != HEADER.size + count * RECORD.size:
+        raise FormatError('Roster length does not match its header.')
+    records = []
+    for i in xrange(count):
+        start = HEADER.size + i * RECORD.size
+        rfid, member_id, flags, username = RECORD.unpack(
+            data[start:start + RECORD.size])
+        records.append((rfid, member_id, flags,
+                        username.rstrip('\0').decode('utf-8')))
+    return magic, version, records
+
+
+def FindRfid(data, rfid):
+    """Binary searches a snapshot for a card without unpacking it.
+
+    This is what a controller does against its mmapped snapshot.
+
+    Args:
+      data: str or mmap, a packed snapshot.
+      rfid: int, the card number.
+    Returns:
+      (rfid, member id, flags, unicode username) or None.
+    """
+    count = HEADER.unpack(data[:HEADER.size])[4]
+    low, high = 0, count
+    while low < high:
+        middle = (low + high) // 2
+        start = HEADER.size + middle * RECORD.size
+        record = RECORD.unpack(data[start:start + RECORD.size])
+        if record[0] < rfid:
+            low = middle + 1
+        elif record[0] > rfid:
+            high = middle
+        else:
+            return record[:3] + (record[3].rstrip('\0').decode('utf-8'),)
+    return None
+
+
+def BuildSnapshot():
+    """Packs the whole door roster.
+
+    Returns:
+      (version, str)
+    """
+    latest = 0
+    records = []
+    for page in datastore_util.IterQueryPages(freesidemodels.Member.all()):
+        for member in page:
+            if member.updated is not None:
+                latest = max(latest, _Version(member.updated))
+            if member.rfid is not None:
+                records.append(_Record(member))
+    records.sort()
+    version = _SafeVersion(latest)
+    return version, PackRoster(SNAPSHOT_MAGIC, version, records)
+
+
+def BuildDelta(since):
+    """Packs the roster records of members updated after a version.
+
+    Args:
+      since: int, the version the controller last applied.
+    Returns:
+      (version, str)
+    """
+    query = freesidemodels.Member.all().filter(
+        'updated >', _Datetime(since)).order('updated')
+    latest = since
+    records = []
+    for member in datastore_util.IterQuery(query):
+        latest = max(latest, _Version(member.updated))
+        records.append(_Record(member))
+    version = max(since, _SafeVersion(latest))
+    return version, PackRoster(DELTA_MAGIC, version, records)
+
+
+def GetSnapshot():
+    """Gets the packed roster, cached for the current roster generation.
+
+    Returns:
+      (version, str)
+    """
+    cache_key = 'roster_snapshot:%d' % member_util.GetRosterGeneration()
+    snapshot = memcache.get(cache_key)
+    if snapshot is None:
+        snapshot = BuildSnapshot()
+        memcache.set(cache_key, snapshot, SNAPSHOT_CACHE_SECONDS)
+    return snapshot
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+"""Unittest for roster_util.py"""
+
+import datetime
+import unittest
+
+import member_util
+import random_util
+import roster_util
+import test_util
+
+
+class PackingTest(unittest.TestCase):
+
+    def testRoundTrip(self):
+        records = [(5, 1, roster_util.FLAG_ACTIVE, 'alice'),
+                   (9, 2, 0, u'b\xe9a'.encode('utf-8'))]
+        packed = roster_util.PackRoster(roster_util.SNAPSHOT_MAGIC, 42, records)
+        self.assertEquals(roster_util.HEADER.size + 2 * roster_util.RECORD.size,
+                          len(packed))
+        magic, version, unpacked = roster_util.UnpackRoster(packed)
+        self.assertEquals(roster_util.SNAPSHOT_MAGIC, magic)
+        self.assertEquals(42, version)
+        self.assertEquals([(5, 1, 1, u'alice'), (9, 2, 0, u'b\xe9a')],
+                          unpacked)
+
+    def testFindRfid(self):
+        records = [(rfid, rfid, 0, 'm%d' % rfid) for rfid in range(1, 100, 3)]
+        packed = roster_util.PackRoster(roster_util.SNAPSHOT_MAGIC, 1, records)
+        self.assertEquals((40, 40, 0, u'm40'), roster_util.FindRfid(packed, 40))
+        self.assertEquals(None, roster_util.FindRfid(packed, 41))
+        self.assertEquals(None, roster_util.FindRfid(packed, 1000))
+
+    def testTruncated(self):
+        packed = roster_util.PackRoster(
+            roster_util.SNAPSHOT_MAGIC, 1, [(1, 1, 0, 'a')])
+        self.assertRaises(roster_util.FormatError,
+                          roster_util.UnpackRoster, packed[:-1])
+
+    def testLongUsername(self):
+        username = u'\xe9' * 40
+        self.assertEquals(u'\xe9' * 23,
+                          roster_util._Username(username).decode('utf-8'))
+
+
+class SyncTest(test_util.AppEngineTestBase):
+
+    def setUp(self):
+        test_util.AppEngineTestBase.setUp(self)
+        self.orig_lag = roster_util.VERSION_LAG
+        roster_util.VERSION_LAG = datetime.timedelta(0)
+        self.members = [member_util.SaveMember(random_util.Member())
+                        for _ in range(3)]
+
+    def tearDown(self):
+        roster_util.VERSION_LAG = self.orig_lag
+        test_util.AppEngineTestBase.tearDown(self)
+
+    def testSnapshotIsSorted(self):
+        version, packed = roster_util.BuildSnapshot()
+        magic, unpacked_version, records = roster_util.UnpackRoster(packed)
+        self.assertEquals(version, unpacked_version)
+        self.assertEquals(sorted([m.rfid for m in self.members]),
+                          [record[0] for record in records])
+
+    def testDelta(self):
+        version, _ = roster_util.BuildSnapshot()
+        member = self.members[1]
+        member.rfid = None
+        member_util.SaveMember(member)
+
+        new_version, packed = roster_util.BuildDelta(version)
+        self.assertTrue(new_version > version)
+        magic, _, records = roster_util.UnpackRoster(packed)
+        self.assertEquals(roster_util.DELTA_MAGIC, magic)
+        self.assertEquals([(0, member.key().id(), roster_util.FLAG_DELETED,
+                            u'')], records)
+        self.assertEquals([], roster_util.UnpackRoster(
+            roster_util.BuildDelta(new_version)[1])[2])
+
+    def testSnapshotCachedPerGeneration(self):
+        first = roster_util.GetSnapshot()
+        self.assertEquals(first, roster_util.GetSnapshot())
+        self.members[0].rfid = 5000
+        member_util.SaveMember(self.members[0])
+        self.assertNotEquals(first[1], roster_util.GetSnapshot()[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+
+"""Template tags for building URLs from the routes in route_util.py.
+
+Usage: <a href="{% route "profile" member.username %}">
+"""
+
+from google.appengine.ext import webapp
+
+from django import template
+
+import route_util
+
+
+register = webapp.template.create_template_register()
+
+
+class RouteNode(template.Node):
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def render(self, context):
+        return route_util.Url(
+            template.resolve_variable(self.name, context),
+            *[template.resolve_variable(arg, context) for arg in self.args])
+
+
+def route(parser, token):
+    """Gets the URL of a named route, given the values of its groups."""
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(
+            '%r takes a route name and its arguments.' % bits[0])
+    return RouteNode(bits[1], bits[2:])
+
+register.tag(route)
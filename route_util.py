@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+
+"""URL routing with an explicit route order and reverse URLs.
+
+Routes are tried in the order they are listed, like webapp's own list of
+(regex, handler) pairs, but only the routes that can match a path's first
+segment are tried: routes whose first segment is plain text are bucketed
+by it, and routes whose first segment is a pattern are tried for every
+path, in their place in the order.
+"""
+
+import re
+import urllib
+
+from google.appengine.ext import webapp
+
+
+# Characters that make a path segment a pattern rather than plain text.
+_PATTERN_CHARS = re.compile(r'[.^$*+?{}\[\]\\|()]')
+_GROUP = re.compile(r'\((?!\?:)[^()]*\)')
+# Routes reversed by Url(), set by SetRouter.
+_router = None
+
+
+class Error(Exception):
+    """Base error class for this module."""
+
+
+class ReverseError(Error):
+    """Raised when a URL can't be built for a route."""
+
+
+class Route(object):
+    """A path pattern and the handler that serves it.
+
+    Attributes:
+      pattern: str, a regex that must match the whole path.
+      handler: webapp.RequestHandler subclass.
+      name: str or None, used to build URLs with Router.Url.
+      regexp: compiled pattern.
+      bucket: str, the plain-text first path segment, or None if the first
+          segment is a pattern.
+    """
+
+    def __init__(self, pattern, handler, name=None):
+        self.pattern = pattern
+        self.handler = handler
+        self.name = name
+        self.regexp = re.compile('^%s$' % pattern)
+        self.bucket = FirstSegment(pattern)
+        if _PATTERN_CHARS.search(self.bucket):
+            self.bucket = None
+        self._template = _ReverseTemplate(pattern)
+
+    def Url(self, *args):
+        """Builds a URL this route matches.
+
+        Args:
+          args: values of the route's groups, in order.  They are quoted.
+        Returns:
+          str
+        """
+        if self._template is None:
+            raise ReverseError('Route %r can not be reversed.' % self.pattern)
+        template, num_groups = self._template
+        if len(args) != num_groups:
+            raise ReverseError('Route %r takes %d arguments, not %d.' % (
+                self.pattern, num_groups, len(args)))
+        return template % tuple([_Quote(arg) for arg in args])
+
+
+def FirstSegment(path):
+    """Gets the text between the first and second slashes of a path."""
+    parts = path.split('/', 2)
+    if len(parts) < 2:
+        return ''
+    return parts[1]
+
+
+def _Quote(arg):
+    if isinstance(arg, unicode):
+        arg = arg.encode('utf-8')
+    return urllib.quote(str(arg), '')
+
+
+def _ReverseTemplate(pattern):
+    """Turns a route pattern into a %s template for its groups.
+
+    Returns:
+      (template, number of groups), or None if the pattern has anything but
+      plain text, groups and an optional trailing slash.
+    """
+    template, num_groups = _GROUP.subn('%s', pattern.replace('%', '%%'))
+    if template.endswith('/?'):
+        template = template[:-2] or '/'
+    if _PATTERN_CHARS.search(re.sub(r'\\.', '', template)):
+        return None
+    return re.sub(r'\\(.)', r'\1', template), num_groups
+
+
+class Router(object):
+    """Finds the route for a path, and builds URLs for named routes."""
+
+    def __init__(self, routes):
+        """Compiles the routes.
+
+        Args:
+          routes: list of Route, in the order they should be tried.
+        """
+        self.routes = list(routes)
+        self._named = {}
+        for route in self.routes:
+            if route.name is not None:
+                if route.name in self._named:
+                    raise Error('Two routes are named %r.' % route.name)
+                self._named[route.name] = route
+        # Each bucket holds its own routes and the ones any path could
+        # match, still in the order they were given.
+        self._anywhere = [route for route in self.routes
+                          if route.bucket is None]
+        self._buckets = {}
+        for route in self.routes:
+            if route.bucket is not None:
+                self._buckets.setdefault(route.bucket, [])
+        for bucket in self._buckets:
+            self._buckets[bucket] = [
+                route for route in self.routes
+                if route.bucket == bucket or route.bucket is None]
+
+    def Match(self, path):
+        """Finds the first route that matches a path.
+
+        Args:
+          path: str, e.g. '/members/bender'.
+        Returns:
+          (Route, tuple of groups), or (None, ()) if no route matches.
+        """
+        for route in self._buckets.get(FirstSegment(path), self._anywhere):
+            match = route.regexp.match(path)
+            if match:
+                return route, match.groups()
+        return None, ()
+
+    def Url(self, name, *args):
+        """Builds a URL for a named route.
+
+        Args:
+          name: str, the route's name.
+          args: values of the route's groups, in order.
+        Returns:
+          str
+        """
+        try:
+            route = self._named[name]
+        except KeyError:
+            raise ReverseError('No route is named %r.' % name)
+        return route.Url(*args)
+
+
+def SetRouter(router):
+    """Sets the router that Url() and the {% route %} tag use."""
+    global _router
+    _router = router
+
+
+def Url(name, *args):
+    """Builds a URL for a named route of the router set by SetRouter."""
+    if _router is None:
+        raise ReverseError('No router has been set.')
+    return _router.Url(name, *args)
+
+
+class WSGIApplication(webapp.WSGIApplication):
+    """A webapp application that dispatches through a Router.
+
+    Handlers see the same request, response and arguments as they would
+    under webapp.WSGIApplication.
+    """
+
+    METHODS = ('get', 'post', 'head', 'options', 'put', 'delete', 'trace')
+
+    def __init__(self, router, debug=False):
+        webapp.WSGIApplication.__init__(
+            self, [(route.pattern, route.handler) for route in router.routes],
+            debug=debug)
+        self.router = router
+        self._debug = debug
+
+    def __call__(self, environ, start_response):
+        request = webapp.Request(environ)
+        response = webapp.Response()
+        webapp.WSGIApplication.active_instance = self
+
+        route, groups = self.router.Match(request.path)
+        self.current_request_args = groups
+        if route is None:
+            response.set_status(404)
+        else:
+            handler = route.handler()
+            handler.initialize(request, response)
+            method = environ['REQUEST_METHOD'].lower()
+            try:
+                if method in self.METHODS:
+                    getattr(handler, method)(*groups)
+                else:
+                    handler.error(501)
+            except Exception, e:
+                handler.handle_exception(e, self._debug)
+
+        response.wsgi_write(start_response)
+        return ['']
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+"""Unittest for route_util.py"""
+
+import unittest
+
+import route_util
+
+
+class Handler(object):
+    pass
+
+
+class RouterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.router = route_util.Router([
+            route_util.Route(r'/', Handler, 'root'),
+            route_util.Route(r'/members/?', Handler, 'members'),
+            route_util.Route(r'/members/([^/]+)/picture', Handler, 'picture'),
+            route_util.Route(r'/members/([^/]+)', Handler, 'profile'),
+            route_util.Route(r'/(\w+)\.txt', Handler, 'text'),
+            route_util.Route(r'/door/rfid/(\d+)', Handler),
+            ])
+
+    def Name(self, path):
+        return self.router.Match(path)[0].name
+
+    def testMatchInOrder(self):
+        self.assertEquals('root', self.Name('/'))
+        self.assertEquals('members', self.Name('/members'))
+        self.assertEquals('members', self.Name('/members/'))
+        self.assertEquals('picture', self.Name('/members/fry/picture'))
+        self.assertEquals(
+            ('fry',), self.router.Match('/members/fry')[1])
+        self.assertEquals((None, ()), self.router.Match('/members/a/b'))
+        self.assertEquals((None, ()), self.router.Match('/elections'))
+
+    def testPatternFirstSegment(self):
+        self.assertEquals(None, self.router.routes[4].bucket)
+        self.assertEquals('text', self.Name('/robots.txt'))
+        self.assertEquals('members', self.router.routes[1].bucket)
+
+    def testUrl(self):
+        self.assertEquals('/', self.router.Url('root'))
+        self.assertEquals('/members', self.router.Url('members'))
+        self.assertEquals('/members/a%2Fb%20c/picture',
+                          self.router.Url('picture', 'a/b c'))
+        self.assertEquals('/robots.txt', self.router.Url('text', 'robots'))
+
+    def testUrlErrors(self):
+        self.assertRaises(route_util.ReverseError, self.router.Url, 'nope')
+        self.assertRaises(route_util.ReverseError, self.router.Url, 'profile')
+
+    def testDuplicateNames(self):
+        self.assertRaises(route_util.Error, route_util.Router, [
+            route_util.Route(r'/a', Handler, 'a'),
+            route_util.Route(r'/b', Handler, 'a')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,741 @@
+var a,COMPILED=true,goog=goog||{};goog.global=this;goog.DEBUG=true;goog.LOCALE="en";goog.evalWorksForGlobals_=null;goog.provide=function(b){if(!COMPILED){if(goog.getObjectByName(b)&&!goog.implicitNamespaces_[b])throw Error('Namespace "'+b+'" already declared.');for(var c=b;c=c.substring(0,c.lastIndexOf("."));)goog.implicitNamespaces_[c]=true}goog.exportPath_(b)};if(!COMPILED)goog.implicitNamespaces_={};
+goog.exportPath_=function(b,c,d){b=b.split(".");d=d||goog.global;!(b[0]in d)&&d.execScript&&d.execScript("var "+b[0]);for(var e;b.length&&(e=b.shift());)if(!b.length&&goog.isDef(c))d[e]=c;else d=d[e]?d[e]:(d[e]={})};goog.getObjectByName=function(b,c){b=b.split(".");c=c||goog.global;for(var d;d=b.shift();)if(c[d])c=c[d];else return null;return c};goog.globalize=function(b,c){c=c||goog.global;for(var d in b)c[d]=b[d]};
+goog.addDependency=function(b,c,d){if(!COMPILED){var e;b=b.replace(/\\/g,"/");for(var f=goog.dependencies_,g=0;e=c[g];g++){f.nameToPath[e]=b;b in f.pathToNames||(f.pathToNames[b]={});f.pathToNames[b][e]=true}for(e=0;c=d[e];e++){b in f.requires||(f.requires[b]={});f.requires[b][c]=true}}};
+goog.require=function(b){if(!COMPILED)if(!goog.getObjectByName(b)){var c=goog.getPathFromDeps_(b);if(c){goog.included_[c]=true;goog.writeScripts_()}else{b="goog.require could not find: "+b;goog.global.console&&goog.global.console.error(b);throw Error(b);}}};goog.useStrictRequires=false;goog.basePath="";goog.nullFunction=function(){};goog.identityFunction=function(b){return b};goog.abstractMethod=function(){throw Error("unimplemented abstract method");};
+goog.addSingletonGetter=function(b){b.getInstance=function(){return b.instance_||(b.instance_=new b)}};
+if(!COMPILED){goog.included_={};goog.dependencies_={pathToNames:{},nameToPath:{},requires:{},visited:{},written:{}};goog.inHtmlDocument_=function(){var b=goog.global.document;return typeof b!="undefined"&&"write"in b};goog.findBasePath_=function(){if(goog.inHtmlDocument_()){var b=goog.global.document;if(goog.global.CLOSURE_BASE_PATH)goog.basePath=goog.global.CLOSURE_BASE_PATH;else{b=b.getElementsByTagName("script");for(var c,d=0;c=b[d];d++){c=c.src;var e=c.length;if(c.substr(e-7)=="base.js"){goog.basePath=
+c.substr(0,e-7);return}}}}};goog.writeScriptTag_=function(b){if(goog.inHtmlDocument_()&&!goog.dependencies_.written[b]){goog.dependencies_.written[b]=true;var c=goog.global.document;c.write('<script type="text/javascript" src="'+b+'"><\/script>')}};goog.writeScripts_=function(){var b=[],c={},d=goog.dependencies_;function e(g){if(!(g in d.written)){if(!(g in d.visited)){d.visited[g]=true;if(g in d.requires)for(var h in d.requires[g])if(h in d.nameToPath)e(d.nameToPath[h]);else if(!goog.getObjectByName(h))throw Error("Undefined nameToPath for "+
+h);}if(!(g in c)){c[g]=true;b.push(g)}}}for(var f in goog.included_)d.written[f]||e(f);for(f=0;f<b.length;f++)if(b[f])goog.writeScriptTag_(goog.basePath+b[f]);else throw Error("Undefined script input");};goog.getPathFromDeps_=function(b){return b in goog.dependencies_.nameToPath?goog.dependencies_.nameToPath[b]:null};goog.findBasePath_();goog.global.CLOSURE_NO_DEPS||goog.writeScriptTag_(goog.basePath+"deps.js")}
+goog.typeOf=function(b){var c=typeof b;if(c=="object")if(b){if(b instanceof Array||!(b instanceof Object)&&Object.prototype.toString.call(b)=="[object Array]"||typeof b.length=="number"&&typeof b.splice!="undefined"&&typeof b.propertyIsEnumerable!="undefined"&&!b.propertyIsEnumerable("splice"))return"array";if(!(b instanceof Object)&&(Object.prototype.toString.call(b)=="[object Function]"||typeof b.call!="undefined"&&typeof b.propertyIsEnumerable!="undefined"&&!b.propertyIsEnumerable("call")))return"function"}else return"null";
+else if(c=="function"&&typeof b.call=="undefined")return"object";return c};goog.propertyIsEnumerableCustom_=function(b,c){if(c in b)for(var d in b)if(d==c&&Object.prototype.hasOwnProperty.call(b,c))return true;return false};goog.propertyIsEnumerable_=function(b,c){return b instanceof Object?Object.prototype.propertyIsEnumerable.call(b,c):goog.propertyIsEnumerableCustom_(b,c)};goog.isDef=function(b){return b!==undefined};goog.isNull=function(b){return b===null};
+goog.isDefAndNotNull=function(b){return b!=null};goog.isArray=function(b){return goog.typeOf(b)=="array"};goog.isArrayLike=function(b){var c=goog.typeOf(b);return c=="array"||c=="object"&&typeof b.length=="number"};goog.isDateLike=function(b){return goog.isObject(b)&&typeof b.getFullYear=="function"};goog.isString=function(b){return typeof b=="string"};goog.isBoolean=function(b){return typeof b=="boolean"};goog.isNumber=function(b){return typeof b=="number"};
+goog.isFunction=function(b){return goog.typeOf(b)=="function"};goog.isObject=function(b){b=goog.typeOf(b);return b=="object"||b=="array"||b=="function"};goog.getHashCode=function(b){if(b.hasOwnProperty&&b.hasOwnProperty(goog.HASH_CODE_PROPERTY_))return b[goog.HASH_CODE_PROPERTY_];b[goog.HASH_CODE_PROPERTY_]||(b[goog.HASH_CODE_PROPERTY_]=++goog.hashCodeCounter_);return b[goog.HASH_CODE_PROPERTY_]};goog.removeHashCode=function(b){"removeAttribute"in b&&b.removeAttribute(goog.HASH_CODE_PROPERTY_);try{delete b[goog.HASH_CODE_PROPERTY_]}catch(c){}};
+goog.HASH_CODE_PROPERTY_="closure_hashCode_"+Math.floor(Math.random()*2147483648).toString(36);goog.hashCodeCounter_=0;goog.cloneObject=function(b){var c=goog.typeOf(b);if(c=="object"||c=="array"){if(b.clone)return b.clone.call(b);c=c=="array"?[]:{};for(var d in b)c[d]=goog.cloneObject(b[d]);return c}return b};
+goog.bind=function(b,c){var d=c||goog.global;if(arguments.length>2){var e=Array.prototype.slice.call(arguments,2);return function(){var f=Array.prototype.slice.call(arguments);Array.prototype.unshift.apply(f,e);return b.apply(d,f)}}else return function(){return b.apply(d,arguments)}};goog.partial=function(b){var c=Array.prototype.slice.call(arguments,1);return function(){var d=Array.prototype.slice.call(arguments);d.unshift.apply(d,c);return b.apply(this,d)}};
+goog.mixin=function(b,c){for(var d in c)b[d]=c[d]};goog.now=Date.now||function(){return(new Date).getTime()};
+goog.globalEval=function(b){if(goog.global.execScript)goog.global.execScript(b,"JavaScript");else if(goog.global.eval){if(goog.evalWorksForGlobals_==null){goog.global.eval("var _et_ = 1;");if(typeof goog.global._et_!="undefined"){delete goog.global._et_;goog.evalWorksForGlobals_=true}else goog.evalWorksForGlobals_=false}if(goog.evalWorksForGlobals_)goog.global.eval(b);else{var c=goog.global.document,d=c.createElement("script");d.type="text/javascript";d.defer=false;d.appendChild(c.createTextNode(b));
+c.body.appendChild(d);c.body.removeChild(d)}}else throw Error("goog.globalEval not available");};goog.typedef=true;goog.getCssName=function(b,c){b=b+(c?"-"+c:"");return goog.cssNameMapping_&&b in goog.cssNameMapping_?goog.cssNameMapping_[b]:b};goog.setCssNameMapping=function(b){goog.cssNameMapping_=b};goog.getMsg=function(b,c){c=c||{};for(var d in c)b=b.replace(new RegExp("\\{\\$"+d+"\\}","gi"),c[d]);return b};goog.exportSymbol=function(b,c,d){goog.exportPath_(b,c,d)};
+goog.exportProperty=function(b,c,d){b[c]=d};goog.inherits=function(b,c){function d(){}d.prototype=c.prototype;b.superClass_=c.prototype;b.prototype=new d;b.prototype.constructor=b};goog.array={};goog.array.ArrayLike=goog.typedef;goog.array.peek=function(b){return b[b.length-1]};goog.array.indexOf=function(b,c,d){if(b.indexOf)return b.indexOf(c,d);if(Array.indexOf)return Array.indexOf(b,c,d);for(d=d=d==null?0:d<0?Math.max(0,b.length+d):d;d<b.length;d++)if(d in b&&b[d]===c)return d;return-1};
+goog.array.lastIndexOf=function(b,c,d){d=d==null?b.length-1:d;if(b.lastIndexOf)return b.lastIndexOf(c,d);if(Array.lastIndexOf)return Array.lastIndexOf(b,c,d);if(d<0)d=Math.max(0,b.length+d);for(d=d;d>=0;d--)if(d in b&&b[d]===c)return d;return-1};goog.array.forEach=function(b,c,d){if(b.forEach)b.forEach(c,d);else if(Array.forEach)Array.forEach(b,c,d);else for(var e=b.length,f=goog.isString(b)?b.split(""):b,g=0;g<e;g++)g in f&&c.call(d,f[g],g,b)};
+goog.array.forEachRight=function(b,c,d){var e=b.length,f=goog.isString(b)?b.split(""):b;for(e=e-1;e>=0;--e)e in f&&c.call(d,f[e],e,b)};goog.array.filter=function(b,c,d){if(b.filter)return b.filter(c,d);if(Array.filter)return Array.filter(b,c,d);for(var e=b.length,f=[],g=0,h=goog.isString(b)?b.split(""):b,i=0;i<e;i++)if(i in h){var j=h[i];if(c.call(d,j,i,b))f[g++]=j}return f};
+goog.array.map=function(b,c,d){if(b.map)return b.map(c,d);if(Array.map)return Array.map(b,c,d);for(var e=b.length,f=[],g=0,h=goog.isString(b)?b.split(""):b,i=0;i<e;i++)if(i in h)f[g++]=c.call(d,h[i],i,b);return f};goog.array.reduce=function(b,c,d,e){if(b.reduce)return e?b.reduce(goog.bind(c,e),d):b.reduce(c,d);var f=d;goog.array.forEach(b,function(g,h){f=c.call(e,f,g,h,b)});return f};
+goog.array.reduceRight=function(b,c,d,e){if(b.reduceRight)return e?b.reduceRight(goog.bind(c,e),d):b.reduceRight(c,d);var f=d;goog.array.forEachRight(b,function(g,h){f=c.call(e,f,g,h,b)});return f};goog.array.some=function(b,c,d){if(b.some)return b.some(c,d);if(Array.some)return Array.some(b,c,d);for(var e=b.length,f=goog.isString(b)?b.split(""):b,g=0;g<e;g++)if(g in f&&c.call(d,f[g],g,b))return true;return false};
+goog.array.every=function(b,c,d){if(b.every)return b.every(c,d);if(Array.every)return Array.every(b,c,d);for(var e=b.length,f=goog.isString(b)?b.split(""):b,g=0;g<e;g++)if(g in f&&!c.call(d,f[g],g,b))return false;return true};goog.array.find=function(b,c,d){c=goog.array.findIndex(b,c,d);return c<0?null:goog.isString(b)?b.charAt(c):b[c]};goog.array.findIndex=function(b,c,d){for(var e=b.length,f=goog.isString(b)?b.split(""):b,g=0;g<e;g++)if(g in f&&c.call(d,f[g],g,b))return g;return-1};
+goog.array.findRight=function(b,c,d){c=goog.array.findIndexRight(b,c,d);return c<0?null:goog.isString(b)?b.charAt(c):b[c]};goog.array.findIndexRight=function(b,c,d){var e=b.length,f=goog.isString(b)?b.split(""):b;for(e=e-1;e>=0;e--)if(e in f&&c.call(d,f[e],e,b))return e;return-1};goog.array.contains=function(b,c){if(b.contains)return b.contains(c);return goog.array.indexOf(b,c)>-1};goog.array.isEmpty=function(b){return b.length==0};
+goog.array.clear=function(b){if(!goog.isArray(b))for(var c=b.length-1;c>=0;c--)delete b[c];b.length=0};goog.array.insert=function(b,c){goog.array.contains(b,c)||b.push(c)};goog.array.insertAt=function(b,c,d){goog.array.splice(b,d,0,c)};goog.array.insertArrayAt=function(b,c,d){goog.partial(goog.array.splice,b,d,0).apply(null,c)};goog.array.insertBefore=function(b,c,d){var e;arguments.length==2||(e=goog.array.indexOf(b,d))==-1?b.push(c):goog.array.insertAt(b,c,e)};
+goog.array.remove=function(b,c){c=goog.array.indexOf(b,c);var d;if(d=c!=-1)goog.array.removeAt(b,c);return d};goog.array.removeAt=function(b,c){return Array.prototype.splice.call(b,c,1).length==1};goog.array.removeIf=function(b,c,d){c=goog.array.findIndex(b,c,d);if(c>=0){goog.array.removeAt(b,c);return true}return false};goog.array.clone=function(b){if(goog.isArray(b))return b.concat();else{for(var c=[],d=0,e=b.length;d<e;d++)c[d]=b[d];return c}};
+goog.array.toArray=function(b){if(goog.isArray(b))return b.concat();return goog.array.clone(b)};goog.array.extend=function(b){for(var c=1;c<arguments.length;c++){var d=arguments[c];if(goog.isArrayLike(d)){d=goog.array.toArray(d);b.push.apply(b,d)}else b.push(d)}};goog.array.splice=function(b){return Array.prototype.splice.apply(b,goog.array.slice(arguments,1))};goog.array.slice=function(b,c,d){return arguments.length<=2?Array.prototype.slice.call(b,c):Array.prototype.slice.call(b,c,d)};
+goog.array.removeDuplicates=function(b,c){c=c||b;for(var d={},e=0,f=0;f<b.length;){var g=b[f++],h=goog.isObject(g)?goog.getHashCode(g):g;if(!Object.prototype.hasOwnProperty.call(d,h)){d[h]=true;c[e++]=g}}c.length=e};goog.array.binarySearch=function(b,c,d){var e=0,f=b.length-1;for(d=d||goog.array.defaultCompare;e<=f;){var g=e+f>>1,h=d(c,b[g]);if(h>0)e=g+1;else if(h<0)f=g-1;else return g}return-(e+1)};goog.array.sort=function(b,c){Array.prototype.sort.call(b,c||goog.array.defaultCompare)};
+goog.array.stableSort=function(b,c){for(var d=0;d<b.length;d++)b[d]={index:d,value:b[d]};var e=c||goog.array.defaultCompare;function f(g,h){return e(g.value,h.value)||g.index-h.index}goog.array.sort(b,f);for(d=0;d<b.length;d++)b[d]=b[d].value};goog.array.sortObjectsByKey=function(b,c,d){var e=d||goog.array.defaultCompare;goog.array.sort(b,function(f,g){return e(f[c],g[c])})};
+goog.array.equals=function(b,c,d){if(!goog.isArrayLike(b)||!goog.isArrayLike(c)||b.length!=c.length)return false;var e=b.length;d=d||goog.array.defaultCompareEquality;for(var f=0;f<e;f++)if(!d(b[f],c[f]))return false;return true};goog.array.compare=function(b,c,d){return goog.array.equals(b,c,d)};goog.array.defaultCompare=function(b,c){return b>c?1:b<c?-1:0};goog.array.defaultCompareEquality=function(b,c){return b===c};
+goog.array.binaryInsert=function(b,c,d){d=goog.array.binarySearch(b,c,d);if(d<0){goog.array.insertAt(b,c,-(d+1));return true}return false};goog.array.binaryRemove=function(b,c,d){c=goog.array.binarySearch(b,c,d);return c>=0?goog.array.removeAt(b,c):false};goog.array.bucket=function(b,c){for(var d={},e=0;e<b.length;e++){var f=b[e],g=c(f,e,b);if(goog.isDef(g)){g=d[g]||(d[g]=[]);g.push(f)}}return d};goog.array.repeat=function(b,c){for(var d=[],e=0;e<c;e++)d[e]=b;return d};
+goog.array.flatten=function(){for(var b=[],c=0;c<arguments.length;c++){var d=arguments[c];goog.isArray(d)?b.push.apply(b,goog.array.flatten.apply(null,d)):b.push(d)}return b};goog.array.rotate=function(b,c){if(b.length){c%=b.length;if(c>0)Array.prototype.unshift.apply(b,b.splice(-c,c));else c<0&&Array.prototype.push.apply(b,b.splice(0,-c))}return b};goog.dom={};
+goog.dom.TagName={A:"A",ABBR:"ABBR",ACRONYM:"ACRONYM",ADDRESS:"ADDRESS",APPLET:"APPLET",AREA:"AREA",B:"B",BASE:"BASE",BASEFONT:"BASEFONT",BDO:"BDO",BIG:"BIG",BLOCKQUOTE:"BLOCKQUOTE",BODY:"BODY",BR:"BR",BUTTON:"BUTTON",CAPTION:"CAPTION",CENTER:"CENTER",CITE:"CITE",CODE:"CODE",COL:"COL",COLGROUP:"COLGROUP",DD:"DD",DEL:"DEL",DFN:"DFN",DIR:"DIR",DIV:"DIV",DL:"DL",DT:"DT",EM:"EM",FIELDSET:"FIELDSET",FONT:"FONT",FORM:"FORM",FRAME:"FRAME",FRAMESET:"FRAMESET",H1:"H1",H2:"H2",H3:"H3",H4:"H4",H5:"H5",H6:"H6",
+HEAD:"HEAD",HR:"HR",HTML:"HTML",I:"I",IFRAME:"IFRAME",IMG:"IMG",INPUT:"INPUT",INS:"INS",ISINDEX:"ISINDEX",KBD:"KBD",LABEL:"LABEL",LEGEND:"LEGEND",LI:"LI",LINK:"LINK",MAP:"MAP",MENU:"MENU",META:"META",NOFRAMES:"NOFRAMES",NOSCRIPT:"NOSCRIPT",OBJECT:"OBJECT",OL:"OL",OPTGROUP:"OPTGROUP",OPTION:"OPTION",P:"P",PARAM:"PARAM",PRE:"PRE",Q:"Q",S:"S",SAMP:"SAMP",SCRIPT:"SCRIPT",SELECT:"SELECT",SMALL:"SMALL",SPAN:"SPAN",STRIKE:"STRIKE",STRONG:"STRONG",STYLE:"STYLE",SUB:"SUB",SUP:"SUP",TABLE:"TABLE",TBODY:"TBODY",
+TD:"TD",TEXTAREA:"TEXTAREA",TFOOT:"TFOOT",TH:"TH",THEAD:"THEAD",TITLE:"TITLE",TR:"TR",TT:"TT",U:"U",UL:"UL",VAR:"VAR"};goog.dom.classes={};goog.dom.classes.set=function(b,c){b.className=c};goog.dom.classes.get=function(b){return(b=b.className)&&typeof b.split=="function"?b.split(" "):[]};goog.dom.classes.add=function(b){var c=goog.dom.classes.get(b),d=goog.array.slice(arguments,1);d=goog.dom.classes.add_(c,d);b.className=c.join(" ");return d};goog.dom.classes.remove=function(b){var c=goog.dom.classes.get(b),d=goog.array.slice(arguments,1);d=goog.dom.classes.remove_(c,d);b.className=c.join(" ");return d};
+goog.dom.classes.add_=function(b,c){for(var d=0,e=0;e<c.length;e++)if(!goog.array.contains(b,c[e])){b.push(c[e]);d++}return d==c.length};goog.dom.classes.remove_=function(b,c){for(var d=0,e=0;e<b.length;e++)if(goog.array.contains(c,b[e])){goog.array.splice(b,e--,1);d++}return d==c.length};goog.dom.classes.swap=function(b,c,d){for(var e=goog.dom.classes.get(b),f=false,g=0;g<e.length;g++)if(e[g]==c){goog.array.splice(e,g--,1);f=true}if(f){e.push(d);b.className=e.join(" ")}return f};
+goog.dom.classes.addRemove=function(b,c,d){var e=goog.dom.classes.get(b);if(goog.isString(c))goog.array.remove(e,c);else goog.isArray(c)&&goog.dom.classes.remove_(e,c);if(goog.isString(d)&&!goog.array.contains(e,d))e.push(d);else goog.isArray(d)&&goog.dom.classes.add_(e,d);b.className=e.join(" ")};goog.dom.classes.has=function(b,c){return goog.array.contains(goog.dom.classes.get(b),c)};goog.dom.classes.enable=function(b,c,d){d?goog.dom.classes.add(b,c):goog.dom.classes.remove(b,c)};
+goog.dom.classes.toggle=function(b,c){var d=!goog.dom.classes.has(b,c);goog.dom.classes.enable(b,c,d);return d};goog.math={};goog.math.Coordinate=function(b,c){this.x=goog.isDef(b)?b:0;this.y=goog.isDef(c)?c:0};goog.math.Coordinate.prototype.clone=function(){return new goog.math.Coordinate(this.x,this.y)};if(goog.DEBUG)goog.math.Coordinate.prototype.toString=function(){return"("+this.x+", "+this.y+")"};goog.math.Coordinate.equals=function(b,c){if(b==c)return true;if(!b||!c)return false;return b.x==c.x&&b.y==c.y};goog.math.Coordinate.distance=function(b,c){var d=b.x-c.x;b=b.y-c.y;return Math.sqrt(d*d+b*b)};
+goog.math.Coordinate.squaredDistance=function(b,c){var d=b.x-c.x;b=b.y-c.y;return d*d+b*b};goog.math.Coordinate.difference=function(b,c){return new goog.math.Coordinate(b.x-c.x,b.y-c.y)};goog.math.Coordinate.sum=function(b,c){return new goog.math.Coordinate(b.x+c.x,b.y+c.y)};goog.math.Size=function(b,c){this.width=b;this.height=c};goog.math.Size.equals=function(b,c){if(b==c)return true;if(!b||!c)return false;return b.width==c.width&&b.height==c.height};goog.math.Size.prototype.clone=function(){return new goog.math.Size(this.width,this.height)};if(goog.DEBUG)goog.math.Size.prototype.toString=function(){return"("+this.width+" x "+this.height+")"};a=goog.math.Size.prototype;a.getLongest=function(){return Math.max(this.width,this.height)};
+a.getShortest=function(){return Math.min(this.width,this.height)};a.area=function(){return this.width*this.height};a.aspectRatio=function(){return this.width/this.height};a.isEmpty=function(){return!this.area()};a.ceil=function(){this.width=Math.ceil(this.width);this.height=Math.ceil(this.height);return this};a.fitsInside=function(b){return this.width<=b.width&&this.height<=b.height};a.floor=function(){this.width=Math.floor(this.width);this.height=Math.floor(this.height);return this};
+a.round=function(){this.width=Math.round(this.width);this.height=Math.round(this.height);return this};a.scale=function(b){this.width*=b;this.height*=b;return this};a.scaleToFit=function(b){b=this.aspectRatio()>b.aspectRatio()?b.width/this.width:b.height/this.height;return this.scale(b)};goog.object={};goog.object.forEach=function(b,c,d){for(var e in b)c.call(d,b[e],e,b)};goog.object.filter=function(b,c,d){var e={};for(var f in b)if(c.call(d,b[f],f,b))e[f]=b[f];return e};goog.object.map=function(b,c,d){var e={};for(var f in b)e[f]=c.call(d,b[f],f,b);return e};goog.object.some=function(b,c,d){for(var e in b)if(c.call(d,b[e],e,b))return true;return false};goog.object.every=function(b,c,d){for(var e in b)if(!c.call(d,b[e],e,b))return false;return true};
+goog.object.getCount=function(b){var c=0;for(var d in b)c++;return c};goog.object.getAnyKey=function(b){for(var c in b)return c};goog.object.getAnyValue=function(b){for(var c in b)return b[c]};goog.object.contains=function(b,c){return goog.object.containsValue(b,c)};goog.object.getValues=function(b){var c=[],d=0;for(var e in b)c[d++]=b[e];return c};goog.object.getKeys=function(b){var c=[],d=0;for(var e in b)c[d++]=e;return c};goog.object.containsKey=function(b,c){return c in b};
+goog.object.containsValue=function(b,c){for(var d in b)if(b[d]==c)return true;return false};goog.object.findKey=function(b,c,d){for(var e in b)if(c.call(d,b[e],e,b))return e};goog.object.findValue=function(b,c,d){return(c=goog.object.findKey(b,c,d))&&b[c]};goog.object.isEmpty=function(b){for(var c in b)return false;return true};goog.object.clear=function(b){for(var c=goog.object.getKeys(b),d=c.length-1;d>=0;d--)goog.object.remove(b,c[d])};
+goog.object.remove=function(b,c){var d;if(d=c in b)delete b[c];return d};goog.object.add=function(b,c,d){if(c in b)throw Error('The object already contains the key "'+c+'"');goog.object.set(b,c,d)};goog.object.get=function(b,c,d){if(c in b)return b[c];return d};goog.object.set=function(b,c,d){b[c]=d};goog.object.setIfUndefined=function(b,c,d){return c in b?b[c]:(b[c]=d)};goog.object.clone=function(b){var c={};for(var d in b)c[d]=b[d];return c};
+goog.object.transpose=function(b){var c={};for(var d in b)c[b[d]]=d;return c};goog.object.PROTOTYPE_FIELDS_=["constructor","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","toLocaleString","toString","valueOf"];goog.object.extend=function(b){for(var c,d,e=1;e<arguments.length;e++){d=arguments[e];for(c in d)b[c]=d[c];for(var f=0;f<goog.object.PROTOTYPE_FIELDS_.length;f++){c=goog.object.PROTOTYPE_FIELDS_[f];if(Object.prototype.hasOwnProperty.call(d,c))b[c]=d[c]}}};
+goog.object.create=function(){var b=arguments.length;if(b==1&&goog.isArray(arguments[0]))return goog.object.create.apply(null,arguments[0]);if(b%2)throw Error("Uneven number of arguments");for(var c={},d=0;d<b;d+=2)c[arguments[d]]=arguments[d+1];return c};goog.object.createSet=function(){var b=arguments.length;if(b==1&&goog.isArray(arguments[0]))return goog.object.createSet.apply(null,arguments[0]);for(var c={},d=0;d<b;d++)c[arguments[d]]=true;return c};goog.string={};goog.string.Unicode={NBSP:"\u00a0"};goog.string.startsWith=function(b,c){return b.indexOf(c)==0};goog.string.endsWith=function(b,c){var d=b.length-c.length;return d>=0&&b.lastIndexOf(c,d)==d};goog.string.caseInsensitiveStartsWith=function(b,c){return goog.string.caseInsensitiveCompare(c,b.substr(0,c.length))==0};goog.string.caseInsensitiveEndsWith=function(b,c){return goog.string.caseInsensitiveCompare(c,b.substr(b.length-c.length,c.length))==0};
+goog.string.subs=function(b){for(var c=1;c<arguments.length;c++){var d=String(arguments[c]).replace(/\$/g,"$$$$");b=b.replace(/\%s/,d)}return b};goog.string.collapseWhitespace=function(b){return b.replace(/[\s\xa0]+/g," ").replace(/^\s+|\s+$/g,"")};goog.string.isEmpty=function(b){return/^[\s\xa0]*$/.test(b)};goog.string.isEmptySafe=function(b){return goog.string.isEmpty(goog.string.makeSafe(b))};goog.string.isBreakingWhitespace=function(b){return!/[^\t\n\r ]/.test(b)};goog.string.isAlpha=function(b){return!/[^a-zA-Z]/.test(b)};
+goog.string.isNumeric=function(b){return!/[^0-9]/.test(b)};goog.string.isAlphaNumeric=function(b){return!/[^a-zA-Z0-9]/.test(b)};goog.string.isSpace=function(b){return b==" "};goog.string.isUnicodeChar=function(b){return b.length==1&&b>=" "&&b<="~"||b>="\u0080"&&b<="\ufffd"};goog.string.stripNewlines=function(b){return b.replace(/(\r\n|\r|\n)+/g," ")};goog.string.canonicalizeNewlines=function(b){return b.replace(/(\r\n|\r|\n)/g,"\n")};
+goog.string.normalizeWhitespace=function(b){return b.replace(/\xa0|\s/g," ")};goog.string.normalizeSpaces=function(b){return b.replace(/\xa0|[ \t]+/g," ")};goog.string.trim=function(b){return b.replace(/^[\s\xa0]+|[\s\xa0]+$/g,"")};goog.string.trimLeft=function(b){return b.replace(/^[\s\xa0]+/,"")};goog.string.trimRight=function(b){return b.replace(/[\s\xa0]+$/,"")};goog.string.caseInsensitiveCompare=function(b,c){b=String(b).toLowerCase();c=String(c).toLowerCase();return b<c?-1:b==c?0:1};
+goog.string.numerateCompareRegExp_=/(\.\d+)|(\d+)|(\D+)/g;goog.string.numerateCompare=function(b,c){if(b==c)return 0;if(!b)return-1;if(!c)return 1;for(var d=b.toLowerCase().match(goog.string.numerateCompareRegExp_),e=c.toLowerCase().match(goog.string.numerateCompareRegExp_),f=Math.min(d.length,e.length),g=0;g<f;g++){var h=d[g],i=e[g];if(h!=i){b=parseInt(h,10);if(!isNaN(b)){c=parseInt(i,10);if(!isNaN(c)&&b-c)return b-c}return h<i?-1:1}}if(d.length!=e.length)return d.length-e.length;return b<c?-1:1};
+goog.string.encodeUriRegExp_=/^[a-zA-Z0-9\-_.!~*'()]*$/;goog.string.urlEncode=function(b){b=String(b);if(!goog.string.encodeUriRegExp_.test(b))return encodeURIComponent(b);return b};goog.string.urlDecode=function(b){return decodeURIComponent(b.replace(/\+/g," "))};goog.string.newLineToBr=function(b,c){return b.replace(/(\r\n|\r|\n)/g,c?"<br />":"<br>")};
+goog.string.htmlEscape=function(b,c){if(c)return b.replace(goog.string.amperRe_,"&amp;").replace(goog.string.ltRe_,"&lt;").replace(goog.string.gtRe_,"&gt;").replace(goog.string.quotRe_,"&quot;");else{if(!goog.string.allRe_.test(b))return b;if(b.indexOf("&")!=-1)b=b.replace(goog.string.amperRe_,"&amp;");if(b.indexOf("<")!=-1)b=b.replace(goog.string.ltRe_,"&lt;");if(b.indexOf(">")!=-1)b=b.replace(goog.string.gtRe_,"&gt;");if(b.indexOf('"')!=-1)b=b.replace(goog.string.quotRe_,"&quot;");return b}};
+goog.string.amperRe_=/&/g;goog.string.ltRe_=/</g;goog.string.gtRe_=/>/g;goog.string.quotRe_=/\"/g;goog.string.allRe_=/[&<>\"]/;goog.string.unescapeEntities=function(b){if(goog.string.contains(b,"&"))return"document"in goog.global&&!goog.string.contains(b,"<")?goog.string.unescapeEntitiesUsingDom_(b):goog.string.unescapePureXmlEntities_(b);return b};
+goog.string.unescapeEntitiesUsingDom_=function(b){var c=goog.global.document.createElement("a");c.innerHTML=b;c[goog.string.NORMALIZE_FN_]&&c[goog.string.NORMALIZE_FN_]();b=c.firstChild.nodeValue;c.innerHTML="";return b};goog.string.unescapePureXmlEntities_=function(b){return b.replace(/&([^;]+);/g,function(c,d){switch(d){case "amp":return"&";case "lt":return"<";case "gt":return">";case "quot":return'"';default:if(d.charAt(0)=="#"){d=Number("0"+d.substr(1));if(!isNaN(d))return String.fromCharCode(d)}return c}})};
+goog.string.NORMALIZE_FN_="normalize";goog.string.whitespaceEscape=function(b,c){return goog.string.newLineToBr(b.replace(/  /g," &#160;"),c)};goog.string.stripQuotes=function(b,c){for(var d=c.length,e=0;e<d;e++){var f=d==1?c:c.charAt(e);if(b.charAt(0)==f&&b.charAt(b.length-1)==f)return b.substring(1,b.length-1)}return b};goog.string.truncate=function(b,c,d){if(d)b=goog.string.unescapeEntities(b);if(b.length>c)b=b.substring(0,c-3)+"...";if(d)b=goog.string.htmlEscape(b);return b};
+goog.string.truncateMiddle=function(b,c,d){if(d)b=goog.string.unescapeEntities(b);if(b.length>c){var e=Math.floor(c/2),f=b.length-e;e+=c%2;b=b.substring(0,e)+"..."+b.substring(f)}if(d)b=goog.string.htmlEscape(b);return b};goog.string.jsEscapeCache_={"\u0008":"\\b","\u000c":"\\f","\n":"\\n","\r":"\\r","\t":"\\t","\u000b":"\\x0B",'"':'\\"',"'":"\\'","\\":"\\\\"};
+goog.string.quote=function(b){b=String(b);if(b.quote)return b.quote();else{for(var c=['"'],d=0;d<b.length;d++)c[d+1]=goog.string.escapeChar(b.charAt(d));c.push('"');return c.join("")}};goog.string.escapeChar=function(b){if(b in goog.string.jsEscapeCache_)return goog.string.jsEscapeCache_[b];var c=b,d=b.charCodeAt(0);if(d>31&&d<127)c=b;else{if(d<256){c="\\x";if(d<16||d>256)c+="0"}else{c="\\u";if(d<4096)c+="0"}c+=d.toString(16).toUpperCase()}return goog.string.jsEscapeCache_[b]=c};
+goog.string.toMap=function(b){for(var c={},d=0;d<b.length;d++)c[b.charAt(d)]=true;return c};goog.string.contains=function(b,c){return b.indexOf(c)!=-1};goog.string.removeAt=function(b,c,d){var e=b;if(c>=0&&c<b.length&&d>0)e=b.substr(0,c)+b.substr(c+d,b.length-c-d);return e};goog.string.remove=function(b,c){c=new RegExp(goog.string.regExpEscape(c),"");return b.replace(c,"")};goog.string.removeAll=function(b,c){c=new RegExp(goog.string.regExpEscape(c),"g");return b.replace(c,"")};
+goog.string.regExpEscape=function(b){return String(b).replace(/([-()\[\]{}+?*.$\^|,:#<!\\])/g,"\\$1").replace(/\x08/g,"\\x08")};goog.string.repeat=function(b,c){return(new Array(c+1)).join(b)};goog.string.padNumber=function(b,c,d){b=goog.isDef(d)?b.toFixed(d):String(b);d=b.indexOf(".");if(d==-1)d=b.length;return goog.string.repeat("0",Math.max(0,c-d))+b};goog.string.makeSafe=function(b){return b==null?"":String(b)};goog.string.buildString=function(){return Array.prototype.join.call(arguments,"")};
+goog.string.getRandomString=function(){return Math.floor(Math.random()*2147483648).toString(36)+(Math.floor(Math.random()*2147483648)^(new Date).getTime()).toString(36)};
+goog.string.compareVersions=function(b,c){var d=0;b=goog.string.trim(String(b)).split(".");c=goog.string.trim(String(c)).split(".");for(var e=Math.max(b.length,c.length),f=0;d==0&&f<e;f++){var g=b[f]||"",h=c[f]||"",i=new RegExp("(\\d*)(\\D*)","g"),j=new RegExp("(\\d*)(\\D*)","g");do{var k=i.exec(g)||["","",""],l=j.exec(h)||["","",""];if(k[0].length==0&&l[0].length==0)break;d=k[1].length==0?0:parseInt(k[1],10);var m=l[1].length==0?0:parseInt(l[1],10);d=goog.string.compareElements_(d,m)||goog.string.compareElements_(k[2].length==
+0,l[2].length==0)||goog.string.compareElements_(k[2],l[2])}while(d==0)}return d};goog.string.compareElements_=function(b,c){if(b<c)return-1;else if(b>c)return 1;return 0};goog.string.HASHCODE_MAX_=4294967296;goog.string.hashCode=function(b){for(var c=0,d=0;d<b.length;++d){c=31*c+b.charCodeAt(d);c%=goog.string.HASHCODE_MAX_}return c};goog.string.uniqueStringCounter_=goog.now();goog.string.createUniqueString=function(){return"goog_"+goog.string.uniqueStringCounter_++};
+goog.string.toNumber=function(b){var c=Number(b);if(c==0&&goog.string.isEmpty(b))return NaN;return c};goog.userAgent={};goog.userAgent.ASSUME_IE=false;goog.userAgent.ASSUME_GECKO=false;goog.userAgent.ASSUME_CAMINO=false;goog.userAgent.ASSUME_WEBKIT=false;goog.userAgent.ASSUME_MOBILE_WEBKIT=false;goog.userAgent.ASSUME_OPERA=false;goog.userAgent.BROWSER_KNOWN_=goog.userAgent.ASSUME_IE||goog.userAgent.ASSUME_GECKO||goog.userAgent.ASSUME_CAMINO||goog.userAgent.ASSUME_MOBILE_WEBKIT||goog.userAgent.ASSUME_WEBKIT||goog.userAgent.ASSUME_OPERA;
+goog.userAgent.getUserAgentString=function(){return goog.global.navigator?goog.global.navigator.userAgent:null};goog.userAgent.getNavigator=function(){return goog.global.navigator};
+goog.userAgent.init_=function(){goog.userAgent.detectedOpera_=false;goog.userAgent.detectedIe_=false;goog.userAgent.detectedWebkit_=false;goog.userAgent.detectedMobile_=false;goog.userAgent.detectedGecko_=false;goog.userAgent.detectedCamino_=false;var b;if(!goog.userAgent.BROWSER_KNOWN_&&(b=goog.userAgent.getUserAgentString())){var c=goog.userAgent.getNavigator();goog.userAgent.detectedOpera_=b.indexOf("Opera")==0;goog.userAgent.detectedIe_=!goog.userAgent.detectedOpera_&&b.indexOf("MSIE")!=-1;goog.userAgent.detectedWebkit_=
+!goog.userAgent.detectedOpera_&&b.indexOf("WebKit")!=-1;goog.userAgent.detectedMobile_=goog.userAgent.detectedWebkit_&&b.indexOf("Mobile")!=-1;goog.userAgent.detectedGecko_=!goog.userAgent.detectedOpera_&&!goog.userAgent.detectedWebkit_&&c.product=="Gecko";goog.userAgent.detectedCamino_=goog.userAgent.detectedGecko_&&c.vendor=="Camino"}};goog.userAgent.BROWSER_KNOWN_||goog.userAgent.init_();goog.userAgent.OPERA=goog.userAgent.BROWSER_KNOWN_?goog.userAgent.ASSUME_OPERA:goog.userAgent.detectedOpera_;
+goog.userAgent.IE=goog.userAgent.BROWSER_KNOWN_?goog.userAgent.ASSUME_IE:goog.userAgent.detectedIe_;goog.userAgent.GECKO=goog.userAgent.BROWSER_KNOWN_?goog.userAgent.ASSUME_GECKO||goog.userAgent.ASSUME_CAMINO:goog.userAgent.detectedGecko_;goog.userAgent.CAMINO=goog.userAgent.BROWSER_KNOWN_?goog.userAgent.ASSUME_CAMINO:goog.userAgent.detectedCamino_;goog.userAgent.WEBKIT=goog.userAgent.BROWSER_KNOWN_?goog.userAgent.ASSUME_WEBKIT||goog.userAgent.ASSUME_MOBILE_WEBKIT:goog.userAgent.detectedWebkit_;
+goog.userAgent.MOBILE=goog.userAgent.ASSUME_MOBILE_WEBKIT||goog.userAgent.detectedMobile_;goog.userAgent.SAFARI=goog.userAgent.WEBKIT;goog.userAgent.determinePlatform_=function(){var b=goog.userAgent.getNavigator();return b&&b.platform||""};goog.userAgent.PLATFORM=goog.userAgent.determinePlatform_();goog.userAgent.ASSUME_MAC=false;goog.userAgent.ASSUME_WINDOWS=false;goog.userAgent.ASSUME_LINUX=false;goog.userAgent.ASSUME_X11=false;
+goog.userAgent.PLATFORM_KNOWN_=goog.userAgent.ASSUME_MAC||goog.userAgent.ASSUME_WINDOWS||goog.userAgent.ASSUME_LINUX||goog.userAgent.ASSUME_X11;
+goog.userAgent.initPlatform_=function(){goog.userAgent.detectedMac_=goog.string.contains(goog.userAgent.PLATFORM,"Mac");goog.userAgent.detectedWindows_=goog.string.contains(goog.userAgent.PLATFORM,"Win");goog.userAgent.detectedLinux_=goog.string.contains(goog.userAgent.PLATFORM,"Linux");goog.userAgent.detectedX11_=!!goog.userAgent.getNavigator()&&goog.string.contains(goog.userAgent.getNavigator().appVersion||"","X11")};goog.userAgent.PLATFORM_KNOWN_||goog.userAgent.initPlatform_();
+goog.userAgent.MAC=goog.userAgent.PLATFORM_KNOWN_?goog.userAgent.ASSUME_MAC:goog.userAgent.detectedMac_;goog.userAgent.WINDOWS=goog.userAgent.PLATFORM_KNOWN_?goog.userAgent.ASSUME_WINDOWS:goog.userAgent.detectedWindows_;goog.userAgent.LINUX=goog.userAgent.PLATFORM_KNOWN_?goog.userAgent.ASSUME_LINUX:goog.userAgent.detectedLinux_;goog.userAgent.X11=goog.userAgent.PLATFORM_KNOWN_?goog.userAgent.ASSUME_X11:goog.userAgent.detectedX11_;
+goog.userAgent.determineVersion_=function(){var b="",c;if(goog.userAgent.OPERA&&goog.global.opera){b=goog.global.opera.version;b=typeof b=="function"?b():b}else{if(goog.userAgent.GECKO)c=/rv\:([^\);]+)(\)|;)/;else if(goog.userAgent.IE)c=/MSIE\s+([^\);]+)(\)|;)/;else if(goog.userAgent.WEBKIT)c=/WebKit\/(\S+)/;if(c)b=(b=c.exec(goog.userAgent.getUserAgentString()))?b[1]:""}return b};goog.userAgent.VERSION=goog.userAgent.determineVersion_();
+goog.userAgent.compare=function(b,c){return goog.string.compareVersions(b,c)};goog.userAgent.isVersionCache_={};goog.userAgent.isVersion=function(b){return goog.userAgent.isVersionCache_[b]||(goog.userAgent.isVersionCache_[b]=goog.string.compareVersions(goog.userAgent.VERSION,b)>=0)};goog.dom.ASSUME_QUIRKS_MODE=false;goog.dom.ASSUME_STANDARDS_MODE=false;goog.dom.COMPAT_MODE_KNOWN_=goog.dom.ASSUME_QUIRKS_MODE||goog.dom.ASSUME_STANDARDS_MODE;goog.dom.NodeType={ELEMENT:1,ATTRIBUTE:2,TEXT:3,CDATA_SECTION:4,ENTITY_REFERENCE:5,ENTITY:6,PROCESSING_INSTRUCTION:7,COMMENT:8,DOCUMENT:9,DOCUMENT_TYPE:10,DOCUMENT_FRAGMENT:11,NOTATION:12};goog.dom.getDomHelper=function(b){return b?new goog.dom.DomHelper(goog.dom.getOwnerDocument(b)):goog.dom.defaultDomHelper_||(goog.dom.defaultDomHelper_=new goog.dom.DomHelper)};
+goog.dom.getDocument=function(){return document};goog.dom.getElement=function(b){return goog.isString(b)?document.getElementById(b):b};goog.dom.$=goog.dom.getElement;goog.dom.getElementsByTagNameAndClass=function(b,c,d){return goog.dom.getElementsByTagNameAndClass_(document,b,c,d)};
+goog.dom.getElementsByTagNameAndClass_=function(b,c,d,e){e=e||b;c=c&&c!="*"?c.toLowerCase():"";if(e.querySelectorAll&&(c||d)&&(!goog.userAgent.WEBKIT||goog.dom.isCss1CompatMode_(b)||goog.userAgent.isVersion("528"))){d=c+(d?"."+d:"");return e.querySelectorAll(d)}if(d&&e.getElementsByClassName){b=e.getElementsByClassName(d);if(c){e={};for(var f=0,g=0,h;h=b[g];g++)if(c==h.nodeName.toLowerCase())e[f++]=h;e.length=f;return e}else return b}b=e.getElementsByTagName(c||"*");if(d){e={};for(g=f=0;h=b[g];g++){c=
+h.className;if(typeof c.split=="function"&&goog.array.contains(c.split(" "),d))e[f++]=h}e.length=f;return e}else return b};goog.dom.$$=goog.dom.getElementsByTagNameAndClass;goog.dom.setProperties=function(b,c){goog.object.forEach(c,function(d,e){if(e=="style")b.style.cssText=d;else if(e=="class")b.className=d;else if(e=="for")b.htmlFor=d;else if(e in goog.dom.DIRECT_ATTRIBUTE_MAP_)b.setAttribute(goog.dom.DIRECT_ATTRIBUTE_MAP_[e],d);else b[e]=d})};
+goog.dom.DIRECT_ATTRIBUTE_MAP_={cellpadding:"cellPadding",cellspacing:"cellSpacing",colspan:"colSpan",rowspan:"rowSpan",valign:"vAlign",height:"height",width:"width",usemap:"useMap",frameborder:"frameBorder",type:"type"};goog.dom.getViewportSize=function(b){return goog.dom.getViewportSize_(b||window)};
+goog.dom.getViewportSize_=function(b){var c=b.document;if(goog.userAgent.WEBKIT&&!goog.userAgent.isVersion("500")&&!goog.userAgent.MOBILE){if(typeof b.innerHeight=="undefined")b=window;c=b.innerHeight;var d=b.document.documentElement.scrollHeight;if(b==b.top)if(d<c)c-=15;return new goog.math.Size(b.innerWidth,c)}b=goog.dom.isCss1CompatMode_(c)&&(!goog.userAgent.OPERA||goog.userAgent.OPERA&&goog.userAgent.isVersion("9.50"))?c.documentElement:c.body;return new goog.math.Size(b.clientWidth,b.clientHeight)};
+goog.dom.getDocumentHeight=function(){return goog.dom.getDocumentHeight_(window)};goog.dom.getDocumentHeight_=function(b){var c=b.document,d=0;if(c){b=goog.dom.getViewportSize_(b).height;d=c.body;var e=c.documentElement;if(goog.dom.isCss1CompatMode_(c)&&e.scrollHeight)d=e.scrollHeight!=b?e.scrollHeight:e.offsetHeight;else{c=e.scrollHeight;var f=e.offsetHeight;if(e.clientHeight!=f){c=d.scrollHeight;f=d.offsetHeight}d=c>b?c>f?c:f:c<f?c:f}}return d};
+goog.dom.getPageScroll=function(b){b=b||goog.global||window;return goog.dom.getDomHelper(b.document).getDocumentScroll()};goog.dom.getDocumentScroll=function(){return goog.dom.getDocumentScroll_(document)};goog.dom.getDocumentScroll_=function(b){b=goog.dom.getDocumentScrollElement_(b);return new goog.math.Coordinate(b.scrollLeft,b.scrollTop)};goog.dom.getDocumentScrollElement=function(){return goog.dom.getDocumentScrollElement_(document)};
+goog.dom.getDocumentScrollElement_=function(b){return!goog.userAgent.WEBKIT&&goog.dom.isCss1CompatMode_(b)?b.documentElement:b.body};goog.dom.getWindow=function(b){return b?goog.dom.getWindow_(b):window};goog.dom.getWindow_=function(b){if(b.parentWindow)return b.parentWindow;if(goog.userAgent.WEBKIT&&!goog.userAgent.isVersion("500")&&!goog.userAgent.MOBILE){var c=b.createElement("script");c.innerHTML="document.parentWindow=window";var d=b.documentElement;d.appendChild(c);d.removeChild(c);return b.parentWindow}return b.defaultView};
+goog.dom.createDom=function(){return goog.dom.createDom_(document,arguments)};
+goog.dom.createDom_=function(b,c){var d=c[0],e=c[1];if(goog.userAgent.IE&&e&&(e.name||e.type)){d=["<",d];e.name&&d.push(' name="',goog.string.htmlEscape(e.name),'"');if(e.type){d.push(' type="',goog.string.htmlEscape(e.type),'"');e=goog.cloneObject(e);delete e.type}d.push(">");d=d.join("")}var f=b.createElement(d);if(e)if(goog.isString(e))f.className=e;else goog.dom.setProperties(f,e);if(c.length>2){function g(h){if(h)f.appendChild(goog.isString(h)?b.createTextNode(h):h)}for(e=2;e<c.length;e++){d=
+c[e];goog.isArrayLike(d)&&!goog.dom.isNodeLike(d)?goog.array.forEach(goog.dom.isNodeList(d)?goog.array.clone(d):d,g):g(d)}}return f};goog.dom.$dom=goog.dom.createDom;goog.dom.createElement=function(b){return document.createElement(b)};goog.dom.createTextNode=function(b){return document.createTextNode(b)};goog.dom.htmlToDocumentFragment=function(b){return goog.dom.htmlToDocumentFragment_(document,b)};
+goog.dom.htmlToDocumentFragment_=function(b,c){var d=b.createElement("div");d.innerHTML=c;if(d.childNodes.length==1)return d.firstChild;else{for(b=b.createDocumentFragment();d.firstChild;)b.appendChild(d.firstChild);return b}};goog.dom.getCompatMode=function(){return goog.dom.isCss1CompatMode()?"CSS1Compat":"BackCompat"};goog.dom.isCss1CompatMode=function(){return goog.dom.isCss1CompatMode_(document)};
+goog.dom.isCss1CompatMode_=function(b){if(goog.dom.COMPAT_MODE_KNOWN_)return goog.dom.ASSUME_STANDARDS_MODE;return b.compatMode=="CSS1Compat"};goog.dom.canHaveChildren=function(b){if(b.nodeType!=goog.dom.NodeType.ELEMENT)return false;if("canHaveChildren"in b)return b.canHaveChildren;switch(b.tagName){case goog.dom.TagName.APPLET:case goog.dom.TagName.AREA:case goog.dom.TagName.BR:case goog.dom.TagName.COL:case goog.dom.TagName.FRAME:case goog.dom.TagName.HR:case goog.dom.TagName.IMG:case goog.dom.TagName.INPUT:case goog.dom.TagName.IFRAME:case goog.dom.TagName.ISINDEX:case goog.dom.TagName.LINK:case goog.dom.TagName.NOFRAMES:case goog.dom.TagName.NOSCRIPT:case goog.dom.TagName.META:case goog.dom.TagName.OBJECT:case goog.dom.TagName.PARAM:case goog.dom.TagName.SCRIPT:case goog.dom.TagName.STYLE:return false}return true};
+goog.dom.appendChild=function(b,c){b.appendChild(c)};goog.dom.removeChildren=function(b){for(var c;c=b.firstChild;)b.removeChild(c)};goog.dom.insertSiblingBefore=function(b,c){c.parentNode&&c.parentNode.insertBefore(b,c)};goog.dom.insertSiblingAfter=function(b,c){c.parentNode&&c.parentNode.insertBefore(b,c.nextSibling)};goog.dom.removeNode=function(b){return b&&b.parentNode?b.parentNode.removeChild(b):null};goog.dom.replaceNode=function(b,c){var d=c.parentNode;d&&d.replaceChild(b,c)};
+goog.dom.flattenElement=function(b){var c,d=b.parentNode;if(d&&d.nodeType!=goog.dom.NodeType.DOCUMENT_FRAGMENT)if(b.removeNode)return b.removeNode(false);else{for(;c=b.firstChild;)d.insertBefore(c,b);return goog.dom.removeNode(b)}};goog.dom.getFirstElementChild=function(b){return goog.dom.getNextElementNode_(b.firstChild,true)};goog.dom.getLastElementChild=function(b){return goog.dom.getNextElementNode_(b.lastChild,false)};
+goog.dom.getNextElementSibling=function(b){return goog.dom.getNextElementNode_(b.nextSibling,true)};goog.dom.getPreviousElementSibling=function(b){return goog.dom.getNextElementNode_(b.previousSibling,false)};goog.dom.getNextElementNode_=function(b,c){for(;b&&b.nodeType!=goog.dom.NodeType.ELEMENT;)b=c?b.nextSibling:b.previousSibling;return b};goog.dom.isNodeLike=function(b){return goog.isObject(b)&&b.nodeType>0};goog.dom.BAD_CONTAINS_WEBKIT_=goog.userAgent.WEBKIT&&goog.userAgent.isVersion("522");
+goog.dom.contains=function(b,c){if(typeof b.contains!="undefined"&&!goog.dom.BAD_CONTAINS_WEBKIT_&&c.nodeType==goog.dom.NodeType.ELEMENT)return b==c||b.contains(c);if(typeof b.compareDocumentPosition!="undefined")return b==c||Boolean(b.compareDocumentPosition(c)&16);for(;c&&b!=c;)c=c.parentNode;return c==b};
+goog.dom.compareNodeOrder=function(b,c){if(b==c)return 0;if(b.compareDocumentPosition)return b.compareDocumentPosition(c)&2?1:-1;if("sourceIndex"in b||b.parentNode&&"sourceIndex"in b.parentNode){var d=b.nodeType==goog.dom.NodeType.ELEMENT,e=c.nodeType==goog.dom.NodeType.ELEMENT;if(d&&e)return b.sourceIndex-c.sourceIndex;else{var f=b.parentNode,g=c.parentNode;if(f==g)return goog.dom.compareSiblingOrder_(b,c);if(!d&&goog.dom.contains(f,c))return-1*goog.dom.compareParentsDescendantNodeIe_(b,c);if(!e&&
+goog.dom.contains(g,b))return goog.dom.compareParentsDescendantNodeIe_(c,b);return(d?b.sourceIndex:f.sourceIndex)-(e?c.sourceIndex:g.sourceIndex)}}e=goog.dom.getOwnerDocument(b);d=e.createRange();d.selectNode(b);d.collapse(true);b=e.createRange();b.selectNode(c);b.collapse(true);return d.compareBoundaryPoints(goog.global.Range.START_TO_END,b)};
+goog.dom.compareParentsDescendantNodeIe_=function(b,c){var d=b.parentNode;if(d==c)return-1;for(c=c;c.parentNode!=d;)c=c.parentNode;return goog.dom.compareSiblingOrder_(c,b)};goog.dom.compareSiblingOrder_=function(b,c){for(c=c;c=c.previousSibling;)if(c==b)return-1;return 1};
+goog.dom.findCommonAncestor=function(){var b,c=arguments.length;if(c){if(c==1)return arguments[0]}else return null;var d=[],e=Infinity;for(b=0;b<c;b++){for(var f=[],g=arguments[b];g;){f.unshift(g);g=g.parentNode}d.push(f);e=Math.min(e,f.length)}f=null;for(b=0;b<e;b++){g=d[0][b];for(var h=1;h<c;h++)if(g!=d[h][b])return f;f=g}return f};goog.dom.getOwnerDocument=function(b){return b.nodeType==goog.dom.NodeType.DOCUMENT?b:b.ownerDocument||b.document};
+goog.dom.getFrameContentDocument=function(b){return b=goog.userAgent.WEBKIT?b.document||b.contentWindow.document:b.contentDocument||b.contentWindow.document};goog.dom.getFrameContentWindow=function(b){return b.contentWindow||goog.dom.getWindow_(goog.dom.getFrameContentDocument(b))};
+goog.dom.setTextContent=function(b,c){if("textContent"in b)b.textContent=c;else if(b.firstChild&&b.firstChild.nodeType==goog.dom.NodeType.TEXT){for(;b.lastChild!=b.firstChild;)b.removeChild(b.lastChild);b.firstChild.data=c}else{goog.dom.removeChildren(b);var d=goog.dom.getOwnerDocument(b);b.appendChild(d.createTextNode(c))}};goog.dom.getOuterHtml=function(b){if("outerHTML"in b)return b.outerHTML;else{var c=goog.dom.getOwnerDocument(b);c=c.createElement("div");c.appendChild(b.cloneNode(true));return c.innerHTML}};
+goog.dom.findNode=function(b,c){var d=[];return(b=goog.dom.findNodes_(b,c,d,true))?d[0]:undefined};goog.dom.findNodes=function(b,c){var d=[];goog.dom.findNodes_(b,c,d,false);return d};goog.dom.findNodes_=function(b,c,d,e){if(b!=null)for(var f=0,g;g=b.childNodes[f];f++){if(c(g)){d.push(g);if(e)return true}if(goog.dom.findNodes_(g,c,d,e))return true}return false};goog.dom.TAGS_TO_IGNORE_={SCRIPT:1,STYLE:1,HEAD:1,IFRAME:1,OBJECT:1};goog.dom.PREDEFINED_TAG_VALUES_={IMG:" ",BR:"\n"};
+goog.dom.isFocusableTabIndex=function(b){var c=b.getAttributeNode("tabindex");if(c&&c.specified){b=b.tabIndex;return goog.isNumber(b)&&b>=0}return false};goog.dom.setFocusableTabIndex=function(b,c){if(c)b.tabIndex=0;else b.removeAttribute("tabIndex")};
+goog.dom.getTextContent=function(b){if(goog.userAgent.IE&&"innerText"in b)b=goog.string.canonicalizeNewlines(b.innerText);else{var c=[];goog.dom.getTextContent_(b,c,true);b=c.join("")}b=b.replace(/\xAD/g,"");b=b.replace(/ +/g," ");if(b!=" ")b=b.replace(/^\s*/,"");return b};goog.dom.getRawTextContent=function(b){var c=[];goog.dom.getTextContent_(b,c,false);return c.join("")};
+goog.dom.getTextContent_=function(b,c,d){if(!(b.nodeName in goog.dom.TAGS_TO_IGNORE_))if(b.nodeType==goog.dom.NodeType.TEXT)d?c.push(String(b.nodeValue).replace(/(\r\n|\r|\n)/g,"")):c.push(b.nodeValue);else if(b.nodeName in goog.dom.PREDEFINED_TAG_VALUES_)c.push(goog.dom.PREDEFINED_TAG_VALUES_[b.nodeName]);else for(b=b.firstChild;b;){goog.dom.getTextContent_(b,c,d);b=b.nextSibling}};goog.dom.getNodeTextLength=function(b){return goog.dom.getTextContent(b).length};
+goog.dom.getNodeTextOffset=function(b,c){c=c||goog.dom.getOwnerDocument(b).body;for(var d=[];b&&b!=c;){for(var e=b;e=e.previousSibling;)d.unshift(goog.dom.getTextContent(e));b=b.parentNode}return goog.string.trimLeft(d.join("")).replace(/ +/g," ").length};
+goog.dom.getNodeAtOffset=function(b,c,d){b=[b];for(var e=0,f;b.length>0&&e<c;){f=b.pop();if(!(f.nodeName in goog.dom.TAGS_TO_IGNORE_))if(f.nodeType==goog.dom.NodeType.TEXT){var g=f.nodeValue.replace(/(\r\n|\r|\n)/g,"").replace(/ +/g," ");e+=g.length}else if(f.nodeName in goog.dom.PREDEFINED_TAG_VALUES_)e+=goog.dom.PREDEFINED_TAG_VALUES_[f.nodeName].length;else for(g=f.childNodes.length-1;g>=0;g--)b.push(f.childNodes[g])}if(goog.isObject(d)){d.remainder=f?f.nodeValue.length+c-e-1:0;d.node=f}return f};
+goog.dom.isNodeList=function(b){if(b&&typeof b.length=="number")if(goog.isObject(b))return typeof b.item=="function"||typeof b.item=="string";else if(goog.isFunction(b))return typeof b.item=="function";return false};goog.dom.getAncestorByTagNameAndClass=function(b,c,d){return goog.dom.getAncestor(b,function(e){return(!c||e.nodeName==c)&&(!d||goog.dom.classes.has(e,d))},true)};
+goog.dom.getAncestor=function(b,c,d,e){if(!d)b=b.parentNode;d=e==null;for(var f=0;b&&(d||f<=e);){if(c(b))return b;b=b.parentNode;f++}return null};goog.dom.DomHelper=function(b){this.document_=b||goog.global.document||document};a=goog.dom.DomHelper.prototype;a.getDomHelper=goog.dom.getDomHelper;a.setDocument=function(b){this.document_=b};a.getDocument=function(){return this.document_};a.getElement=function(b){return goog.isString(b)?this.document_.getElementById(b):b};a.$=goog.dom.DomHelper.prototype.getElement;
+a.getElementsByTagNameAndClass=function(b,c,d){return goog.dom.getElementsByTagNameAndClass_(this.document_,b,c,d)};a.$$=goog.dom.DomHelper.prototype.getElementsByTagNameAndClass;a.setProperties=goog.dom.setProperties;a.getViewportSize=function(b){return goog.dom.getViewportSize(b||this.getWindow())};a.getDocumentHeight=function(){return goog.dom.getDocumentHeight_(this.getWindow())};a.createDom=function(){return goog.dom.createDom_(this.document_,arguments)};a.$dom=goog.dom.DomHelper.prototype.createDom;
+a.createElement=function(b){return this.document_.createElement(b)};a.createTextNode=function(b){return this.document_.createTextNode(b)};a.htmlToDocumentFragment=function(b){return goog.dom.htmlToDocumentFragment_(this.document_,b)};a.getCompatMode=function(){return this.isCss1CompatMode()?"CSS1Compat":"BackCompat"};a.isCss1CompatMode=function(){return goog.dom.isCss1CompatMode_(this.document_)};a.getWindow=function(){return goog.dom.getWindow_(this.document_)};a.getDocumentScrollElement=function(){return goog.dom.getDocumentScrollElement_(this.document_)};
+a.getDocumentScroll=function(){return goog.dom.getDocumentScroll_(this.document_)};a.appendChild=goog.dom.appendChild;a.removeChildren=goog.dom.removeChildren;a.insertSiblingBefore=goog.dom.insertSiblingBefore;a.insertSiblingAfter=goog.dom.insertSiblingAfter;a.removeNode=goog.dom.removeNode;a.replaceNode=goog.dom.replaceNode;a.flattenElement=goog.dom.flattenElement;a.getFirstElementChild=goog.dom.getFirstElementChild;a.getLastElementChild=goog.dom.getLastElementChild;a.getNextElementSibling=goog.dom.getNextElementSibling;
+a.getPreviousElementSibling=goog.dom.getPreviousElementSibling;a.isNodeLike=goog.dom.isNodeLike;a.contains=goog.dom.contains;a.getOwnerDocument=goog.dom.getOwnerDocument;a.getFrameContentDocument=goog.dom.getFrameContentDocument;a.getFrameContentWindow=goog.dom.getFrameContentWindow;a.setTextContent=goog.dom.setTextContent;a.findNode=goog.dom.findNode;a.findNodes=goog.dom.findNodes;a.getTextContent=goog.dom.getTextContent;a.getNodeTextLength=goog.dom.getNodeTextLength;a.getNodeTextOffset=goog.dom.getNodeTextOffset;
+a.getAncestorByTagNameAndClass=goog.dom.getAncestorByTagNameAndClass;a.getAncestor=goog.dom.getAncestor;goog.date={};goog.date.weekDay={MON:0,TUE:1,WED:2,THU:3,FRI:4,SAT:5,SUN:6};goog.date.month={JAN:0,FEB:1,MAR:2,APR:3,MAY:4,JUN:5,JUL:6,AUG:7,SEP:8,OCT:9,NOV:10,DEC:11};goog.date.formatMonthAndYear=function(b,c){return b=goog.getMsg("{$monthName} {$yearNum}",{monthName:b,yearNum:c})};goog.date.splitDateStringRegex_=/^(\d{4})(?:(?:-?(\d{2})(?:-?(\d{2}))?)|(?:-?(\d{3}))|(?:-?W(\d{2})(?:-?([1-7]))?))?$/;goog.date.splitTimeStringRegex_=/^(\d{2})(?::?(\d{2})(?::?(\d{2})(\.\d+)?)?)?$/;
+goog.date.splitTimezoneStringRegex_=/Z|(?:([-+])(\d{2})(?::?(\d{2}))?)$/;goog.date.splitDurationRegex_=/^(-)?P(?:(\d+)Y)?(?:(\d+)M)?(?:(\d+)D)?(T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?$/;goog.date.isLeapYear=function(b){return b%4==0&&(b%100!=0||b%400==0)};goog.date.isLongIsoYear=function(b){var c=5*b+12-4*(Math.floor(b/100)-Math.floor(b/400));c+=Math.floor((b-100)/400)-Math.floor((b-102)/400);c+=Math.floor((b-200)/400)-Math.floor((b-199)/400);return c%28<5};
+goog.date.getNumberOfDaysInMonth=function(b,c){switch(c){case goog.date.month.FEB:return goog.date.isLeapYear(b)?29:28;case goog.date.month.JUN:case goog.date.month.SEP:case goog.date.month.NOV:case goog.date.month.APR:return 30}return 31};goog.date.isSameDay=function(b,c){c=c||new Date(goog.now());return b.getDate()==c.getDate()&&goog.date.isSameMonth(b,c)};goog.date.isSameMonth=function(b,c){c=c||new Date(goog.now());return b.getMonth()==c.getMonth()&&goog.date.isSameYear(b,c)};
+goog.date.isSameYear=function(b,c){c=c||new Date(goog.now());return b.getFullYear()==c.getFullYear()};goog.date.getWeekNumber=function(b,c,d,e,f){b=new Date(b,c,d);e=e||goog.date.weekDay.THU;c=f||goog.date.weekDay.MON;f=86400000;d=(b.getDay()+6)%7;d=(d-c+7)%7;e=(e-c+7)%7;b=b.valueOf()+(e-d)*f;e=(new Date((new Date(b)).getFullYear(),0,1)).valueOf();return Math.floor(Math.round((b-e)/f)/7)+1};
+goog.date.fromIsoString=function(b){var c=new goog.date.DateTime(2000);return goog.date.setIso8601DateTime(c,b)?c:null};goog.date.setIso8601DateTime=function(b,c){c=goog.string.trim(c);var d=c.indexOf("T")==-1?" ":"T";c=c.split(d);return goog.date.setIso8601DateOnly_(b,c[0])&&(c.length<2||goog.date.setIso8601TimeOnly_(b,c[1]))};
+goog.date.setIso8601DateOnly_=function(b,c){var d=c.match(goog.date.splitDateStringRegex_);if(!d)return false;c=d[1];var e=d[2],f=d[3],g=d[4],h=d[5];d=d[6]||1;b.setFullYear(c);if(g){b.setDate(1);b.setMonth(0);c=g-1;b.add(new goog.date.Interval(goog.date.Interval.DAYS,c))}else if(h)goog.date.setDateFromIso8601Week_(b,h,d);else{if(e){b.setDate(1);b.setMonth(e-1)}f&&b.setDate(f)}return true};
+goog.date.setDateFromIso8601Week_=function(b,c,d){b.setMonth(0);b.setDate(1);var e=b.getDay();e=e||7;var f=4;e=e<=f?1-e:8-e;c=Number(d)+7*(Number(c)-1);c=e+c-1;c=new goog.date.Interval(goog.date.Interval.DAYS,c);b.add(c)};
+goog.date.setIso8601TimeOnly_=function(b,c){var d=c.match(goog.date.splitTimezoneStringRegex_),e=0;if(d){if(d[0]!="Z"){e=d[2]*60+Number(d[3]);e*=d[1]=="-"?1:-1}e-=b.getTimezoneOffset();c=c.substr(0,c.length-d[0].length)}d=c.match(goog.date.splitTimeStringRegex_);if(!d)return false;b.setHours(d[1]);b.setMinutes(d[2]||0);b.setSeconds(d[3]||0);b.setMilliseconds(d[4]?d[4]*1000:0);e!=0&&b.setTime(b.getTime()+e*60000);return true};
+goog.date.Interval=function(b,c,d,e,f,g){if(goog.isString(b)){b=b;c=c;this.years=b==goog.date.Interval.YEARS?c:0;this.months=b==goog.date.Interval.MONTHS?c:0;this.days=b==goog.date.Interval.DAYS?c:0;this.hours=b==goog.date.Interval.HOURS?c:0;this.minutes=b==goog.date.Interval.MINUTES?c:0;this.seconds=b==goog.date.Interval.SECONDS?c:0}else{this.years=b||0;this.months=c||0;this.days=d||0;this.hours=e||0;this.minutes=f||0;this.seconds=g||0}};
+goog.date.Interval.fromIsoString=function(b){b=b.match(goog.date.splitDurationRegex_);if(!b)return null;var c=!(b[6]||b[7]||b[8]),d=c&&!(b[2]||b[3]||b[4]);if(d||c&&b[5])return null;c=b[1];d=parseInt(b[2],10)||0;var e=parseInt(b[3],10)||0,f=parseInt(b[4],10)||0,g=parseInt(b[6],10)||0,h=parseInt(b[7],10)||0;b=parseFloat(b[8])||0;return c?new goog.date.Interval(-d,-e,-f,-g,-h,-b):new goog.date.Interval(d,e,f,g,h,b)};
+goog.date.Interval.prototype.toIsoString=function(b){var c=Math.min(this.years,this.months,this.days,this.hours,this.minutes,this.seconds),d=Math.max(this.years,this.months,this.days,this.hours,this.minutes,this.seconds);if(c<0&&d>0)return null;if(!b&&c==0&&d==0)return"PT0S";d=[];c<0&&d.push("-");d.push("P");if(this.years||b)d.push(Math.abs(this.years)+"Y");if(this.months||b)d.push(Math.abs(this.months)+"M");if(this.days||b)d.push(Math.abs(this.days)+"D");if(this.hours||this.minutes||this.seconds||
+b){d.push("T");if(this.hours||b)d.push(Math.abs(this.hours)+"H");if(this.minutes||b)d.push(Math.abs(this.minutes)+"M");if(this.seconds||b)d.push(Math.abs(this.seconds)+"S")}return d.join("")};goog.date.Interval.prototype.equals=function(b){return b.years==this.years&&b.months==this.months&&b.days==this.days&&b.hours==this.hours&&b.minutes==this.minutes&&b.seconds==this.seconds};
+goog.date.Interval.prototype.clone=function(){return new goog.date.Interval(this.years,this.months,this.days,this.hours,this.minutes,this.seconds)};goog.date.Interval.YEARS="y";goog.date.Interval.MONTHS="m";goog.date.Interval.DAYS="d";goog.date.Interval.HOURS="h";goog.date.Interval.MINUTES="n";goog.date.Interval.SECONDS="s";goog.date.Interval.prototype.getInverse=function(){return new goog.date.Interval(-this.years,-this.months,-this.days,-this.hours,-this.minutes,-this.seconds)};
+goog.date.Interval.prototype.add=function(b){this.years+=b.years;this.months+=b.months;this.days+=b.days;this.hours+=b.hours;this.minutes+=b.minutes;this.seconds+=b.seconds};goog.date.Date=function(b,c,d){if(goog.isNumber(b)){this.date_=new Date(b,c||0,d||1);this.maybeFixDst_(d||1)}else if(goog.isObject(b)){this.date_=new Date(b.getFullYear(),b.getMonth(),b.getDate());this.maybeFixDst_(b.getDate())}else{this.date_=new Date;this.date_.setHours(0);this.date_.setMinutes(0);this.date_.setSeconds(0);this.date_.setMilliseconds(0)}};
+a=goog.date.Date.prototype;a.firstDayOfWeek_=goog.date.weekDay.MON;a.firstWeekCutOffDay_=goog.date.weekDay.THU;a.clone=function(){var b=new goog.date.Date(this.date_);b.firstDayOfWeek_=this.firstDayOfWeek_;b.firstWeekCutOffDay_=this.firstWeekCutOffDay_;return b};a.getFullYear=function(){return this.date_.getFullYear()};a.getYear=function(){return this.getFullYear()};a.getMonth=function(){return this.date_.getMonth()};a.getDate=function(){return this.date_.getDate()};a.getTime=function(){return this.date_.getTime()};
+a.getDay=function(){return this.date_.getDay()};a.getIsoWeekday=function(){return(this.getDay()+6)%7};a.getWeekday=function(){return(this.getIsoWeekday()-this.firstDayOfWeek_+7)%7};a.getUTCFullYear=function(){return this.date_.getUTCFullYear()};a.getUTCMonth=function(){return this.date_.getUTCMonth()};a.getUTCDate=function(){return this.date_.getUTCDate()};a.getUTCDay=function(){return this.date_.getDay()};a.getUTCHours=function(){return this.date_.getUTCHours()};a.getUTCMinutes=function(){return this.date_.getUTCMinutes()};
+a.getUTCIsoWeekday=function(){return(this.date_.getUTCDay()+6)%7};a.getUTCWeekday=function(){return(this.getUTCIsoWeekday()-this.firstDayOfWeek_+7)%7};a.getFirstDayOfWeek=function(){return this.firstDayOfWeek_};a.getFirstWeekCutOffDay=function(){return this.firstWeekCutOffDay_};a.getNumberOfDaysInMonth=function(){return goog.date.getNumberOfDaysInMonth(this.getFullYear(),this.getMonth())};
+a.getWeekNumber=function(){return goog.date.getWeekNumber(this.getFullYear(),this.getMonth(),this.getDate(),this.firstWeekCutOffDay_,this.firstDayOfWeek_)};a.getDayOfYear=function(){for(var b=this.getDate(),c=this.getFullYear(),d=this.getMonth()-1;d>=0;d--)b+=goog.date.getNumberOfDaysInMonth(c,d);return b};a.getTimezoneOffset=function(){return this.date_.getTimezoneOffset()};
+a.getTimezoneOffsetString=function(){var b;b=this.getTimezoneOffset();if(b==0)b="Z";else{var c=Math.abs(b)/60,d=Math.floor(c);c=(c-d)*60;b=(b>0?"-":"+")+goog.string.padNumber(d,2)+":"+goog.string.padNumber(c,2)}return b};a.set=function(b){this.date_=new Date(b.getFullYear(),b.getMonth(),b.getDate())};a.setFullYear=function(b){this.date_.setFullYear(b)};a.setYear=function(b){this.setFullYear(b)};a.setMonth=function(b){this.date_.setMonth(b)};a.setDate=function(b){this.date_.setDate(b)};a.setTime=function(b){this.date_.setTime(b)};
+a.setUTCFullYear=function(b){this.date_.setUTCFullYear(b)};a.setUTCMonth=function(b){this.date_.setUTCMonth(b)};a.setUTCDate=function(b){this.date_.setUTCDate(b)};a.setFirstDayOfWeek=function(b){this.firstDayOfWeek_=b};a.setFirstWeekCutOffDay=function(b){this.firstWeekCutOffDay_=b};
+a.add=function(b){if(b.years||b.months){var c=this.getMonth()+b.months+b.years*12,d=this.getYear()+Math.floor(c/12);c%=12;if(c<0)c+=12;var e=goog.date.getNumberOfDaysInMonth(d,c);e=Math.min(e,this.getDate());this.setDate(1);this.setFullYear(d);this.setMonth(c);this.setDate(e)}if(b.days){c=new Date(this.getYear(),this.getMonth(),this.getDate(),12);b=new Date(c.getTime()+b.days*86400000);this.setDate(1);this.setFullYear(b.getFullYear());this.setMonth(b.getMonth());this.setDate(b.getDate());this.maybeFixDst_(b.getDate())}};
+a.toIsoString=function(b,c){var d=[this.getFullYear(),goog.string.padNumber(this.getMonth()+1,2),goog.string.padNumber(this.getDate(),2)];return d.join(b?"-":"")+(c?this.getTimezoneOffsetString():"")};a.toUTCIsoString=function(b,c){var d=[this.getUTCFullYear(),goog.string.padNumber(this.getUTCMonth()+1,2),goog.string.padNumber(this.getUTCDate(),2)];return d.join(b?"-":"")+(c?"Z":"")};a.equals=function(b){return this.getYear()==b.getYear()&&this.getMonth()==b.getMonth()&&this.getDate()==b.getDate()};
+a.toString=function(){return this.toIsoString()};a.maybeFixDst_=function(b){if(this.getDate()!=b){b=this.getDate()<b?1:-1;this.date_.setUTCHours(this.date_.getUTCHours()+b)}};a.valueOf=function(){return this.date_.valueOf()};goog.date.DateTime=function(b,c,d,e,f,g,h){this.date_=goog.isNumber(b)?new Date(b,c||0,d||1,e||0,f||0,g||0,h||0):new Date(b?b.getTime():goog.now())};goog.inherits(goog.date.DateTime,goog.date.Date);a=goog.date.DateTime.prototype;a.getHours=function(){return this.date_.getHours()};
+a.getMinutes=function(){return this.date_.getMinutes()};a.getSeconds=function(){return this.date_.getSeconds()};a.getMilliseconds=function(){return this.date_.getMilliseconds()};a.getUTCDay=function(){return this.date_.getUTCDay()};a.getUTCHours=function(){return this.date_.getUTCHours()};a.getUTCMinutes=function(){return this.date_.getUTCMinutes()};a.getUTCSeconds=function(){return this.date_.getUTCSeconds()};a.getUTCMilliseconds=function(){return this.date_.getUTCMilliseconds()};a.setHours=function(b){this.date_.setHours(b)};
+a.setMinutes=function(b){this.date_.setMinutes(b)};a.setSeconds=function(b){this.date_.setSeconds(b)};a.setMilliseconds=function(b){this.date_.setMilliseconds(b)};a.setUTCHours=function(b){this.date_.setUTCHours(b)};a.setUTCMinutes=function(b){this.date_.setUTCMinutes(b)};a.setUTCSeconds=function(b){this.date_.setUTCSeconds(b)};a.setUTCMilliseconds=function(b){this.date_.setUTCMilliseconds(b)};
+a.add=function(b){goog.date.Date.prototype.add.call(this,b);b.hours&&this.setHours(this.date_.getHours()+b.hours);b.minutes&&this.setMinutes(this.date_.getMinutes()+b.minutes);b.seconds&&this.setSeconds(this.date_.getSeconds()+b.seconds)};
+a.toIsoString=function(b,c){var d=goog.date.Date.prototype.toIsoString.call(this,b);if(b)return d+" "+goog.string.padNumber(this.getHours(),2)+":"+goog.string.padNumber(this.getMinutes(),2)+":"+goog.string.padNumber(this.getSeconds(),2)+(c?this.getTimezoneOffsetString():"");return d+"T"+goog.string.padNumber(this.getHours(),2)+goog.string.padNumber(this.getMinutes(),2)+goog.string.padNumber(this.getSeconds(),2)+(c?this.getTimezoneOffsetString():"")};
+a.toXmlDateTime=function(b){return goog.date.Date.prototype.toIsoString.call(this,true)+"T"+goog.string.padNumber(this.getHours(),2)+":"+goog.string.padNumber(this.getMinutes(),2)+":"+goog.string.padNumber(this.getSeconds(),2)+(b?this.getTimezoneOffsetString():"")};
+a.toUTCIsoString=function(b,c){var d=goog.date.Date.prototype.toUTCIsoString.call(this,b);if(b)return d+" "+goog.string.padNumber(this.getUTCHours(),2)+":"+goog.string.padNumber(this.getUTCMinutes(),2)+":"+goog.string.padNumber(this.getUTCSeconds(),2)+(c?"Z":"");return d+"T"+goog.string.padNumber(this.getUTCHours(),2)+goog.string.padNumber(this.getUTCMinutes(),2)+goog.string.padNumber(this.getUTCSeconds(),2)+(c?"Z":"")};a.equals=function(b){return this.getTime()==b.getTime()};a.toString=function(){return this.toIsoString()};
+a.toUsTimeString=function(b,c,d){var e=this.getHours();goog.isDef(c)||(c=true);var f=e==12;if(e>12){e-=12;f=true}if(e==0&&c)e=12;b=b?goog.string.padNumber(e,2):String(e);e=this.getMinutes();if(!d||e>0)b+=":"+goog.string.padNumber(e,2);if(c){c=goog.getMsg("am");d=goog.getMsg("pm");b+=f?d:c}return b};a.toIsoTimeString=function(b){var c=this.getHours();c=goog.string.padNumber(c,2)+":"+goog.string.padNumber(this.getMinutes(),2);if(!goog.isDef(b)||b)c+=":"+goog.string.padNumber(this.getSeconds(),2);return c};
+a.clone=function(){var b=new goog.date.DateTime(this.date_);b.firstDayOfWeek_=this.firstDayOfWeek_;b.firstWeekCutOffDay_=this.firstWeekCutOffDay_;return b};goog.asserts={};goog.asserts.assert=function(b,c){if(goog.DEBUG&&!b)throw Error("Assertion failed"+(c?": "+c:""));};goog.asserts.fail=function(b){if(goog.DEBUG)throw Error("Failure"+(b?": "+b:""));};goog.asserts.assertNumber=function(b,c){goog.asserts.assert(goog.isNumber(b),c)};goog.asserts.assertString=function(b,c){goog.asserts.assert(goog.isString(b),c)};goog.asserts.assertFunction=function(b,c){goog.asserts.assert(goog.isFunction(b),c)};
+goog.asserts.assertObject=function(b,c){goog.asserts.assert(goog.isObject(b),c)};goog.asserts.assertInstanceof=function(b,c,d){goog.asserts.assert(b instanceof c,d)};goog.i18n={};
+goog.i18n.DateTimeSymbols_en_ISO={ERAS:["BC","AD"],ERANAMES:["Before Christ","Anno Domini"],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["January","February","March","April","May","June","July","August","September","October","November","December"],STANDALONEMONTHS:["January","February","March","April","May","June","July","August","September","October","November","December"],SHORTMONTHS:["Jan","Feb",
+"Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],STANDALONESHORTMONTHS:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],WEEKDAYS:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],STANDALONEWEEKDAYS:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],SHORTWEEKDAYS:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],STANDALONESHORTWEEKDAYS:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],NARROWWEEKDAYS:["S","M","T","W","T","F","S"],
+STANDALONENARROWWEEKDAYS:["S","M","T","W","T","F","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["1st quarter","2nd quarter","3rd quarter","4th quarter"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, y MMMM dd","y MMMM d","y MMM d","yyyy-MM-dd"],TIMEFORMATS:["HH:mm:ss v","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"M/d",MMMMd:"MMMM d",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_ar={ERAS:["\u0642.\u0645","\u0645"],ERANAMES:["\u0642\u0628\u0644 \u0627\u0644\u0645\u064a\u0644\u0627\u062f","\u0645\u064a\u0644\u0627\u062f\u064a"],NARROWMONTHS:["\u064a","\u0641","\u0645","\u0623","\u0648","\u0646","\u0644","\u063a","\u0633","\u0643","\u0628","\u062f"],STANDALONENARROWMONTHS:["\u064a","\u0641","\u0645","\u0623","\u0648","\u0646","\u0644","\u063a","\u0633","\u0643","\u0628","\u062f"],MONTHS:["\u064a\u0646\u0627\u064a\u0631","\u0641\u0628\u0631\u0627\u064a\u0631",
+"\u0645\u0627\u0631\u0633","\u0623\u0628\u0631\u064a\u0644","\u0645\u0627\u064a\u0648","\u064a\u0648\u0646\u064a\u0648","\u064a\u0648\u0644\u064a\u0648","\u0623\u063a\u0633\u0637\u0633","\u0633\u0628\u062a\u0645\u0628\u0631","\u0623\u0643\u062a\u0648\u0628\u0631","\u0646\u0648\u0641\u0645\u0628\u0631","\u062f\u064a\u0633\u0645\u0628\u0631"],STANDALONEMONTHS:["\u064a\u0646\u0627\u064a\u0631","\u0641\u0628\u0631\u0627\u064a\u0631","\u0645\u0627\u0631\u0633","\u0623\u0628\u0631\u064a\u0644","\u0645\u0627\u064a\u0648",
+"\u064a\u0648\u0646\u064a\u0648","\u064a\u0648\u0644\u064a\u0648","\u0623\u063a\u0633\u0637\u0633","\u0633\u0628\u062a\u0645\u0628\u0631","\u0623\u0643\u062a\u0648\u0628\u0631","\u0646\u0648\u0641\u0645\u0628\u0631","\u062f\u064a\u0633\u0645\u0628\u0631"],SHORTMONTHS:["\u064a\u0646\u0627\u064a\u0631","\u0641\u0628\u0631\u0627\u064a\u0631","\u0645\u0627\u0631\u0633","\u0623\u0628\u0631\u064a\u0644","\u0645\u0627\u064a\u0648","\u064a\u0648\u0646\u064a\u0648","\u064a\u0648\u0644\u064a\u0648","\u0623\u063a\u0633\u0637\u0633",
+"\u0633\u0628\u062a\u0645\u0628\u0631","\u0623\u0643\u062a\u0648\u0628\u0631","\u0646\u0648\u0641\u0645\u0628\u0631","\u062f\u064a\u0633\u0645\u0628\u0631"],STANDALONESHORTMONTHS:["\u064a\u0646\u0627\u064a\u0631","\u0641\u0628\u0631\u0627\u064a\u0631","\u0645\u0627\u0631\u0633","\u0623\u0628\u0631\u064a\u0644","\u0645\u0627\u064a\u0648","\u064a\u0648\u0646\u064a\u0648","\u064a\u0648\u0644\u064a\u0648","\u0623\u063a\u0633\u0637\u0633","\u0633\u0628\u062a\u0645\u0628\u0631","\u0623\u0643\u062a\u0648\u0628\u0631",
+"\u0646\u0648\u0641\u0645\u0628\u0631","\u062f\u064a\u0633\u0645\u0628\u0631"],WEEKDAYS:["\u0627\u0644\u0623\u062d\u062f","\u0627\u0644\u0625\u062b\u0646\u064a\u0646","\u0627\u0644\u062b\u0644\u0627\u062b\u0627\u0621","\u0627\u0644\u0623\u0631\u0628\u0639\u0627\u0621","\u0627\u0644\u062e\u0645\u064a\u0633","\u0627\u0644\u062c\u0645\u0639\u0629","\u0627\u0644\u0633\u0628\u062a"],STANDALONEWEEKDAYS:["\u0627\u0644\u0623\u062d\u062f","\u0627\u0644\u0625\u062b\u0646\u064a\u0646","\u0627\u0644\u062b\u0644\u0627\u062b\u0627\u0621",
+"\u0627\u0644\u0623\u0631\u0628\u0639\u0627\u0621","\u0627\u0644\u062e\u0645\u064a\u0633","\u0627\u0644\u062c\u0645\u0639\u0629","\u0627\u0644\u0633\u0628\u062a"],SHORTWEEKDAYS:["\u0623\u062d\u062f","\u0625\u062b\u0646\u064a\u0646","\u062b\u0644\u0627\u062b\u0627\u0621","\u0623\u0631\u0628\u0639\u0627\u0621","\u062e\u0645\u064a\u0633","\u062c\u0645\u0639\u0629","\u0633\u0628\u062a"],STANDALONESHORTWEEKDAYS:["\u0623\u062d\u062f","\u0625\u062b\u0646\u064a\u0646","\u062b\u0644\u0627\u062b\u0627\u0621",
+"\u0623\u0631\u0628\u0639\u0627\u0621","\u062e\u0645\u064a\u0633","\u062c\u0645\u0639\u0629","\u0633\u0628\u062a"],NARROWWEEKDAYS:["\u062d","\u0646","\u062b","\u0631","\u062e","\u062c","\u0633"],STANDALONENARROWWEEKDAYS:["\u062d","\u0646","\u062b","\u0631","\u062e","\u062c","\u0633"],SHORTQUARTERS:["\u0627\u0644\u0631\u0628\u0639 \u0627\u0644\u0623\u0648\u0644","\u0627\u0644\u0631\u0628\u0639 \u0627\u0644\u062b\u0627\u0646\u064a","\u0627\u0644\u0631\u0628\u0639 \u0627\u0644\u062b\u0627\u0644\u062b",
+"\u0627\u0644\u0631\u0628\u0639 \u0627\u0644\u0631\u0627\u0628\u0639"],QUARTERS:["\u0627\u0644\u0631\u0628\u0639 \u0627\u0644\u0623\u0648\u0644","\u0627\u0644\u0631\u0628\u0639 \u0627\u0644\u062b\u0627\u0646\u064a","\u0627\u0644\u0631\u0628\u0639 \u0627\u0644\u062b\u0627\u0644\u062b","\u0627\u0644\u0631\u0628\u0639 \u0627\u0644\u0631\u0627\u0628\u0639"],AMPMS:["\u0635","\u0645"],DATEFORMATS:["EEEE\u060c d MMMM\u060c y","d MMMM\u060c y","dd/MM/yyyy","d/M/yyyy"],TIMEFORMATS:["zzzz h:mm:ss a","z h:mm:ss a",
+"h:mm:ss a","h:mm a"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:5,WEEKENDRANGE:[4,5],FIRSTWEEKCUTOFFDAY:1};
+goog.i18n.DateTimeSymbols_bg={ERAS:["\u043f\u0440. \u043d. \u0435.","\u043e\u0442 \u043d. \u0435."],ERANAMES:["\u043f\u0440.\u0425\u0440.","\u0441\u043b.\u0425\u0440."],NARROWMONTHS:["\u044f","\u0444","\u043c","\u0430","\u043c","\u044e","\u044e","\u0430","\u0441","\u043e","\u043d","\u0434"],STANDALONENARROWMONTHS:["\u044f","\u0444","\u043c","\u0430","\u043c","\u044e","\u044e","\u0430","\u0441","\u043e","\u043d","\u0434"],MONTHS:["\u044f\u043d\u0443\u0430\u0440\u0438","\u0444\u0435\u0432\u0440\u0443\u0430\u0440\u0438",
+"\u043c\u0430\u0440\u0442","\u0430\u043f\u0440\u0438\u043b","\u043c\u0430\u0439","\u044e\u043d\u0438","\u044e\u043b\u0438","\u0430\u0432\u0433\u0443\u0441\u0442","\u0441\u0435\u043f\u0442\u0435\u043c\u0432\u0440\u0438","\u043e\u043a\u0442\u043e\u043c\u0432\u0440\u0438","\u043d\u043e\u0435\u043c\u0432\u0440\u0438","\u0434\u0435\u043a\u0435\u043c\u0432\u0440\u0438"],STANDALONEMONTHS:["\u044f\u043d\u0443\u0430\u0440\u0438","\u0444\u0435\u0432\u0440\u0443\u0430\u0440\u0438","\u043c\u0430\u0440\u0442",
+"\u0430\u043f\u0440\u0438\u043b","\u043c\u0430\u0439","\u044e\u043d\u0438","\u044e\u043b\u0438","\u0430\u0432\u0433\u0443\u0441\u0442","\u0441\u0435\u043f\u0442\u0435\u043c\u0432\u0440\u0438","\u043e\u043a\u0442\u043e\u043c\u0432\u0440\u0438","\u043d\u043e\u0435\u043c\u0432\u0440\u0438","\u0434\u0435\u043a\u0435\u043c\u0432\u0440\u0438"],SHORTMONTHS:["\u044f\u043d.","\u0444\u0435\u0432\u0440.","\u043c\u0430\u0440\u0442","\u0430\u043f\u0440.","\u043c\u0430\u0439","\u044e\u043d\u0438","\u044e\u043b\u0438",
+"\u0430\u0432\u0433.","\u0441\u0435\u043f\u0442.","\u043e\u043a\u0442.","\u043d\u043e\u0435\u043c.","\u0434\u0435\u043a."],STANDALONESHORTMONTHS:["\u044f\u043d.","\u0444\u0435\u0432\u0440.","\u043c\u0430\u0440\u0442","\u0430\u043f\u0440.","\u043c\u0430\u0439","\u044e\u043d\u0438","\u044e\u043b\u0438","\u0430\u0432\u0433.","\u0441\u0435\u043f\u0442.","\u043e\u043a\u0442.","\u043d\u043e\u0435\u043c.","\u0434\u0435\u043a."],WEEKDAYS:["\u043d\u0435\u0434\u0435\u043b\u044f","\u043f\u043e\u043d\u0435\u0434\u0435\u043b\u043d\u0438\u043a",
+"\u0432\u0442\u043e\u0440\u043d\u0438\u043a","\u0441\u0440\u044f\u0434\u0430","\u0447\u0435\u0442\u0432\u044a\u0440\u0442\u044a\u043a","\u043f\u0435\u0442\u044a\u043a","\u0441\u044a\u0431\u043e\u0442\u0430"],STANDALONEWEEKDAYS:["\u043d\u0435\u0434\u0435\u043b\u044f","\u043f\u043e\u043d\u0435\u0434\u0435\u043b\u043d\u0438\u043a","\u0432\u0442\u043e\u0440\u043d\u0438\u043a","\u0441\u0440\u044f\u0434\u0430","\u0447\u0435\u0442\u0432\u044a\u0440\u0442\u044a\u043a","\u043f\u0435\u0442\u044a\u043a","\u0441\u044a\u0431\u043e\u0442\u0430"],
+SHORTWEEKDAYS:["\u043d\u0434","\u043f\u043d","\u0432\u0442","\u0441\u0440","\u0447\u0442","\u043f\u0442","\u0441\u0431"],STANDALONESHORTWEEKDAYS:["\u043d\u0434","\u043f\u043d","\u0432\u0442","\u0441\u0440","\u0447\u0442","\u043f\u0442","\u0441\u0431"],NARROWWEEKDAYS:["\u043d","\u043f","\u0432","\u0441","\u0447","\u043f","\u0441"],STANDALONENARROWWEEKDAYS:["\u043d","\u043f","\u0432","\u0441","\u0447","\u043f","\u0441"],SHORTQUARTERS:["I \u0442\u0440\u0438\u043c.","II \u0442\u0440\u0438\u043c.","III \u0442\u0440\u0438\u043c.",
+"IV \u0442\u0440\u0438\u043c."],QUARTERS:["1-\u0432\u043e \u0442\u0440\u0438\u043c\u0435\u0441\u0435\u0447\u0438\u0435","2-\u0440\u043e \u0442\u0440\u0438\u043c\u0435\u0441\u0435\u0447\u0438\u0435","3-\u0442\u043e \u0442\u0440\u0438\u043c\u0435\u0441\u0435\u0447\u0438\u0435","4-\u0442\u043e \u0442\u0440\u0438\u043c\u0435\u0441\u0435\u0447\u0438\u0435"],AMPMS:["\u043f\u0440. \u043e\u0431.","\u0441\u043b. \u043e\u0431."],DATEFORMATS:["dd MMMM y, EEEE","dd MMMM y","dd.MM.yyyy","dd.MM.yy"],TIMEFORMATS:["HH:mm:ss zzzz",
+"HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"d MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_bn={ERAS:["\u0996\u09c3\u09b7\u09cd\u099f\u09aa\u09c2\u09b0\u09cd\u09ac","\u0996\u09c3\u09b7\u09cd\u099f\u09be\u09ac\u09cd\u09a6"],ERANAMES:["\u0996\u09c3\u09b7\u09cd\u099f\u09aa\u09c2\u09b0\u09cd\u09ac","\u0996\u09c3\u09b7\u09cd\u099f\u09be\u09ac\u09cd\u09a6"],NARROWMONTHS:["\u099c\u09be","\u09ab\u09c7","\u09ae\u09be","\u098f","\u09ae\u09c7","\u099c\u09c1\u09a8","\u099c\u09c1","\u0986","\u09b8\u09c7","\u0985","\u09a8","\u09a1\u09bf"],STANDALONENARROWMONTHS:["\u099c\u09be",
+"\u09ab\u09c7","\u09ae\u09be","\u098f","\u09ae\u09c7","\u099c\u09c1\u09a8","\u099c\u09c1","\u0986","\u09b8\u09c7","\u0985","\u09a8","\u09a1\u09bf"],MONTHS:["\u099c\u09be\u09a8\u09c1\u09af\u09bc\u09be\u09b0\u09c0","\u09ab\u09c7\u09ac\u09cd\u09b0\u09c1\u09af\u09bc\u09be\u09b0\u09c0","\u09ae\u09be\u09b0\u09cd\u099a","\u098f\u09aa\u09cd\u09b0\u09bf\u09b2","\u09ae\u09c7","\u099c\u09c1\u09a8","\u099c\u09c1\u09b2\u09be\u0987","\u0986\u0997\u09b8\u09cd\u099f","\u09b8\u09c7\u09aa\u09cd\u099f\u09c7\u09ae\u09cd\u09ac\u09b0",
+"\u0985\u0995\u09cd\u099f\u09cb\u09ac\u09b0","\u09a8\u09ad\u09c7\u09ae\u09cd\u09ac\u09b0","\u09a1\u09bf\u09b8\u09c7\u09ae\u09cd\u09ac\u09b0"],STANDALONEMONTHS:["\u099c\u09be\u09a8\u09c1\u09af\u09bc\u09be\u09b0\u09c0","\u09ab\u09c7\u09ac\u09cd\u09b0\u09c1\u09af\u09bc\u09be\u09b0\u09c0","\u09ae\u09be\u09b0\u09cd\u099a","\u098f\u09aa\u09cd\u09b0\u09bf\u09b2","\u09ae\u09c7","\u099c\u09c1\u09a8","\u099c\u09c1\u09b2\u09be\u0987","\u0986\u0997\u09b8\u09cd\u099f","\u09b8\u09c7\u09aa\u09cd\u099f\u09c7\u09ae\u09cd\u09ac\u09b0",
+"\u0985\u0995\u09cd\u099f\u09cb\u09ac\u09b0","\u09a8\u09ad\u09c7\u09ae\u09cd\u09ac\u09b0","\u09a1\u09bf\u09b8\u09c7\u09ae\u09cd\u09ac\u09b0"],SHORTMONTHS:["\u099c\u09be\u09a8\u09c1\u09af\u09bc\u09be\u09b0\u09c0","\u09ab\u09c7\u09ac\u09cd\u09b0\u09c1\u09af\u09bc\u09be\u09b0\u09c0","\u09ae\u09be\u09b0\u09cd\u099a","\u098f\u09aa\u09cd\u09b0\u09bf\u09b2","\u09ae\u09c7","\u099c\u09c1\u09a8","\u099c\u09c1\u09b2\u09be\u0987","\u0986\u0997\u09b8\u09cd\u099f","\u09b8\u09c7\u09aa\u09cd\u099f\u09c7\u09ae\u09cd\u09ac\u09b0",
+"\u0985\u0995\u09cd\u099f\u09cb\u09ac\u09b0","\u09a8\u09ad\u09c7\u09ae\u09cd\u09ac\u09b0","\u09a1\u09bf\u09b8\u09c7\u09ae\u09cd\u09ac\u09b0"],STANDALONESHORTMONTHS:["\u099c\u09be\u09a8\u09c1\u09af\u09bc\u09be\u09b0\u09c0","\u09ab\u09c7\u09ac\u09cd\u09b0\u09c1\u09af\u09bc\u09be\u09b0\u09c0","\u09ae\u09be\u09b0\u09cd\u099a","\u098f\u09aa\u09cd\u09b0\u09bf\u09b2","\u09ae\u09c7","\u099c\u09c1\u09a8","\u099c\u09c1\u09b2\u09be\u0987","\u0986\u0997\u09b8\u09cd\u099f","\u09b8\u09c7\u09aa\u09cd\u099f\u09c7\u09ae\u09cd\u09ac\u09b0",
+"\u0985\u0995\u09cd\u099f\u09cb\u09ac\u09b0","\u09a8\u09ad\u09c7\u09ae\u09cd\u09ac\u09b0","\u09a1\u09bf\u09b8\u09c7\u09ae\u09cd\u09ac\u09b0"],WEEKDAYS:["\u09b0\u09ac\u09bf\u09ac\u09be\u09b0","\u09b8\u09cb\u09ae\u09ac\u09be\u09b0","\u09ae\u0999\u09cd\u0997\u09b2\u09ac\u09be\u09b0","\u09ac\u09c1\u09a7\u09ac\u09be\u09b0","\u09ac\u09c3\u09b9\u09b7\u09cd\u09aa\u09a4\u09bf\u09ac\u09be\u09b0","\u09b6\u09c1\u0995\u09cd\u09b0\u09ac\u09be\u09b0","\u09b6\u09a8\u09bf\u09ac\u09be\u09b0"],STANDALONEWEEKDAYS:["\u09b0\u09ac\u09bf\u09ac\u09be\u09b0",
+"\u09b8\u09cb\u09ae\u09ac\u09be\u09b0","\u09ae\u0999\u09cd\u0997\u09b2\u09ac\u09be\u09b0","\u09ac\u09c1\u09a7\u09ac\u09be\u09b0","\u09ac\u09c3\u09b9\u09b7\u09cd\u09aa\u09a4\u09bf\u09ac\u09be\u09b0","\u09b6\u09c1\u0995\u09cd\u09b0\u09ac\u09be\u09b0","\u09b6\u09a8\u09bf\u09ac\u09be\u09b0"],SHORTWEEKDAYS:["\u09b0\u09ac\u09bf","\u09b8\u09cb\u09ae","\u09ae\u0999\u09cd\u0997\u09b2","\u09ac\u09c1\u09a7","\u09ac\u09c3\u09b9\u09b8\u09cd\u09aa\u09a4\u09bf","\u09b6\u09c1\u0995\u09cd\u09b0","\u09b6\u09a8\u09bf"],
+STANDALONESHORTWEEKDAYS:["\u09b0\u09ac\u09bf","\u09b8\u09cb\u09ae","\u09ae\u0999\u09cd\u0997\u09b2","\u09ac\u09c1\u09a7","\u09ac\u09c3\u09b9\u09b8\u09cd\u09aa\u09a4\u09bf","\u09b6\u09c1\u0995\u09cd\u09b0","\u09b6\u09a8\u09bf"],NARROWWEEKDAYS:["\u09b0","\u09b8\u09cb","\u09ae","\u09ac\u09c1","\u09ac\u09c3","\u09b6\u09c1","\u09b6"],STANDALONENARROWWEEKDAYS:["\u09b0","\u09b8\u09cb","\u09ae","\u09ac\u09c1","\u09ac\u09c3","\u09b6\u09c1","\u09b6"],SHORTQUARTERS:["\u099a\u09a4\u09c1\u09b0\u09cd\u09a5\u09be\u0982\u09b6 \u09e7",
+"\u099a\u09a4\u09c1\u09b0\u09cd\u09a5\u09be\u0982\u09b6 \u09e8","\u099a\u09a4\u09c1\u09b0\u09cd\u09a5\u09be\u0982\u09b6 \u09e9","\u099a\u09a4\u09c1\u09b0\u09cd\u09a5\u09be\u0982\u09b6 \u09ea"],QUARTERS:["\u09aa\u09cd\u09b0\u09a5\u09ae \u099a\u09a4\u09c1\u09b0\u09cd\u09a5\u09be\u0982\u09b6","\u09a6\u09cd\u09ac\u09bf\u09a4\u09c0\u09af\u09bc \u099a\u09a4\u09c1\u09b0\u09cd\u09a5\u09be\u0982\u09b6","\u09a4\u09c3\u09a4\u09c0\u09af\u09bc \u099a\u09a4\u09c1\u09b0\u09cd\u09a5\u09be\u0982\u09b6","\u099a\u09a4\u09c1\u09b0\u09cd\u09a5 \u099a\u09a4\u09c1\u09b0\u09cd\u09a5\u09be\u0982\u09b6"],
+AMPMS:["am","pm"],DATEFORMATS:["EEEE, d MMMM, y","d MMMM, y","d MMM, y","d/M/yy"],TIMEFORMATS:["h:mm:ss a zzzz","h:mm:ss a z","h:mm:ss a","h:mm a"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_ca={ERAS:["aC","dC"],ERANAMES:["aC","dC"],NARROWMONTHS:["g","f","m","a","m","j","j","a","s","o","n","d"],STANDALONENARROWMONTHS:["g","f","m","a","m","j","j","a","s","o","n","d"],MONTHS:["de gener","de febrer","de mar\u00e7","d\u2019abril","de maig","de juny","de juliol","d\u2019agost","de setembre","d\u2019octubre","de novembre","de desembre"],STANDALONEMONTHS:["gener","febrer","mar\u00e7","abril","maig","juny","juliol","agost","setembre","octubre","novembre","desembre"],
+SHORTMONTHS:["gen.","febr.","mar\u00e7","abr.","maig","juny","jul.","ag.","set.","oct.","nov.","des."],STANDALONESHORTMONTHS:["gen.","febr.","mar\u00e7","abr.","maig","juny","jul.","ag.","set.","oct.","nov.","des."],WEEKDAYS:["diumenge","dilluns","dimarts","dimecres","dijous","divendres","dissabte"],STANDALONEWEEKDAYS:["diumenge","dilluns","dimarts","dimecres","dijous","divendres","dissabte"],SHORTWEEKDAYS:["dg.","dl.","dt.","dc.","dj.","dv.","ds."],STANDALONESHORTWEEKDAYS:["dg","dl","dt","dc","dj",
+"dv","ds"],NARROWWEEKDAYS:["g","l","t","c","j","v","s"],STANDALONENARROWWEEKDAYS:["g","l","t","c","j","v","s"],SHORTQUARTERS:["1T","2T","3T","4T"],QUARTERS:["1r trimestre","2n trimestre","3r trimestre","4t trimestre"],AMPMS:["a.m.","p.m."],DATEFORMATS:["EEEE d MMMM 'de' y","d MMMM 'de' y","dd/MM/yyyy","dd/MM/yy"],TIMEFORMATS:["H:mm:ss zzzz","H:mm:ss z","H:mm:ss","H:mm"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_cs={ERAS:["p\u0159.Kr.","po Kr."],ERANAMES:["p\u0159.Kr.","po Kr."],NARROWMONTHS:["l","\u00fa","b","d","k","\u010d","\u010d","s","z","\u0159","l","p"],STANDALONENARROWMONTHS:["l","\u00fa","b","d","k","\u010d","\u010d","s","z","\u0159","l","p"],MONTHS:["ledna","\u00fanora","b\u0159ezna","dubna","kv\u011btna","\u010dervna","\u010dervence","srpna","z\u00e1\u0159\u00ed","\u0159\u00edjna","listopadu","prosince"],STANDALONEMONTHS:["leden","\u00fanor","b\u0159ezen","duben","kv\u011bten",
+"\u010derven","\u010dervenec","srpen","z\u00e1\u0159\u00ed","\u0159\u00edjen","listopad","prosinec"],SHORTMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],STANDALONESHORTMONTHS:["1.","2.","3.","4.","5.","6.","7.","8.","9.","10.","11.","12."],WEEKDAYS:["ned\u011ble","pond\u011bl\u00ed","\u00fater\u00fd","st\u0159eda","\u010dtvrtek","p\u00e1tek","sobota"],STANDALONEWEEKDAYS:["ned\u011ble","pond\u011bl\u00ed","\u00fater\u00fd","st\u0159eda","\u010dtvrtek","p\u00e1tek","sobota"],SHORTWEEKDAYS:["ne",
+"po","\u00fat","st","\u010dt","p\u00e1","so"],STANDALONESHORTWEEKDAYS:["ne","po","\u00fat","st","\u010dt","p\u00e1","so"],NARROWWEEKDAYS:["N","P","\u00da","S","\u010c","P","S"],STANDALONENARROWWEEKDAYS:["N","P","\u00da","S","\u010c","P","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["1. \u010dtvrtlet\u00ed","2. \u010dtvrtlet\u00ed","3. \u010dtvrtlet\u00ed","4. \u010dtvrtlet\u00ed"],AMPMS:["dop.","odp."],DATEFORMATS:["EEEE, d. MMMM y","d. MMMM y","d.M.yyyy","d.M.yy"],TIMEFORMATS:["HH:mm:ss zzzz",
+"HH:mm:ss z","H:mm:ss","H:mm"],AVAILABLEFORMATS:{Md:"d.M",MMMMd:"d. MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_da={ERAS:["f.Kr.","e.Kr."],ERANAMES:["f.Kr.","e.Kr."],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["januar","februar","marts","april","maj","juni","juli","august","september","oktober","november","december"],STANDALONEMONTHS:["januar","februar","marts","april","maj","juni","juli","august","september","oktober","november","december"],SHORTMONTHS:["jan.","feb.","mar.","apr.",
+"maj","jun.","jul.","aug.","sep.","okt.","nov.","dec."],STANDALONESHORTMONTHS:["jan","feb","mar","apr","maj","jun","jul","aug","sep","okt","nov","dec"],WEEKDAYS:["s\u00f8ndag","mandag","tirsdag","onsdag","torsdag","fredag","l\u00f8rdag"],STANDALONEWEEKDAYS:["s\u00f8ndag","mandag","tirsdag","onsdag","torsdag","fredag","l\u00f8rdag"],SHORTWEEKDAYS:["s\u00f8n","man","tir","ons","tor","fre","l\u00f8r"],STANDALONESHORTWEEKDAYS:["s\u00f8n","man","tir","ons","tor","fre","l\u00f8r"],NARROWWEEKDAYS:["S","M",
+"T","O","T","F","L"],STANDALONENARROWWEEKDAYS:["S","M","T","O","T","F","L"],SHORTQUARTERS:["K1","K2","K3","K4"],QUARTERS:["1. kvartal","2. kvartal","3. kvartal","4. kvartal"],AMPMS:["f.m.","e.m."],DATEFORMATS:["EEEE 'den' d. MMMM y","d. MMM y","dd/MM/yyyy","dd/MM/yy"],TIMEFORMATS:["HH.mm.ss zzzz","HH:mm:ss z","HH.mm.ss","HH.mm"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d. MMMM",MMMd:"d. MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_de={ERAS:["v. Chr.","n. Chr."],ERANAMES:["v. Chr.","n. Chr."],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["Januar","Februar","M\u00e4rz","April","Mai","Juni","Juli","August","September","Oktober","November","Dezember"],STANDALONEMONTHS:["Januar","Februar","M\u00e4rz","April","Mai","Juni","Juli","August","September","Oktober","November","Dezember"],SHORTMONTHS:["Jan","Feb",
+"M\u00e4r","Apr","Mai","Jun","Jul","Aug","Sep","Okt","Nov","Dez"],STANDALONESHORTMONTHS:["Jan","Feb","M\u00e4r","Apr","Mai","Jun","Jul","Aug","Sep","Okt","Nov","Dez"],WEEKDAYS:["Sonntag","Montag","Dienstag","Mittwoch","Donnerstag","Freitag","Samstag"],STANDALONEWEEKDAYS:["Sonntag","Montag","Dienstag","Mittwoch","Donnerstag","Freitag","Samstag"],SHORTWEEKDAYS:["So.","Mo.","Di.","Mi.","Do.","Fr.","Sa."],STANDALONESHORTWEEKDAYS:["So.","Mo.","Di.","Mi.","Do.","Fr.","Sa."],NARROWWEEKDAYS:["S","M","D",
+"M","D","F","S"],STANDALONENARROWWEEKDAYS:["S","M","D","M","D","F","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["1. Quartal","2. Quartal","3. Quartal","4. Quartal"],AMPMS:["vorm.","nachm."],DATEFORMATS:["EEEE, d. MMMM y","d. MMMM y","dd.MM.yyyy","dd.MM.yy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d.M.",MMMMd:"d. MMMM",MMMd:"d. MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_de_AT={ERAS:["v. Chr.","n. Chr."],ERANAMES:["v. Chr.","n. Chr."],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["J\u00e4nner","Februar","M\u00e4rz","April","Mai","Juni","Juli","August","September","Oktober","November","Dezember"],STANDALONEMONTHS:["J\u00e4nner","Februar","M\u00e4rz","April","Mai","Juni","Juli","August","September","Oktober","November","Dezember"],SHORTMONTHS:["J\u00e4n",
+"Feb","M\u00e4r","Apr","Mai","Jun","Jul","Aug","Sep","Okt","Nov","Dez"],STANDALONESHORTMONTHS:["J\u00e4n","Feb","M\u00e4r","Apr","Mai","Jun","Jul","Aug","Sep","Okt","Nov","Dez"],WEEKDAYS:["Sonntag","Montag","Dienstag","Mittwoch","Donnerstag","Freitag","Samstag"],STANDALONEWEEKDAYS:["Sonntag","Montag","Dienstag","Mittwoch","Donnerstag","Freitag","Samstag"],SHORTWEEKDAYS:["So.","Mo.","Di.","Mi.","Do.","Fr.","Sa."],STANDALONESHORTWEEKDAYS:["So.","Mo.","Di.","Mi.","Do.","Fr.","Sa."],NARROWWEEKDAYS:["S",
+"M","D","M","D","F","S"],STANDALONENARROWWEEKDAYS:["S","M","D","M","D","F","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["1. Quartal","2. Quartal","3. Quartal","4. Quartal"],AMPMS:["vorm.","nachm."],DATEFORMATS:["EEEE, dd. MMMM y","dd. MMMM y","dd.MM.yyyy","dd.MM.yy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d.M.",MMMMd:"d. MMMM",MMMd:"d. MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};goog.i18n.DateTimeSymbols_de_CH=goog.i18n.DateTimeSymbols_de;
+goog.i18n.DateTimeSymbols_el={ERAS:["\u03c0.\u03a7.","\u03bc.\u03a7."],ERANAMES:["\u03c0.\u03a7.","\u03bc.\u03a7."],NARROWMONTHS:["\u0399","\u03a6","\u039c","\u0391","\u039c","\u0399","\u0399","\u0391","\u03a3","\u039f","\u039d","\u0394"],STANDALONENARROWMONTHS:["\u0399","\u03a6","\u039c","\u0391","\u039c","\u0399","\u0399","\u0391","\u03a3","\u039f","\u039d","\u0394"],MONTHS:["\u0399\u03b1\u03bd\u03bf\u03c5\u03b1\u03c1\u03af\u03bf\u03c5","\u03a6\u03b5\u03b2\u03c1\u03bf\u03c5\u03b1\u03c1\u03af\u03bf\u03c5",
+"\u039c\u03b1\u03c1\u03c4\u03af\u03bf\u03c5","\u0391\u03c0\u03c1\u03b9\u03bb\u03af\u03bf\u03c5","\u039c\u03b1\u0390\u03bf\u03c5","\u0399\u03bf\u03c5\u03bd\u03af\u03bf\u03c5","\u0399\u03bf\u03c5\u03bb\u03af\u03bf\u03c5","\u0391\u03c5\u03b3\u03bf\u03cd\u03c3\u03c4\u03bf\u03c5","\u03a3\u03b5\u03c0\u03c4\u03b5\u03bc\u03b2\u03c1\u03af\u03bf\u03c5","\u039f\u03ba\u03c4\u03c9\u03b2\u03c1\u03af\u03bf\u03c5","\u039d\u03bf\u03b5\u03bc\u03b2\u03c1\u03af\u03bf\u03c5","\u0394\u03b5\u03ba\u03b5\u03bc\u03b2\u03c1\u03af\u03bf\u03c5"],
+STANDALONEMONTHS:["\u0399\u03b1\u03bd\u03bf\u03c5\u03ac\u03c1\u03b9\u03bf\u03c2","\u03a6\u03b5\u03b2\u03c1\u03bf\u03c5\u03ac\u03c1\u03b9\u03bf\u03c2","\u039c\u03ac\u03c1\u03c4\u03b9\u03bf\u03c2","\u0391\u03c0\u03c1\u03af\u03bb\u03b9\u03bf\u03c2","\u039c\u03ac\u03b9\u03bf\u03c2","\u0399\u03bf\u03cd\u03bd\u03b9\u03bf\u03c2","\u0399\u03bf\u03cd\u03bb\u03b9\u03bf\u03c2","\u0391\u03cd\u03b3\u03bf\u03c5\u03c3\u03c4\u03bf\u03c2","\u03a3\u03b5\u03c0\u03c4\u03ad\u03bc\u03b2\u03c1\u03b9\u03bf\u03c2","\u039f\u03ba\u03c4\u03ce\u03b2\u03c1\u03b9\u03bf\u03c2",
+"\u039d\u03bf\u03ad\u03bc\u03b2\u03c1\u03b9\u03bf\u03c2","\u0394\u03b5\u03ba\u03ad\u03bc\u03b2\u03c1\u03b9\u03bf\u03c2"],SHORTMONTHS:["\u0399\u03b1\u03bd","\u03a6\u03b5\u03b2","\u039c\u03b1\u03c1","\u0391\u03c0\u03c1","\u039c\u03b1\u03ca","\u0399\u03bf\u03c5\u03bd","\u0399\u03bf\u03c5\u03bb","\u0391\u03c5\u03b3","\u03a3\u03b5\u03c0","\u039f\u03ba\u03c4","\u039d\u03bf\u03b5","\u0394\u03b5\u03ba"],STANDALONESHORTMONTHS:["\u0399\u03b1\u03bd","\u03a6\u03b5\u03b2","\u039c\u03b1\u03c1","\u0391\u03c0\u03c1",
+"\u039c\u03b1\u03ca","\u0399\u03bf\u03c5\u03bd","\u0399\u03bf\u03c5\u03bb","\u0391\u03c5\u03b3","\u03a3\u03b5\u03c0","\u039f\u03ba\u03c4","\u039d\u03bf\u03b5","\u0394\u03b5\u03ba"],WEEKDAYS:["\u039a\u03c5\u03c1\u03b9\u03b1\u03ba\u03ae","\u0394\u03b5\u03c5\u03c4\u03ad\u03c1\u03b1","\u03a4\u03c1\u03af\u03c4\u03b7","\u03a4\u03b5\u03c4\u03ac\u03c1\u03c4\u03b7","\u03a0\u03ad\u03bc\u03c0\u03c4\u03b7","\u03a0\u03b1\u03c1\u03b1\u03c3\u03ba\u03b5\u03c5\u03ae","\u03a3\u03ac\u03b2\u03b2\u03b1\u03c4\u03bf"],
+STANDALONEWEEKDAYS:["\u039a\u03c5\u03c1\u03b9\u03b1\u03ba\u03ae","\u0394\u03b5\u03c5\u03c4\u03ad\u03c1\u03b1","\u03a4\u03c1\u03af\u03c4\u03b7","\u03a4\u03b5\u03c4\u03ac\u03c1\u03c4\u03b7","\u03a0\u03ad\u03bc\u03c0\u03c4\u03b7","\u03a0\u03b1\u03c1\u03b1\u03c3\u03ba\u03b5\u03c5\u03ae","\u03a3\u03ac\u03b2\u03b2\u03b1\u03c4\u03bf"],SHORTWEEKDAYS:["\u039a\u03c5\u03c1","\u0394\u03b5\u03c5","\u03a4\u03c1\u03b9","\u03a4\u03b5\u03c4","\u03a0\u03b5\u03bc","\u03a0\u03b1\u03c1","\u03a3\u03b1\u03b2"],STANDALONESHORTWEEKDAYS:["\u039a\u03c5\u03c1",
+"\u0394\u03b5\u03c5","\u03a4\u03c1\u03b9","\u03a4\u03b5\u03c4","\u03a0\u03b5\u03bc","\u03a0\u03b1\u03c1","\u03a3\u03b1\u03b2"],NARROWWEEKDAYS:["\u039a","\u0394","\u03a4","\u03a4","\u03a0","\u03a0","\u03a3"],STANDALONENARROWWEEKDAYS:["\u039a","\u0394","\u03a4","\u03a4","\u03a0","\u03a0","\u03a3"],SHORTQUARTERS:["\u03a41","\u03a42","\u03a43","\u03a44"],QUARTERS:["1\u03bf \u03c4\u03c1\u03af\u03bc\u03b7\u03bd\u03bf","2\u03bf \u03c4\u03c1\u03af\u03bc\u03b7\u03bd\u03bf","3\u03bf \u03c4\u03c1\u03af\u03bc\u03b7\u03bd\u03bf",
+"4\u03bf \u03c4\u03c1\u03af\u03bc\u03b7\u03bd\u03bf"],AMPMS:["\u03c0.\u03bc.","\u03bc.\u03bc."],DATEFORMATS:["EEEE, dd MMMM y","dd MMMM y","dd MMM y","dd/MM/yyyy"],TIMEFORMATS:["h:mm:ss a zzzz","h:mm:ss a z","h:mm:ss a","h:mm a"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_en={ERAS:["BC","AD"],ERANAMES:["Before Christ","Anno Domini"],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["January","February","March","April","May","June","July","August","September","October","November","December"],STANDALONEMONTHS:["January","February","March","April","May","June","July","August","September","October","November","December"],SHORTMONTHS:["Jan","Feb","Mar",
+"Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],STANDALONESHORTMONTHS:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],WEEKDAYS:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],STANDALONEWEEKDAYS:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],SHORTWEEKDAYS:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],STANDALONESHORTWEEKDAYS:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],NARROWWEEKDAYS:["S","M","T","W","T","F","S"],STANDALONENARROWWEEKDAYS:["S",
+"M","T","W","T","F","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["1st quarter","2nd quarter","3rd quarter","4th quarter"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, MMMM d, y","MMMM d, y","MMM d, y","M/d/yy"],TIMEFORMATS:["h:mm:ss a zzzz","h:mm:ss a z","h:mm:ss a","h:mm a"],AVAILABLEFORMATS:{Md:"M/d",MMMMd:"MMMM d",MMMd:"MMM d"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_en_AU={ERAS:["BC","AD"],ERANAMES:["Before Christ","Anno Domini"],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["January","February","March","April","May","June","July","August","September","October","November","December"],STANDALONEMONTHS:["January","February","March","April","May","June","July","August","September","October","November","December"],SHORTMONTHS:["Jan","Feb","Mar",
+"Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],STANDALONESHORTMONTHS:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],WEEKDAYS:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],STANDALONEWEEKDAYS:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],SHORTWEEKDAYS:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],STANDALONESHORTWEEKDAYS:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],NARROWWEEKDAYS:["S","M","T","W","T","F","S"],STANDALONENARROWWEEKDAYS:["S",
+"M","T","W","T","F","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["1st quarter","2nd quarter","3rd quarter","4th quarter"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, d MMMM y","d MMMM y","dd/MM/yyyy","d/MM/yy"],TIMEFORMATS:["h:mm:ss a zzzz","h:mm:ss a z","h:mm:ss a","h:mm a"],AVAILABLEFORMATS:{Md:"M/d",MMMMd:"d MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_en_GB={ERAS:["BC","AD"],ERANAMES:["Before Christ","Anno Domini"],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["January","February","March","April","May","June","July","August","September","October","November","December"],STANDALONEMONTHS:["January","February","March","April","May","June","July","August","September","October","November","December"],SHORTMONTHS:["Jan","Feb","Mar",
+"Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],STANDALONESHORTMONTHS:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],WEEKDAYS:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],STANDALONEWEEKDAYS:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],SHORTWEEKDAYS:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],STANDALONESHORTWEEKDAYS:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],NARROWWEEKDAYS:["S","M","T","W","T","F","S"],STANDALONENARROWWEEKDAYS:["S",
+"M","T","W","T","F","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["1st quarter","2nd quarter","3rd quarter","4th quarter"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, d MMMM y","d MMMM y","d MMM y","dd/MM/yyyy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_en_IE={ERAS:["BC","AD"],ERANAMES:["Before Christ","Anno Domini"],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["January","February","March","April","May","June","July","August","September","October","November","December"],STANDALONEMONTHS:["January","February","March","April","May","June","July","August","September","October","November","December"],SHORTMONTHS:["Jan","Feb","Mar",
+"Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],STANDALONESHORTMONTHS:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],WEEKDAYS:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],STANDALONEWEEKDAYS:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],SHORTWEEKDAYS:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],STANDALONESHORTWEEKDAYS:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],NARROWWEEKDAYS:["S","M","T","W","T","F","S"],STANDALONENARROWWEEKDAYS:["S",
+"M","T","W","T","F","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["1st quarter","2nd quarter","3rd quarter","4th quarter"],AMPMS:["a.m.","p.m."],DATEFORMATS:["EEEE d MMMM y","d MMMM y","d MMM y","dd/MM/yyyy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_en_IN={ERAS:["BC","AD"],ERANAMES:["Before Christ","Anno Domini"],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["January","February","March","April","May","June","July","August","September","October","November","December"],STANDALONEMONTHS:["January","February","March","April","May","June","July","August","September","October","November","December"],SHORTMONTHS:["Jan","Feb","Mar",
+"Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],STANDALONESHORTMONTHS:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],WEEKDAYS:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],STANDALONEWEEKDAYS:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],SHORTWEEKDAYS:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],STANDALONESHORTWEEKDAYS:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],NARROWWEEKDAYS:["S","M","T","W","T","F","S"],STANDALONENARROWWEEKDAYS:["S",
+"M","T","W","T","F","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["1st quarter","2nd quarter","3rd quarter","4th quarter"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE d MMMM y","d MMMM y","dd-MMM-y","dd/MM/yy"],TIMEFORMATS:["h:mm:ss a zzzz","h:mm:ss a z","h:mm:ss a","h:mm a"],AVAILABLEFORMATS:{Md:"M/d",MMMMd:"d MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[6,6],FIRSTWEEKCUTOFFDAY:2};goog.i18n.DateTimeSymbols_en_SG=goog.i18n.DateTimeSymbols_en;goog.i18n.DateTimeSymbols_en_US=goog.i18n.DateTimeSymbols_en;
+goog.i18n.DateTimeSymbols_en_ZA={ERAS:["BC","AD"],ERANAMES:["Before Christ","Anno Domini"],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["January","February","March","April","May","June","July","August","September","October","November","December"],STANDALONEMONTHS:["January","February","March","April","May","June","July","August","September","October","November","December"],SHORTMONTHS:["Jan","Feb","Mar",
+"Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],STANDALONESHORTMONTHS:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],WEEKDAYS:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],STANDALONEWEEKDAYS:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],SHORTWEEKDAYS:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],STANDALONESHORTWEEKDAYS:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],NARROWWEEKDAYS:["S","M","T","W","T","F","S"],STANDALONENARROWWEEKDAYS:["S",
+"M","T","W","T","F","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["1st quarter","2nd quarter","3rd quarter","4th quarter"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE dd MMMM y","dd MMMM y","dd MMM y","yyyy/MM/dd"],TIMEFORMATS:["h:mm:ss a zzzz","h:mm:ss a z","h:mm:ss a","h:mm a"],AVAILABLEFORMATS:{Md:"M/d",MMMMd:"MMMM d",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_es={ERAS:["a.C.","d.C."],ERANAMES:["antes de Cristo","anno D\u00f3mini"],NARROWMONTHS:["E","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["E","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["enero","febrero","marzo","abril","mayo","junio","julio","agosto","septiembre","octubre","noviembre","diciembre"],STANDALONEMONTHS:["enero","febrero","marzo","abril","mayo","junio","julio","agosto","septiembre","octubre","noviembre","diciembre"],SHORTMONTHS:["ene",
+"feb","mar","abr","may","jun","jul","ago","sep","oct","nov","dic"],STANDALONESHORTMONTHS:["ene","feb","mar","abr","may","jun","jul","ago","sep","oct","nov","dic"],WEEKDAYS:["domingo","lunes","martes","mi\u00e9rcoles","jueves","viernes","s\u00e1bado"],STANDALONEWEEKDAYS:["domingo","lunes","martes","mi\u00e9rcoles","jueves","viernes","s\u00e1bado"],SHORTWEEKDAYS:["dom","lun","mar","mi\u00e9","jue","vie","s\u00e1b"],STANDALONESHORTWEEKDAYS:["dom","lun","mar","mi\u00e9","jue","vie","s\u00e1b"],NARROWWEEKDAYS:["D",
+"L","M","M","J","V","S"],STANDALONENARROWWEEKDAYS:["D","L","M","M","J","V","S"],SHORTQUARTERS:["T1","T2","T3","T4"],QUARTERS:["1er trimestre","2\u00ba trimestre","3er trimestre","4\u00ba trimestre"],AMPMS:["a.m.","p.m."],DATEFORMATS:["EEEE d 'de' MMMM 'de' y","d 'de' MMMM 'de' y","dd/MM/yyyy","dd/MM/yy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d 'de' MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_et={ERAS:["e.m.a.","m.a.j."],ERANAMES:["enne meie aega","meie aja j\u00e4rgi"],NARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],STANDALONENARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],MONTHS:["jaanuar","veebruar","m\u00e4rts","aprill","mai","juuni","juuli","august","september","oktoober","november","detsember"],STANDALONEMONTHS:["jaanuar","veebruar","m\u00e4rts","aprill","mai","juuni","juuli","august","september","oktoober","november",
+"detsember"],SHORTMONTHS:["jaan","veebr","m\u00e4rts","apr","mai","juuni","juuli","aug","sept","okt","nov","dets"],STANDALONESHORTMONTHS:["jaan","veebr","m\u00e4rts","apr","mai","juuni","juuli","aug","sept","okt","nov","dets"],WEEKDAYS:["p\u00fchap\u00e4ev","esmasp\u00e4ev","teisip\u00e4ev","kolmap\u00e4ev","neljap\u00e4ev","reede","laup\u00e4ev"],STANDALONEWEEKDAYS:["p\u00fchap\u00e4ev","esmasp\u00e4ev","teisip\u00e4ev","kolmap\u00e4ev","neljap\u00e4ev","reede","laup\u00e4ev"],SHORTWEEKDAYS:["P",
+"E","T","K","N","R","L"],STANDALONESHORTWEEKDAYS:["P","E","T","K","N","R","L"],NARROWWEEKDAYS:["1","2","3","4","5","6","7"],STANDALONENARROWWEEKDAYS:["1","2","3","4","5","6","7"],SHORTQUARTERS:["K1","K2","K3","K4"],QUARTERS:["1. kvartal","2. kvartal","3. kvartal","4. kvartal"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, d, MMMM y","d MMMM y","dd.MM.yyyy","dd.MM.yy"],TIMEFORMATS:["H:mm:ss zzzz","H:mm:ss z","H:mm:ss","H:mm"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"d MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,
+6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_eu={ERAS:["BCE","CE"],ERANAMES:["BCE","CE"],NARROWMONTHS:["U","O","M","A","M","E","U","A","I","U","A","A"],STANDALONENARROWMONTHS:["U","O","M","A","M","E","U","A","I","U","A","A"],MONTHS:["urtarrila","otsaila","martxoa","apirila","maiatza","ekaina","uztaila","abuztua","iraila","urria","azaroa","abendua"],STANDALONEMONTHS:["urtarrila","otsaila","martxoa","apirila","maiatza","ekaina","uztaila","abuztua","iraila","urria","azaroa","abendua"],SHORTMONTHS:["urt","ots","mar","api",
+"mai","eka","uzt","abu","ira","urr","aza","abe"],STANDALONESHORTMONTHS:["urt","ots","mar","api","mai","eka","uzt","abu","ira","urr","aza","abe"],WEEKDAYS:["igandea","astelehena","asteartea","asteazkena","osteguna","ostirala","larunbata"],STANDALONEWEEKDAYS:["igandea","astelehena","asteartea","asteazkena","osteguna","ostirala","larunbata"],SHORTWEEKDAYS:["ig","al","as","az","og","or","lr"],STANDALONESHORTWEEKDAYS:["ig","al","as","az","og","or","lr"],NARROWWEEKDAYS:["1","2","3","4","5","6","7"],STANDALONENARROWWEEKDAYS:["1",
+"2","3","4","5","6","7"],SHORTQUARTERS:["1Hh","2Hh","3Hh","4Hh"],QUARTERS:["1. hiruhilekoa","2. hiruhilekoa","3. hiruhilekoa","4. hiruhilekoa"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, y'eko' MMMM'ren' dd'a'","y'eko' MMM'ren' dd'a'","y MMM d","yyyy-MM-dd"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"MMMM d",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_fa={ERAS:["\u0642.\u0645.","\u0645."],ERANAMES:["\u0642\u0628\u0644 \u0627\u0632 \u0645\u06cc\u0644\u0627\u062f","\u0645\u06cc\u0644\u0627\u062f\u06cc"],NARROWMONTHS:["\u0698","\u0641","\u0645","\u0622","\u0645","\u0698","\u0698","\u0627","\u0633","\u0627","\u0646","\u062f"],STANDALONENARROWMONTHS:["\u0698","\u0641","\u0645","\u0622","\u0645","\u0698","\u0698","\u0627","\u0633","\u0627","\u0646","\u062f"],MONTHS:["\u0698\u0627\u0646\u0648\u06cc\u0647\u0654","\u0641\u0648\u0631\u06cc\u0647\u0654",
+"\u0645\u0627\u0631\u0633","\u0622\u0648\u0631\u06cc\u0644","\u0645\u0647\u0654","\u0698\u0648\u0626\u0646","\u0698\u0648\u0626\u06cc\u0647\u0654","\u0627\u0648\u062a","\u0633\u067e\u062a\u0627\u0645\u0628\u0631","\u0627\u06a9\u062a\u0628\u0631","\u0646\u0648\u0627\u0645\u0628\u0631","\u062f\u0633\u0627\u0645\u0628\u0631"],STANDALONEMONTHS:["\u0698\u0627\u0646\u0648\u06cc\u0647","\u0641\u0648\u0631\u06cc\u0647","\u0645\u0627\u0631\u0633","\u0622\u0648\u0631\u06cc\u0644","\u0645\u0647","\u0698\u0648\u0626\u0646",
+"\u0698\u0648\u0626\u06cc\u0647","\u0627\u0648\u062a","\u0633\u067e\u062a\u0627\u0645\u0628\u0631","\u0627\u06a9\u062a\u0628\u0631","\u0646\u0648\u0627\u0645\u0628\u0631","\u062f\u0633\u0627\u0645\u0628\u0631"],SHORTMONTHS:["\u0698\u0627\u0646\u0648\u06cc\u0647\u0654","\u0641\u0648\u0631\u06cc\u0647\u0654","\u0645\u0627\u0631\u0633","\u0622\u0648\u0631\u06cc\u0644","\u0645\u0647\u0654","\u0698\u0648\u0626\u0646","\u0698\u0648\u0626\u06cc\u0647\u0654","\u0627\u0648\u062a","\u0633\u067e\u062a\u0627\u0645\u0628\u0631",
+"\u0627\u06a9\u062a\u0628\u0631","\u0646\u0648\u0627\u0645\u0628\u0631","\u062f\u0633\u0627\u0645\u0628\u0631"],STANDALONESHORTMONTHS:["\u0698\u0627\u0646\u0648\u06cc\u0647","\u0641\u0648\u0631\u06cc\u0647","\u0645\u0627\u0631\u0633","\u0622\u0648\u0631\u06cc\u0644","\u0645\u0647","\u0698\u0648\u0626\u0646","\u0698\u0648\u0626\u06cc\u0647","\u0627\u0648\u062a","\u0633\u067e\u062a\u0627\u0645\u0628\u0631","\u0627\u06a9\u062a\u0628\u0631","\u0646\u0648\u0627\u0645\u0628\u0631","\u062f\u0633\u0627\u0645\u0628\u0631"],
+WEEKDAYS:["\u06cc\u06a9\u0634\u0646\u0628\u0647","\u062f\u0648\u0634\u0646\u0628\u0647","\u0633\u0647\u0634\u0646\u0628\u0647","\u0686\u0647\u0627\u0631\u0634\u0646\u0628\u0647","\u067e\u0646\u062c\u0634\u0646\u0628\u0647","\u062c\u0645\u0639\u0647","\u0634\u0646\u0628\u0647"],STANDALONEWEEKDAYS:["\u06cc\u06a9\u0634\u0646\u0628\u0647","\u062f\u0648\u0634\u0646\u0628\u0647","\u0633\u0647\u0634\u0646\u0628\u0647","\u0686\u0647\u0627\u0631\u0634\u0646\u0628\u0647","\u067e\u0646\u062c\u0634\u0646\u0628\u0647",
+"\u062c\u0645\u0639\u0647","\u0634\u0646\u0628\u0647"],SHORTWEEKDAYS:["\u06cc\u06a9\u0634\u0646\u0628\u0647","\u062f\u0648\u0634\u0646\u0628\u0647","\u0633\u0647\u0634\u0646\u0628\u0647","\u0686\u0647\u0627\u0631\u0634\u0646\u0628\u0647","\u067e\u0646\u062c\u0634\u0646\u0628\u0647","\u062c\u0645\u0639\u0647","\u0634\u0646\u0628\u0647"],STANDALONESHORTWEEKDAYS:["\u06cc\u06a9\u0634\u0646\u0628\u0647","\u062f\u0648\u0634\u0646\u0628\u0647","\u0633\u0647\u0634\u0646\u0628\u0647","\u0686\u0647\u0627\u0631\u0634\u0646\u0628\u0647",
+"\u067e\u0646\u062c\u0634\u0646\u0628\u0647","\u062c\u0645\u0639\u0647","\u0634\u0646\u0628\u0647"],NARROWWEEKDAYS:["\u06cc","\u062f","\u0633","\u0686","\u067e","\u062c","\u0634"],STANDALONENARROWWEEKDAYS:["\u06cc","\u062f","\u0633","\u0686","\u067e","\u062c","\u0634"],SHORTQUARTERS:["\u0633\u0645\u06f1","\u0633\u0645\u06f2","\u0633\u0645\u06f3","\u0633\u0645\u06f4"],QUARTERS:["\u0633\u0647\u0645\u0627\u0647\u0647\u0654 \u0627\u0648\u0644","\u0633\u0647\u0645\u0627\u0647\u0647\u0654 \u062f\u0648\u0645",
+"\u0633\u0647\u0645\u0627\u0647\u0647\u0654 \u0633\u0648\u0645","\u0633\u0647\u0645\u0627\u0647\u0647\u0654 \u0686\u0647\u0627\u0631\u0645"],AMPMS:["\u0642\u0628\u0644 \u0627\u0632 \u0638\u0647\u0631","\u0628\u0639\u062f \u0627\u0632 \u0638\u0647\u0631"],DATEFORMATS:["EEEE d MMMM y","d MMMM y","yyyy/M/d","yy/M/d"],TIMEFORMATS:["H:mm:ss (zzzz)","H:mm:ss (z)","H:mm:ss","H:mm"],AVAILABLEFORMATS:{Md:"M/d",MMMMd:"d LLLL",MMMd:"d LLL"},FIRSTDAYOFWEEK:5,WEEKENDRANGE:[3,4],FIRSTWEEKCUTOFFDAY:1};
+goog.i18n.DateTimeSymbols_fi={ERAS:["eKr.","jKr."],ERANAMES:["ennen Kristuksen syntym\u00e4\u00e4","j\u00e4lkeen Kristuksen syntym\u00e4n"],NARROWMONTHS:["T","H","M","H","T","K","H","E","S","L","M","J"],STANDALONENARROWMONTHS:["T","H","M","H","T","K","H","E","S","L","M","J"],MONTHS:["tammikuuta","helmikuuta","maaliskuuta","huhtikuuta","toukokuuta","kes\u00e4kuuta","hein\u00e4kuuta","elokuuta","syyskuuta","lokakuuta","marraskuuta","joulukuuta"],STANDALONEMONTHS:["tammikuu","helmikuu","maaliskuu","huhtikuu",
+"toukokuu","kes\u00e4kuu","hein\u00e4kuu","elokuu","syyskuu","lokakuu","marraskuu","joulukuu"],SHORTMONTHS:["tammikuuta","helmikuuta","maaliskuuta","huhtikuuta","toukokuuta","kes\u00e4kuuta","hein\u00e4kuuta","elokuuta","syyskuuta","lokakuuta","marraskuuta","joulukuuta"],STANDALONESHORTMONTHS:["tammi","helmi","maalis","huhti","touko","kes\u00e4","hein\u00e4","elo","syys","loka","marras","joulu"],WEEKDAYS:["sunnuntaina","maanantaina","tiistaina","keskiviikkona","torstaina","perjantaina","lauantaina"],
+STANDALONEWEEKDAYS:["sunnuntai","maanantai","tiistai","keskiviikko","torstai","perjantai","lauantai"],SHORTWEEKDAYS:["su","ma","ti","ke","to","pe","la"],STANDALONESHORTWEEKDAYS:["su","ma","ti","ke","to","pe","la"],NARROWWEEKDAYS:["S","M","T","K","T","P","L"],STANDALONENARROWWEEKDAYS:["S","M","T","K","T","P","L"],SHORTQUARTERS:["1. nelj.","2. nelj.","3. nelj.","4. nelj."],QUARTERS:["1. nelj\u00e4nnes","2. nelj\u00e4nnes","3. nelj\u00e4nnes","4. nelj\u00e4nnes"],AMPMS:["ap.","ip."],DATEFORMATS:["EEEE d. MMMM y",
+"d. MMMM y","d.M.yyyy","d.M.yyyy"],TIMEFORMATS:["H.mm.ss zzzz","H.mm.ss z","H.mm.ss","H.mm"],AVAILABLEFORMATS:{Md:"d.M.",MMMMd:"d. MMMM",MMMd:"d. MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_fil={ERAS:["BCE","CE"],ERANAMES:["BCE","CE"],NARROWMONTHS:["E","P","M","A","M","H","H","A","S","O","N","D"],STANDALONENARROWMONTHS:["E","P","M","A","M","H","H","A","S","O","N","D"],MONTHS:["Enero","Pebrero","Marso","Abril","Mayo","Hunyo","Hulyo","Agosto","Setyembre","Oktubre","Nobyembre","Disyembre"],STANDALONEMONTHS:["Enero","Pebrero","Marso","Abril","Mayo","Hunyo","Hulyo","Agosto","Setyembre","Oktubre","Nobyembre","Disyembre"],SHORTMONTHS:["Ene","Peb","Mar","Abr","May",
+"Hun","Hul","Ago","Set","Okt","Nob","Dis"],STANDALONESHORTMONTHS:["Ene","Peb","Mar","Abr","May","Hun","Hul","Ago","Set","Okt","Nob","Dis"],WEEKDAYS:["Linggo","Lunes","Martes","Miyerkules","Huwebes","Biyernes","Sabado"],STANDALONEWEEKDAYS:["Linggo","Lunes","Martes","Miyerkules","Huwebes","Biyernes","Sabado"],SHORTWEEKDAYS:["Lin","Lun","Mar","Mye","Huw","Bye","Sab"],STANDALONESHORTWEEKDAYS:["Lin","Lun","Mar","Miy","Huw","Biy","Sab"],NARROWWEEKDAYS:["L","L","M","M","H","B","S"],STANDALONENARROWWEEKDAYS:["L",
+"L","M","M","H","B","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["Q1","Q2","Q3","Q4"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, MMMM dd y","MMMM d, y","MMM d, y","M/d/yy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"MMMM d",MMMd:"MMM d"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_fr={ERAS:["av. J.-C.","ap. J.-C."],ERANAMES:["avant J\u00e9sus-Christ","apr\u00e8s J\u00e9sus-Christ"],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["janvier","f\u00e9vrier","mars","avril","mai","juin","juillet","ao\u00fbt","septembre","octobre","novembre","d\u00e9cembre"],STANDALONEMONTHS:["janvier","f\u00e9vrier","mars","avril","mai","juin","juillet","ao\u00fbt","septembre",
+"octobre","novembre","d\u00e9cembre"],SHORTMONTHS:["janv.","f\u00e9vr.","mars","avr.","mai","juin","juil.","ao\u00fbt","sept.","oct.","nov.","d\u00e9c."],STANDALONESHORTMONTHS:["janv.","f\u00e9vr.","mars","avr.","mai","juin","juil.","ao\u00fbt","sept.","oct.","nov.","d\u00e9c."],WEEKDAYS:["dimanche","lundi","mardi","mercredi","jeudi","vendredi","samedi"],STANDALONEWEEKDAYS:["dimanche","lundi","mardi","mercredi","jeudi","vendredi","samedi"],SHORTWEEKDAYS:["dim.","lun.","mar.","mer.","jeu.","ven.",
+"sam."],STANDALONESHORTWEEKDAYS:["dim.","lun.","mar.","mer.","jeu.","ven.","sam."],NARROWWEEKDAYS:["D","L","M","M","J","V","S"],STANDALONENARROWWEEKDAYS:["D","L","M","M","J","V","S"],SHORTQUARTERS:["T1","T2","T3","T4"],QUARTERS:["1er trimestre","2e trimestre","3e trimestre","4e trimestre"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE d MMMM y","d MMMM y","d MMM y","dd/MM/yy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:0,
+WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_fr_CA={ERAS:["av. J.-C.","ap. J.-C."],ERANAMES:["avant J\u00e9sus-Christ","apr\u00e8s J\u00e9sus-Christ"],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["janvier","f\u00e9vrier","mars","avril","mai","juin","juillet","ao\u00fbt","septembre","octobre","novembre","d\u00e9cembre"],STANDALONEMONTHS:["janvier","f\u00e9vrier","mars","avril","mai","juin","juillet","ao\u00fbt","septembre",
+"octobre","novembre","d\u00e9cembre"],SHORTMONTHS:["janv.","f\u00e9vr.","mars","avr.","mai","juin","juil.","ao\u00fbt","sept.","oct.","nov.","d\u00e9c."],STANDALONESHORTMONTHS:["janv.","f\u00e9vr.","mars","avr.","mai","juin","juil.","ao\u00fbt","sept.","oct.","nov.","d\u00e9c."],WEEKDAYS:["dimanche","lundi","mardi","mercredi","jeudi","vendredi","samedi"],STANDALONEWEEKDAYS:["dimanche","lundi","mardi","mercredi","jeudi","vendredi","samedi"],SHORTWEEKDAYS:["dim.","lun.","mar.","mer.","jeu.","ven.",
+"sam."],STANDALONESHORTWEEKDAYS:["dim.","lun.","mar.","mer.","jeu.","ven.","sam."],NARROWWEEKDAYS:["D","L","M","M","J","V","S"],STANDALONENARROWWEEKDAYS:["D","L","M","M","J","V","S"],SHORTQUARTERS:["T1","T2","T3","T4"],QUARTERS:["1er trimestre","2e trimestre","3e trimestre","4e trimestre"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE d MMMM y","d MMMM y","yyyy-MM-dd","yy-MM-dd"],TIMEFORMATS:["HH 'h' mm 'min' ss 's' zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"d MMMM",MMMd:"d MMM"},
+FIRSTDAYOFWEEK:6,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_gl={ERAS:["a.C.","d.C."],ERANAMES:["antes de Cristo","despois de Cristo"],NARROWMONTHS:["X","F","M","A","M","X","X","A","S","O","N","D"],STANDALONENARROWMONTHS:["X","F","M","A","M","X","X","A","S","O","N","D"],MONTHS:["Xaneiro","Febreiro","Marzo","Abril","Maio","Xu\u00f1o","Xullo","Agosto","Setembro","Outubro","Novembro","Decembro"],STANDALONEMONTHS:["Xaneiro","Febreiro","Marzo","Abril","Maio","Xu\u00f1o","Xullo","Agosto","Setembro","Outubro","Novembro","Decembro"],SHORTMONTHS:["Xan",
+"Feb","Mar","Abr","Mai","Xu\u00f1","Xul","Ago","Set","Out","Nov","Dec"],STANDALONESHORTMONTHS:["Xan","Feb","Mar","Abr","Mai","Xu\u00f1","Xul","Ago","Set","Out","Nov","Dec"],WEEKDAYS:["Domingo","Luns","Martes","M\u00e9rcores","Xoves","Venres","S\u00e1bado"],STANDALONEWEEKDAYS:["Domingo","Luns","Martes","M\u00e9rcores","Xoves","Venres","S\u00e1bado"],SHORTWEEKDAYS:["Dom","Lun","Mar","M\u00e9r","Xov","Ven","S\u00e1b"],STANDALONESHORTWEEKDAYS:["Dom","Lun","Mar","M\u00e9r","Xov","Ven","S\u00e1b"],NARROWWEEKDAYS:["D",
+"L","M","M","X","V","S"],STANDALONENARROWWEEKDAYS:["D","L","M","M","X","V","S"],SHORTQUARTERS:["T1","T2","T3","T4"],QUARTERS:["1o trimestre","2o trimestre","3o trimestre","4o trimestre"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE dd MMMM y","dd MMMM y","d MMM, y","dd/MM/yy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d-M",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_gsw={ERAS:["v. Chr.","n. Chr."],ERANAMES:["v. Chr.","n. Chr."],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["Januar","Februar","M\u00e4rz","April","Mai","Juni","Juli","Auguscht","Sept\u00e4mber","Oktoober","Nov\u00e4mber","Dez\u00e4mber"],STANDALONEMONTHS:["Januar","Februar","M\u00e4rz","April","Mai","Juni","Juli","Auguscht","Sept\u00e4mber","Oktoober","Nov\u00e4mber","Dez\u00e4mber"],
+SHORTMONTHS:["Jan","Feb","M\u00e4r","Apr","Mai","Jun","Jul","Aug","Sep","Okt","Nov","Dez"],STANDALONESHORTMONTHS:["Jan","Feb","M\u00e4r","Apr","Mai","Jun","Jul","Aug","Sep","Okt","Nov","Dez"],WEEKDAYS:["Sunntig","M\u00e4\u00e4ntig","Ziischtig","Mittwuch","Dunschtig","Friitig","Samschtig"],STANDALONEWEEKDAYS:["Sunntig","M\u00e4\u00e4ntig","Ziischtig","Mittwuch","Dunschtig","Friitig","Samschtig"],SHORTWEEKDAYS:["Su.","M\u00e4.","Zi.","Mi.","Du.","Fr.","Sa."],STANDALONESHORTWEEKDAYS:["Su.","M\u00e4.",
+"Zi.","Mi.","Du.","Fr.","Sa."],NARROWWEEKDAYS:["S","M","D","M","D","F","S"],STANDALONENARROWWEEKDAYS:["S","M","D","M","D","F","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["1. Quartal","2. Quartal","3. Quartal","4. Quartal"],AMPMS:["vorm.","nam."],DATEFORMATS:["EEEE, d. MMMM y","d. MMMM y","dd.MM.yyyy","dd.MM.yy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d.M.",MMMMd:"d. MMMM",MMMd:"d. MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_gu={ERAS:["BCE","CE"],ERANAMES:["\u0a88\u0ab8\u0ab5\u0ac0\u0ab8\u0aa8 \u0aaa\u0ac2\u0ab0\u0acd\u0ab5\u0ac7","\u0a87\u0ab8\u0ab5\u0ac0\u0ab8\u0aa8"],NARROWMONTHS:["\u0a9c\u0abe","\u0aab\u0ac7","\u0aae\u0abe","\u0a8f","\u0aae\u0ac7","\u0a9c\u0ac2","\u0a9c\u0ac1","\u0a91","\u0ab8","\u0a91","\u0aa8","\u0aa1\u0abf"],STANDALONENARROWMONTHS:["\u0a9c\u0abe","\u0aab\u0ac7","\u0aae\u0abe","\u0a8f","\u0aae\u0ac7","\u0a9c\u0ac2","\u0a9c\u0ac1","\u0a91","\u0ab8","\u0a91","\u0aa8","\u0aa1\u0abf"],
+MONTHS:["\u0a9c\u0abe\u0aa8\u0acd\u0aaf\u0ac1\u0a86\u0ab0\u0ac0","\u0aab\u0ac7\u0aac\u0acd\u0ab0\u0ac1\u0a86\u0ab0\u0ac0","\u0aae\u0abe\u0ab0\u0acd\u0a9a","\u0a8f\u0aaa\u0acd\u0ab0\u0abf\u0ab2","\u0aae\u0ac7","\u0a9c\u0ac2\u0aa8","\u0a9c\u0ac1\u0ab2\u0abe\u0a88","\u0a91\u0a97\u0ab8\u0acd\u0a9f","\u0ab8\u0aaa\u0acd\u0a9f\u0ac7\u0aae\u0acd\u0aac\u0ab0","\u0a91\u0a95\u0acd\u0a9f\u0acd\u0aac\u0ab0","\u0aa8\u0ab5\u0ac7\u0aae\u0acd\u0aac\u0ab0","\u0aa1\u0abf\u0ab8\u0ac7\u0aae\u0acd\u0aac\u0ab0"],STANDALONEMONTHS:["\u0a9c\u0abe\u0aa8\u0acd\u0aaf\u0ac1\u0a86\u0ab0\u0ac0",
+"\u0aab\u0ac7\u0aac\u0acd\u0ab0\u0ac1\u0a86\u0ab0\u0ac0","\u0aae\u0abe\u0ab0\u0acd\u0a9a","\u0a8f\u0aaa\u0acd\u0ab0\u0abf\u0ab2","\u0aae\u0ac7","\u0a9c\u0ac2\u0aa8","\u0a9c\u0ac1\u0ab2\u0abe\u0a88","\u0a91\u0a97\u0ab8\u0acd\u0a9f","\u0ab8\u0aaa\u0acd\u0a9f\u0ac7\u0aae\u0acd\u0aac\u0ab0","\u0a91\u0a95\u0acd\u0a9f\u0acd\u0aac\u0ab0","\u0aa8\u0ab5\u0ac7\u0aae\u0acd\u0aac\u0ab0","\u0aa1\u0abf\u0ab8\u0ac7\u0aae\u0acd\u0aac\u0ab0"],SHORTMONTHS:["\u0a9c\u0abe\u0aa8\u0acd\u0aaf\u0ac1","\u0aab\u0ac7\u0aac\u0acd\u0ab0\u0ac1",
+"\u0aae\u0abe\u0ab0\u0acd\u0a9a","\u0a8f\u0aaa\u0acd\u0ab0\u0abf\u0ab2","\u0aae\u0ac7","\u0a9c\u0ac2\u0aa8","\u0a9c\u0ac1\u0ab2\u0abe\u0a88","\u0a91\u0a97\u0ab8\u0acd\u0a9f","\u0ab8\u0aaa\u0acd\u0a9f\u0ac7","\u0a91\u0a95\u0acd\u0a9f\u0acb","\u0aa8\u0ab5\u0ac7","\u0aa1\u0abf\u0ab8\u0ac7"],STANDALONESHORTMONTHS:["\u0a9c\u0abe\u0aa8\u0acd\u0aaf\u0ac1","\u0aab\u0ac7\u0aac\u0acd\u0ab0\u0ac1","\u0aae\u0abe\u0ab0\u0acd\u0a9a","\u0a8f\u0aaa\u0acd\u0ab0\u0abf\u0ab2","\u0aae\u0ac7","\u0a9c\u0ac2\u0aa8","\u0a9c\u0ac1\u0ab2\u0abe\u0a88",
+"\u0a91\u0a97\u0ab8\u0acd\u0a9f","\u0ab8\u0aaa\u0acd\u0a9f\u0ac7","\u0a91\u0a95\u0acd\u0a9f\u0acb","\u0aa8\u0ab5\u0ac7","\u0aa1\u0abf\u0ab8\u0ac7"],WEEKDAYS:["\u0ab0\u0ab5\u0abf\u0ab5\u0abe\u0ab0","\u0ab8\u0acb\u0aae\u0ab5\u0abe\u0ab0","\u0aae\u0a82\u0a97\u0ab3\u0ab5\u0abe\u0ab0","\u0aac\u0ac1\u0aa7\u0ab5\u0abe\u0ab0","\u0a97\u0ac1\u0ab0\u0ac1\u0ab5\u0abe\u0ab0","\u0ab6\u0ac1\u0a95\u0acd\u0ab0\u0ab5\u0abe\u0ab0","\u0ab6\u0aa8\u0abf\u0ab5\u0abe\u0ab0"],STANDALONEWEEKDAYS:["\u0ab0\u0ab5\u0abf\u0ab5\u0abe\u0ab0",
+"\u0ab8\u0acb\u0aae\u0ab5\u0abe\u0ab0","\u0aae\u0a82\u0a97\u0ab3\u0ab5\u0abe\u0ab0","\u0aac\u0ac1\u0aa7\u0ab5\u0abe\u0ab0","\u0a97\u0ac1\u0ab0\u0ac1\u0ab5\u0abe\u0ab0","\u0ab6\u0ac1\u0a95\u0acd\u0ab0\u0ab5\u0abe\u0ab0","\u0ab6\u0aa8\u0abf\u0ab5\u0abe\u0ab0"],SHORTWEEKDAYS:["\u0ab0\u0ab5\u0abf","\u0ab8\u0acb\u0aae","\u0aae\u0a82\u0a97\u0ab3","\u0aac\u0ac1\u0aa7","\u0a97\u0ac1\u0ab0\u0ac1","\u0ab6\u0ac1\u0a95\u0acd\u0ab0","\u0ab6\u0aa8\u0abf"],STANDALONESHORTWEEKDAYS:["\u0ab0\u0ab5\u0abf","\u0ab8\u0acb\u0aae",
+"\u0aae\u0a82\u0a97\u0ab3","\u0aac\u0ac1\u0aa7","\u0a97\u0ac1\u0ab0\u0ac1","\u0ab6\u0ac1\u0a95\u0acd\u0ab0","\u0ab6\u0aa8\u0abf"],NARROWWEEKDAYS:["\u0ab0","\u0ab8\u0acb","\u0aae\u0a82","\u0aac\u0ac1","\u0a97\u0ac1","\u0ab6\u0ac1","\u0ab6"],STANDALONENARROWWEEKDAYS:["\u0ab0","\u0ab8\u0acb","\u0aae\u0a82","\u0aac\u0ac1","\u0a97\u0ac1","\u0ab6\u0ac1","\u0ab6"],SHORTQUARTERS:["\u0aa4\u0acd\u0ab0\u0abf\u0aae\u0abe\u0ab8\u0abf\u0a95 \u0ae7","\u0aa4\u0acd\u0ab0\u0abf\u0aae\u0abe\u0ab8\u0abf\u0a95 \u0ae8",
+"\u0aa4\u0acd\u0ab0\u0abf\u0aae\u0abe\u0ab8\u0abf\u0a95 \u0ae9","\u0aa4\u0acd\u0ab0\u0abf\u0aae\u0abe\u0ab8\u0abf\u0a95 \u0aea"],QUARTERS:["\u0aaa\u0ab9\u0ab2\u0ac0 \u0aa4\u0acd\u0ab0\u0abf\u0aae\u0abe\u0ab8\u0abf\u0a95","\u0aac\u0ac0\u0a9c\u0ac0 \u0aa4\u0acd\u0ab0\u0abf\u0aae\u0abe\u0ab8\u0abf\u0a95","\u0aa4\u0acd\u0ab0\u0ac0\u0a9c\u0ac0 \u0aa4\u0acd\u0ab0\u0abf\u0aae\u0abe\u0ab8\u0abf\u0a95","\u0a9a\u0acc\u0aa5\u0ac0 \u0aa4\u0acd\u0ab0\u0abf\u0aae\u0abe\u0ab8\u0abf\u0a95"],AMPMS:["am","pm"],DATEFORMATS:["EEEE, d MMMM, y",
+"d MMMM, y","d MMM, y","d-MM-yy"],TIMEFORMATS:["hh:mm:ss a zzzz","hh:mm:ss a z","hh:mm:ss a","hh:mm a"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"d MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[6,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_he={ERAS:["\u05dc\u05e4\u05e0\u05d4\u05f4\u05e1","\u05dc\u05e1\u05d4\u05f4\u05e0"],ERANAMES:["\u05dc\u05e4\u05e0\u05d9 \u05d4\u05e1\u05e4\u05d9\u05e8\u05d4","\u05dc\u05e1\u05e4\u05d9\u05e8\u05d4"],NARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],STANDALONENARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],MONTHS:["\u05d9\u05e0\u05d5\u05d0\u05e8","\u05e4\u05d1\u05e8\u05d5\u05d0\u05e8","\u05de\u05e8\u05e1","\u05d0\u05e4\u05e8\u05d9\u05dc","\u05de\u05d0\u05d9",
+"\u05d9\u05d5\u05e0\u05d9","\u05d9\u05d5\u05dc\u05d9","\u05d0\u05d5\u05d2\u05d5\u05e1\u05d8","\u05e1\u05e4\u05d8\u05de\u05d1\u05e8","\u05d0\u05d5\u05e7\u05d8\u05d5\u05d1\u05e8","\u05e0\u05d5\u05d1\u05de\u05d1\u05e8","\u05d3\u05e6\u05de\u05d1\u05e8"],STANDALONEMONTHS:["\u05d9\u05e0\u05d5\u05d0\u05e8","\u05e4\u05d1\u05e8\u05d5\u05d0\u05e8","\u05de\u05e8\u05e1","\u05d0\u05e4\u05e8\u05d9\u05dc","\u05de\u05d0\u05d9","\u05d9\u05d5\u05e0\u05d9","\u05d9\u05d5\u05dc\u05d9","\u05d0\u05d5\u05d2\u05d5\u05e1\u05d8",
+"\u05e1\u05e4\u05d8\u05de\u05d1\u05e8","\u05d0\u05d5\u05e7\u05d8\u05d5\u05d1\u05e8","\u05e0\u05d5\u05d1\u05de\u05d1\u05e8","\u05d3\u05e6\u05de\u05d1\u05e8"],SHORTMONTHS:["\u05d9\u05e0\u05d5","\u05e4\u05d1\u05e8","\u05de\u05e8\u05e1","\u05d0\u05e4\u05e8","\u05de\u05d0\u05d9","\u05d9\u05d5\u05e0","\u05d9\u05d5\u05dc","\u05d0\u05d5\u05d2","\u05e1\u05e4\u05d8","\u05d0\u05d5\u05e7","\u05e0\u05d5\u05d1","\u05d3\u05e6\u05de"],STANDALONESHORTMONTHS:["\u05d9\u05e0\u05d5","\u05e4\u05d1\u05e8","\u05de\u05e8\u05e1",
+"\u05d0\u05e4\u05e8","\u05de\u05d0\u05d9","\u05d9\u05d5\u05e0","\u05d9\u05d5\u05dc","\u05d0\u05d5\u05d2","\u05e1\u05e4\u05d8","\u05d0\u05d5\u05e7","\u05e0\u05d5\u05d1","\u05d3\u05e6\u05de"],WEEKDAYS:["\u05d9\u05d5\u05dd \u05e8\u05d0\u05e9\u05d5\u05df","\u05d9\u05d5\u05dd \u05e9\u05e0\u05d9","\u05d9\u05d5\u05dd \u05e9\u05dc\u05d9\u05e9\u05d9","\u05d9\u05d5\u05dd \u05e8\u05d1\u05d9\u05e2\u05d9","\u05d9\u05d5\u05dd \u05d7\u05de\u05d9\u05e9\u05d9","\u05d9\u05d5\u05dd \u05e9\u05d9\u05e9\u05d9","\u05d9\u05d5\u05dd \u05e9\u05d1\u05ea"],
+STANDALONEWEEKDAYS:["\u05d9\u05d5\u05dd \u05e8\u05d0\u05e9\u05d5\u05df","\u05d9\u05d5\u05dd \u05e9\u05e0\u05d9","\u05d9\u05d5\u05dd \u05e9\u05dc\u05d9\u05e9\u05d9","\u05d9\u05d5\u05dd \u05e8\u05d1\u05d9\u05e2\u05d9","\u05d9\u05d5\u05dd \u05d7\u05de\u05d9\u05e9\u05d9","\u05d9\u05d5\u05dd \u05e9\u05d9\u05e9\u05d9","\u05d9\u05d5\u05dd \u05e9\u05d1\u05ea"],SHORTWEEKDAYS:["\u05d9\u05d5\u05dd \u05d0'","\u05d9\u05d5\u05dd \u05d1'","\u05d9\u05d5\u05dd \u05d2'","\u05d9\u05d5\u05dd \u05d3'","\u05d9\u05d5\u05dd \u05d4'",
+"\u05d9\u05d5\u05dd \u05d5'","\u05e9\u05d1\u05ea"],STANDALONESHORTWEEKDAYS:["\u05d9\u05d5\u05dd \u05d0'","\u05d9\u05d5\u05dd \u05d1'","\u05d9\u05d5\u05dd \u05d2'","\u05d9\u05d5\u05dd \u05d3'","\u05d9\u05d5\u05dd \u05d4'","\u05d9\u05d5\u05dd \u05d5'","\u05e9\u05d1\u05ea"],NARROWWEEKDAYS:["\u05d0","\u05d1","\u05d2","\u05d3","\u05d4","\u05d5","\u05e9"],STANDALONENARROWWEEKDAYS:["\u05d0","\u05d1","\u05d2","\u05d3","\u05d4","\u05d5","\u05e9"],SHORTQUARTERS:["\u05e8\u05d1\u05e2\u05d5\u05df 1","\u05e8\u05d1\u05e2\u05d5\u05df 2",
+"\u05e8\u05d1\u05e2\u05d5\u05df 3","\u05e8\u05d1\u05e2\u05d5\u05df 4"],QUARTERS:["\u05e8\u05d1\u05e2\u05d5\u05df 1","\u05e8\u05d1\u05e2\u05d5\u05df 2","\u05e8\u05d1\u05e2\u05d5\u05df 3","\u05e8\u05d1\u05e2\u05d5\u05df 4"],AMPMS:['\u05dc\u05e4\u05e0\u05d4"\u05e6','\u05d0\u05d7\u05d4"\u05e6'],DATEFORMATS:["EEEE, d \u05d1MMMM y","d \u05d1MMMM y","dd/MM/yyyy","dd/MM/yy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d \u05d1MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:6,
+WEEKENDRANGE:[4,5],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_hi={ERAS:["\u0908\u0938\u093e\u092a\u0942\u0930\u094d\u0935","\u0938\u0928"],ERANAMES:["\u0908\u0938\u093e\u092a\u0942\u0930\u094d\u0935","\u0938\u0928"],NARROWMONTHS:["\u091c","\u092b\u093c","\u092e\u093e","\u0905","\u092e","\u091c\u0942","\u091c\u0941","\u0905","\u0938\u093f","\u0905","\u0928","\u0926\u093f"],STANDALONENARROWMONTHS:["\u091c","\u092b\u093c","\u092e\u093e","\u0905","\u092e","\u091c\u0942","\u091c\u0941","\u0905","\u0938\u093f","\u0905","\u0928","\u0926\u093f"],
+MONTHS:["\u091c\u0928\u0935\u0930\u0940","\u092b\u0930\u0935\u0930\u0940","\u092e\u093e\u0930\u094d\u091a","\u0905\u092a\u094d\u0930\u0948\u0932","\u092e\u0908","\u091c\u0942\u0928","\u091c\u0941\u0932\u093e\u0908","\u0905\u0917\u0938\u094d\u0924","\u0938\u093f\u0924\u092e\u094d\u092c\u0930","\u0905\u0915\u094d\u0924\u0942\u092c\u0930","\u0928\u0935\u092e\u094d\u092c\u0930","\u0926\u093f\u0938\u092e\u094d\u092c\u0930"],STANDALONEMONTHS:["\u091c\u0928\u0935\u0930\u0940","\u092b\u0930\u0935\u0930\u0940",
+"\u092e\u093e\u0930\u094d\u091a","\u0905\u092a\u094d\u0930\u0948\u0932","\u092e\u0908","\u091c\u0942\u0928","\u091c\u0941\u0932\u093e\u0908","\u0905\u0917\u0938\u094d\u0924","\u0938\u093f\u0924\u092e\u094d\u092c\u0930","\u0905\u0915\u094d\u0924\u0942\u092c\u0930","\u0928\u0935\u092e\u094d\u092c\u0930","\u0926\u093f\u0938\u092e\u094d\u092c\u0930"],SHORTMONTHS:["\u091c\u0928\u0935\u0930\u0940","\u092b\u0930\u0935\u0930\u0940","\u092e\u093e\u0930\u094d\u091a","\u0905\u092a\u094d\u0930\u0948\u0932","\u092e\u0908",
+"\u091c\u0942\u0928","\u091c\u0941\u0932\u093e\u0908","\u0905\u0917\u0938\u094d\u0924","\u0938\u093f\u0924\u092e\u094d\u092c\u0930","\u0905\u0915\u094d\u0924\u0942\u092c\u0930","\u0928\u0935\u092e\u094d\u092c\u0930","\u0926\u093f\u0938\u092e\u094d\u092c\u0930"],STANDALONESHORTMONTHS:["\u091c\u0928\u0935\u0930\u0940","\u092b\u0930\u0935\u0930\u0940","\u092e\u093e\u0930\u094d\u091a","\u0905\u092a\u094d\u0930\u0948\u0932","\u092e\u0908","\u091c\u0942\u0928","\u091c\u0941\u0932\u093e\u0908","\u0905\u0917\u0938\u094d\u0924",
+"\u0938\u093f\u0924\u092e\u094d\u092c\u0930","\u0905\u0915\u094d\u0924\u0942\u092c\u0930","\u0928\u0935\u092e\u094d\u092c\u0930","\u0926\u093f\u0938\u092e\u094d\u092c\u0930"],WEEKDAYS:["\u0930\u0935\u093f\u0935\u093e\u0930","\u0938\u094b\u092e\u0935\u093e\u0930","\u092e\u0902\u0917\u0932\u0935\u093e\u0930","\u092c\u0941\u0927\u0935\u093e\u0930","\u0917\u0941\u0930\u0941\u0935\u093e\u0930","\u0936\u0941\u0915\u094d\u0930\u0935\u093e\u0930","\u0936\u0928\u093f\u0935\u093e\u0930"],STANDALONEWEEKDAYS:["\u0930\u0935\u093f\u0935\u093e\u0930",
+"\u0938\u094b\u092e\u0935\u093e\u0930","\u092e\u0902\u0917\u0932\u0935\u093e\u0930","\u092c\u0941\u0927\u0935\u093e\u0930","\u0917\u0941\u0930\u0941\u0935\u093e\u0930","\u0936\u0941\u0915\u094d\u0930\u0935\u093e\u0930","\u0936\u0928\u093f\u0935\u093e\u0930"],SHORTWEEKDAYS:["\u0930\u0935\u093f","\u0938\u094b\u092e","\u092e\u0902\u0917\u0932","\u092c\u0941\u0927","\u0917\u0941\u0930\u0941","\u0936\u0941\u0915\u094d\u0930","\u0936\u0928\u093f"],STANDALONESHORTWEEKDAYS:["\u0930\u0935\u093f","\u0938\u094b\u092e",
+"\u092e\u0902\u0917\u0932","\u092c\u0941\u0927","\u0917\u0941\u0930\u0941","\u0936\u0941\u0915\u094d\u0930","\u0936\u0928\u093f"],NARROWWEEKDAYS:["\u0930","\u0938\u094b","\u092e\u0902","\u092c\u0941","\u0917\u0941","\u0936\u0941","\u0936"],STANDALONENARROWWEEKDAYS:["\u0930","\u0938\u094b","\u092e\u0902","\u092c\u0941","\u0917\u0941","\u0936\u0941","\u0936"],SHORTQUARTERS:["\u092a\u094d\u0930\u0925\u092e \u091a\u094c\u0925\u093e\u0908","\u0926\u094d\u0935\u093f\u0924\u0940\u092f \u091a\u094c\u0925\u093e\u0908",
+"\u0924\u0943\u0924\u0940\u092f \u091a\u094c\u0925\u093e\u0908","\u091a\u0924\u0941\u0930\u094d\u0925 \u091a\u094c\u0925\u093e\u0908"],QUARTERS:["\u092a\u094d\u0930\u0925\u092e \u091a\u094c\u0925\u093e\u0908","\u0926\u094d\u0935\u093f\u0924\u0940\u092f \u091a\u094c\u0925\u093e\u0908","\u0924\u0943\u0924\u0940\u092f \u091a\u094c\u0925\u093e\u0908","\u091a\u0924\u0941\u0930\u094d\u0925 \u091a\u094c\u0925\u093e\u0908"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, d MMMM y","d MMMM y","dd-MM-yyyy","d-M-yy"],
+TIMEFORMATS:["h:mm:ss a zzzz","h:mm:ss a z","h:mm:ss a","h:mm a"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[6,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_hr={ERAS:["pr.n.e.","AD"],ERANAMES:["Prije Krista","Poslije Krista"],NARROWMONTHS:["1.","2.","3.","4.","5.","6.","7.","8.","9.","10.","11.","12."],STANDALONENARROWMONTHS:["1.","2.","3.","4.","5.","6.","7.","8.","9.","10.","11.","12."],MONTHS:["sije\u010dnja","velja\u010de","o\u017eujka","travnja","svibnja","lipnja","srpnja","kolovoza","rujna","listopada","studenoga","prosinca"],STANDALONEMONTHS:["sije\u010danj","velja\u010da","o\u017eujak","travanj","svibanj","lipanj","srpanj",
+"kolovoz","rujan","listopad","studeni","prosinac"],SHORTMONTHS:["01.","02.","03.","04.","05.","06.","07.","08.","09.","10.","11.","12."],STANDALONESHORTMONTHS:["01.","02.","03.","04.","05.","06.","07.","08.","09.","10.","11.","12."],WEEKDAYS:["nedjelja","ponedjeljak","utorak","srijeda","\u010detvrtak","petak","subota"],STANDALONEWEEKDAYS:["nedjelja","ponedjeljak","utorak","srijeda","\u010detvrtak","petak","subota"],SHORTWEEKDAYS:["ned","pon","uto","sri","\u010det","pet","sub"],STANDALONESHORTWEEKDAYS:["ned",
+"pon","uto","sri","\u010det","pet","sub"],NARROWWEEKDAYS:["n","p","u","s","\u010d","p","s"],STANDALONENARROWWEEKDAYS:["n","p","u","s","\u010d","p","s"],SHORTQUARTERS:["1kv","2kv","3kv","4kv"],QUARTERS:["1. kvartal","2. kvartal","3. kvartal","4. kvartal"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, d. MMMM y.","d. MMMM y.","d.M.yyyy.","dd.MM.yyyy."],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d.M.",MMMMd:"d. MMMM",MMMd:"d.MMM."},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],
+FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_hu={ERAS:["i. e.","i. sz."],ERANAMES:["id\u0151sz\u00e1m\u00edt\u00e1sunk el\u0151tt","id\u0151sz\u00e1m\u00edt\u00e1sunk szerint"],NARROWMONTHS:["J","F","M","\u00c1","M","J","J","A","Sz","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","\u00c1","M","J","J","A","Sz","O","N","D"],MONTHS:["janu\u00e1r","febru\u00e1r","m\u00e1rcius","\u00e1prilis","m\u00e1jus","j\u00fanius","j\u00falius","augusztus","szeptember","okt\u00f3ber","november","december"],STANDALONEMONTHS:["janu\u00e1r","febru\u00e1r",
+"m\u00e1rcius","\u00e1prilis","m\u00e1jus","j\u00fanius","j\u00falius","augusztus","szeptember","okt\u00f3ber","november","december"],SHORTMONTHS:["jan.","febr.","m\u00e1rc.","\u00e1pr.","m\u00e1j.","j\u00fan.","j\u00fal.","aug.","szept.","okt.","nov.","dec."],STANDALONESHORTMONTHS:["jan.","febr.","m\u00e1rc.","\u00e1pr.","m\u00e1j.","j\u00fan.","j\u00fal.","aug.","szept.","okt.","nov.","dec."],WEEKDAYS:["vas\u00e1rnap","h\u00e9tf\u0151","kedd","szerda","cs\u00fct\u00f6rt\u00f6k","p\u00e9ntek","szombat"],
+STANDALONEWEEKDAYS:["vas\u00e1rnap","h\u00e9tf\u0151","kedd","szerda","cs\u00fct\u00f6rt\u00f6k","p\u00e9ntek","szombat"],SHORTWEEKDAYS:["V","H","K","Sze","Cs","P","Szo"],STANDALONESHORTWEEKDAYS:["V","H","K","Sze","Cs","P","Szo"],NARROWWEEKDAYS:["V","H","K","Sz","Cs","P","Sz"],STANDALONENARROWWEEKDAYS:["V","H","K","Sz","Cs","P","Sz"],SHORTQUARTERS:["N1","N2","N3","N4"],QUARTERS:["I. negyed\u00e9v","II. negyed\u00e9v","III. negyed\u00e9v","IV. negyed\u00e9v"],AMPMS:["de.","du."],DATEFORMATS:["y. MMMM d., EEEE",
+"y. MMMM d.","yyyy.MM.dd.","yyyy.MM.dd."],TIMEFORMATS:["H:mm:ss zzzz","H:mm:ss z","H:mm:ss","H:mm"],AVAILABLEFORMATS:{Md:"M. d.",MMMMd:"MMMM d.",MMMd:"MMM d."},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_id={ERAS:["BCE","CE"],ERANAMES:["BCE","CE"],NARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],STANDALONENARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],MONTHS:["Januari","Februari","Maret","April","Mei","Juni","Juli","Agustus","September","Oktober","November","Desember"],STANDALONEMONTHS:["Januari","Februari","Maret","April","Mei","Juni","Juli","Agustus","September","Oktober","November","Desember"],SHORTMONTHS:["Jan","Feb","Mar","Apr","Mei",
+"Jun","Jul","Agu","Sep","Okt","Nov","Des"],STANDALONESHORTMONTHS:["Jan","Feb","Mar","Apr","Mei","Jun","Jul","Agu","Sep","Okt","Nov","Des"],WEEKDAYS:["Minggu","Senin","Selasa","Rabu","Kamis","Jumat","Sabtu"],STANDALONEWEEKDAYS:["Minggu","Senin","Selasa","Rabu","Kamis","Jumat","Sabtu"],SHORTWEEKDAYS:["Min","Sen","Sel","Rab","Kam","Jum","Sab"],STANDALONESHORTWEEKDAYS:["Min","Sen","Sel","Rab","Kam","Jum","Sab"],NARROWWEEKDAYS:["1","2","3","4","5","6","7"],STANDALONENARROWWEEKDAYS:["1","2","3","4","5",
+"6","7"],SHORTQUARTERS:["K1","K2","K3","K4"],QUARTERS:["kuartal pertama","kuartal kedua","kuartal ketiga","kuartal keempat"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, dd MMMM yyyy","d MMMM yyyy","d MMM yyyy","dd/MM/yy"],TIMEFORMATS:["H:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"MMMM d",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_in={ERAS:["BCE","CE"],ERANAMES:["BCE","CE"],NARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],STANDALONENARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],MONTHS:["Januari","Februari","Maret","April","Mei","Juni","Juli","Agustus","September","Oktober","November","Desember"],STANDALONEMONTHS:["Januari","Februari","Maret","April","Mei","Juni","Juli","Agustus","September","Oktober","November","Desember"],SHORTMONTHS:["Jan","Feb","Mar","Apr","Mei",
+"Jun","Jul","Agu","Sep","Okt","Nov","Des"],STANDALONESHORTMONTHS:["Jan","Feb","Mar","Apr","Mei","Jun","Jul","Agu","Sep","Okt","Nov","Des"],WEEKDAYS:["Minggu","Senin","Selasa","Rabu","Kamis","Jumat","Sabtu"],STANDALONEWEEKDAYS:["Minggu","Senin","Selasa","Rabu","Kamis","Jumat","Sabtu"],SHORTWEEKDAYS:["Min","Sen","Sel","Rab","Kam","Jum","Sab"],STANDALONESHORTWEEKDAYS:["Min","Sen","Sel","Rab","Kam","Jum","Sab"],NARROWWEEKDAYS:["1","2","3","4","5","6","7"],STANDALONENARROWWEEKDAYS:["1","2","3","4","5",
+"6","7"],SHORTQUARTERS:["K1","K2","K3","K4"],QUARTERS:["kuartal pertama","kuartal kedua","kuartal ketiga","kuartal keempat"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, dd MMMM yyyy","d MMMM yyyy","d MMM yyyy","dd/MM/yy"],TIMEFORMATS:["H:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"MMMM d",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_is={ERAS:["fyrir Krist","eftir Krist"],ERANAMES:["fyrir Krist","eftir Krist"],NARROWMONTHS:["j","f","m","a","m","j","j","\u00e1","s","o","n","d"],STANDALONENARROWMONTHS:["j","f","m","a","m","j","j","\u00e1","s","o","n","d"],MONTHS:["jan\u00faar","febr\u00faar","mars","apr\u00edl","ma\u00ed","j\u00fan\u00ed","j\u00fal\u00ed","\u00e1g\u00fast","september","okt\u00f3ber","n\u00f3vember","desember"],STANDALONEMONTHS:["jan\u00faar","febr\u00faar","mars","apr\u00edl","ma\u00ed",
+"j\u00fan\u00ed","j\u00fal\u00ed","\u00e1g\u00fast","september","okt\u00f3ber","n\u00f3vember","desember"],SHORTMONTHS:["jan","feb","mar","apr","ma\u00ed","j\u00fan","j\u00fal","\u00e1g\u00fa","sep","okt","n\u00f3v","des"],STANDALONESHORTMONTHS:["jan","feb","mar","apr","ma\u00ed","j\u00fan","j\u00fal","\u00e1g\u00fa","sep","okt","n\u00f3v","des"],WEEKDAYS:["sunnudagur","m\u00e1nudagur","\u00feri\u00f0judagur","mi\u00f0vikudagur","fimmtudagur","f\u00f6studagur","laugardagur"],STANDALONEWEEKDAYS:["sunnudagur",
+"m\u00e1nudagur","\u00feri\u00f0judagur","mi\u00f0vikudagur","fimmtudagur","f\u00f6studagur","laugardagur"],SHORTWEEKDAYS:["sun","m\u00e1n","\u00feri","mi\u00f0","fim","f\u00f6s","lau"],STANDALONESHORTWEEKDAYS:["sun","m\u00e1n","\u00feri","mi\u00f0","fim","f\u00f6s","lau"],NARROWWEEKDAYS:["s","m","\u00fe","m","f","f","l"],STANDALONENARROWWEEKDAYS:["s","m","\u00fe","m","f","f","l"],SHORTQUARTERS:["F1","F2","F3","F4"],QUARTERS:["1st fj\u00f3r\u00f0ungur","2nd fj\u00f3r\u00f0ungur","3rd fj\u00f3r\u00f0ungur",
+"4th fj\u00f3r\u00f0ungur"],AMPMS:["f.h.","e.h."],DATEFORMATS:["EEEE, d. MMMM y","d. MMMM y","d.M.yyyy","d.M.yyyy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d.M",MMMMd:"d. MMMM",MMMd:"d. MMM"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_it={ERAS:["aC","dC"],ERANAMES:["a.C.","d.C"],NARROWMONTHS:["G","F","M","A","M","G","L","A","S","O","N","D"],STANDALONENARROWMONTHS:["G","F","M","A","M","G","L","A","S","O","N","D"],MONTHS:["gennaio","febbraio","marzo","aprile","maggio","giugno","luglio","agosto","settembre","ottobre","novembre","dicembre"],STANDALONEMONTHS:["Gennaio","Febbraio","Marzo","Aprile","Maggio","Giugno","Luglio","Agosto","Settembre","Ottobre","Novembre","Dicembre"],SHORTMONTHS:["gen","feb","mar",
+"apr","mag","giu","lug","ago","set","ott","nov","dic"],STANDALONESHORTMONTHS:["gen","feb","mar","apr","mag","giu","lug","ago","set","ott","nov","dic"],WEEKDAYS:["domenica","luned\u00ec","marted\u00ec","mercoled\u00ec","gioved\u00ec","venerd\u00ec","sabato"],STANDALONEWEEKDAYS:["Domenica","Luned\u00ec","Marted\u00ec","Mercoled\u00ec","Gioved\u00ec","Venerd\u00ec","Sabato"],SHORTWEEKDAYS:["dom","lun","mar","mer","gio","ven","sab"],STANDALONESHORTWEEKDAYS:["dom","lun","mar","mer","gio","ven","sab"],
+NARROWWEEKDAYS:["D","L","M","M","G","V","S"],STANDALONENARROWWEEKDAYS:["D","L","M","M","G","V","S"],SHORTQUARTERS:["T1","T2","T3","T4"],QUARTERS:["1o trimestre","2o trimestre","3o trimestre","4o trimestre"],AMPMS:["m.","p."],DATEFORMATS:["EEEE d MMMM y","dd MMMM y","dd/MMM/y","dd/MM/yy"],TIMEFORMATS:["HH.mm.ss zzzz","HH.mm.ss z","HH.mm.ss","HH.mm"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_iw={ERAS:["\u05dc\u05e4\u05e0\u05d4\u05f4\u05e1","\u05dc\u05e1\u05d4\u05f4\u05e0"],ERANAMES:["\u05dc\u05e4\u05e0\u05d9 \u05d4\u05e1\u05e4\u05d9\u05e8\u05d4","\u05dc\u05e1\u05e4\u05d9\u05e8\u05d4"],NARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],STANDALONENARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],MONTHS:["\u05d9\u05e0\u05d5\u05d0\u05e8","\u05e4\u05d1\u05e8\u05d5\u05d0\u05e8","\u05de\u05e8\u05e1","\u05d0\u05e4\u05e8\u05d9\u05dc","\u05de\u05d0\u05d9",
+"\u05d9\u05d5\u05e0\u05d9","\u05d9\u05d5\u05dc\u05d9","\u05d0\u05d5\u05d2\u05d5\u05e1\u05d8","\u05e1\u05e4\u05d8\u05de\u05d1\u05e8","\u05d0\u05d5\u05e7\u05d8\u05d5\u05d1\u05e8","\u05e0\u05d5\u05d1\u05de\u05d1\u05e8","\u05d3\u05e6\u05de\u05d1\u05e8"],STANDALONEMONTHS:["\u05d9\u05e0\u05d5\u05d0\u05e8","\u05e4\u05d1\u05e8\u05d5\u05d0\u05e8","\u05de\u05e8\u05e1","\u05d0\u05e4\u05e8\u05d9\u05dc","\u05de\u05d0\u05d9","\u05d9\u05d5\u05e0\u05d9","\u05d9\u05d5\u05dc\u05d9","\u05d0\u05d5\u05d2\u05d5\u05e1\u05d8",
+"\u05e1\u05e4\u05d8\u05de\u05d1\u05e8","\u05d0\u05d5\u05e7\u05d8\u05d5\u05d1\u05e8","\u05e0\u05d5\u05d1\u05de\u05d1\u05e8","\u05d3\u05e6\u05de\u05d1\u05e8"],SHORTMONTHS:["\u05d9\u05e0\u05d5","\u05e4\u05d1\u05e8","\u05de\u05e8\u05e1","\u05d0\u05e4\u05e8","\u05de\u05d0\u05d9","\u05d9\u05d5\u05e0","\u05d9\u05d5\u05dc","\u05d0\u05d5\u05d2","\u05e1\u05e4\u05d8","\u05d0\u05d5\u05e7","\u05e0\u05d5\u05d1","\u05d3\u05e6\u05de"],STANDALONESHORTMONTHS:["\u05d9\u05e0\u05d5","\u05e4\u05d1\u05e8","\u05de\u05e8\u05e1",
+"\u05d0\u05e4\u05e8","\u05de\u05d0\u05d9","\u05d9\u05d5\u05e0","\u05d9\u05d5\u05dc","\u05d0\u05d5\u05d2","\u05e1\u05e4\u05d8","\u05d0\u05d5\u05e7","\u05e0\u05d5\u05d1","\u05d3\u05e6\u05de"],WEEKDAYS:["\u05d9\u05d5\u05dd \u05e8\u05d0\u05e9\u05d5\u05df","\u05d9\u05d5\u05dd \u05e9\u05e0\u05d9","\u05d9\u05d5\u05dd \u05e9\u05dc\u05d9\u05e9\u05d9","\u05d9\u05d5\u05dd \u05e8\u05d1\u05d9\u05e2\u05d9","\u05d9\u05d5\u05dd \u05d7\u05de\u05d9\u05e9\u05d9","\u05d9\u05d5\u05dd \u05e9\u05d9\u05e9\u05d9","\u05d9\u05d5\u05dd \u05e9\u05d1\u05ea"],
+STANDALONEWEEKDAYS:["\u05d9\u05d5\u05dd \u05e8\u05d0\u05e9\u05d5\u05df","\u05d9\u05d5\u05dd \u05e9\u05e0\u05d9","\u05d9\u05d5\u05dd \u05e9\u05dc\u05d9\u05e9\u05d9","\u05d9\u05d5\u05dd \u05e8\u05d1\u05d9\u05e2\u05d9","\u05d9\u05d5\u05dd \u05d7\u05de\u05d9\u05e9\u05d9","\u05d9\u05d5\u05dd \u05e9\u05d9\u05e9\u05d9","\u05d9\u05d5\u05dd \u05e9\u05d1\u05ea"],SHORTWEEKDAYS:["\u05d9\u05d5\u05dd \u05d0'","\u05d9\u05d5\u05dd \u05d1'","\u05d9\u05d5\u05dd \u05d2'","\u05d9\u05d5\u05dd \u05d3'","\u05d9\u05d5\u05dd \u05d4'",
+"\u05d9\u05d5\u05dd \u05d5'","\u05e9\u05d1\u05ea"],STANDALONESHORTWEEKDAYS:["\u05d9\u05d5\u05dd \u05d0'","\u05d9\u05d5\u05dd \u05d1'","\u05d9\u05d5\u05dd \u05d2'","\u05d9\u05d5\u05dd \u05d3'","\u05d9\u05d5\u05dd \u05d4'","\u05d9\u05d5\u05dd \u05d5'","\u05e9\u05d1\u05ea"],NARROWWEEKDAYS:["\u05d0","\u05d1","\u05d2","\u05d3","\u05d4","\u05d5","\u05e9"],STANDALONENARROWWEEKDAYS:["\u05d0","\u05d1","\u05d2","\u05d3","\u05d4","\u05d5","\u05e9"],SHORTQUARTERS:["\u05e8\u05d1\u05e2\u05d5\u05df 1","\u05e8\u05d1\u05e2\u05d5\u05df 2",
+"\u05e8\u05d1\u05e2\u05d5\u05df 3","\u05e8\u05d1\u05e2\u05d5\u05df 4"],QUARTERS:["\u05e8\u05d1\u05e2\u05d5\u05df 1","\u05e8\u05d1\u05e2\u05d5\u05df 2","\u05e8\u05d1\u05e2\u05d5\u05df 3","\u05e8\u05d1\u05e2\u05d5\u05df 4"],AMPMS:['\u05dc\u05e4\u05e0\u05d4"\u05e6','\u05d0\u05d7\u05d4"\u05e6'],DATEFORMATS:["EEEE, d \u05d1MMMM y","d \u05d1MMMM y","dd/MM/yyyy","dd/MM/yy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d \u05d1MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,
+WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_ja={ERAS:["\u7d00\u5143\u524d","\u897f\u66a6"],ERANAMES:["\u7d00\u5143\u524d","\u897f\u66a6"],NARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],STANDALONENARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],MONTHS:["1\u6708","2\u6708","3\u6708","4\u6708","5\u6708","6\u6708","7\u6708","8\u6708","9\u6708","10\u6708","11\u6708","12\u6708"],STANDALONEMONTHS:["1\u6708","2\u6708","3\u6708","4\u6708","5\u6708","6\u6708","7\u6708","8\u6708","9\u6708",
+"10\u6708","11\u6708","12\u6708"],SHORTMONTHS:["1\u6708","2\u6708","3\u6708","4\u6708","5\u6708","6\u6708","7\u6708","8\u6708","9\u6708","10\u6708","11\u6708","12\u6708"],STANDALONESHORTMONTHS:["1\u6708","2\u6708","3\u6708","4\u6708","5\u6708","6\u6708","7\u6708","8\u6708","9\u6708","10\u6708","11\u6708","12\u6708"],WEEKDAYS:["\u65e5\u66dc\u65e5","\u6708\u66dc\u65e5","\u706b\u66dc\u65e5","\u6c34\u66dc\u65e5","\u6728\u66dc\u65e5","\u91d1\u66dc\u65e5","\u571f\u66dc\u65e5"],STANDALONEWEEKDAYS:["\u65e5\u66dc\u65e5",
+"\u6708\u66dc\u65e5","\u706b\u66dc\u65e5","\u6c34\u66dc\u65e5","\u6728\u66dc\u65e5","\u91d1\u66dc\u65e5","\u571f\u66dc\u65e5"],SHORTWEEKDAYS:["\u65e5","\u6708","\u706b","\u6c34","\u6728","\u91d1","\u571f"],STANDALONESHORTWEEKDAYS:["\u65e5","\u6708","\u706b","\u6c34","\u6728","\u91d1","\u571f"],NARROWWEEKDAYS:["\u65e5","\u6708","\u706b","\u6c34","\u6728","\u91d1","\u571f"],STANDALONENARROWWEEKDAYS:["\u65e5","\u6708","\u706b","\u6c34","\u6728","\u91d1","\u571f"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],
+QUARTERS:["\u7b2c1\u56db\u534a\u671f","\u7b2c2\u56db\u534a\u671f","\u7b2c3\u56db\u534a\u671f","\u7b2c4\u56db\u534a\u671f"],AMPMS:["\u5348\u524d","\u5348\u5f8c"],DATEFORMATS:["y\u5e74M\u6708d\u65e5EEEE","y\u5e74M\u6708d\u65e5","yyyy/MM/dd","yy/MM/dd"],TIMEFORMATS:["H\u6642mm\u5206ss\u79d2 zzzz","HH:mm:ss z","H:mm:ss","H:mm"],AVAILABLEFORMATS:{Md:"M/d",MMMMd:"M\u6708d\u65e5",MMMd:"M\u6708d\u65e5"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_kn={ERAS:["BCE","CE"],ERANAMES:["\u0c88\u0cb8\u0caa\u0cc2\u0cb5\u0cef.","\u0c95\u0ccd\u0cb0\u0cbf\u0cb8\u0ccd\u0ca4 \u0cb6\u0c95"],NARROWMONTHS:["\u0c9c","\u0cab\u0cc6","\u0cae\u0cbe","\u0c8e","\u0cae\u0cc7","\u0c9c\u0cc2","\u0c9c\u0cc1","\u0c86","\u0cb8\u0cc6","\u0c85","\u0ca8","\u0ca1\u0cbf"],STANDALONENARROWMONTHS:["\u0c9c","\u0cab\u0cc6","\u0cae\u0cbe","\u0c8e","\u0cae\u0cc7","\u0c9c\u0cc2","\u0c9c\u0cc1","\u0c86","\u0cb8\u0cc6","\u0c85","\u0ca8","\u0ca1\u0cbf"],MONTHS:["\u0c9c\u0ca8\u0cb5\u0cb0\u0cc0",
+"\u0cab\u0cc6\u0cac\u0ccd\u0cb0\u0cb5\u0cb0\u0cc0","\u0cae\u0cbe\u0cb0\u0ccd\u0c9a\u0ccd","\u0c8e\u0caa\u0ccd\u0cb0\u0cbf\u0cb2\u0ccd","\u0cae\u0cc6","\u0c9c\u0cc2\u0ca8\u0ccd","\u0c9c\u0cc1\u0cb2\u0cc8","\u0c86\u0c97\u0cb8\u0ccd\u0c9f\u0ccd","\u0cb8\u0caa\u0ccd\u0c9f\u0cc6\u0c82\u0cac\u0cb0\u0ccd","\u0c85\u0c95\u0ccd\u0c9f\u0ccb\u0cac\u0cb0\u0ccd","\u0ca8\u0cb5\u0cc6\u0c82\u0cac\u0cb0\u0ccd","\u0ca1\u0cbf\u0cb8\u0cc6\u0c82\u0cac\u0cb0\u0ccd"],STANDALONEMONTHS:["\u0c9c\u0ca8\u0cb5\u0cb0\u0cc0","\u0cab\u0cc6\u0cac\u0ccd\u0cb0\u0cb5\u0cb0\u0cc0",
+"\u0cae\u0cbe\u0cb0\u0ccd\u0c9a\u0ccd","\u0c8e\u0caa\u0ccd\u0cb0\u0cbf\u0cb2\u0ccd","\u0cae\u0cc6","\u0c9c\u0cc2\u0ca8\u0ccd","\u0c9c\u0cc1\u0cb2\u0cc8","\u0c86\u0c97\u0cb8\u0ccd\u0c9f\u0ccd","\u0cb8\u0caa\u0ccd\u0c9f\u0cc6\u0c82\u0cac\u0cb0\u0ccd","\u0c85\u0c95\u0ccd\u0c9f\u0ccb\u0cac\u0cb0\u0ccd","\u0ca8\u0cb5\u0cc6\u0c82\u0cac\u0cb0\u0ccd","\u0ca1\u0cbf\u0cb8\u0cc6\u0c82\u0cac\u0cb0\u0ccd"],SHORTMONTHS:["\u0c9c\u0ca8\u0cb5\u0cb0\u0cc0","\u0cab\u0cc6\u0cac\u0ccd\u0cb0\u0cb5\u0cb0\u0cc0","\u0cae\u0cbe\u0cb0\u0ccd\u0c9a\u0ccd",
+"\u0c8e\u0caa\u0ccd\u0cb0\u0cbf\u0cb2\u0ccd","\u0cae\u0cc6","\u0c9c\u0cc2\u0ca8\u0ccd","\u0c9c\u0cc1\u0cb2\u0cc8","\u0c86\u0c97\u0cb8\u0ccd\u0c9f\u0ccd","\u0cb8\u0caa\u0ccd\u0c9f\u0cc6\u0c82\u0cac\u0cb0\u0ccd","\u0c85\u0c95\u0ccd\u0c9f\u0ccb\u0cac\u0cb0\u0ccd","\u0ca8\u0cb5\u0cc6\u0c82\u0cac\u0cb0\u0ccd","\u0ca1\u0cbf\u0cb8\u0cc6\u0c82\u0cac\u0cb0\u0ccd"],STANDALONESHORTMONTHS:["\u0c9c\u0ca8\u0cb5\u0cb0\u0cc0","\u0cab\u0cc6\u0cac\u0ccd\u0cb0\u0cb5\u0cb0\u0cc0","\u0cae\u0cbe\u0cb0\u0ccd\u0c9a\u0ccd",
+"\u0c8e\u0caa\u0ccd\u0cb0\u0cbf\u0cb2\u0ccd","\u0cae\u0cc6","\u0c9c\u0cc2\u0ca8\u0ccd","\u0c9c\u0cc1\u0cb2\u0cc8","\u0c86\u0c97\u0cb8\u0ccd\u0c9f\u0ccd","\u0cb8\u0caa\u0ccd\u0c9f\u0cc6\u0c82\u0cac\u0cb0\u0ccd","\u0c85\u0c95\u0ccd\u0c9f\u0ccb\u0cac\u0cb0\u0ccd","\u0ca8\u0cb5\u0cc6\u0c82\u0cac\u0cb0\u0ccd","\u0ca1\u0cbf\u0cb8\u0cc6\u0c82\u0cac\u0cb0\u0ccd"],WEEKDAYS:["\u0cb0\u0cb5\u0cbf\u0cb5\u0cbe\u0cb0","\u0cb8\u0ccb\u0cae\u0cb5\u0cbe\u0cb0","\u0cae\u0c82\u0c97\u0cb3\u0cb5\u0cbe\u0cb0","\u0cac\u0cc1\u0ca7\u0cb5\u0cbe\u0cb0",
+"\u0c97\u0cc1\u0cb0\u0cc1\u0cb5\u0cbe\u0cb0","\u0cb6\u0cc1\u0c95\u0ccd\u0cb0\u0cb5\u0cbe\u0cb0","\u0cb6\u0ca8\u0cbf\u0cb5\u0cbe\u0cb0"],STANDALONEWEEKDAYS:["\u0cb0\u0cb5\u0cbf\u0cb5\u0cbe\u0cb0","\u0cb8\u0ccb\u0cae\u0cb5\u0cbe\u0cb0","\u0cae\u0c82\u0c97\u0cb3\u0cb5\u0cbe\u0cb0","\u0cac\u0cc1\u0ca7\u0cb5\u0cbe\u0cb0","\u0c97\u0cc1\u0cb0\u0cc1\u0cb5\u0cbe\u0cb0","\u0cb6\u0cc1\u0c95\u0ccd\u0cb0\u0cb5\u0cbe\u0cb0","\u0cb6\u0ca8\u0cbf\u0cb5\u0cbe\u0cb0"],SHORTWEEKDAYS:["\u0cb0.","\u0cb8\u0ccb.","\u0cae\u0c82.",
+"\u0cac\u0cc1.","\u0c97\u0cc1.","\u0cb6\u0cc1.","\u0cb6\u0ca8\u0cbf."],STANDALONESHORTWEEKDAYS:["\u0cb0.","\u0cb8\u0ccb.","\u0cae\u0c82.","\u0cac\u0cc1.","\u0c97\u0cc1.","\u0cb6\u0cc1.","\u0cb6\u0ca8\u0cbf."],NARROWWEEKDAYS:["\u0cb0","\u0cb8\u0ccb","\u0cae\u0c82","\u0cac\u0cc1","\u0c97\u0cc1","\u0cb6\u0cc1","\u0cb6"],STANDALONENARROWWEEKDAYS:["\u0cb0","\u0cb8\u0ccb","\u0cae\u0c82","\u0cac\u0cc1","\u0c97\u0cc1","\u0cb6\u0cc1","\u0cb6"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["\u0c92\u0c82\u0ca6\u0cc1 1",
+"\u0c8e\u0cb0\u0ca1\u0cc1 2","\u0cae\u0cc2\u0cb0\u0cc1 3","\u0ca8\u0cbe\u0cb2\u0cc3\u0c95 4"],AMPMS:["am","pm"],DATEFORMATS:["EEEE d MMMM y","d MMMM y","d MMM y","d-M-yy"],TIMEFORMATS:["hh:mm:ss a zzzz","hh:mm:ss a z","hh:mm:ss a","hh:mm a"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"d MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[6,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_ko={ERAS:["\uae30\uc6d0\uc804","\uc11c\uae30"],ERANAMES:["\uc11c\ub825\uae30\uc6d0\uc804","\uc11c\ub825\uae30\uc6d0"],NARROWMONTHS:["1\uc6d4","2\uc6d4","3\uc6d4","4\uc6d4","5\uc6d4","6\uc6d4","7\uc6d4","8\uc6d4","9\uc6d4","10\uc6d4","11\uc6d4","12\uc6d4"],STANDALONENARROWMONTHS:["1\uc6d4","2\uc6d4","3\uc6d4","4\uc6d4","5\uc6d4","6\uc6d4","7\uc6d4","8\uc6d4","9\uc6d4","10\uc6d4","11\uc6d4","12\uc6d4"],MONTHS:["1\uc6d4","2\uc6d4","3\uc6d4","4\uc6d4","5\uc6d4","6\uc6d4","7\uc6d4",
+"8\uc6d4","9\uc6d4","10\uc6d4","11\uc6d4","12\uc6d4"],STANDALONEMONTHS:["1\uc6d4","2\uc6d4","3\uc6d4","4\uc6d4","5\uc6d4","6\uc6d4","7\uc6d4","8\uc6d4","9\uc6d4","10\uc6d4","11\uc6d4","12\uc6d4"],SHORTMONTHS:["1\uc6d4","2\uc6d4","3\uc6d4","4\uc6d4","5\uc6d4","6\uc6d4","7\uc6d4","8\uc6d4","9\uc6d4","10\uc6d4","11\uc6d4","12\uc6d4"],STANDALONESHORTMONTHS:["1\uc6d4","2\uc6d4","3\uc6d4","4\uc6d4","5\uc6d4","6\uc6d4","7\uc6d4","8\uc6d4","9\uc6d4","10\uc6d4","11\uc6d4","12\uc6d4"],WEEKDAYS:["\uc77c\uc694\uc77c",
+"\uc6d4\uc694\uc77c","\ud654\uc694\uc77c","\uc218\uc694\uc77c","\ubaa9\uc694\uc77c","\uae08\uc694\uc77c","\ud1a0\uc694\uc77c"],STANDALONEWEEKDAYS:["\uc77c\uc694\uc77c","\uc6d4\uc694\uc77c","\ud654\uc694\uc77c","\uc218\uc694\uc77c","\ubaa9\uc694\uc77c","\uae08\uc694\uc77c","\ud1a0\uc694\uc77c"],SHORTWEEKDAYS:["\uc77c","\uc6d4","\ud654","\uc218","\ubaa9","\uae08","\ud1a0"],STANDALONESHORTWEEKDAYS:["\uc77c","\uc6d4","\ud654","\uc218","\ubaa9","\uae08","\ud1a0"],NARROWWEEKDAYS:["\uc77c","\uc6d4","\ud654",
+"\uc218","\ubaa9","\uae08","\ud1a0"],STANDALONENARROWWEEKDAYS:["\uc77c","\uc6d4","\ud654","\uc218","\ubaa9","\uae08","\ud1a0"],SHORTQUARTERS:["1\ubd84\uae30","2\ubd84\uae30","3\ubd84\uae30","4\ubd84\uae30"],QUARTERS:["\uc81c 1/4\ubd84\uae30","\uc81c 2/4\ubd84\uae30","\uc81c 3/4\ubd84\uae30","\uc81c 4/4\ubd84\uae30"],AMPMS:["\uc624\uc804","\uc624\ud6c4"],DATEFORMATS:["y\ub144 M\uc6d4 d\uc77c EEEE","y\ub144 M\uc6d4 d\uc77c","yyyy. M. d.","yy. M. d."],TIMEFORMATS:["a hh\uc2dc mm\ubd84 ss\ucd08 zzzz",
+"a hh\uc2dc mm\ubd84 ss\ucd08 z","a h:mm:ss","a h:mm"],AVAILABLEFORMATS:{Md:"M. d.",MMMMd:"MMMM d\uc77c",MMMd:"MMM d\uc77c"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_ln={ERAS:["libos\u00f3 ya Y.-K.","nsima ya Y.-K."],ERANAMES:["libos\u00f3 ya Y.-K.","nsima ya Y.-K."],NARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],STANDALONENARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],MONTHS:["s\u00e1nz\u00e1 ya yambo","s\u00e1nz\u00e1 ya m\u00edbal\u00e9","s\u00e1nz\u00e1 ya m\u00eds\u00e1to","s\u00e1nz\u00e1 ya m\u00ednei","s\u00e1nz\u00e1 ya m\u00edt\u00e1no","s\u00e1nz\u00e1 ya mot\u00f3b\u00e1","s\u00e1nz\u00e1 ya nsambo",
+"s\u00e1nz\u00e1 ya mwambe","s\u00e1nz\u00e1 ya libwa","s\u00e1nz\u00e1 ya z\u00f3mi","s\u00e1nz\u00e1 ya z\u00f3mi na m\u0254\u030ck\u0254\u0301","s\u00e1nz\u00e1 ya z\u00f3mi na m\u00edbal\u00e9"],STANDALONEMONTHS:["s\u00e1nz\u00e1 ya yambo","s\u00e1nz\u00e1 ya m\u00edbal\u00e9","s\u00e1nz\u00e1 ya m\u00eds\u00e1to","s\u00e1nz\u00e1 ya m\u00ednei","s\u00e1nz\u00e1 ya m\u00edt\u00e1no","s\u00e1nz\u00e1 ya mot\u00f3b\u00e1","s\u00e1nz\u00e1 ya nsambo","s\u00e1nz\u00e1 ya mwambe","s\u00e1nz\u00e1 ya libwa",
+"s\u00e1nz\u00e1 ya z\u00f3mi","s\u00e1nz\u00e1 ya z\u00f3mi na m\u0254\u030ck\u0254\u0301","s\u00e1nz\u00e1 ya z\u00f3mi na m\u00edbal\u00e9"],SHORTMONTHS:["s1","s2","s3","s4","s5","s6","s7","s8","s9","s10","s11","s12"],STANDALONESHORTMONTHS:["s1","s2","s3","s4","s5","s6","s7","s8","s9","s10","s11","s12"],WEEKDAYS:["eyenga","mok\u0254l\u0254 ya libos\u00f3","mok\u0254l\u0254 ya m\u00edbal\u00e9","mok\u0254l\u0254 ya m\u00eds\u00e1to","mok\u0254l\u0254 ya m\u00edn\u00e9i","mok\u0254l\u0254 ya m\u00edt\u00e1no",
+"mp\u0254\u0301s\u0254"],STANDALONEWEEKDAYS:["eyenga","mok\u0254l\u0254 ya libos\u00f3","mok\u0254l\u0254 ya m\u00edbal\u00e9","mok\u0254l\u0254 ya m\u00eds\u00e1to","mok\u0254l\u0254 ya m\u00edn\u00e9i","mok\u0254l\u0254 ya m\u00edt\u00e1no","mp\u0254\u0301s\u0254"],SHORTWEEKDAYS:["eye","m1","m2","m3","m4","m5","mps"],STANDALONESHORTWEEKDAYS:["eye","m1","m2","m3","m4","m5","mps"],NARROWWEEKDAYS:["1","2","3","4","5","6","7"],STANDALONENARROWWEEKDAYS:["1","2","3","4","5","6","7"],SHORTQUARTERS:["SM1",
+"SM2","SM3","SM4"],QUARTERS:["s\u00e1nz\u00e1 m\u00eds\u00e1to ya yambo","s\u00e1nz\u00e1 m\u00eds\u00e1to ya m\u00edbal\u00e9","s\u00e1nz\u00e1 m\u00eds\u00e1to ya m\u00eds\u00e1to","s\u00e1nz\u00e1 m\u00eds\u00e1to ya m\u00ednei"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, y MMMM dd","y MMMM d","y MMM d","yy/MM/dd"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"MMMM d",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_lt={ERAS:["pr. Kr.","po Kr."],ERANAMES:["prie\u0161 Krist\u0173","po Kristaus"],NARROWMONTHS:["S","V","K","B","G","B","L","R","R","S","L","G"],STANDALONENARROWMONTHS:["S","V","K","B","G","B","L","R","R","S","L","G"],MONTHS:["sausio","vasario","kovo","baland\u017eio","gegu\u017e\u0117s","bir\u017eelio","liepos","rugpj\u016b\u010dio","rugs\u0117jo","spalio","lapkri\u010dio","gruod\u017eio"],STANDALONEMONTHS:["Sausis","Vasaris","Kovas","Balandis","Gegu\u017e\u0117","Bir\u017eelis",
+"Liepa","Rugpj\u016btis","Rugs\u0117jis","Spalis","Lapkritis","Gruodis"],SHORTMONTHS:["Sau","Vas","Kov","Bal","Geg","Bir","Lie","Rgp","Rgs","Spl","Lap","Grd"],STANDALONESHORTMONTHS:["Sau","Vas","Kov","Bal","Geg","Bir","Lie","Rgp","Rgs","Spl","Lap","Grd"],WEEKDAYS:["sekmadienis","pirmadienis","antradienis","tre\u010diadienis","ketvirtadienis","penktadienis","\u0161e\u0161tadienis"],STANDALONEWEEKDAYS:["sekmadienis","pirmadienis","antradienis","tre\u010diadienis","ketvirtadienis","penktadienis","\u0161e\u0161tadienis"],
+SHORTWEEKDAYS:["Sk","Pr","An","Tr","Kt","Pn","\u0160t"],STANDALONESHORTWEEKDAYS:["Sk","Pr","An","Tr","Kt","Pn","\u0160t"],NARROWWEEKDAYS:["S","P","A","T","K","P","\u0160"],STANDALONENARROWWEEKDAYS:["S","P","A","T","K","P","\u0160"],SHORTQUARTERS:["K1","K2","K3","K4"],QUARTERS:["pirmas ketvirtis","antras ketvirtis","tre\u010dias ketvirtis","ketvirtas ketvirtis"],AMPMS:["prie\u0161piet","popiet"],DATEFORMATS:["y 'm'. MMMM d 'd'.,EEEE","y 'm'. MMMM d 'd'.","yyyy.MM.dd","yyyy-MM-dd"],TIMEFORMATS:["HH:mm:ss zzzz",
+"HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"MMMM d",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_lv={ERAS:["p.m.\u0113.","m.\u0113."],ERANAMES:["pirms m\u016bsu \u0113ras","m\u016bsu \u0113r\u0101"],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["janv\u0101ris","febru\u0101ris","marts","apr\u012blis","maijs","j\u016bnijs","j\u016blijs","augusts","septembris","oktobris","novembris","decembris"],STANDALONEMONTHS:["janv\u0101ris","febru\u0101ris","marts","apr\u012blis","maijs",
+"j\u016bnijs","j\u016blijs","augusts","septembris","oktobris","novembris","decembris"],SHORTMONTHS:["janv.","febr.","marts","apr.","maijs","j\u016bn.","j\u016bl.","aug.","sept.","okt.","nov.","dec."],STANDALONESHORTMONTHS:["janv.","febr.","marts","apr.","maijs","j\u016bn.","j\u016bl.","aug.","sept.","okt.","nov.","dec."],WEEKDAYS:["sv\u0113tdiena","pirmdiena","otrdiena","tre\u0161diena","ceturtdiena","piektdiena","sestdiena"],STANDALONEWEEKDAYS:["sv\u0113tdiena","pirmdiena","otrdiena","tre\u0161diena",
+"ceturtdiena","piektdiena","sestdiena"],SHORTWEEKDAYS:["Sv","Pr","Ot","Tr","Ce","Pk","Se"],STANDALONESHORTWEEKDAYS:["Sv","Pr","Ot","Tr","Ce","Pk","Se"],NARROWWEEKDAYS:["S","P","O","T","C","P","S"],STANDALONENARROWWEEKDAYS:["S","P","O","T","C","P","S"],SHORTQUARTERS:["C1","C2","C3","C4"],QUARTERS:["1. ceturksnis","2. ceturksnis","3. ceturksnis","4. ceturksnis"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, y. 'gada' d. MMMM","y. 'gada' d. MMMM","y. 'gada' d. MMM","dd.MM.yy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z",
+"HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"dd.mm.",MMMMd:"d. MMMM",MMMd:"d. MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_ml={ERAS:["\u0d15\u0d4d\u0d30\u0d3f.\u0d2e\u0d41.","\u0d15\u0d4d\u0d30\u0d3f.\u0d2a\u0d3f."],ERANAMES:["\u0d15\u0d4d\u0d30\u0d3f\u0d38\u0d4d\u0d24\u0d41\u0d35\u0d3f\u0d28\u0d41\u0d4d \u0d2e\u0d41\u0d2e\u0d4d\u0d2a\u0d4d","\u0d15\u0d4d\u0d30\u0d3f\u0d38\u0d4d\u0d24\u0d41\u0d35\u0d3f\u0d28\u0d4d \u0d2a\u0d3f\u0d28\u0d4d\u0d2a\u0d4d"],NARROWMONTHS:["\u0d1c","\u0d2b\u0d46","\u0d2e\u0d3e","\u0d0f","\u0d2e\u0d47","\u0d1c\u0d42","\u0d1c\u0d42","\u0d13","\u0d38\u0d46","\u0d12","\u0d28",
+"\u0d21\u0d3f"],STANDALONENARROWMONTHS:["\u0d1c","\u0d2b\u0d46","\u0d2e\u0d3e","\u0d0f","\u0d2e\u0d47","\u0d1c\u0d42","\u0d1c\u0d42","\u0d13","\u0d38\u0d46","\u0d12","\u0d28","\u0d21\u0d3f"],MONTHS:["\u0d1c\u0d28\u0d41\u0d35\u0d30\u0d3f","\u0d2b\u0d46\u0d2c\u0d4d\u0d30\u0d41\u0d35\u0d30\u0d3f","\u0d2e\u0d3e\u0d30\u0d4d\u0d1a\u0d4d\u0d1a\u0d4d","\u0d0f\u0d2a\u0d4d\u0d30\u0d3f\u0d32\u0d4d","\u0d2e\u0d47\u0d2f\u0d4d","\u0d1c\u0d42\u0d23\u0d4d","\u0d1c\u0d42\u0d32\u0d48","\u0d13\u0d17\u0d38\u0d4d\u0d31\u0d4d\u0d31\u0d4d",
+"\u0d38\u0d46\u0d2a\u0d4d\u0d31\u0d4d\u0d31\u0d02\u0d2c\u0d30\u0d4d","\u0d12\u0d15\u0d4d\u0d1f\u0d4b\u0d2c\u0d30\u0d4d","\u0d28\u0d35\u0d02\u0d2c\u0d30\u0d4d","\u0d21\u0d3f\u0d38\u0d02\u0d2c\u0d30\u0d4d"],STANDALONEMONTHS:["\u0d1c\u0d28\u0d41\u0d35\u0d30\u0d3f","\u0d2b\u0d46\u0d2c\u0d4d\u0d30\u0d41\u0d35\u0d30\u0d3f","\u0d2e\u0d3e\u0d30\u0d4d\u0d1a\u0d4d\u0d1a\u0d4d","\u0d0f\u0d2a\u0d4d\u0d30\u0d3f\u0d32\u0d4d","\u0d2e\u0d47\u0d2f\u0d4d","\u0d1c\u0d42\u0d23\u0d4d","\u0d1c\u0d42\u0d32\u0d48","\u0d13\u0d17\u0d38\u0d4d\u0d31\u0d4d\u0d31\u0d4d",
+"\u0d38\u0d46\u0d2a\u0d4d\u0d31\u0d4d\u0d31\u0d02\u0d2c\u0d30\u0d4d","\u0d12\u0d15\u0d4d\u0d1f\u0d4b\u0d2c\u0d30\u0d4d","\u0d28\u0d35\u0d02\u0d2c\u0d30\u0d4d","\u0d21\u0d3f\u0d38\u0d02\u0d2c\u0d30\u0d4d"],SHORTMONTHS:["\u0d1c\u0d28\u0d41","\u0d2b\u0d46\u0d2c\u0d4d\u0d30\u0d41","\u0d2e\u0d3e\u0d30\u0d4d","\u0d0f\u0d2a\u0d4d\u0d30\u0d3f","\u0d2e\u0d47\u0d2f\u0d4d","\u0d1c\u0d42\u0d23\u0d4d","\u0d1c\u0d42\u0d32\u0d48","\u0d13\u0d17","\u0d38\u0d46\u0d2a\u0d4d\u0d31\u0d4d\u0d31\u0d02","\u0d12\u0d15\u0d4d\u0d1f\u0d4b",
+"\u0d28\u0d35\u0d02","\u0d21\u0d3f\u0d38\u0d02"],STANDALONESHORTMONTHS:["\u0d1c\u0d28\u0d41","\u0d2b\u0d46\u0d2c\u0d4d\u0d30\u0d41","\u0d2e\u0d3e\u0d30\u0d4d","\u0d0f\u0d2a\u0d4d\u0d30\u0d3f","\u0d2e\u0d47\u0d2f\u0d4d","\u0d1c\u0d42\u0d23\u0d4d","\u0d1c\u0d42\u0d32\u0d48","\u0d13\u0d17","\u0d38\u0d46\u0d2a\u0d4d\u0d31\u0d4d\u0d31\u0d02","\u0d12\u0d15\u0d4d\u0d1f\u0d4b","\u0d28\u0d35\u0d02","\u0d21\u0d3f\u0d38\u0d02"],WEEKDAYS:["\u0d1e\u0d3e\u0d2f\u0d31\u0d3e\u0d34\u0d4d\u0d1a","\u0d24\u0d3f\u0d19\u0d4d\u0d15\u0d33\u0d3e\u0d34\u0d4d\u0d1a",
+"\u0d1a\u0d4a\u0d35\u0d4d\u0d35\u0d3e\u0d34\u0d4d\u0d1a","\u0d2c\u0d41\u0d27\u0d28\u0d3e\u0d34\u0d4d\u0d1a","\u0d35\u0d4d\u0d2f\u0d3e\u0d34\u0d3e\u0d34\u0d4d\u0d1a","\u0d35\u0d46\u0d33\u0d4d\u0d33\u0d3f\u0d2f\u0d3e\u0d34\u0d4d\u0d1a","\u0d36\u0d28\u0d3f\u0d2f\u0d3e\u0d34\u0d4d\u0d1a"],STANDALONEWEEKDAYS:["\u0d1e\u0d3e\u0d2f\u0d31\u0d3e\u0d34\u0d4d\u0d1a","\u0d24\u0d3f\u0d19\u0d4d\u0d15\u0d33\u0d3e\u0d34\u0d4d\u0d1a","\u0d1a\u0d4a\u0d35\u0d4d\u0d35\u0d3e\u0d34\u0d4d\u0d1a","\u0d2c\u0d41\u0d27\u0d28\u0d3e\u0d34\u0d4d\u0d1a",
+"\u0d35\u0d4d\u0d2f\u0d3e\u0d34\u0d3e\u0d34\u0d4d\u0d1a","\u0d35\u0d46\u0d33\u0d4d\u0d33\u0d3f\u0d2f\u0d3e\u0d34\u0d4d\u0d1a","\u0d36\u0d28\u0d3f\u0d2f\u0d3e\u0d34\u0d4d\u0d1a"],SHORTWEEKDAYS:["\u0d1e\u0d3e\u0d2f\u0d30\u0d4d","\u0d24\u0d3f\u0d19\u0d4d\u0d15\u0d33\u0d4d","\u0d1a\u0d4a\u0d35\u0d4d\u0d35","\u0d2c\u0d41\u0d27\u0d28\u0d4d","\u0d35\u0d4d\u0d2f\u0d3e\u0d34\u0d02","\u0d35\u0d46\u0d33\u0d4d\u0d33\u0d3f","\u0d36\u0d28\u0d3f"],STANDALONESHORTWEEKDAYS:["\u0d1e\u0d3e\u0d2f\u0d30\u0d4d","\u0d24\u0d3f\u0d19\u0d4d\u0d15\u0d33\u0d4d",
+"\u0d1a\u0d4a\u0d35\u0d4d\u0d35","\u0d2c\u0d41\u0d27\u0d28\u0d4d","\u0d35\u0d4d\u0d2f\u0d3e\u0d34\u0d02","\u0d35\u0d46\u0d33\u0d4d\u0d33\u0d3f","\u0d36\u0d28\u0d3f"],NARROWWEEKDAYS:["\u0d1e\u0d3e","\u0d24\u0d3f","\u0d1a\u0d4a","\u0d2c\u0d41","\u0d35\u0d4d\u0d2f\u0d3e","\u0d35\u0d46","\u0d36"],STANDALONENARROWWEEKDAYS:["\u0d1e\u0d3e","\u0d24\u0d3f","\u0d1a\u0d4a","\u0d2c\u0d41","\u0d35\u0d4d\u0d2f\u0d3e","\u0d35\u0d46","\u0d36"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["\u0d12\u0d28\u0d4d\u0d28\u0d3e\u0d02 \u0d2a\u0d3e\u0d26\u0d02",
+"\u0d30\u0d23\u0d4d\u0d1f\u0d3e\u0d02 \u0d2a\u0d3e\u0d26\u0d02","\u0d2e\u0d42\u0d28\u0d4d\u0d28\u0d3e\u0d02 \u0d2a\u0d3e\u0d26\u0d02","\u0d28\u0d3e\u0d32\u0d3e\u0d02 \u0d2a\u0d3e\u0d26\u0d02"],AMPMS:["am","pm"],DATEFORMATS:["y, MMMM d, EEEE","y, MMMM d","y, MMM d","dd/MM/yy"],TIMEFORMATS:["h:mm:ss a zzzz","h:mm:ss a z","h:mm:ss a","h:mm a"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"MMMM d",MMMd:"MMM d"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[6,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_mo={ERAS:["\u00ee.Hr.","d.Hr."],ERANAMES:["\u00eenainte de Hristos","dup\u0103 Hristos"],NARROWMONTHS:["I","F","M","A","M","I","I","A","S","O","N","D"],STANDALONENARROWMONTHS:["I","F","M","A","M","I","I","A","S","O","N","D"],MONTHS:["ianuarie","februarie","martie","aprilie","mai","iunie","iulie","august","septembrie","octombrie","noiembrie","decembrie"],STANDALONEMONTHS:["ianuarie","februarie","martie","aprilie","mai","iunie","iulie","august","septembrie","octombrie","noiembrie",
+"decembrie"],SHORTMONTHS:["ian.","feb.","mar.","apr.","mai","iun.","iul.","aug.","sept.","oct.","nov.","dec."],STANDALONESHORTMONTHS:["ian.","feb.","mar.","apr.","mai","iun.","iul.","aug.","sept.","oct.","nov.","dec."],WEEKDAYS:["duminic\u0103","luni","mar\u021bi","miercuri","joi","vineri","s\u00e2mb\u0103t\u0103"],STANDALONEWEEKDAYS:["duminic\u0103","luni","mar\u021bi","miercuri","joi","vineri","s\u00e2mb\u0103t\u0103"],SHORTWEEKDAYS:["Du","Lu","Ma","Mi","Jo","Vi","S\u00e2"],STANDALONESHORTWEEKDAYS:["Du",
+"Lu","Ma","Mi","Jo","Vi","S\u00e2"],NARROWWEEKDAYS:["D","L","M","M","J","V","S"],STANDALONENARROWWEEKDAYS:["D","L","M","M","J","V","S"],SHORTQUARTERS:["trim. I","trim. II","trim. III","trim. IV"],QUARTERS:["trimestrul I","trimestrul al II-lea","trimestrul al III-lea","trimestrul al IV-lea"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, d MMMM y","d MMMM y","dd.MM.yyyy","dd.MM.yyyy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d.M",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:0,
+WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_mr={ERAS:["\u0908.\u0938.\u092a\u0942.","\u0908.\u0938."],ERANAMES:["\u0908\u0938\u0935\u0940\u0938\u0928\u092a\u0942\u0930\u094d\u0935","\u0908\u0938\u0935\u0940\u0938\u0928"],NARROWMONTHS:["\u091c\u093e","\u092b\u0947","\u092e\u093e","\u090f","\u092e\u0947","\u091c\u0942","\u091c\u0941","\u0911","\u0938","\u0911","\u0928\u094b","\u0921\u093f"],STANDALONENARROWMONTHS:["\u091c\u093e","\u092b\u0947","\u092e\u093e","\u090f","\u092e\u0947","\u091c\u0942","\u091c\u0941","\u0911",
+"\u0938","\u0911","\u0928\u094b","\u0921\u093f"],MONTHS:["\u091c\u093e\u0928\u0947\u0935\u093e\u0930\u0940","\u092b\u0947\u092c\u094d\u0930\u0941\u0935\u093e\u0930\u0940","\u092e\u093e\u0930\u094d\u091a","\u090f\u092a\u094d\u0930\u093f\u0932","\u092e\u0947","\u091c\u0942\u0928","\u091c\u0941\u0932\u0948","\u0911\u0917\u0938\u094d\u091f","\u0938\u092a\u094d\u091f\u0947\u0902\u092c\u0930","\u0911\u0915\u094d\u091f\u094b\u092c\u0930","\u0928\u094b\u0935\u094d\u0939\u0947\u0902\u092c\u0930","\u0921\u093f\u0938\u0947\u0902\u092c\u0930"],
+STANDALONEMONTHS:["\u091c\u093e\u0928\u0947\u0935\u093e\u0930\u0940","\u092b\u0947\u092c\u094d\u0930\u0941\u0935\u093e\u0930\u0940","\u092e\u093e\u0930\u094d\u091a","\u090f\u092a\u094d\u0930\u093f\u0932","\u092e\u0947","\u091c\u0942\u0928","\u091c\u0941\u0932\u0948","\u0911\u0917\u0938\u094d\u091f","\u0938\u092a\u094d\u091f\u0947\u0902\u092c\u0930","\u0911\u0915\u094d\u091f\u094b\u092c\u0930","\u0928\u094b\u0935\u094d\u0939\u0947\u0902\u092c\u0930","\u0921\u093f\u0938\u0947\u0902\u092c\u0930"],SHORTMONTHS:["\u091c\u093e\u0928\u0947\u0935\u093e\u0930\u0940",
+"\u092b\u0947\u092c\u094d\u0930\u0941\u0935\u093e\u0930\u0940","\u092e\u093e\u0930\u094d\u091a","\u090f\u092a\u094d\u0930\u093f\u0932","\u092e\u0947","\u091c\u0942\u0928","\u091c\u0941\u0932\u0948","\u0911\u0917\u0938\u094d\u091f","\u0938\u092a\u094d\u091f\u0947\u0902\u092c\u0930","\u0911\u0915\u094d\u091f\u094b\u092c\u0930","\u0928\u094b\u0935\u094d\u0939\u0947\u0902\u092c\u0930","\u0921\u093f\u0938\u0947\u0902\u092c\u0930"],STANDALONESHORTMONTHS:["\u091c\u093e\u0928\u0947\u0935\u093e\u0930\u0940",
+"\u092b\u0947\u092c\u094d\u0930\u0941\u0935\u093e\u0930\u0940","\u092e\u093e\u0930\u094d\u091a","\u090f\u092a\u094d\u0930\u093f\u0932","\u092e\u0947","\u091c\u0942\u0928","\u091c\u0941\u0932\u0948","\u0911\u0917\u0938\u094d\u091f","\u0938\u092a\u094d\u091f\u0947\u0902\u092c\u0930","\u0911\u0915\u094d\u091f\u094b\u092c\u0930","\u0928\u094b\u0935\u094d\u0939\u0947\u0902\u092c\u0930","\u0921\u093f\u0938\u0947\u0902\u092c\u0930"],WEEKDAYS:["\u0930\u0935\u093f\u0935\u093e\u0930","\u0938\u094b\u092e\u0935\u093e\u0930",
+"\u092e\u0902\u0917\u0933\u0935\u093e\u0930","\u092c\u0941\u0927\u0935\u093e\u0930","\u0917\u0941\u0930\u0941\u0935\u093e\u0930","\u0936\u0941\u0915\u094d\u0930\u0935\u093e\u0930","\u0936\u0928\u093f\u0935\u093e\u0930"],STANDALONEWEEKDAYS:["\u0930\u0935\u093f\u0935\u093e\u0930","\u0938\u094b\u092e\u0935\u093e\u0930","\u092e\u0902\u0917\u0933\u0935\u093e\u0930","\u092c\u0941\u0927\u0935\u093e\u0930","\u0917\u0941\u0930\u0941\u0935\u093e\u0930","\u0936\u0941\u0915\u094d\u0930\u0935\u093e\u0930","\u0936\u0928\u093f\u0935\u093e\u0930"],
+SHORTWEEKDAYS:["\u0930\u0935\u093f","\u0938\u094b\u092e","\u092e\u0902\u0917\u0933","\u092c\u0941\u0927","\u0917\u0941\u0930\u0941","\u0936\u0941\u0915\u094d\u0930","\u0936\u0928\u093f"],STANDALONESHORTWEEKDAYS:["\u0930\u0935\u093f","\u0938\u094b\u092e","\u092e\u0902\u0917\u0933","\u092c\u0941\u0927","\u0917\u0941\u0930\u0941","\u0936\u0941\u0915\u094d\u0930","\u0936\u0928\u093f"],NARROWWEEKDAYS:["\u0930","\u0938\u094b","\u092e\u0902","\u092c\u0941","\u0917\u0941","\u0936\u0941","\u0936"],STANDALONENARROWWEEKDAYS:["\u0930",
+"\u0938\u094b","\u092e\u0902","\u092c\u0941","\u0917\u0941","\u0936\u0941","\u0936"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["\u092a\u094d\u0930\u0925\u092e \u0924\u093f\u092e\u093e\u0939\u0940","\u0926\u094d\u0935\u093f\u0924\u0940\u092f \u0924\u093f\u092e\u093e\u0939\u0940","\u0924\u0943\u0924\u0940\u092f \u0924\u093f\u092e\u093e\u0939\u0940","\u091a\u0924\u0941\u0930\u094d\u0925 \u0924\u093f\u092e\u093e\u0939\u0940"],AMPMS:["am","pm"],DATEFORMATS:["EEEE d MMMM y","d MMMM y","d MMM y","d-M-yy"],
+TIMEFORMATS:["h-mm-ss a zzzz","h-mm-ss a z","h-mm-ss a","h-mm a"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"d MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[6,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_ms={ERAS:["S.M.","T.M."],ERANAMES:["S.M.","T.M."],NARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],STANDALONENARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],MONTHS:["Januari","Februari","Mac","April","Mei","Jun","Julai","Ogos","September","Oktober","November","Disember"],STANDALONEMONTHS:["Januari","Februari","Mac","April","Mei","Jun","Julai","Ogos","September","Oktober","November","Disember"],SHORTMONTHS:["Jan","Feb","Mac","Apr","Mei",
+"Jun","Jul","Ogos","Sep","Okt","Nov","Dis"],STANDALONESHORTMONTHS:["Jan","Feb","Mac","Apr","Mei","Jun","Jul","Ogos","Sep","Okt","Nov","Dis"],WEEKDAYS:["Ahad","Isnin","Selasa","Rabu","Khamis","Jumaat","Sabtu"],STANDALONEWEEKDAYS:["Ahad","Isnin","Selasa","Rabu","Khamis","Jumaat","Sabtu"],SHORTWEEKDAYS:["Ahd","Isn","Sel","Rab","Kha","Jum","Sab"],STANDALONESHORTWEEKDAYS:["Ahd","Isn","Sel","Rab","Kha","Jum","Sab"],NARROWWEEKDAYS:["1","2","3","4","5","6","7"],STANDALONENARROWWEEKDAYS:["1","2","3","4","5",
+"6","7"],SHORTQUARTERS:["S1","S2","S3","S4"],QUARTERS:["suku pertama","suku kedua","suku ketiga","suku keempat"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE dd MMM y","dd MMMM y","dd MMM y","dd/MM/yyyy"],TIMEFORMATS:["h:mm:ss a zzzz","h:mm:ss a z","h:mm:ss a","h:mm"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"MMMM d",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_mt={ERAS:["QK","WK"],ERANAMES:["Qabel Kristu","Wara Kristu"],NARROWMONTHS:["J","F","M","A","M","\u0120","L","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","\u0120","L","A","S","O","N","D"],MONTHS:["Jannar","Frar","Marzu","April","Mejju","\u0120unju","Lulju","Awwissu","Settembru","Ottubru","Novembru","Di\u010bembru"],STANDALONEMONTHS:["Jannar","Frar","Marzu","April","Mejju","\u0120unju","Lulju","Awwissu","Settembru","Ottubru","Novembru","Di\u010bembru"],
+SHORTMONTHS:["Jan","Fra","Mar","Apr","Mej","\u0120un","Lul","Aww","Set","Ott","Nov","Di\u010b"],STANDALONESHORTMONTHS:["Jan","Fra","Mar","Apr","Mej","\u0120un","Lul","Aww","Set","Ott","Nov","Di\u010b"],WEEKDAYS:["Il-\u0126add","It-Tnejn","It-Tlieta","L-Erbg\u0127a","Il-\u0126amis","Il-\u0120img\u0127a","Is-Sibt"],STANDALONEWEEKDAYS:["Il-\u0126add","It-Tnejn","It-Tlieta","L-Erbg\u0127a","Il-\u0126amis","Il-\u0120img\u0127a","Is-Sibt"],SHORTWEEKDAYS:["\u0126ad","Tne","Tli","Erb","\u0126am","\u0120im",
+"Sib"],STANDALONESHORTWEEKDAYS:["\u0126ad","Tne","Tli","Erb","\u0126am","\u0120im","Sib"],NARROWWEEKDAYS:["\u0126","T","T","E","\u0126","\u0120","S"],STANDALONENARROWWEEKDAYS:["\u0126","T","T","E","\u0126","\u0120","S"],SHORTQUARTERS:["K1","K2","K3","K4"],QUARTERS:["K1","K2","K3","K4"],AMPMS:["QN","WN"],DATEFORMATS:["EEEE, d 'ta'\u2019 MMMM y","d 'ta'\u2019 MMMM y","dd MMM y","dd/MM/yyyy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"d 'ta'\u2019 MMMM",
+MMMd:"MMM d"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_nl={ERAS:["v. Chr.","n. Chr."],ERANAMES:["Voor Christus","Anno Domini"],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["januari","februari","maart","april","mei","juni","juli","augustus","september","oktober","november","december"],STANDALONEMONTHS:["januari","februari","maart","april","mei","juni","juli","augustus","september","oktober","november","december"],SHORTMONTHS:["jan.",
+"feb.","mrt.","apr.","mei","jun.","jul.","aug.","sep.","okt.","nov.","dec."],STANDALONESHORTMONTHS:["jan.","feb.","mrt.","apr.","mei","jun.","jul.","aug.","sep.","okt.","nov.","dec."],WEEKDAYS:["zondag","maandag","dinsdag","woensdag","donderdag","vrijdag","zaterdag"],STANDALONEWEEKDAYS:["zondag","maandag","dinsdag","woensdag","donderdag","vrijdag","zaterdag"],SHORTWEEKDAYS:["zo","ma","di","wo","do","vr","za"],STANDALONESHORTWEEKDAYS:["zo","ma","di","wo","do","vr","za"],NARROWWEEKDAYS:["Z","M","D",
+"W","D","V","Z"],STANDALONENARROWWEEKDAYS:["Z","M","D","W","D","V","Z"],SHORTQUARTERS:["K1","K2","K3","K4"],QUARTERS:["1e kwartaal","2e kwartaal","3e kwartaal","4e kwartaal"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE d MMMM y","d MMMM y","d MMM y","dd-MM-yy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d-M",MMMMd:"d MMMM",MMMd:"d-MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_no={ERAS:["f.Kr.","e.Kr."],ERANAMES:["f.Kr.","e.Kr."],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["januar","februar","mars","april","mai","juni","juli","august","september","oktober","november","desember"],STANDALONEMONTHS:["januar","februar","mars","april","mai","juni","juli","august","september","oktober","november","desember"],SHORTMONTHS:["jan.","feb.","mars","apr.","mai",
+"juni","juli","aug.","sep.","okt.","nov.","des."],STANDALONESHORTMONTHS:["jan.","feb.","mars","apr.","mai","juni","juli","aug.","sep.","okt.","nov.","des."],WEEKDAYS:["s\u00f8ndag","mandag","tirsdag","onsdag","torsdag","fredag","l\u00f8rdag"],STANDALONEWEEKDAYS:["s\u00f8ndag","mandag","tirsdag","onsdag","torsdag","fredag","l\u00f8rdag"],SHORTWEEKDAYS:["s\u00f8n.","man.","tir.","ons.","tor.","fre.","l\u00f8r."],STANDALONESHORTWEEKDAYS:["s\u00f8n.","man.","tir.","ons.","tor.","fre.","l\u00f8r."],NARROWWEEKDAYS:["S",
+"M","T","O","T","F","L"],STANDALONENARROWWEEKDAYS:["S","M","T","O","T","F","L"],SHORTQUARTERS:["K1","K2","K3","K4"],QUARTERS:["1. kvartal","2. kvartal","3. kvartal","4. kvartal"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE d. MMMM y","d. MMMM y","d. MMM y","dd.MM.yy"],TIMEFORMATS:["'kl'. HH.mm.ss zzzz","HH.mm.ss z","HH.mm.ss","HH.mm"],AVAILABLEFORMATS:{Md:"d.M.",MMMMd:"d. MMMM",MMMd:"d. MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_or={ERAS:["BCE","CE"],ERANAMES:["BCE","CE"],NARROWMONTHS:["\u0b1c\u0b3e","\u0b2b\u0b47","\u0b2e\u0b3e","\u0b05","\u0b2e\u0b47","\u0b1c\u0b41","\u0b1c\u0b41","\u0b05","\u0b38\u0b47","\u0b05","\u0b28","\u0b21\u0b3f"],STANDALONENARROWMONTHS:["\u0b1c\u0b3e","\u0b2b\u0b47","\u0b2e\u0b3e","\u0b05","\u0b2e\u0b47","\u0b1c\u0b41","\u0b1c\u0b41","\u0b05","\u0b38\u0b47","\u0b05","\u0b28","\u0b21\u0b3f"],MONTHS:["\u0b1c\u0b3e\u0b28\u0b41\u0b06\u0b30\u0b40","\u0b2b\u0b47\u0b2c\u0b4d\u0b30\u0b41\u0b5f\u0b3e\u0b30\u0b40",
+"\u0b2e\u0b3e\u0b30\u0b4d\u0b1a\u0b4d\u0b1a","\u0b05\u0b2a\u0b4d\u0b30\u0b47\u0b32","\u0b2e\u0b47","\u0b1c\u0b41\u0b28","\u0b1c\u0b41\u0b32\u0b3e\u0b07","\u0b05\u0b17\u0b37\u0b4d\u0b1f","\u0b38\u0b47\u0b2a\u0b4d\u0b1f\u0b47\u0b2e\u0b4d\u0b2c\u0b30","\u0b05\u0b15\u0b4d\u0b1f\u0b4b\u0b2c\u0b30","\u0b28\u0b2d\u0b47\u0b2e\u0b4d\u0b2c\u0b30","\u0b21\u0b3f\u0b38\u0b47\u0b2e\u0b4d\u0b2c\u0b30"],STANDALONEMONTHS:["\u0b1c\u0b3e\u0b28\u0b41\u0b06\u0b30\u0b40","\u0b2b\u0b47\u0b2c\u0b4d\u0b30\u0b41\u0b5f\u0b3e\u0b30\u0b40",
+"\u0b2e\u0b3e\u0b30\u0b4d\u0b1a\u0b4d\u0b1a","\u0b05\u0b2a\u0b4d\u0b30\u0b47\u0b32","\u0b2e\u0b47","\u0b1c\u0b41\u0b28","\u0b1c\u0b41\u0b32\u0b3e\u0b07","\u0b05\u0b17\u0b37\u0b4d\u0b1f","\u0b38\u0b47\u0b2a\u0b4d\u0b1f\u0b47\u0b2e\u0b4d\u0b2c\u0b30","\u0b05\u0b15\u0b4d\u0b1f\u0b4b\u0b2c\u0b30","\u0b28\u0b2d\u0b47\u0b2e\u0b4d\u0b2c\u0b30","\u0b21\u0b3f\u0b38\u0b47\u0b2e\u0b4d\u0b2c\u0b30"],SHORTMONTHS:["\u0b1c\u0b3e\u0b28\u0b41\u0b06\u0b30\u0b40","\u0b2b\u0b47\u0b2c\u0b4d\u0b30\u0b41\u0b5f\u0b3e\u0b30\u0b40",
+"\u0b2e\u0b3e\u0b30\u0b4d\u0b1a\u0b4d\u0b1a","\u0b05\u0b2a\u0b4d\u0b30\u0b47\u0b32","\u0b2e\u0b47","\u0b1c\u0b41\u0b28","\u0b1c\u0b41\u0b32\u0b3e\u0b07","\u0b05\u0b17\u0b37\u0b4d\u0b1f","\u0b38\u0b47\u0b2a\u0b4d\u0b1f\u0b47\u0b2e\u0b4d\u0b2c\u0b30","\u0b05\u0b15\u0b4d\u0b1f\u0b4b\u0b2c\u0b30","\u0b28\u0b2d\u0b47\u0b2e\u0b4d\u0b2c\u0b30","\u0b21\u0b3f\u0b38\u0b47\u0b2e\u0b4d\u0b2c\u0b30"],STANDALONESHORTMONTHS:["\u0b1c\u0b3e\u0b28\u0b41\u0b06\u0b30\u0b40","\u0b2b\u0b47\u0b2c\u0b4d\u0b30\u0b41\u0b5f\u0b3e\u0b30\u0b40",
+"\u0b2e\u0b3e\u0b30\u0b4d\u0b1a\u0b4d\u0b1a","\u0b05\u0b2a\u0b4d\u0b30\u0b47\u0b32","\u0b2e\u0b47","\u0b1c\u0b41\u0b28","\u0b1c\u0b41\u0b32\u0b3e\u0b07","\u0b05\u0b17\u0b37\u0b4d\u0b1f","\u0b38\u0b47\u0b2a\u0b4d\u0b1f\u0b47\u0b2e\u0b4d\u0b2c\u0b30","\u0b05\u0b15\u0b4d\u0b1f\u0b4b\u0b2c\u0b30","\u0b28\u0b2d\u0b47\u0b2e\u0b4d\u0b2c\u0b30","\u0b21\u0b3f\u0b38\u0b47\u0b2e\u0b4d\u0b2c\u0b30"],WEEKDAYS:["\u0b30\u0b2c\u0b3f\u0b2c\u0b3e\u0b30","\u0b38\u0b4b\u0b2e\u0b2c\u0b3e\u0b30","\u0b2e\u0b19\u0b4d\u0b17\u0b33\u0b2c\u0b3e\u0b30",
+"\u0b2c\u0b41\u0b27\u0b2c\u0b3e\u0b30","\u0b17\u0b41\u0b30\u0b41\u0b2c\u0b3e\u0b30","\u0b36\u0b41\u0b15\u0b4d\u0b30\u0b2c\u0b3e\u0b30","\u0b36\u0b28\u0b3f\u0b2c\u0b3e\u0b30"],STANDALONEWEEKDAYS:["\u0b30\u0b2c\u0b3f\u0b2c\u0b3e\u0b30","\u0b38\u0b4b\u0b2e\u0b2c\u0b3e\u0b30","\u0b2e\u0b19\u0b4d\u0b17\u0b33\u0b2c\u0b3e\u0b30","\u0b2c\u0b41\u0b27\u0b2c\u0b3e\u0b30","\u0b17\u0b41\u0b30\u0b41\u0b2c\u0b3e\u0b30","\u0b36\u0b41\u0b15\u0b4d\u0b30\u0b2c\u0b3e\u0b30","\u0b36\u0b28\u0b3f\u0b2c\u0b3e\u0b30"],SHORTWEEKDAYS:["\u0b30\u0b2c\u0b3f",
+"\u0b38\u0b4b\u0b2e","\u0b2e\u0b19\u0b4d\u0b17\u0b33","\u0b2c\u0b41\u0b27","\u0b17\u0b41\u0b30\u0b41","\u0b36\u0b41\u0b15\u0b4d\u0b30","\u0b36\u0b28\u0b3f"],STANDALONESHORTWEEKDAYS:["\u0b30\u0b2c\u0b3f","\u0b38\u0b4b\u0b2e","\u0b2e\u0b19\u0b4d\u0b17\u0b33","\u0b2c\u0b41\u0b27","\u0b17\u0b41\u0b30\u0b41","\u0b36\u0b41\u0b15\u0b4d\u0b30","\u0b36\u0b28\u0b3f"],NARROWWEEKDAYS:["\u0b30","\u0b38\u0b4b","\u0b2e","\u0b2c\u0b41","\u0b17\u0b41","\u0b36\u0b41","\u0b36"],STANDALONENARROWWEEKDAYS:["\u0b30","\u0b38\u0b4b",
+"\u0b2e","\u0b2c\u0b41","\u0b17\u0b41","\u0b36\u0b41","\u0b36"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["Q1","Q2","Q3","Q4"],AMPMS:["am","pm"],DATEFORMATS:["EEEE, d MMMM y","d MMMM y","d MMM y","d-M-yy"],TIMEFORMATS:["h:mm:ss a zzzz","h:mm:ss a z","h:mm:ss a","h:mm a"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"MMMM d",MMMd:"MMM d"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[6,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_pl={ERAS:["p.n.e.","n.e."],ERANAMES:["p.n.e.","n.e."],NARROWMONTHS:["s","l","m","k","m","c","l","s","w","p","l","g"],STANDALONENARROWMONTHS:["s","l","m","k","m","c","l","s","w","p","l","g"],MONTHS:["stycznia","lutego","marca","kwietnia","maja","czerwca","lipca","sierpnia","wrze\u015bnia","pa\u017adziernika","listopada","grudnia"],STANDALONEMONTHS:["stycze\u0144","luty","marzec","kwiecie\u0144","maj","czerwiec","lipiec","sierpie\u0144","wrzesie\u0144","pa\u017adziernik","listopad",
+"grudzie\u0144"],SHORTMONTHS:["sty","lut","mar","kwi","maj","cze","lip","sie","wrz","pa\u017a","lis","gru"],STANDALONESHORTMONTHS:["sty","lut","mar","kwi","maj","cze","lip","sie","wrz","pa\u017a","lis","gru"],WEEKDAYS:["niedziela","poniedzia\u0142ek","wtorek","\u015broda","czwartek","pi\u0105tek","sobota"],STANDALONEWEEKDAYS:["niedziela","poniedzia\u0142ek","wtorek","\u015broda","czwartek","pi\u0105tek","sobota"],SHORTWEEKDAYS:["niedz.","pon.","wt.","\u015br.","czw.","pt.","sob."],STANDALONESHORTWEEKDAYS:["niedz.",
+"pon.","wt.","\u015br.","czw.","pt.","sob."],NARROWWEEKDAYS:["N","P","W","\u015a","C","P","S"],STANDALONENARROWWEEKDAYS:["N","P","W","\u015a","C","P","S"],SHORTQUARTERS:["K1","K2","K3","K4"],QUARTERS:["I kwarta\u0142","II kwarta\u0142","III kwarta\u0142","IV kwarta\u0142"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, d MMMM y","d MMMM y","dd-MM-yyyy","dd-MM-yy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d.M",MMMMd:"d MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,
+6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_pt={ERAS:["a.C.","d.C."],ERANAMES:["Antes de Cristo","Ano do Senhor"],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["janeiro","fevereiro","mar\u00e7o","abril","maio","junho","julho","agosto","setembro","outubro","novembro","dezembro"],STANDALONEMONTHS:["janeiro","fevereiro","mar\u00e7o","abril","maio","junho","julho","agosto","setembro","outubro","novembro","dezembro"],SHORTMONTHS:["jan",
+"fev","mar","abr","mai","jun","jul","ago","set","out","nov","dez"],STANDALONESHORTMONTHS:["jan","fev","mar","abr","mai","jun","jul","ago","set","out","nov","dez"],WEEKDAYS:["domingo","segunda-feira","ter\u00e7a-feira","quarta-feira","quinta-feira","sexta-feira","s\u00e1bado"],STANDALONEWEEKDAYS:["domingo","segunda-feira","ter\u00e7a-feira","quarta-feira","quinta-feira","sexta-feira","s\u00e1bado"],SHORTWEEKDAYS:["dom","seg","ter","qua","qui","sex","s\u00e1b"],STANDALONESHORTWEEKDAYS:["dom","seg",
+"ter","qua","qui","sex","s\u00e1b"],NARROWWEEKDAYS:["D","S","T","Q","Q","S","S"],STANDALONENARROWWEEKDAYS:["D","S","T","Q","Q","S","S"],SHORTQUARTERS:["T1","T2","T3","T4"],QUARTERS:["1\u00ba trimestre","2\u00ba trimestre","3\u00ba trimestre","4\u00ba trimestre"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, d 'de' MMMM 'de' y","d 'de' MMMM 'de' y","dd/MM/yyyy","dd/MM/yy"],TIMEFORMATS:["HH'h'mm'min'ss's' zzzz","HH'h'mm'min'ss's' z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d 'de' MMMM",MMMd:"d 'de' MMM"},
+FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};goog.i18n.DateTimeSymbols_pt_BR=goog.i18n.DateTimeSymbols_pt;
+goog.i18n.DateTimeSymbols_pt_PT={ERAS:["a.C.","d.C."],ERANAMES:["Antes de Cristo","Ano do Senhor"],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["Janeiro","Fevereiro","Mar\u00e7o","Abril","Maio","Junho","Julho","Agosto","Setembro","Outubro","Novembro","Dezembro"],STANDALONEMONTHS:["Janeiro","Fevereiro","Mar\u00e7o","Abril","Maio","Junho","Julho","Agosto","Setembro","Outubro","Novembro","Dezembro"],SHORTMONTHS:["Jan",
+"Fev","Mar","Abr","Mai","Jun","Jul","Ago","Set","Out","Nov","Dez"],STANDALONESHORTMONTHS:["Jan","Fev","Mar","Abr","Mai","Jun","Jul","Ago","Set","Out","Nov","Dez"],WEEKDAYS:["domingo","segunda-feira","ter\u00e7a-feira","quarta-feira","quinta-feira","sexta-feira","s\u00e1bado"],STANDALONEWEEKDAYS:["domingo","segunda-feira","ter\u00e7a-feira","quarta-feira","quinta-feira","sexta-feira","s\u00e1bado"],SHORTWEEKDAYS:["dom","seg","ter","qua","qui","sex","s\u00e1b"],STANDALONESHORTWEEKDAYS:["dom","seg",
+"ter","qua","qui","sex","s\u00e1b"],NARROWWEEKDAYS:["D","S","T","Q","Q","S","S"],STANDALONENARROWWEEKDAYS:["D","S","T","Q","Q","S","S"],SHORTQUARTERS:["T1","T2","T3","T4"],QUARTERS:["1.\u00ba trimestre","2.\u00ba trimestre","3.\u00ba trimestre","4.\u00ba trimestre"],AMPMS:["Antes do meio-dia","Depois do meio-dia"],DATEFORMATS:["EEEE, d 'de' MMMM 'de' y","d 'de' MMMM 'de' y","d 'de' MMM 'de' yyyy","dd/MM/yy"],TIMEFORMATS:["HH'h'mm'min'ss's' zzzz","HH'h'mm'min'ss's' z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d/M",
+MMMMd:"d 'de' MMMM",MMMd:"d 'de' MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_ro={ERAS:["\u00ee.Hr.","d.Hr."],ERANAMES:["\u00eenainte de Hristos","dup\u0103 Hristos"],NARROWMONTHS:["I","F","M","A","M","I","I","A","S","O","N","D"],STANDALONENARROWMONTHS:["I","F","M","A","M","I","I","A","S","O","N","D"],MONTHS:["ianuarie","februarie","martie","aprilie","mai","iunie","iulie","august","septembrie","octombrie","noiembrie","decembrie"],STANDALONEMONTHS:["ianuarie","februarie","martie","aprilie","mai","iunie","iulie","august","septembrie","octombrie","noiembrie",
+"decembrie"],SHORTMONTHS:["ian.","feb.","mar.","apr.","mai","iun.","iul.","aug.","sept.","oct.","nov.","dec."],STANDALONESHORTMONTHS:["ian.","feb.","mar.","apr.","mai","iun.","iul.","aug.","sept.","oct.","nov.","dec."],WEEKDAYS:["duminic\u0103","luni","mar\u021bi","miercuri","joi","vineri","s\u00e2mb\u0103t\u0103"],STANDALONEWEEKDAYS:["duminic\u0103","luni","mar\u021bi","miercuri","joi","vineri","s\u00e2mb\u0103t\u0103"],SHORTWEEKDAYS:["Du","Lu","Ma","Mi","Jo","Vi","S\u00e2"],STANDALONESHORTWEEKDAYS:["Du",
+"Lu","Ma","Mi","Jo","Vi","S\u00e2"],NARROWWEEKDAYS:["D","L","M","M","J","V","S"],STANDALONENARROWWEEKDAYS:["D","L","M","M","J","V","S"],SHORTQUARTERS:["trim. I","trim. II","trim. III","trim. IV"],QUARTERS:["trimestrul I","trimestrul al II-lea","trimestrul al III-lea","trimestrul al IV-lea"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, d MMMM y","d MMMM y","dd.MM.yyyy","dd.MM.yyyy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d.M",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:0,
+WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_ru={ERAS:["\u0434\u043e \u043d.\u044d.","\u043d.\u044d."],ERANAMES:["\u0434\u043e \u043d.\u044d.","\u043d.\u044d."],NARROWMONTHS:["\u042f","\u0424","\u041c","\u0410","\u041c","\u0418","\u0418","\u0410","\u0421","\u041e","\u041d","\u0414"],STANDALONENARROWMONTHS:["\u042f","\u0424","\u041c","\u0410","\u041c","\u0418","\u0418","\u0410","\u0421","\u041e","\u041d","\u0414"],MONTHS:["\u044f\u043d\u0432\u0430\u0440\u044f","\u0444\u0435\u0432\u0440\u0430\u043b\u044f","\u043c\u0430\u0440\u0442\u0430",
+"\u0430\u043f\u0440\u0435\u043b\u044f","\u043c\u0430\u044f","\u0438\u044e\u043d\u044f","\u0438\u044e\u043b\u044f","\u0430\u0432\u0433\u0443\u0441\u0442\u0430","\u0441\u0435\u043d\u0442\u044f\u0431\u0440\u044f","\u043e\u043a\u0442\u044f\u0431\u0440\u044f","\u043d\u043e\u044f\u0431\u0440\u044f","\u0434\u0435\u043a\u0430\u0431\u0440\u044f"],STANDALONEMONTHS:["\u042f\u043d\u0432\u0430\u0440\u044c","\u0424\u0435\u0432\u0440\u0430\u043b\u044c","\u041c\u0430\u0440\u0442","\u0410\u043f\u0440\u0435\u043b\u044c",
+"\u041c\u0430\u0439","\u0418\u044e\u043d\u044c","\u0418\u044e\u043b\u044c","\u0410\u0432\u0433\u0443\u0441\u0442","\u0421\u0435\u043d\u0442\u044f\u0431\u0440\u044c","\u041e\u043a\u0442\u044f\u0431\u0440\u044c","\u041d\u043e\u044f\u0431\u0440\u044c","\u0414\u0435\u043a\u0430\u0431\u0440\u044c"],SHORTMONTHS:["\u044f\u043d\u0432.","\u0444\u0435\u0432\u0440.","\u043c\u0430\u0440\u0442\u0430","\u0430\u043f\u0440.","\u043c\u0430\u044f","\u0438\u044e\u043d\u044f","\u0438\u044e\u043b\u044f","\u0430\u0432\u0433.",
+"\u0441\u0435\u043d\u0442.","\u043e\u043a\u0442.","\u043d\u043e\u044f\u0431.","\u0434\u0435\u043a."],STANDALONESHORTMONTHS:["\u044f\u043d\u0432.","\u0444\u0435\u0432\u0440.","\u043c\u0430\u0440\u0442","\u0430\u043f\u0440.","\u043c\u0430\u0439","\u0438\u044e\u043d\u044c","\u0438\u044e\u043b\u044c","\u0430\u0432\u0433.","\u0441\u0435\u043d\u0442.","\u043e\u043a\u0442.","\u043d\u043e\u044f\u0431.","\u0434\u0435\u043a."],WEEKDAYS:["\u0432\u043e\u0441\u043a\u0440\u0435\u0441\u0435\u043d\u044c\u0435","\u043f\u043e\u043d\u0435\u0434\u0435\u043b\u044c\u043d\u0438\u043a",
+"\u0432\u0442\u043e\u0440\u043d\u0438\u043a","\u0441\u0440\u0435\u0434\u0430","\u0447\u0435\u0442\u0432\u0435\u0440\u0433","\u043f\u044f\u0442\u043d\u0438\u0446\u0430","\u0441\u0443\u0431\u0431\u043e\u0442\u0430"],STANDALONEWEEKDAYS:["\u0412\u043e\u0441\u043a\u0440\u0435\u0441\u0435\u043d\u044c\u0435","\u041f\u043e\u043d\u0435\u0434\u0435\u043b\u044c\u043d\u0438\u043a","\u0412\u0442\u043e\u0440\u043d\u0438\u043a","\u0421\u0440\u0435\u0434\u0430","\u0427\u0435\u0442\u0432\u0435\u0440\u0433","\u041f\u044f\u0442\u043d\u0438\u0446\u0430",
+"\u0421\u0443\u0431\u0431\u043e\u0442\u0430"],SHORTWEEKDAYS:["\u0412\u0441","\u041f\u043d","\u0412\u0442","\u0421\u0440","\u0427\u0442","\u041f\u0442","\u0421\u0431"],STANDALONESHORTWEEKDAYS:["\u0412\u0441","\u041f\u043d","\u0412\u0442","\u0421\u0440","\u0427\u0442","\u041f\u0442","\u0421\u0431"],NARROWWEEKDAYS:["\u0412","\u041f","\u0412","\u0421","\u0427","\u041f","\u0421"],STANDALONENARROWWEEKDAYS:["\u0412","\u041f","\u0412","\u0421","\u0427","\u041f","\u0421"],SHORTQUARTERS:["1-\u0439 \u043a\u0432.",
+"2-\u0439 \u043a\u0432.","3-\u0439 \u043a\u0432.","4-\u0439 \u043a\u0432."],QUARTERS:["1-\u0439 \u043a\u0432\u0430\u0440\u0442\u0430\u043b","2-\u0439 \u043a\u0432\u0430\u0440\u0442\u0430\u043b","3-\u0439 \u043a\u0432\u0430\u0440\u0442\u0430\u043b","4-\u0439 \u043a\u0432\u0430\u0440\u0442\u0430\u043b"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, d MMMM y '\u0433'.","d MMMM y '\u0433'.","dd.MM.yyyy","dd.MM.yy"],TIMEFORMATS:["H:mm:ss zzzz","H:mm:ss z","H:mm:ss","H:mm"],AVAILABLEFORMATS:{Md:"d.M",MMMMd:"d MMMM",
+MMMd:"d MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_sk={ERAS:["pred n.l.","n.l."],ERANAMES:["pred n.l.","n.l."],NARROWMONTHS:["j","f","m","a","m","j","j","a","s","o","n","d"],STANDALONENARROWMONTHS:["j","f","m","a","m","j","j","a","s","o","n","d"],MONTHS:["janu\u00e1ra","febru\u00e1ra","marca","apr\u00edla","m\u00e1ja","j\u00fana","j\u00fala","augusta","septembra","okt\u00f3bra","novembra","decembra"],STANDALONEMONTHS:["janu\u00e1r","febru\u00e1r","marec","apr\u00edl","m\u00e1j","j\u00fan","j\u00fal","august","september",
+"okt\u00f3ber","november","december"],SHORTMONTHS:["jan","feb","mar","apr","m\u00e1j","j\u00fan","j\u00fal","aug","sep","okt","nov","dec"],STANDALONESHORTMONTHS:["jan","feb","mar","apr","m\u00e1j","j\u00fan","j\u00fal","aug","sep","okt","nov","dec"],WEEKDAYS:["nede\u013ea","pondelok","utorok","streda","\u0161tvrtok","piatok","sobota"],STANDALONEWEEKDAYS:["nede\u013ea","pondelok","utorok","streda","\u0161tvrtok","piatok","sobota"],SHORTWEEKDAYS:["ne","po","ut","st","\u0161t","pi","so"],STANDALONESHORTWEEKDAYS:["ne",
+"po","ut","st","\u0161t","pi","so"],NARROWWEEKDAYS:["N","P","U","S","\u0160","P","S"],STANDALONENARROWWEEKDAYS:["N","P","U","S","\u0160","P","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["1. \u0161tvr\u0165rok","2. \u0161tvr\u0165rok","3. \u0161tvr\u0165rok","4. \u0161tvr\u0165rok"],AMPMS:["dopoludnia","popoludn\u00ed"],DATEFORMATS:["EEEE, d. MMMM y","d. MMMM y","d.M.yyyy","d.M.yyyy"],TIMEFORMATS:["H:mm:ss zzzz","H:mm:ss z","H:mm:ss","H:mm"],AVAILABLEFORMATS:{Md:"d.M.",MMMMd:"d. MMMM",MMMd:"d. MMM"},
+FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_sl={ERAS:["pr. n. \u0161t.","po Kr."],ERANAMES:["pred na\u0161im \u0161tetjem","na\u0161e \u0161tetje"],NARROWMONTHS:["j","f","m","a","m","j","j","a","s","o","n","d"],STANDALONENARROWMONTHS:["j","f","m","a","m","j","j","a","s","o","n","d"],MONTHS:["januar","februar","marec","april","maj","junij","julij","avgust","september","oktober","november","december"],STANDALONEMONTHS:["januar","februar","marec","april","maj","junij","julij","avgust","september","oktober","november",
+"december"],SHORTMONTHS:["jan","feb","mar","apr","maj","jun","jul","avg","sep","okt","nov","dec"],STANDALONESHORTMONTHS:["jan","feb","mar","apr","maj","jun","jul","avg","sep","okt","nov","dec"],WEEKDAYS:["nedelja","ponedeljek","torek","sreda","\u010detrtek","petek","sobota"],STANDALONEWEEKDAYS:["nedelja","ponedeljek","torek","sreda","\u010detrtek","petek","sobota"],SHORTWEEKDAYS:["ned","pon","tor","sre","\u010det","pet","sob"],STANDALONESHORTWEEKDAYS:["ned","pon","tor","sre","\u010det","pet","sob"],
+NARROWWEEKDAYS:["n","p","t","s","\u010d","p","s"],STANDALONENARROWWEEKDAYS:["n","p","t","s","\u010d","p","s"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["1. \u010detrtletje","2. \u010detrtletje","3. \u010detrtletje","4. \u010detrtletje"],AMPMS:["dop.","pop."],DATEFORMATS:["EEEE, dd. MMMM y","dd. MMMM y","d. MMM. yyyy","d. MM. yy"],TIMEFORMATS:["H:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d. M.",MMMMd:"d. MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_sq={ERAS:["p.e.r.","n.e.r."],ERANAMES:["p.e.r.","n.e.r."],NARROWMONTHS:["J","S","M","P","M","Q","K","G","S","T","N","D"],STANDALONENARROWMONTHS:["J","S","M","P","M","Q","K","G","S","T","N","D"],MONTHS:["janar","shkurt","mars","prill","maj","qershor","korrik","gusht","shtator","tetor","n\u00ebntor","dhjetor"],STANDALONEMONTHS:["janar","shkurt","mars","prill","maj","qershor","korrik","gusht","shtator","tetor","n\u00ebntor","dhjetor"],SHORTMONTHS:["Jan","Shk","Mar","Pri","Maj",
+"Qer","Kor","Gsh","Sht","Tet","N\u00ebn","Dhj"],STANDALONESHORTMONTHS:["Jan","Shk","Mar","Pri","Maj","Qer","Kor","Gsh","Sht","Tet","N\u00ebn","Dhj"],WEEKDAYS:["e diel","e h\u00ebn\u00eb","e mart\u00eb","e m\u00ebrkur\u00eb","e enjte","e premte","e shtun\u00eb"],STANDALONEWEEKDAYS:["e diel","e h\u00ebn\u00eb","e mart\u00eb","e m\u00ebrkur\u00eb","e enjte","e premte","e shtun\u00eb"],SHORTWEEKDAYS:["Die","H\u00ebn","Mar","M\u00ebr","Enj","Pre","Sht"],STANDALONESHORTWEEKDAYS:["Die","H\u00ebn","Mar",
+"M\u00ebr","Enj","Pre","Sht"],NARROWWEEKDAYS:["D","H","M","M","E","P","S"],STANDALONENARROWWEEKDAYS:["D","H","M","M","E","P","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["Q1","Q2","Q3","Q4"],AMPMS:["PD","MD"],DATEFORMATS:["EEEE, dd MMMM y","dd MMMM y","yyyy-MM-dd","yy-MM-dd"],TIMEFORMATS:["h.mm.ss.a zzzz","h.mm.ss.a z","h.mm.ss.a","h.mm.a"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_sr={ERAS:["\u043f. \u043d. \u0435.","\u043d. \u0435"],ERANAMES:["\u041f\u0440\u0435 \u043d\u043e\u0432\u0435 \u0435\u0440\u0435","\u041d\u043e\u0432\u0435 \u0435\u0440\u0435"],NARROWMONTHS:["\u0458","\u0444","\u043c","\u0430","\u043c","\u0458","\u0458","\u0430","\u0441","\u043e","\u043d","\u0434"],STANDALONENARROWMONTHS:["\u0458","\u0444","\u043c","\u0430","\u043c","\u0458","\u0458","\u0430","\u0441","\u043e","\u043d","\u0434"],MONTHS:["\u0458\u0430\u043d\u0443\u0430\u0440",
+"\u0444\u0435\u0431\u0440\u0443\u0430\u0440","\u043c\u0430\u0440\u0442","\u0430\u043f\u0440\u0438\u043b","\u043c\u0430\u0458","\u0458\u0443\u043d","\u0458\u0443\u043b","\u0430\u0432\u0433\u0443\u0441\u0442","\u0441\u0435\u043f\u0442\u0435\u043c\u0431\u0430\u0440","\u043e\u043a\u0442\u043e\u0431\u0430\u0440","\u043d\u043e\u0432\u0435\u043c\u0431\u0430\u0440","\u0434\u0435\u0446\u0435\u043c\u0431\u0430\u0440"],STANDALONEMONTHS:["\u0458\u0430\u043d\u0443\u0430\u0440","\u0444\u0435\u0431\u0440\u0443\u0430\u0440",
+"\u043c\u0430\u0440\u0442","\u0430\u043f\u0440\u0438\u043b","\u043c\u0430\u0458","\u0458\u0443\u043d","\u0458\u0443\u043b","\u0430\u0432\u0433\u0443\u0441\u0442","\u0441\u0435\u043f\u0442\u0435\u043c\u0431\u0430\u0440","\u043e\u043a\u0442\u043e\u0431\u0430\u0440","\u043d\u043e\u0432\u0435\u043c\u0431\u0430\u0440","\u0434\u0435\u0446\u0435\u043c\u0431\u0430\u0440"],SHORTMONTHS:["\u0458\u0430\u043d","\u0444\u0435\u0431","\u043c\u0430\u0440","\u0430\u043f\u0440","\u043c\u0430\u0458","\u0458\u0443\u043d",
+"\u0458\u0443\u043b","\u0430\u0432\u0433","\u0441\u0435\u043f","\u043e\u043a\u0442","\u043d\u043e\u0432","\u0434\u0435\u0446"],STANDALONESHORTMONTHS:["\u0458\u0430\u043d","\u0444\u0435\u0431","\u043c\u0430\u0440","\u0430\u043f\u0440","\u043c\u0430\u0458","\u0458\u0443\u043d","\u0458\u0443\u043b","\u0430\u0432\u0433","\u0441\u0435\u043f","\u043e\u043a\u0442","\u043d\u043e\u0432","\u0434\u0435\u0446"],WEEKDAYS:["\u043d\u0435\u0434\u0435\u0459\u0430","\u043f\u043e\u043d\u0435\u0434\u0435\u0459\u0430\u043a",
+"\u0443\u0442\u043e\u0440\u0430\u043a","\u0441\u0440\u0435\u0434\u0430","\u0447\u0435\u0442\u0432\u0440\u0442\u0430\u043a","\u043f\u0435\u0442\u0430\u043a","\u0441\u0443\u0431\u043e\u0442\u0430"],STANDALONEWEEKDAYS:["\u043d\u0435\u0434\u0435\u0459\u0430","\u043f\u043e\u043d\u0435\u0434\u0435\u0459\u0430\u043a","\u0443\u0442\u043e\u0440\u0430\u043a","\u0441\u0440\u0435\u0434\u0430","\u0447\u0435\u0442\u0432\u0440\u0442\u0430\u043a","\u043f\u0435\u0442\u0430\u043a","\u0441\u0443\u0431\u043e\u0442\u0430"],
+SHORTWEEKDAYS:["\u043d\u0435\u0434","\u043f\u043e\u043d","\u0443\u0442\u043e","\u0441\u0440\u0435","\u0447\u0435\u0442","\u043f\u0435\u0442","\u0441\u0443\u0431"],STANDALONESHORTWEEKDAYS:["\u043d\u0435\u0434","\u043f\u043e\u043d","\u0443\u0442\u043e","\u0441\u0440\u0435","\u0447\u0435\u0442","\u043f\u0435\u0442","\u0441\u0443\u0431"],NARROWWEEKDAYS:["\u043d","\u043f","\u0443","\u0441","\u0447","\u043f","\u0441"],STANDALONENARROWWEEKDAYS:["\u043d","\u043f","\u0443","\u0441","\u0447","\u043f","\u0441"],
+SHORTQUARTERS:["\u041a1","\u041a2","\u041a3","\u041a4"],QUARTERS:["\u041f\u0440\u0432\u043e \u0442\u0440\u043e\u043c\u0435\u0441\u0435\u0447\u0458\u0435","\u0414\u0440\u0443\u0433\u043e \u0442\u0440\u043e\u043c\u0435\u0441\u0435\u0447\u0458\u0435","\u0422\u0440\u0435\u045b\u0435 \u0442\u0440\u043e\u043c\u0435\u0441\u0435\u0447\u0458\u0435","\u0427\u0435\u0442\u0432\u0440\u0442\u043e \u0442\u0440\u043e\u043c\u0435\u0441\u0435\u0447\u0458\u0435"],AMPMS:["\u043f\u0440\u0435 \u043f\u043e\u0434\u043d\u0435",
+"\u043f\u043e\u043f\u043e\u0434\u043d\u0435"],DATEFORMATS:["EEEE, dd. MMMM y.","dd. MMMM y.","dd.MM.y.","d.M.yy."],TIMEFORMATS:["HH.mm.ss zzzz","HH.mm.ss z","HH.mm.ss","HH.mm"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"MMMM d.",MMMd:"MMM d."},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_sv={ERAS:["f.Kr.","e.Kr."],ERANAMES:["f\u00f6re Kristus","efter Kristus"],NARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],STANDALONENARROWMONTHS:["J","F","M","A","M","J","J","A","S","O","N","D"],MONTHS:["januari","februari","mars","april","maj","juni","juli","augusti","september","oktober","november","december"],STANDALONEMONTHS:["januari","februari","mars","april","maj","juni","juli","augusti","september","oktober","november","december"],SHORTMONTHS:["jan",
+"feb","mar","apr","maj","jun","jul","aug","sep","okt","nov","dec"],STANDALONESHORTMONTHS:["jan","feb","mar","apr","maj","jun","jul","aug","sep","okt","nov","dec"],WEEKDAYS:["s\u00f6ndag","m\u00e5ndag","tisdag","onsdag","torsdag","fredag","l\u00f6rdag"],STANDALONEWEEKDAYS:["s\u00f6ndag","m\u00e5ndag","tisdag","onsdag","torsdag","fredag","l\u00f6rdag"],SHORTWEEKDAYS:["s\u00f6n","m\u00e5n","tis","ons","tors","fre","l\u00f6r"],STANDALONESHORTWEEKDAYS:["s\u00f6n","m\u00e5n","tis","ons","tors","fre","l\u00f6r"],
+NARROWWEEKDAYS:["S","M","T","O","T","F","L"],STANDALONENARROWWEEKDAYS:["S","M","T","O","T","F","L"],SHORTQUARTERS:["K1","K2","K3","K4"],QUARTERS:["1:a kvartalet","2:a kvartalet","3:e kvartalet","4:e kvartalet"],AMPMS:["fm","em"],DATEFORMATS:["EEEE d MMMM y","d MMMM y","d MMM y","yyyy-MM-dd"],TIMEFORMATS:["'kl'. HH.mm.ss zzzz","HH.mm.ss z","HH.mm.ss","HH.mm"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_ta={ERAS:["\u0b95\u0bbf\u0bae\u0bc1","\u0b95\u0bbf\u0baa\u0bbf"],ERANAMES:["\u0b95\u0bbf\u0bb1\u0bbf\u0bb8\u0bcd\u0ba4\u0bc1\u0bb5\u0bc1\u0b95\u0bcd\u0b95\u0bc1 \u0bae\u0bc1\u0ba9\u0bcd","\u0b85\u0ba9\u0bcb \u0b9f\u0bcb\u0bae\u0bbf\u0ba9\u0bbf"],NARROWMONTHS:["\u0b9c","\u0baa\u0bbf","\u0bae\u0bbe","\u0b8f","\u0bae\u0bc7","\u0b9c\u0bc2","\u0b9c\u0bc2","\u0b86","\u0b9a\u0bc6","\u0b85","\u0ba8","\u0b9f\u0bbf"],STANDALONENARROWMONTHS:["\u0b9c","\u0baa\u0bbf","\u0bae\u0bbe","\u0b8f",
+"\u0bae\u0bc7","\u0b9c\u0bc2","\u0b9c\u0bc2","\u0b86","\u0b9a\u0bc6","\u0b85","\u0ba8","\u0b9f\u0bbf"],MONTHS:["\u0b9c\u0ba9\u0bb5\u0bb0\u0bbf","\u0baa\u0bbf\u0baa\u0bcd\u0bb0\u0bb5\u0bb0\u0bbf","\u0bae\u0bbe\u0bb0\u0bcd\u0b9a\u0bcd","\u0b8f\u0baa\u0bcd\u0bb0\u0bb2\u0bcd","\u0bae\u0bc7","\u0b9c\u0bc2\u0ba9\u0bcd","\u0b9c\u0bc2\u0bb2\u0bc8","\u0b86\u0b95\u0bb8\u0bcd\u0b9f\u0bcd","\u0b9a\u0bc6\u0baa\u0bcd\u0b9f\u0bae\u0bcd\u0baa\u0bb0\u0bcd","\u0b85\u0b95\u0bcd\u0b9f\u0bcb\u0baa\u0bb0\u0bcd","\u0ba8\u0bb5\u0bae\u0bcd\u0baa\u0bb0\u0bcd",
+"\u0b9f\u0bbf\u0b9a\u0bae\u0bcd\u0baa\u0bb0\u0bcd"],STANDALONEMONTHS:["\u0b9c\u0ba9\u0bb5\u0bb0\u0bbf","\u0baa\u0bbf\u0baa\u0bcd\u0bb0\u0bb5\u0bb0\u0bbf","\u0bae\u0bbe\u0bb0\u0bcd\u0b9a\u0bcd","\u0b8f\u0baa\u0bcd\u0bb0\u0bb2\u0bcd","\u0bae\u0bc7","\u0b9c\u0bc2\u0ba9\u0bcd","\u0b9c\u0bc2\u0bb2\u0bc8","\u0b86\u0b95\u0bb8\u0bcd\u0b9f\u0bcd","\u0b9a\u0bc6\u0baa\u0bcd\u0b9f\u0bae\u0bcd\u0baa\u0bb0\u0bcd","\u0b85\u0b95\u0bcd\u0b9f\u0bcb\u0baa\u0bb0\u0bcd","\u0ba8\u0bb5\u0bae\u0bcd\u0baa\u0bb0\u0bcd","\u0b9f\u0bbf\u0b9a\u0bae\u0bcd\u0baa\u0bb0\u0bcd"],
+SHORTMONTHS:["\u0b9c\u0ba9.","\u0baa\u0bbf\u0baa\u0bcd.","\u0bae\u0bbe\u0bb0\u0bcd.","\u0b8f\u0baa\u0bcd.","\u0bae\u0bc7","\u0b9c\u0bc2\u0ba9\u0bcd","\u0b9c\u0bc2\u0bb2\u0bc8","\u0b86\u0b95.","\u0b9a\u0bc6\u0baa\u0bcd.","\u0b85\u0b95\u0bcd.","\u0ba8\u0bb5.","\u0b9f\u0bbf\u0b9a."],STANDALONESHORTMONTHS:["\u0b9c\u0ba9.","\u0baa\u0bbf\u0baa\u0bcd.","\u0bae\u0bbe\u0bb0\u0bcd.","\u0b8f\u0baa\u0bcd.","\u0bae\u0bc7","\u0b9c\u0bc2\u0ba9\u0bcd","\u0b9c\u0bc2\u0bb2\u0bc8","\u0b86\u0b95.","\u0b9a\u0bc6\u0baa\u0bcd.",
+"\u0b85\u0b95\u0bcd.","\u0ba8\u0bb5.","\u0b9f\u0bbf\u0b9a."],WEEKDAYS:["\u0b9e\u0bbe\u0baf\u0bbf\u0bb1\u0bc1","\u0ba4\u0bbf\u0b99\u0bcd\u0b95\u0bb3\u0bcd","\u0b9a\u0bc6\u0bb5\u0bcd\u0bb5\u0bbe\u0baf\u0bcd","\u0baa\u0bc1\u0ba4\u0ba9\u0bcd","\u0bb5\u0bbf\u0baf\u0bbe\u0bb4\u0ba9\u0bcd","\u0bb5\u0bc6\u0bb3\u0bcd\u0bb3\u0bbf","\u0b9a\u0ba9\u0bbf"],STANDALONEWEEKDAYS:["\u0b9e\u0bbe\u0baf\u0bbf\u0bb1\u0bc1","\u0ba4\u0bbf\u0b99\u0bcd\u0b95\u0bb3\u0bcd","\u0b9a\u0bc6\u0bb5\u0bcd\u0bb5\u0bbe\u0baf\u0bcd","\u0baa\u0bc1\u0ba4\u0ba9\u0bcd",
+"\u0bb5\u0bbf\u0baf\u0bbe\u0bb4\u0ba9\u0bcd","\u0bb5\u0bc6\u0bb3\u0bcd\u0bb3\u0bbf","\u0b9a\u0ba9\u0bbf"],SHORTWEEKDAYS:["\u0b9e\u0bbe","\u0ba4\u0bbf","\u0b9a\u0bc6","\u0baa\u0bc1","\u0bb5\u0bbf","\u0bb5\u0bc6","\u0b9a"],STANDALONESHORTWEEKDAYS:["\u0b9e\u0bbe","\u0ba4\u0bbf","\u0b9a\u0bc6","\u0baa\u0bc1","\u0bb5\u0bbf","\u0bb5\u0bc6","\u0b9a"],NARROWWEEKDAYS:["\u0b9e\u0bbe","\u0ba4\u0bbf","\u0b9a\u0bc6","\u0baa\u0bc1","\u0bb5\u0bbf","\u0bb5\u0bc6","\u0b9a"],STANDALONENARROWWEEKDAYS:["\u0b9e\u0bbe",
+"\u0ba4\u0bbf","\u0b9a\u0bc6","\u0baa\u0bc1","\u0bb5\u0bbf","\u0bb5\u0bc6","\u0b9a"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["1\u0b86\u0bae\u0bcd \u0b95\u0bbe\u0bb2\u0bbe\u0ba3\u0bcd\u0b9f\u0bc1","2\u0b86\u0bae\u0bcd \u0b95\u0bbe\u0bb2\u0bbe\u0ba3\u0bcd\u0b9f\u0bc1","3\u0b86\u0bae\u0bcd \u0b95\u0bbe\u0bb2\u0bbe\u0ba3\u0bcd\u0b9f\u0bc1","4\u0b86\u0bae\u0bcd \u0b95\u0bbe\u0bb2\u0bbe\u0ba3\u0bcd\u0b9f\u0bc1"],AMPMS:["am","pm"],DATEFORMATS:["EEEE, d MMMM, y","d MMMM, y","d MMM, y","d-M-yy"],TIMEFORMATS:["h:mm:ss a zzzz",
+"h:mm:ss a z","h:mm:ss a","h:mm a"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"d MMMM",MMMd:"MMM d"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[6,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_te={ERAS:["BCE","CE"],ERANAMES:["\u0c08\u0c38\u0c3e\u0c2a\u0c42\u0c30\u0c4d\u0c35.","\u0c38\u0c28\u0c4d."],NARROWMONTHS:["\u0c1c","\u0c2b\u0c3f","\u0c2e","\u0c0e","\u0c2e\u0c46","\u0c1c\u0c41","\u0c1c\u0c41","\u0c06","\u0c38\u0c46","\u0c05","\u0c28","\u0c21\u0c3f"],STANDALONENARROWMONTHS:["\u0c1c","\u0c2b\u0c3f","\u0c2e","\u0c0e","\u0c2e\u0c46","\u0c1c\u0c41","\u0c1c\u0c41","\u0c06","\u0c38\u0c46","\u0c05","\u0c28","\u0c21\u0c3f"],MONTHS:["\u0c1c\u0c28\u0c35\u0c30\u0c3f",
+"\u0c2b\u0c3f\u0c2c\u0c4d\u0c30\u0c35\u0c30\u0c3f","\u0c2e\u0c3e\u0c30\u0c4d\u0c1a\u0c3f","\u0c0f\u0c2a\u0c4d\u0c30\u0c3f\u0c32\u0c4d","\u0c2e\u0c47","\u0c1c\u0c42\u0c28\u0c4d","\u0c1c\u0c42\u0c32\u0c48","\u0c06\u0c17\u0c38\u0c4d\u0c1f\u0c41","\u0c38\u0c46\u0c2a\u0c4d\u0c1f\u0c46\u0c02\u0c2c\u0c30\u0c4d","\u0c05\u0c15\u0c4d\u0c1f\u0c4b\u0c2c\u0c30\u0c4d","\u0c28\u0c35\u0c02\u0c2c\u0c30\u0c4d","\u0c21\u0c3f\u0c38\u0c46\u0c02\u0c2c\u0c30\u0c4d"],STANDALONEMONTHS:["\u0c1c\u0c28\u0c35\u0c30\u0c3f","\u0c2b\u0c3f\u0c2c\u0c4d\u0c30\u0c35\u0c30\u0c3f",
+"\u0c2e\u0c3e\u0c30\u0c4d\u0c1a\u0c3f","\u0c0f\u0c2a\u0c4d\u0c30\u0c3f\u0c32\u0c4d","\u0c2e\u0c47","\u0c1c\u0c42\u0c28\u0c4d","\u0c1c\u0c42\u0c32\u0c48","\u0c06\u0c17\u0c38\u0c4d\u0c1f\u0c41","\u0c38\u0c46\u0c2a\u0c4d\u0c1f\u0c46\u0c02\u0c2c\u0c30\u0c4d","\u0c05\u0c15\u0c4d\u0c1f\u0c4b\u0c2c\u0c30\u0c4d","\u0c28\u0c35\u0c02\u0c2c\u0c30\u0c4d","\u0c21\u0c3f\u0c38\u0c46\u0c02\u0c2c\u0c30\u0c4d"],SHORTMONTHS:["\u0c1c\u0c28\u0c35\u0c30\u0c3f","\u0c2b\u0c3f\u0c2c\u0c4d\u0c30\u0c35\u0c30\u0c3f","\u0c2e\u0c3e\u0c30\u0c4d\u0c1a\u0c3f",
+"\u0c0f\u0c2a\u0c4d\u0c30\u0c3f\u0c32\u0c4d","\u0c2e\u0c47","\u0c1c\u0c42\u0c28\u0c4d","\u0c1c\u0c42\u0c32\u0c48","\u0c06\u0c17\u0c38\u0c4d\u0c1f\u0c41","\u0c38\u0c46\u0c2a\u0c4d\u0c1f\u0c46\u0c02\u0c2c\u0c30\u0c4d","\u0c05\u0c15\u0c4d\u0c1f\u0c4b\u0c2c\u0c30\u0c4d","\u0c28\u0c35\u0c02\u0c2c\u0c30\u0c4d","\u0c21\u0c3f\u0c38\u0c46\u0c02\u0c2c\u0c30\u0c4d"],STANDALONESHORTMONTHS:["\u0c1c\u0c28\u0c35\u0c30\u0c3f","\u0c2b\u0c3f\u0c2c\u0c4d\u0c30\u0c35\u0c30\u0c3f","\u0c2e\u0c3e\u0c30\u0c4d\u0c1a\u0c3f",
+"\u0c0f\u0c2a\u0c4d\u0c30\u0c3f\u0c32\u0c4d","\u0c2e\u0c47","\u0c1c\u0c42\u0c28\u0c4d","\u0c1c\u0c42\u0c32\u0c48","\u0c06\u0c17\u0c38\u0c4d\u0c1f\u0c41","\u0c38\u0c46\u0c2a\u0c4d\u0c1f\u0c46\u0c02\u0c2c\u0c30\u0c4d","\u0c05\u0c15\u0c4d\u0c1f\u0c4b\u0c2c\u0c30\u0c4d","\u0c28\u0c35\u0c02\u0c2c\u0c30\u0c4d","\u0c21\u0c3f\u0c38\u0c46\u0c02\u0c2c\u0c30\u0c4d"],WEEKDAYS:["\u0c06\u0c26\u0c3f\u0c35\u0c3e\u0c30\u0c02","\u0c38\u0c4b\u0c2e\u0c35\u0c3e\u0c30\u0c02","\u0c2e\u0c02\u0c17\u0c33\u0c35\u0c3e\u0c30\u0c02",
+"\u0c2c\u0c41\u0c27\u0c35\u0c3e\u0c30\u0c02","\u0c17\u0c41\u0c30\u0c41\u0c35\u0c3e\u0c30\u0c02","\u0c36\u0c41\u0c15\u0c4d\u0c30\u0c35\u0c3e\u0c30\u0c02","\u0c36\u0c28\u0c3f\u0c35\u0c3e\u0c30\u0c02"],STANDALONEWEEKDAYS:["\u0c06\u0c26\u0c3f\u0c35\u0c3e\u0c30\u0c02","\u0c38\u0c4b\u0c2e\u0c35\u0c3e\u0c30\u0c02","\u0c2e\u0c02\u0c17\u0c33\u0c35\u0c3e\u0c30\u0c02","\u0c2c\u0c41\u0c27\u0c35\u0c3e\u0c30\u0c02","\u0c17\u0c41\u0c30\u0c41\u0c35\u0c3e\u0c30\u0c02","\u0c36\u0c41\u0c15\u0c4d\u0c30\u0c35\u0c3e\u0c30\u0c02",
+"\u0c36\u0c28\u0c3f\u0c35\u0c3e\u0c30\u0c02"],SHORTWEEKDAYS:["\u0c06\u0c26\u0c3f","\u0c38\u0c4b\u0c2e","\u0c2e\u0c02\u0c17\u0c33","\u0c2c\u0c41\u0c27","\u0c17\u0c41\u0c30\u0c41","\u0c36\u0c41\u0c15\u0c4d\u0c30","\u0c36\u0c28\u0c3f"],STANDALONESHORTWEEKDAYS:["\u0c06\u0c26\u0c3f","\u0c38\u0c4b\u0c2e","\u0c2e\u0c02\u0c17\u0c33","\u0c2c\u0c41\u0c27","\u0c17\u0c41\u0c30\u0c41","\u0c36\u0c41\u0c15\u0c4d\u0c30","\u0c36\u0c28\u0c3f"],NARROWWEEKDAYS:["\u0c06","\u0c38\u0c4b","\u0c2e","\u0c2d\u0c41","\u0c17\u0c41",
+"\u0c36\u0c41","\u0c36"],STANDALONENARROWWEEKDAYS:["\u0c06","\u0c38\u0c4b","\u0c2e","\u0c2d\u0c41","\u0c17\u0c41","\u0c36\u0c41","\u0c36"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["\u0c12\u0c15\u0c1f\u0c3f 1","\u0c30\u0c46\u0c02\u0c21\u0c41 2","\u0c2e\u0c42\u0c21\u0c41 3","\u0c28\u0c3e\u0c32\u0c41\u0c17\u0c41 4"],AMPMS:["am","pm"],DATEFORMATS:["EEEE d MMMM y","d MMMM y","d MMM y","dd-MM-yy"],TIMEFORMATS:["h:mm:ss a zzzz","h:mm:ss a z","h:mm:ss a","h:mm a"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"d MMMM",
+MMMd:"MMM d"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[6,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_th={ERAS:["\u0e1b\u0e35\u0e01\u0e48\u0e2d\u0e19 \u0e04.\u0e28.","\u0e04.\u0e28."],ERANAMES:["\u0e1b\u0e35\u0e01\u0e48\u0e2d\u0e19\u0e04\u0e23\u0e34\u0e2a\u0e15\u0e4c\u0e28\u0e31\u0e01\u0e23\u0e32\u0e0a","\u0e04\u0e23\u0e34\u0e2a\u0e15\u0e4c\u0e28\u0e31\u0e01\u0e23\u0e32\u0e0a"],NARROWMONTHS:["\u0e21.\u0e04.","\u0e01.\u0e1e.","\u0e21\u0e35.\u0e04.","\u0e40\u0e21.\u0e22.","\u0e1e.\u0e04.","\u0e21\u0e34.\u0e22.","\u0e01.\u0e04.","\u0e2a.\u0e04.","\u0e01.\u0e22.","\u0e15.\u0e04.",
+"\u0e1e.\u0e22.","\u0e18.\u0e04."],STANDALONENARROWMONTHS:["\u0e21.\u0e04.","\u0e01.\u0e1e.","\u0e21\u0e35.\u0e04.","\u0e40\u0e21.\u0e22.","\u0e1e.\u0e04.","\u0e21\u0e34.\u0e22.","\u0e01.\u0e04.","\u0e2a.\u0e04.","\u0e01.\u0e22.","\u0e15.\u0e04.","\u0e1e.\u0e22.","\u0e18.\u0e04."],MONTHS:["\u0e21\u0e01\u0e23\u0e32\u0e04\u0e21","\u0e01\u0e38\u0e21\u0e20\u0e32\u0e1e\u0e31\u0e19\u0e18\u0e4c","\u0e21\u0e35\u0e19\u0e32\u0e04\u0e21","\u0e40\u0e21\u0e29\u0e32\u0e22\u0e19","\u0e1e\u0e24\u0e29\u0e20\u0e32\u0e04\u0e21",
+"\u0e21\u0e34\u0e16\u0e38\u0e19\u0e32\u0e22\u0e19","\u0e01\u0e23\u0e01\u0e0e\u0e32\u0e04\u0e21","\u0e2a\u0e34\u0e07\u0e2b\u0e32\u0e04\u0e21","\u0e01\u0e31\u0e19\u0e22\u0e32\u0e22\u0e19","\u0e15\u0e38\u0e25\u0e32\u0e04\u0e21","\u0e1e\u0e24\u0e28\u0e08\u0e34\u0e01\u0e32\u0e22\u0e19","\u0e18\u0e31\u0e19\u0e27\u0e32\u0e04\u0e21"],STANDALONEMONTHS:["\u0e21\u0e01\u0e23\u0e32\u0e04\u0e21","\u0e01\u0e38\u0e21\u0e20\u0e32\u0e1e\u0e31\u0e19\u0e18\u0e4c","\u0e21\u0e35\u0e19\u0e32\u0e04\u0e21","\u0e40\u0e21\u0e29\u0e32\u0e22\u0e19",
+"\u0e1e\u0e24\u0e29\u0e20\u0e32\u0e04\u0e21","\u0e21\u0e34\u0e16\u0e38\u0e19\u0e32\u0e22\u0e19","\u0e01\u0e23\u0e01\u0e0e\u0e32\u0e04\u0e21","\u0e2a\u0e34\u0e07\u0e2b\u0e32\u0e04\u0e21","\u0e01\u0e31\u0e19\u0e22\u0e32\u0e22\u0e19","\u0e15\u0e38\u0e25\u0e32\u0e04\u0e21","\u0e1e\u0e24\u0e28\u0e08\u0e34\u0e01\u0e32\u0e22\u0e19","\u0e18\u0e31\u0e19\u0e27\u0e32\u0e04\u0e21"],SHORTMONTHS:["\u0e21.\u0e04.","\u0e01.\u0e1e.","\u0e21\u0e35.\u0e04.","\u0e40\u0e21.\u0e22.","\u0e1e.\u0e04.","\u0e21\u0e34.\u0e22.",
+"\u0e01.\u0e04.","\u0e2a.\u0e04.","\u0e01.\u0e22.","\u0e15.\u0e04.","\u0e1e.\u0e22.","\u0e18.\u0e04."],STANDALONESHORTMONTHS:["\u0e21.\u0e04.","\u0e01.\u0e1e.","\u0e21\u0e35.\u0e04.","\u0e40\u0e21.\u0e22.","\u0e1e.\u0e04.","\u0e21\u0e34.\u0e22.","\u0e01.\u0e04.","\u0e2a.\u0e04.","\u0e01.\u0e22.","\u0e15.\u0e04.","\u0e1e.\u0e22.","\u0e18.\u0e04."],WEEKDAYS:["\u0e27\u0e31\u0e19\u0e2d\u0e32\u0e17\u0e34\u0e15\u0e22\u0e4c","\u0e27\u0e31\u0e19\u0e08\u0e31\u0e19\u0e17\u0e23\u0e4c","\u0e27\u0e31\u0e19\u0e2d\u0e31\u0e07\u0e04\u0e32\u0e23",
+"\u0e27\u0e31\u0e19\u0e1e\u0e38\u0e18","\u0e27\u0e31\u0e19\u0e1e\u0e24\u0e2b\u0e31\u0e2a\u0e1a\u0e14\u0e35","\u0e27\u0e31\u0e19\u0e28\u0e38\u0e01\u0e23\u0e4c","\u0e27\u0e31\u0e19\u0e40\u0e2a\u0e32\u0e23\u0e4c"],STANDALONEWEEKDAYS:["\u0e27\u0e31\u0e19\u0e2d\u0e32\u0e17\u0e34\u0e15\u0e22\u0e4c","\u0e27\u0e31\u0e19\u0e08\u0e31\u0e19\u0e17\u0e23\u0e4c","\u0e27\u0e31\u0e19\u0e2d\u0e31\u0e07\u0e04\u0e32\u0e23","\u0e27\u0e31\u0e19\u0e1e\u0e38\u0e18","\u0e27\u0e31\u0e19\u0e1e\u0e24\u0e2b\u0e31\u0e2a\u0e1a\u0e14\u0e35",
+"\u0e27\u0e31\u0e19\u0e28\u0e38\u0e01\u0e23\u0e4c","\u0e27\u0e31\u0e19\u0e40\u0e2a\u0e32\u0e23\u0e4c"],SHORTWEEKDAYS:["\u0e2d\u0e32.","\u0e08.","\u0e2d.","\u0e1e.","\u0e1e\u0e24.","\u0e28.","\u0e2a."],STANDALONESHORTWEEKDAYS:["\u0e2d\u0e32.","\u0e08.","\u0e2d.","\u0e1e.","\u0e1e\u0e24.","\u0e28.","\u0e2a."],NARROWWEEKDAYS:["\u0e2d","\u0e08","\u0e2d","\u0e1e","\u0e1e","\u0e28","\u0e2a"],STANDALONENARROWWEEKDAYS:["\u0e2d","\u0e08","\u0e2d","\u0e1e","\u0e1e","\u0e28","\u0e2a"],SHORTQUARTERS:["Q1","Q2",
+"Q3","Q4"],QUARTERS:["\u0e44\u0e15\u0e23\u0e21\u0e32\u0e2a 1","\u0e44\u0e15\u0e23\u0e21\u0e32\u0e2a 2","\u0e44\u0e15\u0e23\u0e21\u0e32\u0e2a 3","\u0e44\u0e15\u0e23\u0e21\u0e32\u0e2a 4"],AMPMS:["\u0e01\u0e48\u0e2d\u0e19\u0e40\u0e17\u0e35\u0e48\u0e22\u0e07","\u0e2b\u0e25\u0e31\u0e07\u0e40\u0e17\u0e35\u0e48\u0e22\u0e07"],DATEFORMATS:["EEEE\u0e17\u0e35\u0e48 d MMMM G y","d MMMM y","d MMM y","d/M/yyyy"],TIMEFORMATS:["H \u0e19\u0e32\u0e2c\u0e34\u0e01\u0e32 m \u0e19\u0e32\u0e17\u0e35 ss \u0e27\u0e34\u0e19\u0e32\u0e17\u0e35 zzzz",
+"H \u0e19\u0e32\u0e2c\u0e34\u0e01\u0e32 m \u0e19\u0e32\u0e17\u0e35 ss \u0e27\u0e34\u0e19\u0e32\u0e17\u0e35 z","H:mm:ss","H:mm"],AVAILABLEFORMATS:{Md:"d/M",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_tl={ERAS:["BCE","CE"],ERANAMES:["BCE","CE"],NARROWMONTHS:["E","P","M","A","M","H","H","A","S","O","N","D"],STANDALONENARROWMONTHS:["E","P","M","A","M","H","H","A","S","O","N","D"],MONTHS:["Enero","Pebrero","Marso","Abril","Mayo","Hunyo","Hulyo","Agosto","Setyembre","Oktubre","Nobyembre","Disyembre"],STANDALONEMONTHS:["Enero","Pebrero","Marso","Abril","Mayo","Hunyo","Hulyo","Agosto","Setyembre","Oktubre","Nobyembre","Disyembre"],SHORTMONTHS:["Ene","Peb","Mar","Abr","May",
+"Hun","Hul","Ago","Set","Okt","Nob","Dis"],STANDALONESHORTMONTHS:["Ene","Peb","Mar","Abr","May","Hun","Hul","Ago","Set","Okt","Nob","Dis"],WEEKDAYS:["Linggo","Lunes","Martes","Miyerkules","Huwebes","Biyernes","Sabado"],STANDALONEWEEKDAYS:["Linggo","Lunes","Martes","Miyerkules","Huwebes","Biyernes","Sabado"],SHORTWEEKDAYS:["Lin","Lun","Mar","Mye","Huw","Bye","Sab"],STANDALONESHORTWEEKDAYS:["Lin","Lun","Mar","Miy","Huw","Biy","Sab"],NARROWWEEKDAYS:["L","L","M","M","H","B","S"],STANDALONENARROWWEEKDAYS:["L",
+"L","M","M","H","B","S"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["Q1","Q2","Q3","Q4"],AMPMS:["AM","PM"],DATEFORMATS:["EEEE, MMMM dd y","MMMM d, y","MMM d, y","M/d/yy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"MMMM d",MMMd:"MMM d"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_tr={ERAS:["M\u00d6","MS"],ERANAMES:["Milattan \u00d6nce","Milattan Sonra"],NARROWMONTHS:["O","\u015e","M","N","M","H","T","A","E","E","K","A"],STANDALONENARROWMONTHS:["O","\u015e","M","N","M","H","T","A","E","E","K","A"],MONTHS:["Ocak","\u015eubat","Mart","Nisan","May\u0131s","Haziran","Temmuz","A\u011fustos","Eyl\u00fcl","Ekim","Kas\u0131m","Aral\u0131k"],STANDALONEMONTHS:["Ocak","\u015eubat","Mart","Nisan","May\u0131s","Haziran","Temmuz","A\u011fustos","Eyl\u00fcl","Ekim",
+"Kas\u0131m","Aral\u0131k"],SHORTMONTHS:["Oca","\u015eub","Mar","Nis","May","Haz","Tem","A\u011fu","Eyl","Eki","Kas","Ara"],STANDALONESHORTMONTHS:["Oca","\u015eub","Mar","Nis","May","Haz","Tem","A\u011fu","Eyl","Eki","Kas","Ara"],WEEKDAYS:["Pazar","Pazartesi","Sal\u0131","\u00c7ar\u015famba","Per\u015fembe","Cuma","Cumartesi"],STANDALONEWEEKDAYS:["Pazar","Pazartesi","Sal\u0131","\u00c7ar\u015famba","Per\u015fembe","Cuma","Cumartesi"],SHORTWEEKDAYS:["Paz","Pzt","Sal","\u00c7ar","Per","Cum","Cmt"],
+STANDALONESHORTWEEKDAYS:["Paz","Pzt","Sal","\u00c7ar","Per","Cum","Cmt"],NARROWWEEKDAYS:["P","P","S","\u00c7","P","C","C"],STANDALONENARROWWEEKDAYS:["P","P","S","\u00c7","P","C","C"],SHORTQUARTERS:["\u00c71","\u00c72","\u00c73","\u00c74"],QUARTERS:["1. \u00e7eyrek","2. \u00e7eyrek","3. \u00e7eyrek","4. \u00e7eyrek"],AMPMS:["AM","PM"],DATEFORMATS:["dd MMMM y EEEE","dd MMMM y","dd MMM y","dd MM yyyy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"dd/MM",MMMMd:"dd MMMM",
+MMMd:"dd MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_uk={ERAS:["\u0434\u043e \u043d.\u0435.","\u043d.\u0435."],ERANAMES:["\u0434\u043e \u043d\u0430\u0448\u043e\u0457 \u0435\u0440\u0438","\u043d\u0430\u0448\u043e\u0457 \u0435\u0440\u0438"],NARROWMONTHS:["\u0421","\u041b","\u0411","\u041a","\u0422","\u0427","\u041b","\u0421","\u0412","\u0416","\u041b","\u0413"],STANDALONENARROWMONTHS:["\u0421","\u041b","\u0411","\u041a","\u0422","\u0427","\u041b","\u0421","\u0412","\u0416","\u041b","\u0413"],MONTHS:["\u0441\u0456\u0447\u043d\u044f",
+"\u043b\u044e\u0442\u043e\u0433\u043e","\u0431\u0435\u0440\u0435\u0437\u043d\u044f","\u043a\u0432\u0456\u0442\u043d\u044f","\u0442\u0440\u0430\u0432\u043d\u044f","\u0447\u0435\u0440\u0432\u043d\u044f","\u043b\u0438\u043f\u043d\u044f","\u0441\u0435\u0440\u043f\u043d\u044f","\u0432\u0435\u0440\u0435\u0441\u043d\u044f","\u0436\u043e\u0432\u0442\u043d\u044f","\u043b\u0438\u0441\u0442\u043e\u043f\u0430\u0434\u0430","\u0433\u0440\u0443\u0434\u043d\u044f"],STANDALONEMONTHS:["\u0421\u0456\u0447\u0435\u043d\u044c",
+"\u041b\u044e\u0442\u0438\u0439","\u0411\u0435\u0440\u0435\u0437\u0435\u043d\u044c","\u041a\u0432\u0456\u0442\u0435\u043d\u044c","\u0422\u0440\u0430\u0432\u0435\u043d\u044c","\u0427\u0435\u0440\u0432\u0435\u043d\u044c","\u041b\u0438\u043f\u0435\u043d\u044c","\u0421\u0435\u0440\u043f\u0435\u043d\u044c","\u0412\u0435\u0440\u0435\u0441\u0435\u043d\u044c","\u0416\u043e\u0432\u0442\u0435\u043d\u044c","\u041b\u0438\u0441\u0442\u043e\u043f\u0430\u0434","\u0413\u0440\u0443\u0434\u0435\u043d\u044c"],SHORTMONTHS:["\u0441\u0456\u0447.",
+"\u043b\u044e\u0442.","\u0431\u0435\u0440.","\u043a\u0432\u0456\u0442.","\u0442\u0440\u0430\u0432.","\u0447\u0435\u0440\u0432.","\u043b\u0438\u043f.","\u0441\u0435\u0440\u043f.","\u0432\u0435\u0440.","\u0436\u043e\u0432\u0442.","\u043b\u0438\u0441\u0442.","\u0433\u0440\u0443\u0434."],STANDALONESHORTMONTHS:["\u0421\u0456\u0447","\u041b\u044e\u0442","\u0411\u0435\u0440","\u041a\u0432\u0456","\u0422\u0440\u0430","\u0427\u0435\u0440","\u041b\u0438\u043f","\u0421\u0435\u0440","\u0412\u0435\u0440","\u0416\u043e\u0432",
+"\u041b\u0438\u0441","\u0413\u0440\u0443"],WEEKDAYS:["\u041d\u0435\u0434\u0456\u043b\u044f","\u041f\u043e\u043d\u0435\u0434\u0456\u043b\u043e\u043a","\u0412\u0456\u0432\u0442\u043e\u0440\u043e\u043a","\u0421\u0435\u0440\u0435\u0434\u0430","\u0427\u0435\u0442\u0432\u0435\u0440","\u041f\u02bc\u044f\u0442\u043d\u0438\u0446\u044f","\u0421\u0443\u0431\u043e\u0442\u0430"],STANDALONEWEEKDAYS:["\u041d\u0435\u0434\u0456\u043b\u044f","\u041f\u043e\u043d\u0435\u0434\u0456\u043b\u043e\u043a","\u0412\u0456\u0432\u0442\u043e\u0440\u043e\u043a",
+"\u0421\u0435\u0440\u0435\u0434\u0430","\u0427\u0435\u0442\u0432\u0435\u0440","\u041f\u02bc\u044f\u0442\u043d\u0438\u0446\u044f","\u0421\u0443\u0431\u043e\u0442\u0430"],SHORTWEEKDAYS:["\u041d\u0434","\u041f\u043d","\u0412\u0442","\u0421\u0440","\u0427\u0442","\u041f\u0442","\u0421\u0431"],STANDALONESHORTWEEKDAYS:["\u041d\u0434","\u041f\u043d","\u0412\u0442","\u0421\u0440","\u0427\u0442","\u041f\u0442","\u0421\u0431"],NARROWWEEKDAYS:["\u041d","\u041f","\u0412","\u0421","\u0427","\u041f","\u0421"],
+STANDALONENARROWWEEKDAYS:["\u041d","\u041f","\u0412","\u0421","\u0427","\u041f","\u0421"],SHORTQUARTERS:["I \u043a\u0432.","II \u043a\u0432.","III \u043a\u0432.","IV \u043a\u0432."],QUARTERS:["I \u043a\u0432\u0430\u0440\u0442\u0430\u043b","II \u043a\u0432\u0430\u0440\u0442\u0430\u043b","III \u043a\u0432\u0430\u0440\u0442\u0430\u043b","IV \u043a\u0432\u0430\u0440\u0442\u0430\u043b"],AMPMS:["\u0434\u043f","\u043f\u043f"],DATEFORMATS:["EEEE, d MMMM y '\u0440'.","d MMMM y '\u0440'.","d MMM y","dd.MM.yy"],
+TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_ur={ERAS:["\u0642 \u0645","\u0639\u064a\u0633\u0648\u06cc \u0633\u0646"],ERANAMES:["\u0642\u0628\u0644 \u0645\u0633\u064a\u062d","\u0639\u064a\u0633\u0648\u06cc \u0633\u0646"],NARROWMONTHS:["\u062c","\u0641","\u0645","\u0627","\u0645","\u062c","\u062c","\u0627","\u0633","\u0627","\u0646","\u062f"],STANDALONENARROWMONTHS:["\u062c","\u0641","\u0645","\u0627","\u0645","\u062c","\u062c","\u0627","\u0633","\u0627","\u0646","\u062f"],MONTHS:["\u062c\u0646\u0648\u0631\u06cc","\u0641\u0631\u0648\u0631\u06cc",
+"\u0645\u0627\u0631 \u0686","\u0627\u067e\u0631\u064a\u0644","\u0645\u0626","\u062c\u0648\u0646","\u062c\u0648\u0644\u0627\u0626","\u0627\u06af\u0633\u062a","\u0633\u062a\u0645\u0628\u0631","\u0627\u06a9\u062a\u0648\u0628\u0631","\u0646\u0648\u0645\u0628\u0631","\u062f\u0633\u0645\u0628\u0631"],STANDALONEMONTHS:["\u062c\u0646\u0648\u0631\u06cc","\u0641\u0631\u0648\u0631\u06cc","\u0645\u0627\u0631 \u0686","\u0627\u067e\u0631\u064a\u0644","\u0645\u0626","\u062c\u0648\u0646","\u062c\u0648\u0644\u0627\u0626",
+"\u0627\u06af\u0633\u062a","\u0633\u062a\u0645\u0628\u0631","\u0627\u06a9\u062a\u0648\u0628\u0631","\u0646\u0648\u0645\u0628\u0631","\u062f\u0633\u0645\u0628\u0631"],SHORTMONTHS:["\u062c\u0646\u0648\u0631\u06cc","\u0641\u0631\u0648\u0631\u06cc","\u0645\u0627\u0631 \u0686","\u0627\u067e\u0631\u064a\u0644","\u0645\u0626","\u062c\u0648\u0646","\u062c\u0648\u0644\u0627\u0626","\u0627\u06af\u0633\u062a","\u0633\u062a\u0645\u0628\u0631","\u0627\u06a9\u062a\u0648\u0628\u0631","\u0646\u0648\u0645\u0628\u0631",
+"\u062f\u0633\u0645\u0628\u0631"],STANDALONESHORTMONTHS:["\u062c\u0646\u0648\u0631\u06cc","\u0641\u0631\u0648\u0631\u06cc","\u0645\u0627\u0631 \u0686","\u0627\u067e\u0631\u064a\u0644","\u0645\u0626","\u062c\u0648\u0646","\u062c\u0648\u0644\u0627\u0626","\u0627\u06af\u0633\u062a","\u0633\u062a\u0645\u0628\u0631","\u0627\u06a9\u062a\u0648\u0628\u0631","\u0646\u0648\u0645\u0628\u0631","\u062f\u0633\u0645\u0628\u0631"],WEEKDAYS:["\u0627\u062a\u0648\u0627\u0631","\u067e\u064a\u0631","\u0645\u0646\u06af\u0644",
+"\u0628\u062f\u0647","\u062c\u0645\u0639\u0631\u0627\u062a","\u062c\u0645\u0639\u06c1","\u06c1\u0641\u062a\u06c1"],STANDALONEWEEKDAYS:["\u0627\u062a\u0648\u0627\u0631","\u067e\u064a\u0631","\u0645\u0646\u06af\u0644","\u0628\u062f\u0647","\u062c\u0645\u0639\u0631\u0627\u062a","\u062c\u0645\u0639\u06c1","\u06c1\u0641\u062a\u06c1"],SHORTWEEKDAYS:["\u0627\u062a\u0648\u0627\u0631","\u067e\u064a\u0631","\u0645\u0646\u06af\u0644","\u0628\u062f\u0647","\u062c\u0645\u0639\u0631\u0627\u062a","\u062c\u0645\u0639\u06c1",
+"\u06c1\u0641\u062a\u06c1"],STANDALONESHORTWEEKDAYS:["\u0627\u062a\u0648\u0627\u0631","\u067e\u064a\u0631","\u0645\u0646\u06af\u0644","\u0628\u062f\u0647","\u062c\u0645\u0639\u0631\u0627\u062a","\u062c\u0645\u0639\u06c1","\u06c1\u0641\u062a\u06c1"],NARROWWEEKDAYS:["\u0627","\u067e","\u0645","\u0628","\u062c","\u062c","\u06c1"],STANDALONENARROWWEEKDAYS:["1","2","3","4","5","6","7"],SHORTQUARTERS:["1\u0633\u06c1 \u0645\u0627\u06c1\u06cc","2\u0633\u06c1 \u0645\u0627\u06c1\u06cc","3\u0633\u06c1 \u0645\u0627\u06c1\u06cc",
+"4\u0633\u06c1 \u0645\u0627\u06c1\u06cc"],QUARTERS:["\u067e\u06c1\u0644\u06cc \u0633\u06c1 \u0645\u0627\u06c1\u06cc","\u062f\u0648\u0633\u0631\u06cc \u0633\u06c1 \u0645\u0627\u06c1\u06cc","\u062a\u064a\u0633\u0631\u06cc \u0633\u06c1 \u0645\u0627\u06c1\u06cc","\u0686\u0648\u062a\u0647\u06cc \u0633\u06c1 \u0645\u0627\u06c1\u06cc"],AMPMS:["\u0642\u0628\u0644 \u062f\u0648\u067e\u06c1\u0631","\u0628\u0639\u062f \u062f\u0648\u067e\u06c1\u0631"],DATEFORMATS:["EEEE, d, MMMM y","d, MMMM y","d, MMM y","d/M/yy"],
+TIMEFORMATS:["h:mm:ss a zzzz","h:mm:ss a z","h:mm:ss a","h:mm a"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"MMMM d",MMMd:"MMM d"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_vi={ERAS:["tr. CN","sau CN"],ERANAMES:["tr. CN","sau CN"],NARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],STANDALONENARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],MONTHS:["th\u00e1ng m\u1ed9t","th\u00e1ng hai","th\u00e1ng ba","th\u00e1ng t\u01b0","th\u00e1ng n\u0103m","th\u00e1ng s\u00e1u","th\u00e1ng b\u1ea3y","th\u00e1ng t\u00e1m","th\u00e1ng ch\u00edn","th\u00e1ng m\u01b0\u1eddi","th\u00e1ng m\u01b0\u1eddi m\u1ed9t","th\u00e1ng m\u01b0\u1eddi hai"],
+STANDALONEMONTHS:["th\u00e1ng m\u1ed9t","th\u00e1ng hai","th\u00e1ng ba","th\u00e1ng t\u01b0","th\u00e1ng n\u0103m","th\u00e1ng s\u00e1u","th\u00e1ng b\u1ea3y","th\u00e1ng t\u00e1m","th\u00e1ng ch\u00edn","th\u00e1ng m\u01b0\u1eddi","th\u00e1ng m\u01b0\u1eddi m\u1ed9t","th\u00e1ng m\u01b0\u1eddi hai"],SHORTMONTHS:["thg 1","thg 2","thg 3","thg 4","thg 5","thg 6","thg 7","thg 8","thg 9","thg 10","thg 11","thg 12"],STANDALONESHORTMONTHS:["thg 1","thg 2","thg 3","thg 4","thg 5","thg 6","thg 7","thg 8",
+"thg 9","thg 10","thg 11","thg 12"],WEEKDAYS:["Ch\u1ee7 nh\u1eadt","Th\u1ee9 hai","Th\u1ee9 ba","Th\u1ee9 t\u01b0","Th\u1ee9 n\u0103m","Th\u1ee9 s\u00e1u","Th\u1ee9 b\u1ea3y"],STANDALONEWEEKDAYS:["Ch\u1ee7 nh\u1eadt","Th\u1ee9 hai","Th\u1ee9 ba","Th\u1ee9 t\u01b0","Th\u1ee9 n\u0103m","Th\u1ee9 s\u00e1u","Th\u1ee9 b\u1ea3y"],SHORTWEEKDAYS:["CN","Th 2","Th 3","Th 4","Th 5","Th 6","Th 7"],STANDALONESHORTWEEKDAYS:["CN","Th 2","Th 3","Th 4","Th 5","Th 6","Th 7"],NARROWWEEKDAYS:["1","2","3","4","5","6",
+"7"],STANDALONENARROWWEEKDAYS:["1","2","3","4","5","6","7"],SHORTQUARTERS:["Q1","Q2","Q3","Q4"],QUARTERS:["Q1","Q2","Q3","Q4"],AMPMS:["SA","CH"],DATEFORMATS:["EEEE, 'ng\u00e0y' dd MMMM 'n\u0103m' y","'Ng\u00e0y' dd 'th\u00e1ng' M 'n\u0103m' y","dd-MM-yyyy","dd/MM/yyyy"],TIMEFORMATS:["HH:mm:ss zzzz","HH:mm:ss z","HH:mm:ss","HH:mm"],AVAILABLEFORMATS:{Md:"d-M",MMMMd:"d MMMM",MMMd:"d MMM"},FIRSTDAYOFWEEK:0,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:3};
+goog.i18n.DateTimeSymbols_zh={ERAS:["\u516c\u5143\u524d","\u516c\u5143"],ERANAMES:["\u516c\u5143\u524d","\u516c\u5143"],NARROWMONTHS:["1\u6708","2\u6708","3\u6708","4\u6708","5\u6708","6\u6708","7\u6708","8\u6708","9\u6708","10\u6708","11\u6708","12\u6708"],STANDALONENARROWMONTHS:["1\u6708","2\u6708","3\u6708","4\u6708","5\u6708","6\u6708","7\u6708","8\u6708","9\u6708","10\u6708","11\u6708","12\u6708"],MONTHS:["1\u6708","2\u6708","3\u6708","4\u6708","5\u6708","6\u6708","7\u6708","8\u6708","9\u6708",
+"10\u6708","11\u6708","12\u6708"],STANDALONEMONTHS:["\u4e00\u6708","\u4e8c\u6708","\u4e09\u6708","\u56db\u6708","\u4e94\u6708","\u516d\u6708","\u4e03\u6708","\u516b\u6708","\u4e5d\u6708","\u5341\u6708","\u5341\u4e00\u6708","\u5341\u4e8c\u6708"],SHORTMONTHS:["1\u6708","2\u6708","3\u6708","4\u6708","5\u6708","6\u6708","7\u6708","8\u6708","9\u6708","10\u6708","11\u6708","12\u6708"],STANDALONESHORTMONTHS:["\u4e00\u6708","\u4e8c\u6708","\u4e09\u6708","\u56db\u6708","\u4e94\u6708","\u516d\u6708","\u4e03\u6708",
+"\u516b\u6708","\u4e5d\u6708","\u5341\u6708","\u5341\u4e00\u6708","\u5341\u4e8c\u6708"],WEEKDAYS:["\u661f\u671f\u65e5","\u661f\u671f\u4e00","\u661f\u671f\u4e8c","\u661f\u671f\u4e09","\u661f\u671f\u56db","\u661f\u671f\u4e94","\u661f\u671f\u516d"],STANDALONEWEEKDAYS:["\u661f\u671f\u65e5","\u661f\u671f\u4e00","\u661f\u671f\u4e8c","\u661f\u671f\u4e09","\u661f\u671f\u56db","\u661f\u671f\u4e94","\u661f\u671f\u516d"],SHORTWEEKDAYS:["\u5468\u65e5","\u5468\u4e00","\u5468\u4e8c","\u5468\u4e09","\u5468\u56db",
+"\u5468\u4e94","\u5468\u516d"],STANDALONESHORTWEEKDAYS:["\u5468\u65e5","\u5468\u4e00","\u5468\u4e8c","\u5468\u4e09","\u5468\u56db","\u5468\u4e94","\u5468\u516d"],NARROWWEEKDAYS:["\u65e5","\u4e00","\u4e8c","\u4e09","\u56db","\u4e94","\u516d"],STANDALONENARROWWEEKDAYS:["\u65e5","\u4e00","\u4e8c","\u4e09","\u56db","\u4e94","\u516d"],SHORTQUARTERS:["1\u5b63","2\u5b63","3\u5b63","4\u5b63"],QUARTERS:["\u7b2c1\u5b63\u5ea6","\u7b2c2\u5b63\u5ea6","\u7b2c3\u5b63\u5ea6","\u7b2c4\u5b63\u5ea6"],AMPMS:["\u4e0a\u5348",
+"\u4e0b\u5348"],DATEFORMATS:["y\u5e74M\u6708d\u65e5EEEE","y\u5e74M\u6708d\u65e5","yyyy-M-d","yy-M-d"],TIMEFORMATS:["zzzzah\u65f6mm\u5206ss\u79d2","zah\u65f6mm\u5206ss\u79d2","ahh:mm:ss","ah:mm"],AVAILABLEFORMATS:{Md:"M-d",MMMMd:"MMMMd\u65e5",MMMd:"MMMd\u65e5"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:2};goog.i18n.DateTimeSymbols_zh_CN=goog.i18n.DateTimeSymbols_zh;
+goog.i18n.DateTimeSymbols_zh_HK={ERAS:["\u516c\u5143\u524d","\u516c\u5143"],ERANAMES:["\u897f\u5143\u524d","\u897f\u5143"],NARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],STANDALONENARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],MONTHS:["1\u6708","2\u6708","3\u6708","4\u6708","5\u6708","6\u6708","7\u6708","8\u6708","9\u6708","10\u6708","11\u6708","12\u6708"],STANDALONEMONTHS:["\u4e00\u6708","\u4e8c\u6708","\u4e09\u6708","\u56db\u6708","\u4e94\u6708","\u516d\u6708",
+"\u4e03\u6708","\u516b\u6708","\u4e5d\u6708","\u5341\u6708","\u5341\u4e00\u6708","\u5341\u4e8c\u6708"],SHORTMONTHS:["1\u6708","2\u6708","3\u6708","4\u6708","5\u6708","6\u6708","7\u6708","8\u6708","9\u6708","10\u6708","11\u6708","12\u6708"],STANDALONESHORTMONTHS:["1\u6708","2\u6708","3\u6708","4\u6708","5\u6708","6\u6708","7\u6708","8\u6708","9\u6708","10\u6708","11\u6708","12\u6708"],WEEKDAYS:["\u661f\u671f\u65e5","\u661f\u671f\u4e00","\u661f\u671f\u4e8c","\u661f\u671f\u4e09","\u661f\u671f\u56db",
+"\u661f\u671f\u4e94","\u661f\u671f\u516d"],STANDALONEWEEKDAYS:["\u661f\u671f\u65e5","\u661f\u671f\u4e00","\u661f\u671f\u4e8c","\u661f\u671f\u4e09","\u661f\u671f\u56db","\u661f\u671f\u4e94","\u661f\u671f\u516d"],SHORTWEEKDAYS:["\u9031\u65e5","\u9031\u4e00","\u9031\u4e8c","\u9031\u4e09","\u9031\u56db","\u9031\u4e94","\u9031\u516d"],STANDALONESHORTWEEKDAYS:["\u9031\u65e5","\u9031\u4e00","\u9031\u4e8c","\u9031\u4e09","\u9031\u56db","\u9031\u4e94","\u9031\u516d"],NARROWWEEKDAYS:["\u65e5","\u4e00","\u4e8c",
+"\u4e09","\u56db","\u4e94","\u516d"],STANDALONENARROWWEEKDAYS:["\u65e5","\u4e00","\u4e8c","\u4e09","\u56db","\u4e94","\u516d"],SHORTQUARTERS:["1\u5b63","2\u5b63","3\u5b63","4\u5b63"],QUARTERS:["\u7b2c1\u5b63","\u7b2c2\u5b63","\u7b2c3\u5b63","\u7b2c4\u5b63"],AMPMS:["\u4e0a\u5348","\u4e0b\u5348"],DATEFORMATS:["y\u5e74M\u6708d\u65e5EEEE","y\u5e74M\u6708d\u65e5","y\u5e74M\u6708d\u65e5","yy\u5e74M\u6708d\u65e5"],TIMEFORMATS:["zzzzah\u6642mm\u5206ss\u79d2","zah\u6642mm\u5206ss\u79d2","ahh:mm:ss","ah:mm"],
+AVAILABLEFORMATS:{Md:"M/d",MMMMd:"MMMMd\u65e5",MMMd:"MMMd\u65e5"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols_zh_TW={ERAS:["\u516c\u5143\u524d","\u516c\u5143"],ERANAMES:["\u897f\u5143\u524d","\u897f\u5143"],NARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],STANDALONENARROWMONTHS:["1","2","3","4","5","6","7","8","9","10","11","12"],MONTHS:["1\u6708","2\u6708","3\u6708","4\u6708","5\u6708","6\u6708","7\u6708","8\u6708","9\u6708","10\u6708","11\u6708","12\u6708"],STANDALONEMONTHS:["\u4e00\u6708","\u4e8c\u6708","\u4e09\u6708","\u56db\u6708","\u4e94\u6708","\u516d\u6708",
+"\u4e03\u6708","\u516b\u6708","\u4e5d\u6708","\u5341\u6708","\u5341\u4e00\u6708","\u5341\u4e8c\u6708"],SHORTMONTHS:["1\u6708","2\u6708","3\u6708","4\u6708","5\u6708","6\u6708","7\u6708","8\u6708","9\u6708","10\u6708","11\u6708","12\u6708"],STANDALONESHORTMONTHS:["1\u6708","2\u6708","3\u6708","4\u6708","5\u6708","6\u6708","7\u6708","8\u6708","9\u6708","10\u6708","11\u6708","12\u6708"],WEEKDAYS:["\u661f\u671f\u65e5","\u661f\u671f\u4e00","\u661f\u671f\u4e8c","\u661f\u671f\u4e09","\u661f\u671f\u56db",
+"\u661f\u671f\u4e94","\u661f\u671f\u516d"],STANDALONEWEEKDAYS:["\u661f\u671f\u65e5","\u661f\u671f\u4e00","\u661f\u671f\u4e8c","\u661f\u671f\u4e09","\u661f\u671f\u56db","\u661f\u671f\u4e94","\u661f\u671f\u516d"],SHORTWEEKDAYS:["\u9031\u65e5","\u9031\u4e00","\u9031\u4e8c","\u9031\u4e09","\u9031\u56db","\u9031\u4e94","\u9031\u516d"],STANDALONESHORTWEEKDAYS:["\u9031\u65e5","\u9031\u4e00","\u9031\u4e8c","\u9031\u4e09","\u9031\u56db","\u9031\u4e94","\u9031\u516d"],NARROWWEEKDAYS:["\u65e5","\u4e00","\u4e8c",
+"\u4e09","\u56db","\u4e94","\u516d"],STANDALONENARROWWEEKDAYS:["\u65e5","\u4e00","\u4e8c","\u4e09","\u56db","\u4e94","\u516d"],SHORTQUARTERS:["1\u5b63","2\u5b63","3\u5b63","4\u5b63"],QUARTERS:["\u7b2c1\u5b63","\u7b2c2\u5b63","\u7b2c3\u5b63","\u7b2c4\u5b63"],AMPMS:["\u4e0a\u5348","\u4e0b\u5348"],DATEFORMATS:["y\u5e74M\u6708d\u65e5EEEE","y\u5e74M\u6708d\u65e5","yyyy/M/d","yy/M/d"],TIMEFORMATS:["zzzzah\u6642mm\u5206ss\u79d2","zah\u6642mm\u5206ss\u79d2","ah:mm:ss","ah:mm"],AVAILABLEFORMATS:{Md:"M/d",
+MMMMd:"MMMMd\u65e5",MMMd:"MMMd\u65e5"},FIRSTDAYOFWEEK:6,WEEKENDRANGE:[5,6],FIRSTWEEKCUTOFFDAY:2};
+goog.i18n.DateTimeSymbols=goog.LOCALE=="ar"?goog.i18n.DateTimeSymbols_ar:goog.LOCALE=="bg"?goog.i18n.DateTimeSymbols_bg:goog.LOCALE=="bn"?goog.i18n.DateTimeSymbols_bn:goog.LOCALE=="ca"?goog.i18n.DateTimeSymbols_ca:goog.LOCALE=="cs"?goog.i18n.DateTimeSymbols_cs:goog.LOCALE=="da"?goog.i18n.DateTimeSymbols_da:goog.LOCALE=="de"?goog.i18n.DateTimeSymbols_de:goog.LOCALE=="de_AT"||goog.LOCALE=="de-AT"?goog.i18n.DateTimeSymbols_de_AT:goog.LOCALE=="de_CH"||goog.LOCALE=="de-CH"?goog.i18n.DateTimeSymbols_de:
+goog.LOCALE=="el"?goog.i18n.DateTimeSymbols_el:goog.LOCALE=="en"?goog.i18n.DateTimeSymbols_en:goog.LOCALE=="en_AU"||goog.LOCALE=="en-AU"?goog.i18n.DateTimeSymbols_en_AU:goog.LOCALE=="en_GB"||goog.LOCALE=="en-GB"?goog.i18n.DateTimeSymbols_en_GB:goog.LOCALE=="en_IE"||goog.LOCALE=="en-IE"?goog.i18n.DateTimeSymbols_en_IE:goog.LOCALE=="en_IN"||goog.LOCALE=="en-IN"?goog.i18n.DateTimeSymbols_en_IN:goog.LOCALE=="en_SG"||goog.LOCALE=="en-SG"?goog.i18n.DateTimeSymbols_en:goog.LOCALE=="en_US"||goog.LOCALE==
+"en-US"?goog.i18n.DateTimeSymbols_en:goog.LOCALE=="en_ZA"||goog.LOCALE=="en-ZA"?goog.i18n.DateTimeSymbols_en_ZA:goog.LOCALE=="es"?goog.i18n.DateTimeSymbols_es:goog.LOCALE=="et"?goog.i18n.DateTimeSymbols_et:goog.LOCALE=="eu"?goog.i18n.DateTimeSymbols_eu:goog.LOCALE=="fa"?goog.i18n.DateTimeSymbols_fa:goog.LOCALE=="fi"?goog.i18n.DateTimeSymbols_fi:goog.LOCALE=="fil"?goog.i18n.DateTimeSymbols_fil:goog.LOCALE=="fr"?goog.i18n.DateTimeSymbols_fr:goog.LOCALE=="fr_CA"||goog.LOCALE=="fr-CA"?goog.i18n.DateTimeSymbols_fr_CA:
+goog.LOCALE=="gl"?goog.i18n.DateTimeSymbols_gl:goog.LOCALE=="gsw"?goog.i18n.DateTimeSymbols_gsw:goog.LOCALE=="gu"?goog.i18n.DateTimeSymbols_gu:goog.LOCALE=="he"?goog.i18n.DateTimeSymbols_he:goog.LOCALE=="hi"?goog.i18n.DateTimeSymbols_hi:goog.LOCALE=="hr"?goog.i18n.DateTimeSymbols_hr:goog.LOCALE=="hu"?goog.i18n.DateTimeSymbols_hu:goog.LOCALE=="id"?goog.i18n.DateTimeSymbols_id:goog.LOCALE=="in"?goog.i18n.DateTimeSymbols_in:goog.LOCALE=="is"?goog.i18n.DateTimeSymbols_is:goog.LOCALE=="it"?goog.i18n.DateTimeSymbols_it:
+goog.LOCALE=="iw"?goog.i18n.DateTimeSymbols_iw:goog.LOCALE=="ja"?goog.i18n.DateTimeSymbols_ja:goog.LOCALE=="kn"?goog.i18n.DateTimeSymbols_kn:goog.LOCALE=="ko"?goog.i18n.DateTimeSymbols_ko:goog.LOCALE=="ln"?goog.i18n.DateTimeSymbols_ln:goog.LOCALE=="lt"?goog.i18n.DateTimeSymbols_lt:goog.LOCALE=="lv"?goog.i18n.DateTimeSymbols_lv:goog.LOCALE=="ml"?goog.i18n.DateTimeSymbols_ml:goog.LOCALE=="mo"?goog.i18n.DateTimeSymbols_mo:goog.LOCALE=="mr"?goog.i18n.DateTimeSymbols_mr:goog.LOCALE=="ms"?goog.i18n.DateTimeSymbols_ms:
+goog.LOCALE=="mt"?goog.i18n.DateTimeSymbols_mt:goog.LOCALE=="nl"?goog.i18n.DateTimeSymbols_nl:goog.LOCALE=="no"?goog.i18n.DateTimeSymbols_no:goog.LOCALE=="or"?goog.i18n.DateTimeSymbols_or:goog.LOCALE=="pl"?goog.i18n.DateTimeSymbols_pl:goog.LOCALE=="pt"?goog.i18n.DateTimeSymbols_pt:goog.LOCALE=="pt_BR"||goog.LOCALE=="pt-BR"?goog.i18n.DateTimeSymbols_pt:goog.LOCALE=="pt_PT"||goog.LOCALE=="pt-PT"?goog.i18n.DateTimeSymbols_pt_PT:goog.LOCALE=="ro"?goog.i18n.DateTimeSymbols_ro:goog.LOCALE=="ru"?goog.i18n.DateTimeSymbols_ru:
+goog.LOCALE=="sk"?goog.i18n.DateTimeSymbols_sk:goog.LOCALE=="sl"?goog.i18n.DateTimeSymbols_sl:goog.LOCALE=="sq"?goog.i18n.DateTimeSymbols_sq:goog.LOCALE=="sr"?goog.i18n.DateTimeSymbols_sr:goog.LOCALE=="sv"?goog.i18n.DateTimeSymbols_sv:goog.LOCALE=="ta"?goog.i18n.DateTimeSymbols_ta:goog.LOCALE=="te"?goog.i18n.DateTimeSymbols_te:goog.LOCALE=="th"?goog.i18n.DateTimeSymbols_th:goog.LOCALE=="tl"?goog.i18n.DateTimeSymbols_tl:goog.LOCALE=="tr"?goog.i18n.DateTimeSymbols_tr:goog.LOCALE=="uk"?goog.i18n.DateTimeSymbols_uk:
+goog.LOCALE=="ur"?goog.i18n.DateTimeSymbols_ur:goog.LOCALE=="vi"?goog.i18n.DateTimeSymbols_vi:goog.LOCALE=="zh"?goog.i18n.DateTimeSymbols_zh:goog.LOCALE=="zh_CN"||goog.LOCALE=="zh-CN"?goog.i18n.DateTimeSymbols_zh:goog.LOCALE=="zh_HK"||goog.LOCALE=="zh-HK"?goog.i18n.DateTimeSymbols_zh_HK:goog.LOCALE=="zh_TW"||goog.LOCALE=="zh-TW"?goog.i18n.DateTimeSymbols_zh_TW:goog.i18n.DateTimeSymbols_en;goog.i18n.TimeZone=function(){};goog.i18n.TimeZone.MILLISECONDS_PER_HOUR_=3600000;goog.i18n.TimeZone.NameType={STD_SHORT_NAME:0,STD_LONG_NAME:1,DLT_SHORT_NAME:2,DLT_LONG_NAME:3};goog.i18n.TimeZone.createTimeZone=function(b){if(typeof b=="number")return goog.i18n.TimeZone.createSimpleTimeZone_(b);var c=new goog.i18n.TimeZone;c.timeZoneId_=b.id;c.standardOffset_=-b.std_offset;c.tzNames_=b.names;c.transitions_=b.transitions;return c};
+goog.i18n.TimeZone.createSimpleTimeZone_=function(b){var c=new goog.i18n.TimeZone;c.standardOffset_=b;c.timeZoneId_=goog.i18n.TimeZone.composePosixTimeZoneID_(b);b=goog.i18n.TimeZone.composeUTCString_(b);c.tzNames_=[b,b];c.transitions_=[];return c};goog.i18n.TimeZone.composeGMTString_=function(b){var c=["GMT"];c.push(b<=0?"+":"-");b=Math.abs(b);c.push(goog.string.padNumber(Math.floor(b/60)%100,2),":",goog.string.padNumber(b%60,2));return c.join("")};
+goog.i18n.TimeZone.composePosixTimeZoneID_=function(b){if(b==0)return"Etc/GMT";var c=["Etc/GMT",b<0?"-":"+"];b=Math.abs(b);c.push(Math.floor(b/60)%100);b%=60;b!=0&&c.push(":",goog.string.padNumber(b,2));return c.join("")};goog.i18n.TimeZone.composeUTCString_=function(b){if(b==0)return"UTC";var c=["UTC",b<0?"+":"-"];b=Math.abs(b);c.push(Math.floor(b/60)%100);b%=60;b!=0&&c.push(":",b);return c.join("")};a=goog.i18n.TimeZone.prototype;
+a.getDaylightAdjustment=function(b){b=Date.UTC(b.getUTCFullYear(),b.getUTCMonth(),b.getUTCDate(),b.getUTCHours(),b.getUTCMinutes());b=b/goog.i18n.TimeZone.MILLISECONDS_PER_HOUR_;for(var c=0;c<this.transitions_.length&&b>=this.transitions_[c];)c+=2;return c==0?0:this.transitions_[c-1]};a.getGMTString=function(b){return goog.i18n.TimeZone.composeGMTString_(this.getOffset(b))};a.getLongName=function(b){return this.tzNames_[this.isDaylightTime(b)?goog.i18n.TimeZone.NameType.DLT_LONG_NAME:goog.i18n.TimeZone.NameType.STD_LONG_NAME]};
+a.getOffset=function(b){return this.standardOffset_-this.getDaylightAdjustment(b)};a.getRFCTimeZoneString=function(b){b=-this.getOffset(b);var c=[b<0?"-":"+"];b=Math.abs(b);c.push(goog.string.padNumber(Math.floor(b/60)%100,2),goog.string.padNumber(b%60,2));return c.join("")};a.getShortName=function(b){return this.tzNames_[this.isDaylightTime(b)?goog.i18n.TimeZone.NameType.DLT_SHORT_NAME:goog.i18n.TimeZone.NameType.STD_SHORT_NAME]};a.getTimeZoneId=function(){return this.timeZoneId_};
+a.isDaylightTime=function(b){return this.getDaylightAdjustment(b)>0};goog.i18n.DateTimeFormat=function(b){goog.asserts.assert(goog.isDef(b),"Pattern must be defined");this.patternParts_=[];typeof b=="number"?this.applyStandardPattern_(b):this.applyPattern_(b)};goog.i18n.DateTimeFormat.Format={FULL_DATE:0,LONG_DATE:1,MEDIUM_DATE:2,SHORT_DATE:3,FULL_TIME:4,LONG_TIME:5,MEDIUM_TIME:6,SHORT_TIME:7,FULL_DATETIME:8,LONG_DATETIME:9,MEDIUM_DATETIME:10,SHORT_DATETIME:11};
+goog.i18n.DateTimeFormat.TOKENS_=[/^\'(?:[^\']|\'\')*\'/,/^(?:G+|y+|M+|k+|S+|E+|a+|h+|K+|H+|c+|L+|Q+|d+|m+|s+|v+|z+|Z+)/,/^[^\'GyMkSEahKHcLQdmsvzZ]+/];goog.i18n.DateTimeFormat.PartTypes_={QUOTED_STRING:0,FIELD:1,LITERAL:2};a=goog.i18n.DateTimeFormat.prototype;
+a.applyPattern_=function(b){for(;b;)for(var c=0;c<goog.i18n.DateTimeFormat.TOKENS_.length;++c){var d=b.match(goog.i18n.DateTimeFormat.TOKENS_[c]);if(d){d=d[0];b=b.substring(d.length);if(c==goog.i18n.DateTimeFormat.PartTypes_.QUOTED_STRING)if(d=="''")d="'";else{d=d.substring(1,d.length-1);d=d.replace(/\'\'/,"'")}this.patternParts_.push({text:d,type:c});break}}};
+a.format=function(b,c){var d=c?(b.getTimezoneOffset()-c.getOffset(b))*60000:0,e=d?new Date(b.getTime()+d):b,f=e;if(c&&e.getTimezoneOffset()!=b.getTimezoneOffset()){d+=d>0?-86400000:86400000;f=new Date(b.getTime()+d)}d=[];for(var g=0;g<this.patternParts_.length;++g){var h=this.patternParts_[g].text;goog.i18n.DateTimeFormat.PartTypes_.FIELD==this.patternParts_[g].type?d.push(this.formatField_(h,b,e,f,c)):d.push(h)}return d.join("")};
+a.applyStandardPattern_=function(b){if(b<4)b=goog.i18n.DateTimeSymbols.DATEFORMATS[b];else if(b<8)b=goog.i18n.DateTimeSymbols.TIMEFORMATS[b-4];else if(b<12)b=goog.i18n.DateTimeSymbols.DATEFORMATS[b-8]+" "+goog.i18n.DateTimeSymbols.TIMEFORMATS[b-8];else{this.applyStandardPattern_(goog.i18n.DateTimeFormat.Format.MEDIUM_DATETIME);return}this.applyPattern_(b)};a.formatEra_=function(b,c){c=c.getFullYear()>0?1:0;return b>=4?goog.i18n.DateTimeSymbols.ERANAMES[c]:goog.i18n.DateTimeSymbols.ERAS[c]};
+a.formatYear_=function(b,c){c=c.getFullYear();if(c<0)c=-c;return b==2?goog.string.padNumber(c%100,2):String(c)};a.formatMonth_=function(b,c){c=c.getMonth();switch(b){case 5:return goog.i18n.DateTimeSymbols.NARROWMONTHS[c];case 4:return goog.i18n.DateTimeSymbols.MONTHS[c];case 3:return goog.i18n.DateTimeSymbols.SHORTMONTHS[c];default:return goog.string.padNumber(c+1,b)}};a.format24Hours_=function(b,c){return goog.string.padNumber(c.getHours()||24,b)};
+a.formatFractionalSeconds_=function(b,c){c=c.getTime()%1000/1000;return c.toFixed(Math.min(3,b)).substr(2)+(b>3?goog.string.padNumber(0,b-3):"")};a.formatDayOfWeek_=function(b,c){c=c.getDay();return b>=4?goog.i18n.DateTimeSymbols.WEEKDAYS[c]:goog.i18n.DateTimeSymbols.SHORTWEEKDAYS[c]};a.formatAmPm_=function(b,c){b=c.getHours();return goog.i18n.DateTimeSymbols.AMPMS[b>=12&&b<24?1:0]};a.format1To12Hours_=function(b,c){return goog.string.padNumber(c.getHours()%12||12,b)};
+a.format0To11Hours_=function(b,c){return goog.string.padNumber(c.getHours()%12,b)};a.format0To23Hours_=function(b,c){return goog.string.padNumber(c.getHours(),b)};a.formatStandaloneDay_=function(b,c){c=c.getDay();switch(b){case 5:return goog.i18n.DateTimeSymbols.STANDALONENARROWWEEKDAYS[c];case 4:return goog.i18n.DateTimeSymbols.STANDALONEWEEKDAYS[c];case 3:return goog.i18n.DateTimeSymbols.STANDALONESHORTWEEKDAYS[c];default:return goog.string.padNumber(c,1)}};
+a.formatStandaloneMonth_=function(b,c){c=c.getMonth();switch(b){case 5:return goog.i18n.DateTimeSymbols.STANDALONENARROWMONTHS[c];case 4:return goog.i18n.DateTimeSymbols.STANDALONEMONTHS[c];case 3:return goog.i18n.DateTimeSymbols.STANDALONESHORTMONTHS[c];default:return goog.string.padNumber(c+1,b)}};a.formatQuarter_=function(b,c){c=Math.floor(c.getMonth()/3);return b<4?goog.i18n.DateTimeSymbols.SHORTQUARTERS[c]:goog.i18n.DateTimeSymbols.QUARTERS[c]};
+a.formatDate_=function(b,c){return goog.string.padNumber(c.getDate(),b)};a.formatMinutes_=function(b,c){return goog.string.padNumber(c.getMinutes(),b)};a.formatSeconds_=function(b,c){return goog.string.padNumber(c.getSeconds(),b)};a.formatTimeZoneRFC_=function(b,c,d){d=d||goog.i18n.TimeZone.createTimeZone(c.getTimezoneOffset());return b<4?d.getRFCTimeZoneString(c):d.getGMTString(c)};
+a.formatTimeZone_=function(b,c,d){d=d||goog.i18n.TimeZone.createTimeZone(c.getTimezoneOffset());return b<4?d.getShortName(c):d.getLongName(c)};a.formatTimeZoneId_=function(b,c){c=c||goog.i18n.TimeZone.createTimeZone(b.getTimezoneOffset());return c.getTimeZoneId()};
+a.formatField_=function(b,c,d,e,f){var g=b.length;switch(b.charAt(0)){case "G":return this.formatEra_(g,d);case "y":return this.formatYear_(g,d);case "M":return this.formatMonth_(g,d);case "k":return this.format24Hours_(g,e);case "S":return this.formatFractionalSeconds_(g,e);case "E":return this.formatDayOfWeek_(g,d);case "a":return this.formatAmPm_(g,e);case "h":return this.format1To12Hours_(g,e);case "K":return this.format0To11Hours_(g,e);case "H":return this.format0To23Hours_(g,e);case "c":return this.formatStandaloneDay_(g,
+d);case "L":return this.formatStandaloneMonth_(g,d);case "Q":return this.formatQuarter_(g,d);case "d":return this.formatDate_(g,d);case "m":return this.formatMinutes_(g,e);case "s":return this.formatSeconds_(g,e);case "v":return this.formatTimeZoneId_(c,f);case "z":return this.formatTimeZone_(g,c,f);case "Z":return this.formatTimeZoneRFC_(g,c,f);default:return""}};goog.i18n.DateTimeParse=function(b){this.patternParts_=[];typeof b=="number"?this.applyStandardPattern_(b):this.applyPattern_(b)};goog.i18n.DateTimeParse.ambiguousYearCenturyStart=80;a=goog.i18n.DateTimeParse.prototype;
+a.applyPattern_=function(b){for(var c=false,d="",e=0;e<b.length;e++){var f=b.charAt(e);if(f==" "){if(d.length>0){this.patternParts_.push({text:d,count:0,abutStart:false});d=""}for(this.patternParts_.push({text:" ",count:0,abutStart:false});e<b.length-1&&b.charAt(e+1)==" ";)e++}else if(c)if(f=="'")if(e+1<b.length&&b.charAt(e+1)=="'"){d+="'";e++}else c=false;else d+=f;else if(goog.i18n.DateTimeParse.PATTERN_CHARS_.indexOf(f)>=0){if(d.length>0){this.patternParts_.push({text:d,count:0,abutStart:false});
+d=""}var g=this.getNextCharCount_(b,e);this.patternParts_.push({text:f,count:g,abutStart:false});e+=g-1}else if(f=="'")if(e+1<b.length&&b.charAt(e+1)=="'"){d+="'";e++}else c=true;else d+=f}d.length>0&&this.patternParts_.push({text:d,count:0,abutStart:false});this.markAbutStart_()};
+a.applyStandardPattern_=function(b){if(b>goog.i18n.DateTimeFormat.Format.SHORT_DATETIME)b=goog.i18n.DateTimeFormat.Format.MEDIUM_DATETIME;b=b<4?goog.i18n.DateTimeSymbols.DATEFORMATS[b]:b<8?goog.i18n.DateTimeSymbols.TIMEFORMATS[b-4]:goog.i18n.DateTimeSymbols.DATEFORMATS[b-8]+" "+goog.i18n.DateTimeSymbols.TIMEFORMATS[b-8];this.applyPattern_(b)};a.parse=function(b,c,d){d=d||0;return this.internalParse_(b,c,d,false)};a.strictParse=function(b,c,d){d=d||0;return this.internalParse_(b,c,d,true)};
+a.internalParse_=function(b,c,d,e){for(var f=new goog.i18n.DateTimeParse.MyDate_,g=[d],h=-1,i=0,j=0,k=0;k<this.patternParts_.length;k++)if(this.patternParts_[k].count>0){if(h<0&&this.patternParts_[k].abutStart){h=k;i=d;j=0}if(h>=0){var l=this.patternParts_[k].count;if(k==h){l-=j;j++;if(l==0)return 0}if(!this.subParse_(b,g,this.patternParts_[k],l,f)){k=h-1;g[0]=i}}else{h=-1;if(!this.subParse_(b,g,this.patternParts_[k],0,f))return 0}}else{h=-1;if(this.patternParts_[k].text.charAt(0)==" "){l=g[0];this.skipSpace_(b,
+g);if(g[0]>l)continue}else if(b.indexOf(this.patternParts_[k].text,g[0])==g[0]){g[0]+=this.patternParts_[k].text.length;continue}return 0}return f.calcDate_(c,e)?g[0]-d:0};a.getNextCharCount_=function(b,c){for(var d=b.charAt(c),e=c+1;e<b.length&&b.charAt(e)==d;)e++;return e-c};goog.i18n.DateTimeParse.PATTERN_CHARS_="GyMdkHmsSEDahKzZvQ";goog.i18n.DateTimeParse.NUMERIC_FORMAT_CHARS_="MydhHmsSDkK";a=goog.i18n.DateTimeParse.prototype;
+a.isNumericField_=function(b){if(b.count<=0)return false;var c=goog.i18n.DateTimeParse.NUMERIC_FORMAT_CHARS_.indexOf(b.text.charAt(0));return c>0||c==0&&b.count<3};a.markAbutStart_=function(){for(var b=false,c=0;c<this.patternParts_.length;c++)if(this.isNumericField_(this.patternParts_[c])){if(!b&&c+1<this.patternParts_.length&&this.isNumericField_(this.patternParts_[c+1])){b=true;this.patternParts_[c].abutStart=true}}else b=false};
+a.skipSpace_=function(b,c){if(b=b.substring(c[0]).match(/^\s+/))c[0]+=b[0].length};
+a.subParse_=function(b,c,d,e,f){this.skipSpace_(b,c);var g=c[0],h=d.text.charAt(0),i=-1;if(this.isNumericField_(d))if(e>0){if(g+e>b.length)return false;i=this.parseInt_(b.substring(0,g+e),c)}else i=this.parseInt_(b,c);switch(h){case "G":f.era=this.matchString_(b,c,goog.i18n.DateTimeSymbols.ERAS);return true;case "M":return this.subParseMonth_(b,c,f,i);case "E":return this.subParseDayOfWeek_(b,c,f);case "a":f.ampm=this.matchString_(b,c,goog.i18n.DateTimeSymbols.AMPMS);return true;case "y":return this.subParseYear_(b,
+c,g,i,d,f);case "Q":return this.subParseQuarter_(b,c,f,i);case "d":f.day=i;return true;case "S":return this.subParseFractionalSeconds_(i,c,g,f);case "h":if(i==12)i=0;case "K":case "H":case "k":f.hours=i;return true;case "m":f.minutes=i;return true;case "s":f.seconds=i;return true;case "z":case "Z":case "v":return this.subparseTimeZoneInGMT_(b,c,f);default:return false}};
+a.subParseYear_=function(b,c,d,e,f,g){var h;if(e<0){h=b.charAt(c[0]);if(h!="+"&&h!="-")return false;c[0]++;e=this.parseInt_(b,c);if(e<0)return false;if(h=="-")e=-e}if(!h&&c[0]-d==2&&f.count==2)g.setTwoDigitYear_(e);else g.year=e;return true};a.subParseMonth_=function(b,c,d,e){if(e<0){e=this.matchString_(b,c,goog.i18n.DateTimeSymbols.MONTHS);if(e<0)e=this.matchString_(b,c,goog.i18n.DateTimeSymbols.SHORTMONTHS);if(e<0)return false;d.month=e}else d.month=e-1;return true};
+a.subParseQuarter_=function(b,c,d,e){if(e<0){e=this.matchString_(b,c,goog.i18n.DateTimeSymbols.QUARTERS);if(e<0)e=this.matchString_(b,c,goog.i18n.DateTimeSymbols.SHORTQUARTERS);if(e<0)return false;d.month=e*3;d.day=1;return true}return false};a.subParseDayOfWeek_=function(b,c,d){var e=this.matchString_(b,c,goog.i18n.DateTimeSymbols.WEEKDAYS);if(e<0)e=this.matchString_(b,c,goog.i18n.DateTimeSymbols.SHORTWEEKDAYS);if(e<0)return false;d.dayOfWeek=e;return true};
+a.subParseFractionalSeconds_=function(b,c,d,e){c=c[0]-d;e.milliseconds=c<3?b*Math.pow(10,3-c):Math.round(b/Math.pow(10,c-3));return true};a.subparseTimeZoneInGMT_=function(b,c,d){if(b.indexOf("GMT",c[0])==c[0]){c[0]+=3;return this.parseTimeZoneOffset_(b,c,d)}return this.parseTimeZoneOffset_(b,c,d)};
+a.parseTimeZoneOffset_=function(b,c,d){if(c[0]>=b.length){d.tzOffset=0;return true}var e=1;switch(b.charAt(c[0])){case "-":e=-1;case "+":c[0]++}var f=c[0],g=this.parseInt_(b,c);if(g==0&&c[0]==f)return false;var h;if(c[0]<b.length&&b.charAt(c[0])==":"){h=g*60;c[0]++;f=c[0];g=this.parseInt_(b,c);if(g==0&&c[0]==f)return false;h+=g}else{h=g;if(h<24&&c[0]-f<=2)h*=60;else h=h%100+h/100*60}h*=e;d.tzOffset=-h;return true};
+a.parseInt_=function(b,c){b=b.substring(c[0]).match(/^\d+/);if(!b)return-1;c[0]+=b[0].length;return parseInt(b[0],10)};a.matchString_=function(b,c,d){var e=0,f=-1;b=b.substring(c[0]).toLowerCase();for(var g=0;g<d.length;g++){var h=d[g].length;if(h>e&&b.indexOf(d[g].toLowerCase())==0){f=g;e=h}}if(f>=0)c[0]+=e;return f};goog.i18n.DateTimeParse.MyDate_=function(){};
+goog.i18n.DateTimeParse.MyDate_.prototype.setTwoDigitYear_=function(b){var c=new Date;c=c.getFullYear()-goog.i18n.DateTimeParse.ambiguousYearCenturyStart;var d=c%100;this.ambiguousYear=b==d;b+=Math.floor(c/100)*100+(b<d?100:0);return this.year=b};
+goog.i18n.DateTimeParse.MyDate_.prototype.calcDate_=function(b,c){if(this.era!=undefined&&this.year!=undefined&&this.era==0&&this.year>0)this.year=-(this.year-1);this.year!=undefined&&b.setFullYear(this.year);var d=b.getDate();b.setDate(1);this.month!=undefined&&b.setMonth(this.month);this.day!=undefined?b.setDate(this.day):b.setDate(d);if(this.hours==undefined)this.hours=b.getHours();if(this.ampm!=undefined&&this.ampm>0)if(this.hours<12)this.hours+=12;b.setHours(this.hours);this.minutes!=undefined&&
+b.setMinutes(this.minutes);this.seconds!=undefined&&b.setSeconds(this.seconds);this.milliseconds!=undefined&&b.setMilliseconds(this.milliseconds);if(c&&(this.year!=undefined&&this.year!=b.getFullYear()||this.month!=undefined&&this.month!=b.getMonth()||this.day!=undefined&&this.day!=b.getDate()||this.hours>=24||this.minutes>=60||this.seconds>=60||this.milliseconds>=1000))return false;if(this.tzOffset!=undefined){c=b.getTimezoneOffset();b.setTime(b.getTime()+(this.tzOffset-c)*60*1000)}if(this.ambiguousYear){c=
+new Date;c.setFullYear(c.getFullYear()-goog.i18n.DateTimeParse.ambiguousYearCenturyStart);b.getTime()<c.getTime()&&b.setFullYear(c.getFullYear()+100)}if(this.dayOfWeek!=undefined)if(this.day==undefined){c=(7+this.dayOfWeek-b.getDay())%7;if(c>3)c-=7;d=b.getMonth();b.setDate(b.getDate()+c);if(b.getMonth()!=d)b.setDate(b.getDate()+(c>0?-7:7))}else if(this.dayOfWeek!=b.getDay())return false;return true};goog.debug={};goog.debug.errorHandlerWeakDep={protectEntryPoint:function(b){return b}};goog.Disposable=function(){};a=goog.Disposable.prototype;a.disposed_=false;a.isDisposed=function(){return this.disposed_};a.getDisposed=goog.Disposable.prototype.isDisposed;a.dispose=function(){if(!this.disposed_){this.disposed_=true;this.disposeInternal()}};a.disposeInternal=function(){};goog.dispose=function(b){b&&typeof b.dispose=="function"&&b.dispose()};goog.events={};goog.events.Event=function(b,c){goog.Disposable.call(this);this.type=b;this.currentTarget=this.target=c};goog.inherits(goog.events.Event,goog.Disposable);a=goog.events.Event.prototype;a.disposeInternal=function(){delete this.type;delete this.target;delete this.currentTarget};a.propagationStopped_=false;a.returnValue_=true;a.stopPropagation=function(){this.propagationStopped_=true};a.preventDefault=function(){this.returnValue_=false};goog.events.BrowserEvent=function(b,c){b&&this.init(b,c)};goog.inherits(goog.events.BrowserEvent,goog.events.Event);goog.events.BrowserEvent.MouseButton={LEFT:0,MIDDLE:1,RIGHT:2};goog.events.BrowserEvent.IEButtonMap_=[1,4,2];a=goog.events.BrowserEvent.prototype;a.target=null;a.relatedTarget=null;a.offsetX=0;a.offsetY=0;a.clientX=0;a.clientY=0;a.screenX=0;a.screenY=0;a.button=0;a.keyCode=0;a.charCode=0;a.ctrlKey=false;a.altKey=false;a.shiftKey=false;a.metaKey=false;a.event_=null;
+a.init=function(b,c){var d=this.type=b.type;this.target=b.target||b.srcElement;this.currentTarget=c;if(c=b.relatedTarget){if(goog.userAgent.GECKO)try{c=c.nodeName&&c}catch(e){}}else if(d=="mouseover")c=b.fromElement;else if(d=="mouseout")c=b.toElement;this.relatedTarget=c;this.offsetX=b.offsetX!==undefined?b.offsetX:b.layerX;this.offsetY=b.offsetY!==undefined?b.offsetY:b.layerY;this.clientX=b.clientX!==undefined?b.clientX:b.pageX;this.clientY=b.clientY!==undefined?b.clientY:b.pageY;this.screenX=b.screenX||
+0;this.screenY=b.screenY||0;this.button=b.button;this.keyCode=b.keyCode||0;this.charCode=b.charCode||(d=="keypress"?b.keyCode:0);this.ctrlKey=b.ctrlKey;this.altKey=b.altKey;this.shiftKey=b.shiftKey;this.metaKey=b.metaKey;this.event_=b;delete this.returnValue_;delete this.propagationStopped_};a.isButton=function(b){return goog.userAgent.IE?this.type=="click"?b==goog.events.BrowserEvent.MouseButton.LEFT:!!(this.event_.button&goog.events.BrowserEvent.IEButtonMap_[b]):this.event_.button==b};
+a.stopPropagation=function(){this.propagationStopped_=true;if(this.event_.stopPropagation)this.event_.stopPropagation();else this.event_.cancelBubble=true};goog.events.BrowserEvent.IE7_SET_KEY_CODE_TO_PREVENT_DEFAULT_=goog.userAgent.IE&&!goog.userAgent.isVersion("8");
+goog.events.BrowserEvent.prototype.preventDefault=function(){this.returnValue_=false;var b=this.event_;if(b.preventDefault)b.preventDefault();else{b.returnValue=false;if(goog.events.BrowserEvent.IE7_SET_KEY_CODE_TO_PREVENT_DEFAULT_)try{var c=112,d=123;if(b.ctrlKey||b.keyCode>=c&&b.keyCode<=d)b.keyCode=-1}catch(e){}}};goog.events.BrowserEvent.prototype.getBrowserEvent=function(){return this.event_};
+goog.events.BrowserEvent.prototype.disposeInternal=function(){goog.events.BrowserEvent.superClass_.disposeInternal.call(this);this.relatedTarget=this.currentTarget=this.target=this.event_=null};goog.events.EventWrapper=function(){};goog.events.EventWrapper.prototype.listen=function(){};goog.events.EventWrapper.prototype.unlisten=function(){};goog.events.Listener=function(){};goog.events.Listener.counter_=0;a=goog.events.Listener.prototype;a.key=0;a.removed=false;a.callOnce=false;
+a.init=function(b,c,d,e,f,g){if(goog.isFunction(b))this.isFunctionListener_=true;else if(b&&b.handleEvent&&goog.isFunction(b.handleEvent))this.isFunctionListener_=false;else throw Error("Invalid listener argument");this.listener=b;this.proxy=c;this.src=d;this.type=e;this.capture=!!f;this.handler=g;this.callOnce=false;this.key=++goog.events.Listener.counter_;this.removed=false};
+a.handleEvent=function(b){if(this.isFunctionListener_)return this.listener.call(this.handler||this.src,b);return this.listener.handleEvent.call(this.listener,b)};goog.structs={};goog.structs.SimplePool=function(b,c){goog.Disposable.call(this);this.maxCount_=c;this.freeQueue_=[];this.createInitial_(b)};goog.inherits(goog.structs.SimplePool,goog.Disposable);a=goog.structs.SimplePool.prototype;a.createObjectFn_=null;a.disposeObjectFn_=null;a.setCreateObjectFn=function(b){this.createObjectFn_=b};a.setDisposeObjectFn=function(b){this.disposeObjectFn_=b};a.getObject=function(){if(this.freeQueue_.length)return this.freeQueue_.pop();return this.createObject()};
+a.releaseObject=function(b){this.freeQueue_.length<this.maxCount_?this.freeQueue_.push(b):this.disposeObject(b)};a.createInitial_=function(b){if(b>this.maxCount_)throw Error("[goog.structs.SimplePool] Initial cannot be greater than max");for(var c=0;c<b;c++)this.freeQueue_.push(this.createObject())};a.createObject=function(){return this.createObjectFn_?this.createObjectFn_():{}};
+a.disposeObject=function(b){if(this.disposeObjectFn_)this.disposeObjectFn_(b);else if(goog.isFunction(b.dispose))b.dispose();else for(var c in b)delete b[c]};a.disposeInternal=function(){goog.structs.SimplePool.superClass_.disposeInternal.call(this);for(var b=this.freeQueue_;b.length;)this.disposeObject(b.pop());delete this.freeQueue_};goog.userAgent.jscript={};goog.userAgent.jscript.ASSUME_NO_JSCRIPT=false;goog.userAgent.jscript.init_=function(){var b="ScriptEngine"in goog.global;goog.userAgent.jscript.DETECTED_HAS_JSCRIPT_=b&&goog.global.ScriptEngine()=="JScript";goog.userAgent.jscript.DETECTED_VERSION_=goog.userAgent.jscript.DETECTED_HAS_JSCRIPT_?goog.global.ScriptEngineMajorVersion()+"."+goog.global.ScriptEngineMinorVersion()+"."+goog.global.ScriptEngineBuildVersion():"0"};goog.userAgent.jscript.ASSUME_NO_JSCRIPT||goog.userAgent.jscript.init_();
+goog.userAgent.jscript.HAS_JSCRIPT=goog.userAgent.jscript.ASSUME_NO_JSCRIPT?false:goog.userAgent.jscript.DETECTED_HAS_JSCRIPT_;goog.userAgent.jscript.VERSION=goog.userAgent.jscript.ASSUME_NO_JSCRIPT?"0":goog.userAgent.jscript.DETECTED_VERSION_;goog.userAgent.jscript.isVersion=function(b){return goog.string.compareVersions(goog.userAgent.jscript.VERSION,b)>=0};goog.events.pools={};
+(function(){var b=goog.userAgent.jscript.HAS_JSCRIPT&&!goog.userAgent.jscript.isVersion("5.7");function c(){return{count_:0,remaining_:0}}function d(){return[]}var e;goog.events.pools.setProxyCallbackFunction=function(n){e=n};function f(){function n(p){return e.call(n.src,n.key,p)}return n}function g(){return new goog.events.Listener}function h(){return new goog.events.BrowserEvent}if(b){goog.events.pools.getObject=function(){return j.getObject()};goog.events.pools.releaseObject=function(n){j.releaseObject(n)};
+goog.events.pools.getArray=function(){return k.getObject()};goog.events.pools.releaseArray=function(n){k.releaseObject(n)};goog.events.pools.getProxy=function(){return l.getObject()};goog.events.pools.releaseProxy=function(){l.releaseObject(f())};goog.events.pools.getListener=function(){return m.getObject()};goog.events.pools.releaseListener=function(n){m.releaseObject(n)};goog.events.pools.getEvent=function(){return o.getObject()};goog.events.pools.releaseEvent=function(n){o.releaseObject(n)};b=
+0;var i=600,j=new goog.structs.SimplePool(b,i);j.setCreateObjectFn(c);b=0;i=600;var k=new goog.structs.SimplePool(b,i);k.setCreateObjectFn(d);b=0;i=600;var l=new goog.structs.SimplePool(b,i);l.setCreateObjectFn(f);b=0;i=600;var m=new goog.structs.SimplePool(b,i);m.setCreateObjectFn(g);b=0;i=600;var o=new goog.structs.SimplePool(b,i);o.setCreateObjectFn(h)}else{goog.events.pools.getObject=c;goog.events.pools.releaseObject=goog.nullFunction;goog.events.pools.getArray=d;goog.events.pools.releaseArray=
+goog.nullFunction;goog.events.pools.getProxy=f;goog.events.pools.releaseProxy=goog.nullFunction;goog.events.pools.getListener=g;goog.events.pools.releaseListener=goog.nullFunction;goog.events.pools.getEvent=h;goog.events.pools.releaseEvent=goog.nullFunction}})();goog.events.listeners_={};goog.events.listenerTree_={};goog.events.sources_={};goog.events.onString_="on";goog.events.onStringMap_={};goog.events.keySeparator_="_";
+goog.events.listen=function(b,c,d,e,f){if(c)if(goog.isArray(c)){for(var g=0;g<c.length;g++)goog.events.listen(b,c[g],d,e,f);return null}else{e=!!e;var h=goog.events.listenerTree_;c in h||(h[c]=goog.events.pools.getObject());h=h[c];if(!(e in h)){h[e]=goog.events.pools.getObject();h.count_++}h=h[e];var i=goog.getHashCode(b),j;h.remaining_++;if(h[i]){j=h[i];for(g=0;g<j.length;g++){h=j[g];if(h.listener==d&&h.handler==f){if(h.removed)break;return j[g].key}}}else{j=h[i]=goog.events.pools.getArray();h.count_++}g=
+goog.events.pools.getProxy();g.src=b;h=goog.events.pools.getListener();h.init(d,g,b,c,e,f);d=h.key;g.key=d;j.push(h);goog.events.listeners_[d]=h;goog.events.sources_[i]||(goog.events.sources_[i]=goog.events.pools.getArray());goog.events.sources_[i].push(h);if(b.addEventListener){if(b==goog.global||!b.customEvent_)b.addEventListener(c,g,e)}else b.attachEvent(goog.events.getOnString_(c),g);return d}else throw Error("Invalid event type");};
+goog.events.listenOnce=function(b,c,d,e,f){if(goog.isArray(c)){for(var g=0;g<c.length;g++)goog.events.listenOnce(b,c[g],d,e,f);return null}b=goog.events.listen(b,c,d,e,f);c=goog.events.listeners_[b];c.callOnce=true;return b};goog.events.listenWithWrapper=function(b,c,d,e,f){c.listen(b,d,e,f)};
+goog.events.unlisten=function(b,c,d,e,f){if(goog.isArray(c)){for(var g=0;g<c.length;g++)goog.events.unlisten(b,c[g],d,e,f);return null}e=!!e;b=goog.events.getListeners_(b,c,e);if(!b)return false;for(g=0;g<b.length;g++)if(b[g].listener==d&&b[g].capture==e&&b[g].handler==f)return goog.events.unlistenByKey(b[g].key);return false};
+goog.events.unlistenByKey=function(b){if(!goog.events.listeners_[b])return false;var c=goog.events.listeners_[b];if(c.removed)return false;var d=c.src,e=c.type,f=c.proxy,g=c.capture;if(d.removeEventListener){if(d==goog.global||!d.customEvent_)d.removeEventListener(e,f,g)}else d.detachEvent&&d.detachEvent(goog.events.getOnString_(e),f);d=goog.getHashCode(d);f=goog.events.listenerTree_[e][g][d];if(goog.events.sources_[d]){var h=goog.events.sources_[d];goog.array.remove(h,c);h.length==0&&delete goog.events.sources_[d]}c.removed=
+true;f.needsCleanup_=true;goog.events.cleanUp_(e,g,d,f);delete goog.events.listeners_[b];return true};goog.events.unlistenWithWrapper=function(b,c,d,e,f){c.unlisten(b,d,e,f)};
+goog.events.cleanUp_=function(b,c,d,e){if(!e.locked_)if(e.needsCleanup_){for(var f=0,g=0;f<e.length;f++)if(e[f].removed){var h=e[f].proxy;h.src=null;goog.events.pools.releaseProxy(h);goog.events.pools.releaseListener(e[f])}else{if(f!=g)e[g]=e[f];g++}e.length=g;e.needsCleanup_=false;if(g==0){goog.events.pools.releaseArray(e);delete goog.events.listenerTree_[b][c][d];goog.events.listenerTree_[b][c].count_--;if(goog.events.listenerTree_[b][c].count_==0){goog.events.pools.releaseObject(goog.events.listenerTree_[b][c]);
+delete goog.events.listenerTree_[b][c];goog.events.listenerTree_[b].count_--}if(goog.events.listenerTree_[b].count_==0){goog.events.pools.releaseObject(goog.events.listenerTree_[b]);delete goog.events.listenerTree_[b]}}}};
+goog.events.removeAll=function(b,c,d){var e=0,f=b==null,g=c==null,h=d==null;d=!!d;if(f)goog.object.forEach(goog.events.sources_,function(j){for(var k=j.length-1;k>=0;k--){var l=j[k];if((g||c==l.type)&&(h||d==l.capture)){goog.events.unlistenByKey(l.key);e++}}});else{b=goog.getHashCode(b);if(goog.events.sources_[b]){b=goog.events.sources_[b];for(f=b.length-1;f>=0;f--){var i=b[f];if((g||c==i.type)&&(h||d==i.capture)){goog.events.unlistenByKey(i.key);e++}}}}return e};
+goog.events.getListeners=function(b,c,d){return goog.events.getListeners_(b,c,d)||[]};goog.events.getListeners_=function(b,c,d){var e=goog.events.listenerTree_;if(c in e){e=e[c];if(d in e){e=e[d];b=goog.getHashCode(b);if(e[b])return e[b]}}return null};goog.events.getListener=function(b,c,d,e,f){e=!!e;if(b=goog.events.getListeners_(b,c,e))for(c=0;c<b.length;c++)if(b[c].listener==d&&b[c].capture==e&&b[c].handler==f)return b[c];return null};
+goog.events.hasListener=function(b,c,d){b=goog.getHashCode(b);var e=goog.events.sources_[b];if(e){var f=goog.isDef(c),g=goog.isDef(d);if(f&&g){e=goog.events.listenerTree_[c];return!!e&&!!e[d]&&b in e[d]}else return f||g?goog.array.some(e,function(h){return f&&h.type==c||g&&h.capture==d}):true}return false};goog.events.expose=function(b){var c=[];for(var d in b)b[d]&&b[d].id?c.push(d+" = "+b[d]+" ("+b[d].id+")"):c.push(d+" = "+b[d]);return c.join("\n")};
+goog.events.EventType={CLICK:"click",DBLCLICK:"dblclick",MOUSEDOWN:"mousedown",MOUSEUP:"mouseup",MOUSEOVER:"mouseover",MOUSEOUT:"mouseout",MOUSEMOVE:"mousemove",SELECTSTART:"selectstart",KEYPRESS:"keypress",KEYDOWN:"keydown",KEYUP:"keyup",BLUR:"blur",FOCUS:"focus",DEACTIVATE:"deactivate",FOCUSIN:goog.userAgent.IE?"focusin":"DOMFocusIn",FOCUSOUT:goog.userAgent.IE?"focusout":"DOMFocusOut",CHANGE:"change",SELECT:"select",SUBMIT:"submit",CONTEXTMENU:"contextmenu",DRAGSTART:"dragstart",ERROR:"error",HASHCHANGE:"hashchange",
+HELP:"help",LOAD:"load",LOSECAPTURE:"losecapture",READYSTATECHANGE:"readystatechange",RESIZE:"resize",SCROLL:"scroll",UNLOAD:"unload"};goog.events.getOnString_=function(b){if(b in goog.events.onStringMap_)return goog.events.onStringMap_[b];return goog.events.onStringMap_[b]=goog.events.onString_+b};goog.events.fireListeners=function(b,c,d,e){var f=goog.events.listenerTree_;if(c in f){f=f[c];if(d in f)return goog.events.fireListeners_(f[d],b,c,d,e)}return true};
+goog.events.fireListeners_=function(b,c,d,e,f){var g=1;c=goog.getHashCode(c);if(b[c]){b.remaining_--;b=b[c];if(b.locked_)b.locked_++;else b.locked_=1;try{for(var h=b.length,i=0;i<h;i++){var j=b[i];if(j&&!j.removed)g&=goog.events.fireListener(j,f)!==false}}finally{b.locked_--;goog.events.cleanUp_(d,e,c,b)}}return Boolean(g)};goog.events.fireListener=function(b,c){c=b.handleEvent(c);b.callOnce&&goog.events.unlistenByKey(b.key);return c};goog.events.getTotalListenerCount=function(){return goog.object.getCount(goog.events.listeners_)};
+goog.events.dispatchEvent=function(b,c){if(goog.isString(c))c=new goog.events.Event(c,b);else if(c instanceof goog.events.Event)c.target=c.target||b;else{var d=c;c=new goog.events.Event(c.type,b);goog.object.extend(c,d)}d=1;var e,f=c.type,g=goog.events.listenerTree_;if(!(f in g))return true;g=g[f];f=true in g;var h;if(f){e=[];for(h=b;h;h=h.getParentEventTarget())e.push(h);h=g[true];h.remaining_=h.count_;for(var i=e.length-1;!c.propagationStopped_&&i>=0&&h.remaining_;i--){c.currentTarget=e[i];d&=goog.events.fireListeners_(h,
+e[i],c.type,true,c)&&c.returnValue_!=false}}if(h=false in g){h=g[false];h.remaining_=h.count_;if(f)for(i=0;!c.propagationStopped_&&i<e.length&&h.remaining_;i++){c.currentTarget=e[i];d&=goog.events.fireListeners_(h,e[i],c.type,false,c)&&c.returnValue_!=false}else for(b=b;!c.propagationStopped_&&b&&h.remaining_;b=b.getParentEventTarget()){c.currentTarget=b;d&=goog.events.fireListeners_(h,b,c.type,false,c)&&c.returnValue_!=false}}return Boolean(d)};
+goog.events.protectBrowserEventEntryPoint=function(b,c){goog.events.handleBrowserEvent_=b.protectEntryPoint(goog.events.handleBrowserEvent_,c);goog.events.pools.setProxyCallbackFunction(goog.events.handleBrowserEvent_)};
+goog.events.handleBrowserEvent_=function(b,c){if(!goog.events.listeners_[b])return true;b=goog.events.listeners_[b];var d=b.type,e=goog.events.listenerTree_;if(!(d in e))return true;e=e[d];var f,g;if(goog.userAgent.IE){f=c||goog.getObjectByName("window.event");c=true in e;var h=false in e;if(c){if(goog.events.isMarkedIeEvent_(f))return true;goog.events.markIeEvent_(f)}var i=goog.events.pools.getEvent();i.init(f,this);f=true;try{if(c){for(var j=goog.events.pools.getArray(),k=i.currentTarget;k;k=k.parentNode)j.push(k);
+g=e[true];g.remaining_=g.count_;for(var l=j.length-1;!i.propagationStopped_&&l>=0&&g.remaining_;l--){i.currentTarget=j[l];f&=goog.events.fireListeners_(g,j[l],d,true,i)}if(h){g=e[false];g.remaining_=g.count_;for(l=0;!i.propagationStopped_&&l<j.length&&g.remaining_;l++){i.currentTarget=j[l];f&=goog.events.fireListeners_(g,j[l],d,false,i)}}}else f=goog.events.fireListener(b,i)}finally{if(j){j.length=0;goog.events.pools.releaseArray(j)}i.dispose();goog.events.pools.releaseEvent(i)}return f}g=new goog.events.BrowserEvent(c,
+this);try{f=goog.events.fireListener(b,g)}finally{g.dispose()}return f};goog.events.pools.setProxyCallbackFunction(goog.events.handleBrowserEvent_);goog.events.markIeEvent_=function(b){var c=false;if(b.keyCode==0)try{b.keyCode=-1;return}catch(d){c=true}if(c||b.returnValue==undefined)b.returnValue=true};goog.events.isMarkedIeEvent_=function(b){return b.keyCode<0||b.returnValue!=undefined};goog.events.uniqueIdCounter_=0;goog.events.getUniqueId=function(b){return b+"_"+goog.events.uniqueIdCounter_++};goog.events.EventHandler=function(b){this.handler_=b};goog.inherits(goog.events.EventHandler,goog.Disposable);goog.events.EventHandler.KEY_POOL_INITIAL_COUNT=0;goog.events.EventHandler.KEY_POOL_MAX_COUNT=100;goog.events.EventHandler.keyPool_=new goog.structs.SimplePool(goog.events.EventHandler.KEY_POOL_INITIAL_COUNT,goog.events.EventHandler.KEY_POOL_MAX_COUNT);goog.events.EventHandler.keys_=null;goog.events.EventHandler.key_=null;a=goog.events.EventHandler.prototype;
+a.listen=function(b,c,d,e,f){if(goog.isArray(c))for(var g=0;g<c.length;g++)this.listen(b,c[g],d,e,f);else{b=goog.events.listen(b,c,d||this,e||false,f||this.handler_||this);this.recordListenerKey_(b)}return this};a.listenOnce=function(b,c,d,e,f){if(goog.isArray(c))for(var g=0;g<c.length;g++)this.listenOnce(b,c[g],d,e,f);else{b=goog.events.listenOnce(b,c,d||this,e||false,f||this.handler_||this);this.recordListenerKey_(b)}return this};
+a.listenWithWrapper=function(b,c,d,e,f){c.listen(b,d,e,f||this.handler_,this);return this};a.recordListenerKey_=function(b){if(this.keys_)this.keys_[b]=true;else if(this.key_){this.keys_=goog.events.EventHandler.keyPool_.getObject();this.keys_[this.key_]=true;this.key_=null;this.keys_[b]=true}else this.key_=b};
+a.unlisten=function(b,c,d,e,f){if(this.key_||this.keys_)if(goog.isArray(c))for(var g=0;g<c.length;g++)this.unlisten(b,c[g],d,e,f);else if(b=goog.events.getListener(b,c,d||this,e||false,f||this.handler_||this)){b=b.key;goog.events.unlistenByKey(b);if(this.keys_)goog.object.remove(this.keys_,b);else if(this.key_==b)this.key_=null}return this};a.unlistenWithWrapper=function(b,c,d,e,f){c.unlisten(b,d,e,f||this.handler_,this);return this};
+a.removeAll=function(){if(this.keys_){for(var b in this.keys_){goog.events.unlistenByKey(b);delete this.keys_[b]}goog.events.EventHandler.keyPool_.releaseObject(this.keys_);this.keys_=null}else this.key_&&goog.events.unlistenByKey(this.key_)};a.disposeInternal=function(){goog.events.EventHandler.superClass_.disposeInternal.call(this);this.removeAll()};a.handleEvent=function(){throw Error("EventHandler.handleEvent not implemented");};goog.events.EventTarget=function(){goog.Disposable.call(this)};goog.inherits(goog.events.EventTarget,goog.Disposable);a=goog.events.EventTarget.prototype;a.customEvent_=true;a.parentEventTarget_=null;a.getParentEventTarget=function(){return this.parentEventTarget_};a.setParentEventTarget=function(b){this.parentEventTarget_=b};a.addEventListener=function(b,c,d,e){goog.events.listen(this,b,c,d,e)};a.removeEventListener=function(b,c,d,e){goog.events.unlisten(this,b,c,d,e)};
+a.dispatchEvent=function(b){return goog.events.dispatchEvent(this,b)};a.disposeInternal=function(){goog.events.EventTarget.superClass_.disposeInternal.call(this);goog.events.removeAll(this);this.parentEventTarget_=null};goog.math.Box=function(b,c,d,e){this.top=b;this.right=c;this.bottom=d;this.left=e};goog.math.Box.boundingBox=function(){for(var b=new goog.math.Box(arguments[0].y,arguments[0].x,arguments[0].y,arguments[0].x),c=1;c<arguments.length;c++){var d=arguments[c];b.top=Math.min(b.top,d.y);b.right=Math.max(b.right,d.x);b.bottom=Math.max(b.bottom,d.y);b.left=Math.min(b.left,d.x)}return b};goog.math.Box.prototype.clone=function(){return new goog.math.Box(this.top,this.right,this.bottom,this.left)};
+if(goog.DEBUG)goog.math.Box.prototype.toString=function(){return"("+this.top+"t, "+this.right+"r, "+this.bottom+"b, "+this.left+"l)"};goog.math.Box.prototype.contains=function(b){return goog.math.Box.contains(this,b)};goog.math.Box.prototype.expand=function(b,c,d,e){if(goog.isObject(b)){this.top-=b.top;this.right+=b.right;this.bottom+=b.bottom;this.left-=b.left}else{this.top-=b;this.right+=c;this.bottom+=d;this.left-=e}return this};
+goog.math.Box.equals=function(b,c){if(b==c)return true;if(!b||!c)return false;return b.top==c.top&&b.right==c.right&&b.bottom==c.bottom&&b.left==c.left};goog.math.Box.contains=function(b,c){if(!b||!c)return false;if(c instanceof goog.math.Box)return c.left>=b.left&&c.right<=b.right&&c.top>=b.top&&c.bottom<=b.bottom;return c.x>=b.left&&c.x<=b.right&&c.y>=b.top&&c.y<=b.bottom};
+goog.math.Box.distance=function(b,c){if(c.x>=b.left&&c.x<=b.right){if(c.y>=b.top&&c.y<=b.bottom)return 0;return c.y<b.top?b.top-c.y:c.y-b.bottom}if(c.y>=b.top&&c.y<=b.bottom)return c.x<b.left?b.left-c.x:c.x-b.right;return goog.math.Coordinate.distance(c,new goog.math.Coordinate(c.x<b.left?b.left:b.right,c.y<b.top?b.top:b.bottom))};goog.math.Rect=function(b,c,d,e){this.left=b;this.top=c;this.width=d;this.height=e};goog.math.Rect.prototype.clone=function(){return new goog.math.Rect(this.left,this.top,this.width,this.height)};goog.math.Rect.prototype.toBox=function(){var b=this.left+this.width,c=this.top+this.height;return new goog.math.Box(this.top,b,c,this.left)};goog.math.Rect.createFromBox=function(b){return new goog.math.Rect(b.left,b.top,b.right-b.left,b.bottom-b.top)};
+if(goog.DEBUG)goog.math.Rect.prototype.toString=function(){return"("+this.left+", "+this.top+" - "+this.width+"w x "+this.height+"h)"};goog.math.Rect.equals=function(b,c){if(b==c)return true;if(!b||!c)return false;return b.left==c.left&&b.width==c.width&&b.top==c.top&&b.height==c.height};
+goog.math.Rect.prototype.intersection=function(b){var c=Math.max(this.left,b.left),d=Math.min(this.left+this.width,b.left+b.width);if(c<=d){var e=Math.max(this.top,b.top);b=Math.min(this.top+this.height,b.top+b.height);if(e<=b){this.left=c;this.top=e;this.width=d-c;this.height=b-e;return true}}return false};
+goog.math.Rect.intersection=function(b,c){var d=Math.max(b.left,c.left),e=Math.min(b.left+b.width,c.left+c.width);if(d<=e){var f=Math.max(b.top,c.top);b=Math.min(b.top+b.height,c.top+c.height);if(f<=b)return new goog.math.Rect(d,f,e-d,b-f)}return null};goog.math.Rect.intersects=function(b,c){var d=Math.max(b.left,c.left),e=Math.min(b.left+b.width,c.left+c.width);if(d<=e){d=Math.max(b.top,c.top);b=Math.min(b.top+b.height,c.top+c.height);if(d<=b)return true}return false};
+goog.math.Rect.prototype.intersects=function(b){return goog.math.Rect.intersects(this,b)};
+goog.math.Rect.difference=function(b,c){var d=goog.math.Rect.intersection(b,c);if(!d||!d.height||!d.width)return[b.clone()];d=[];var e=b.top,f=b.height,g=b.left+b.width,h=b.top+b.height,i=c.left+c.width,j=c.top+c.height;if(c.top>b.top){d.push(new goog.math.Rect(b.left,b.top,b.width,c.top-b.top));e=c.top;f-=c.top-b.top}if(j<h){d.push(new goog.math.Rect(b.left,j,b.width,h-j));f=j-e}c.left>b.left&&d.push(new goog.math.Rect(b.left,e,c.left-b.left,f));i<g&&d.push(new goog.math.Rect(i,e,g-i,f));return d};
+goog.math.Rect.prototype.difference=function(b){return goog.math.Rect.difference(this,b)};goog.math.Rect.prototype.boundingRect=function(b){var c=Math.max(this.left+this.width,b.left+b.width),d=Math.max(this.top+this.height,b.top+b.height);this.left=Math.min(this.left,b.left);this.top=Math.min(this.top,b.top);this.width=c-this.left;this.height=d-this.top};goog.math.Rect.boundingRect=function(b,c){if(!b||!c)return null;b=b.clone();b.boundingRect(c);return b};
+goog.math.Rect.prototype.contains=function(b){return b instanceof goog.math.Rect?this.left<=b.left&&this.left+this.width>=b.left+b.width&&this.top<=b.top&&this.top+this.height>=b.top+b.height:b.x>=this.left&&b.x<=this.left+this.width&&b.y>=this.top&&b.y<=this.top+this.height};goog.math.Rect.prototype.getSize=function(){return new goog.math.Size(this.width,this.height)};goog.userAgent.product={};goog.userAgent.product.ASSUME_FIREFOX=false;goog.userAgent.product.ASSUME_CAMINO=false;goog.userAgent.product.ASSUME_IPHONE=false;goog.userAgent.product.ASSUME_ANDROID=false;goog.userAgent.product.ASSUME_CHROME=false;goog.userAgent.product.ASSUME_SAFARI=false;
+goog.userAgent.product.PRODUCT_KNOWN_=goog.userAgent.ASSUME_IE||goog.userAgent.ASSUME_OPERA||goog.userAgent.product.ASSUME_FIREFOX||goog.userAgent.product.ASSUME_CAMINO||goog.userAgent.product.ASSUME_IPHONE||goog.userAgent.product.ASSUME_ANDROID||goog.userAgent.product.ASSUME_CHROME||goog.userAgent.product.ASSUME_SAFARI;
+goog.userAgent.product.init_=function(){goog.userAgent.product.detectedFirefox_=false;goog.userAgent.product.detectedCamino_=false;goog.userAgent.product.detectedIphone_=false;goog.userAgent.product.detectedAndroid_=false;goog.userAgent.product.detectedChrome_=false;goog.userAgent.product.detectedSafari_=false;var b=goog.userAgent.getUserAgentString();if(b)if(b.indexOf("Firefox")!=-1)goog.userAgent.product.detectedFirefox_=true;else if(b.indexOf("Camino")!=-1)goog.userAgent.product.detectedCamino_=
+true;else if(b.indexOf("iPhone")!=-1||b.indexOf("iPod")!=-1)goog.userAgent.product.detectedIphone_=true;else if(b.indexOf("Android")!=-1)goog.userAgent.product.detectedAndroid_=true;else if(b.indexOf("Chrome")!=-1)goog.userAgent.product.detectedChrome_=true;else if(b.indexOf("Safari")!=-1)goog.userAgent.product.detectedSafari_=true};goog.userAgent.product.PRODUCT_KNOWN_||goog.userAgent.product.init_();goog.userAgent.product.OPERA=goog.userAgent.OPERA;goog.userAgent.product.IE=goog.userAgent.IE;
+goog.userAgent.product.FIREFOX=goog.userAgent.product.PRODUCT_KNOWN_?goog.userAgent.product.ASSUME_FIREFOX:goog.userAgent.product.detectedFirefox_;goog.userAgent.product.CAMINO=goog.userAgent.product.PRODUCT_KNOWN_?goog.userAgent.product.ASSUME_CAMINO:goog.userAgent.product.detectedCamino_;goog.userAgent.product.IPHONE=goog.userAgent.product.PRODUCT_KNOWN_?goog.userAgent.product.ASSUME_IPHONE:goog.userAgent.product.detectedIphone_;
+goog.userAgent.product.ANDROID=goog.userAgent.product.PRODUCT_KNOWN_?goog.userAgent.product.ASSUME_ANDROID:goog.userAgent.product.detectedAndroid_;goog.userAgent.product.CHROME=goog.userAgent.product.PRODUCT_KNOWN_?goog.userAgent.product.ASSUME_CHROME:goog.userAgent.product.detectedChrome_;goog.userAgent.product.SAFARI=goog.userAgent.product.PRODUCT_KNOWN_?goog.userAgent.product.ASSUME_SAFARI:goog.userAgent.product.detectedSafari_;goog.style={};goog.style.setStyle=function(b,c,d){goog.isString(c)?goog.style.setStyle_(b,d,c):goog.object.forEach(c,goog.partial(goog.style.setStyle_,b))};goog.style.setStyle_=function(b,c,d){b.style[goog.style.toCamelCase(d)]=c};goog.style.getStyle=function(b,c){return b.style[goog.style.toCamelCase(c)]};goog.style.getComputedStyle=function(b,c){var d=goog.dom.getOwnerDocument(b);if(d.defaultView&&d.defaultView.getComputedStyle)if(b=d.defaultView.getComputedStyle(b,""))return b[c];return null};
+goog.style.getCascadedStyle=function(b,c){return b.currentStyle?b.currentStyle[c]:null};goog.style.getStyle_=function(b,c){return goog.style.getComputedStyle(b,c)||goog.style.getCascadedStyle(b,c)||b.style[c]};goog.style.getComputedPosition=function(b){return goog.style.getStyle_(b,"position")};goog.style.getBackgroundColor=function(b){return goog.style.getStyle_(b,"backgroundColor")};goog.style.getComputedOverflowX=function(b){return goog.style.getStyle_(b,"overflowX")};
+goog.style.getComputedOverflowY=function(b){return goog.style.getStyle_(b,"overflowY")};goog.style.getComputedZIndex=function(b){return goog.style.getStyle_(b,"zIndex")};goog.style.getComputedTextAlign=function(b){return goog.style.getStyle_(b,"textAlign")};goog.style.getComputedCursor=function(b){return goog.style.getStyle_(b,"cursor")};
+goog.style.setPosition=function(b,c,d){var e,f=goog.userAgent.GECKO&&(goog.userAgent.MAC||goog.userAgent.X11)&&goog.userAgent.isVersion("1.9");if(c instanceof goog.math.Coordinate){e=c.x;c=c.y}else{e=c;c=d}b.style.left=typeof e=="number"?(f?Math.round(e):e)+"px":e;b.style.top=typeof c=="number"?(f?Math.round(c):c)+"px":c};goog.style.getPosition=function(b){return new goog.math.Coordinate(b.offsetLeft,b.offsetTop)};
+goog.style.getClientViewportElement=function(b){b=b?b.nodeType==goog.dom.NodeType.DOCUMENT?b:goog.dom.getOwnerDocument(b):goog.dom.getDocument();if(goog.userAgent.IE&&!goog.dom.getDomHelper(b).isCss1CompatMode())return b.body;return b.documentElement};goog.style.getBoundingClientRect_=function(b){var c=b.getBoundingClientRect();if(goog.userAgent.IE){b=b.ownerDocument;c.left-=b.documentElement.clientLeft+b.body.clientLeft;c.top-=b.documentElement.clientTop+b.body.clientTop}return c};
+goog.style.getOffsetParent=function(b){if(goog.userAgent.IE)return b.offsetParent;var c=goog.dom.getOwnerDocument(b),d=goog.style.getStyle_(b,"position"),e=d=="fixed"||d=="absolute";for(b=b.parentNode;b&&b!=c;b=b.parentNode){d=goog.style.getStyle_(b,"position");e=e&&d=="static"&&b!=c.documentElement&&b!=c.body;if(!e&&(b.scrollWidth>b.clientWidth||b.scrollHeight>b.clientHeight||d=="fixed"||d=="absolute"))return b}return null};
+goog.style.getVisibleRectForElement=function(b){var c=new goog.math.Box(0,Infinity,Infinity,0),d=goog.dom.getDomHelper(b),e=d.getDocumentScrollElement(),f;for(b=b;b=goog.style.getOffsetParent(b);)if((!goog.userAgent.IE||b.clientWidth!=0)&&(b.scrollWidth!=b.clientWidth||b.scrollHeight!=b.clientHeight)&&goog.style.getStyle_(b,"overflow")!="visible"){var g=goog.style.getPageOffset(b),h=goog.style.getClientLeftTop(b);g.x+=h.x;g.y+=h.y;c.top=Math.max(c.top,g.y);c.right=Math.min(c.right,g.x+b.clientWidth);
+c.bottom=Math.min(c.bottom,g.y+b.clientHeight);c.left=Math.max(c.left,g.x);f=f||b!=e}b=e.scrollLeft;e=e.scrollTop;if(goog.userAgent.WEBKIT){c.left+=b;c.top+=e}else{c.left=Math.max(c.left,b);c.top=Math.max(c.top,e)}if(!f||goog.userAgent.WEBKIT){c.right+=b;c.bottom+=e}d=d.getViewportSize();c.right=Math.min(c.right,b+d.width);c.bottom=Math.min(c.bottom,e+d.height);return c.top>=0&&c.left>=0&&c.bottom>c.top&&c.right>c.left?c:null};
+goog.style.scrollIntoContainerView=function(b,c,d){var e=goog.style.getPageOffset(b),f=goog.style.getPageOffset(c),g=goog.style.getBorderBox(c),h=e.x-f.x-g.left;e=e.y-f.y-g.top;f=c.clientWidth-b.offsetWidth;b=c.clientHeight-b.offsetHeight;if(d){c.scrollLeft+=h-f/2;c.scrollTop+=e-b/2}else{c.scrollLeft+=Math.min(h,Math.max(h-f,0));c.scrollTop+=Math.min(e,Math.max(e-b,0))}};
+goog.style.getClientLeftTop=function(b){if(goog.userAgent.GECKO&&!goog.userAgent.isVersion("1.9")){var c=parseFloat(goog.style.getComputedStyle(b,"borderLeftWidth"));if(goog.style.isRightToLeft(b)){var d=b.offsetWidth-b.clientWidth-c-parseFloat(goog.style.getComputedStyle(b,"borderRightWidth"));c+=d}return new goog.math.Coordinate(c,parseFloat(goog.style.getComputedStyle(b,"borderTopWidth")))}return new goog.math.Coordinate(b.clientLeft,b.clientTop)};
+goog.style.getPageOffset=function(b){var c,d=goog.dom.getOwnerDocument(b),e=goog.style.getStyle_(b,"position"),f=goog.userAgent.GECKO&&d.getBoxObjectFor&&!b.getBoundingClientRect&&e=="absolute"&&(c=d.getBoxObjectFor(b))&&(c.screenX<0||c.screenY<0),g=new goog.math.Coordinate(0,0),h=goog.style.getClientViewportElement(d);if(b==h)return g;if(b.getBoundingClientRect){c=goog.style.getBoundingClientRect_(b);b=goog.dom.getDomHelper(d).getDocumentScroll();g.x=c.left+b.x;g.y=c.top+b.y}else if(d.getBoxObjectFor&&
+!f){c=d.getBoxObjectFor(b);b=d.getBoxObjectFor(h);g.x=c.screenX-b.screenX;g.y=c.screenY-b.screenY}else{c=b;do{g.x+=c.offsetLeft;g.y+=c.offsetTop;if(c!=b){g.x+=c.clientLeft||0;g.y+=c.clientTop||0}if(goog.userAgent.WEBKIT&&goog.style.getComputedPosition(c)=="fixed"){g.x+=d.body.scrollLeft;g.y+=d.body.scrollTop;break}c=c.offsetParent}while(c&&c!=b);if(goog.userAgent.OPERA||goog.userAgent.WEBKIT&&e=="absolute")g.y-=d.body.offsetTop;for(c=b;(c=goog.style.getOffsetParent(c))&&c!=d.body&&c!=h;){g.x-=c.scrollLeft;
+if(!goog.userAgent.OPERA||c.tagName!="TR")g.y-=c.scrollTop}}return g};goog.style.getPageOffsetLeft=function(b){return goog.style.getPageOffset(b).x};goog.style.getPageOffsetTop=function(b){return goog.style.getPageOffset(b).y};
+goog.style.getFramedPageOffset=function(b,c){var d=new goog.math.Coordinate(0,0),e=goog.dom.getWindow(goog.dom.getOwnerDocument(b));b=b;do{var f=e==c?goog.style.getPageOffset(b):goog.style.getClientPosition(b);d.x+=f.x;d.y+=f.y}while(e&&e!=c&&(b=e.frameElement)&&(e=e.parent));return d};
+goog.style.translateRectForAnotherFrame=function(b,c,d){if(c.getDocument()!=d.getDocument()){var e=c.getDocument().body;d=goog.style.getFramedPageOffset(e,d.getWindow());d=goog.math.Coordinate.difference(d,goog.style.getPageOffset(e));if(goog.userAgent.IE&&!c.isCss1CompatMode())d=goog.math.Coordinate.difference(d,c.getDocumentScroll());b.left+=d.x;b.top+=d.y}};
+goog.style.getRelativePosition=function(b,c){b=goog.style.getClientPosition(b);c=goog.style.getClientPosition(c);return new goog.math.Coordinate(b.x-c.x,b.y-c.y)};goog.style.getClientPosition=function(b){var c=new goog.math.Coordinate;if(b.nodeType==goog.dom.NodeType.ELEMENT)if(b.getBoundingClientRect){var d=goog.style.getBoundingClientRect_(b);c.x=d.left;c.y=d.top}else{d=goog.dom.getDomHelper(b).getDocumentScroll();b=goog.style.getPageOffset(b);c.x=b.x-d.x;c.y=b.y-d.y}else{c.x=b.clientX;c.y=b.clientY}return c};
+goog.style.setPageOffset=function(b,c,d){var e=goog.style.getPageOffset(b);if(c instanceof goog.math.Coordinate){d=c.y;c=c.x}c=c-e.x;d=d-e.y;goog.style.setPosition(b,b.offsetLeft+c,b.offsetTop+d)};goog.style.setSize=function(b,c,d){if(c instanceof goog.math.Size){d=c.height;c=c.width}else{if(d==undefined)throw Error("missing height argument");d=d}b.style.width=typeof c=="number"?Math.round(c)+"px":c;b.style.height=typeof d=="number"?Math.round(d)+"px":d};
+goog.style.getSize=function(b){var c=goog.userAgent.OPERA&&!goog.userAgent.isVersion("10");if(goog.style.getStyle_(b,"display")!="none")return c?new goog.math.Size(b.offsetWidth||b.clientWidth,b.offsetHeight||b.clientHeight):new goog.math.Size(b.offsetWidth,b.offsetHeight);var d=b.style,e=d.display,f=d.visibility,g=d.position;d.visibility="hidden";d.position="absolute";d.display="inline";if(c){c=b.offsetWidth||b.clientWidth;b=b.offsetHeight||b.clientHeight}else{c=b.offsetWidth;b=b.offsetHeight}d.display=
+e;d.position=g;d.visibility=f;return new goog.math.Size(c,b)};goog.style.getBounds=function(b){var c=goog.style.getPageOffset(b);b=goog.style.getSize(b);return new goog.math.Rect(c.x,c.y,b.width,b.height)};goog.style.toCamelCaseCache_={};goog.style.toCamelCase=function(b){return goog.style.toCamelCaseCache_[b]||(goog.style.toCamelCaseCache_[b]=String(b).replace(/\-([a-z])/g,function(c,d){return d.toUpperCase()}))};goog.style.toSelectorCase=function(b){return b.replace(/([A-Z])/g,"-$1").toLowerCase()};
+goog.style.getOpacity=function(b){var c=b.style;b="";if("opacity"in c)b=c.opacity;else if("MozOpacity"in c)b=c.MozOpacity;else if("filter"in c)if(c=c.filter.match(/alpha\(opacity=([\d.]+)\)/))b=String(c[1]/100);return b==""?b:Number(b)};goog.style.setOpacity=function(b,c){b=b.style;if("opacity"in b)b.opacity=c;else if("MozOpacity"in b)b.MozOpacity=c;else if("filter"in b)b.filter=c===""?"":"alpha(opacity="+c*100+")"};
+goog.style.setTransparentBackgroundImage=function(b,c){b=b.style;if(goog.userAgent.IE&&!goog.userAgent.isVersion("8"))b.filter='progid:DXImageTransform.Microsoft.AlphaImageLoader(src="'+c+'", sizingMethod="crop")';else{b.backgroundImage="url("+c+")";b.backgroundPosition="top left";b.backgroundRepeat="no-repeat"}};goog.style.clearTransparentBackgroundImage=function(b){b=b.style;if("filter"in b)b.filter="";else b.backgroundImage="none"};goog.style.showElement=function(b,c){b.style.display=c?"":"none"};
+goog.style.isElementShown=function(b){return b.style.display!="none"};goog.style.installStyles=function(b,c){c=goog.dom.getDomHelper(c);var d=null;if(goog.userAgent.IE){d=c.getDocument().createStyleSheet();goog.style.setStyles(d,b)}else{var e=c.getElementsByTagNameAndClass("head")[0];if(!e){d=c.getElementsByTagNameAndClass("body")[0];e=c.createDom("head");d.parentNode.insertBefore(e,d)}d=c.createDom("style");goog.style.setStyles(d,b);c.appendChild(e,d)}return d};
+goog.style.uninstallStyles=function(b){b=b.ownerNode||b.owningElement||b;goog.dom.removeNode(b)};goog.style.setStyles=function(b,c){if(goog.userAgent.IE)b.cssText=c;else{var d=goog.userAgent.WEBKIT?"innerText":"innerHTML";b[d]=c}};goog.style.setPreWrap=function(b){b=b.style;if(goog.userAgent.IE&&!goog.userAgent.isVersion("8")){b.whiteSpace="pre";b.wordWrap="break-word"}else b.whiteSpace=goog.userAgent.GECKO?"-moz-pre-wrap":goog.userAgent.OPERA?"-o-pre-wrap":"pre-wrap"};
+goog.style.setInlineBlock=function(b){b=b.style;b.position="relative";if(goog.userAgent.IE&&!goog.userAgent.isVersion("8")){b.zoom="1";b.display="inline"}else b.display=goog.userAgent.GECKO?goog.userAgent.isVersion("1.9a")?"inline-block":"-moz-inline-box":"inline-block"};goog.style.isRightToLeft=function(b){return"rtl"==goog.style.getStyle_(b,"direction")};goog.style.unselectableStyle_=goog.userAgent.GECKO?"MozUserSelect":goog.userAgent.WEBKIT?"WebkitUserSelect":null;
+goog.style.isUnselectable=function(b){if(goog.style.unselectableStyle_)return b.style[goog.style.unselectableStyle_].toLowerCase()=="none";else if(goog.userAgent.IE||goog.userAgent.OPERA)return b.getAttribute("unselectable")=="on";return false};
+goog.style.setUnselectable=function(b,c,d){d=!d?b.getElementsByTagName("*"):null;var e=goog.style.unselectableStyle_;if(e){c=c?"none":"";b.style[e]=c;if(d){b=0;for(var f;f=d[b];b++)f.style[e]=c}}else if(goog.userAgent.IE||goog.userAgent.OPERA){c=c?"on":"";b.setAttribute("unselectable",c);if(d)for(b=0;f=d[b];b++)f.setAttribute("unselectable",c)}};goog.style.getBorderBoxSize=function(b){return new goog.math.Size(b.offsetWidth,b.offsetHeight)};
+goog.style.setBorderBoxSize=function(b,c){var d=goog.dom.getOwnerDocument(b),e=goog.dom.getDomHelper(d).isCss1CompatMode();if(goog.userAgent.IE&&(!e||!goog.userAgent.isVersion("8"))){d=b.style;if(e){e=goog.style.getPaddingBox(b);b=goog.style.getBorderBox(b);d.pixelWidth=c.width-b.left-e.left-e.right-b.right;d.pixelHeight=c.height-b.top-e.top-e.bottom-b.bottom}else{d.pixelWidth=c.width;d.pixelHeight=c.height}}else goog.style.setBoxSizingSize_(b,c,"border-box")};
+goog.style.getContentBoxSize=function(b){var c=goog.dom.getOwnerDocument(b),d=goog.userAgent.IE&&b.currentStyle;if(d&&goog.dom.getDomHelper(c).isCss1CompatMode()&&d.width!="auto"&&d.height!="auto"&&!d.boxSizing){c=goog.style.getIePixelValue_(b,d.width,"width","pixelWidth");b=goog.style.getIePixelValue_(b,d.height,"height","pixelHeight");return new goog.math.Size(c,b)}else{d=goog.style.getBorderBoxSize(b);c=goog.style.getPaddingBox(b);b=goog.style.getBorderBox(b);return new goog.math.Size(d.width-
+b.left-c.left-c.right-b.right,d.height-b.top-c.top-c.bottom-b.bottom)}};
+goog.style.setContentBoxSize=function(b,c){var d=goog.dom.getOwnerDocument(b),e=goog.dom.getDomHelper(d).isCss1CompatMode();if(goog.userAgent.IE&&(!e||!goog.userAgent.isVersion("8"))){d=b.style;if(e){d.pixelWidth=c.width;d.pixelHeight=c.height}else{e=goog.style.getPaddingBox(b);b=goog.style.getBorderBox(b);d.pixelWidth=c.width+b.left+e.left+e.right+b.right;d.pixelHeight=c.height+b.top+e.top+e.bottom+b.bottom}}else goog.style.setBoxSizingSize_(b,c,"content-box")};
+goog.style.setBoxSizingSize_=function(b,c,d){b=b.style;if(goog.userAgent.GECKO)b.MozBoxSizing=d;else if(goog.userAgent.WEBKIT)b.WebkitBoxSizing=d;else if(goog.userAgent.OPERA&&!goog.userAgent.isVersion("9.50"))d?b.setProperty("box-sizing",d):b.removeProperty("box-sizing");else b.boxSizing=d;b.width=c.width+"px";b.height=c.height+"px"};
+goog.style.getIePixelValue_=function(b,c,d,e){if(/^\d+px?$/.test(c))return parseInt(c,10);else{var f=b.style[d],g=b.runtimeStyle[d];b.runtimeStyle[d]=b.currentStyle[d];b.style[d]=c;c=b.style[e];b.style[d]=f;b.runtimeStyle[d]=g;return c}};goog.style.getIePixelDistance_=function(b,c){return goog.style.getIePixelValue_(b,goog.style.getCascadedStyle(b,c),"left","pixelLeft")};
+goog.style.getBox_=function(b,c){if(goog.userAgent.IE){var d=goog.style.getIePixelDistance_(b,c+"Left"),e=goog.style.getIePixelDistance_(b,c+"Right"),f=goog.style.getIePixelDistance_(b,c+"Top");b=goog.style.getIePixelDistance_(b,c+"Bottom");return new goog.math.Box(f,e,b,d)}else{d=goog.style.getComputedStyle(b,c+"Left");e=goog.style.getComputedStyle(b,c+"Right");f=goog.style.getComputedStyle(b,c+"Top");b=goog.style.getComputedStyle(b,c+"Bottom");return new goog.math.Box(parseFloat(f),parseFloat(e),
+parseFloat(b),parseFloat(d))}};goog.style.getPaddingBox=function(b){return goog.style.getBox_(b,"padding")};goog.style.getMarginBox=function(b){return goog.style.getBox_(b,"margin")};goog.style.ieBorderWidthKeywords_={thin:2,medium:4,thick:6};
+goog.style.getIePixelBorder_=function(b,c){if(goog.style.getCascadedStyle(b,c+"Style")=="none")return 0;c=goog.style.getCascadedStyle(b,c+"Width");if(c in goog.style.ieBorderWidthKeywords_)return goog.style.ieBorderWidthKeywords_[c];return goog.style.getIePixelValue_(b,c,"left","pixelLeft")};
+goog.style.getBorderBox=function(b){if(goog.userAgent.IE){var c=goog.style.getIePixelBorder_(b,"borderLeft"),d=goog.style.getIePixelBorder_(b,"borderRight"),e=goog.style.getIePixelBorder_(b,"borderTop");b=goog.style.getIePixelBorder_(b,"borderBottom");return new goog.math.Box(e,d,b,c)}else{c=goog.style.getComputedStyle(b,"borderLeftWidth");d=goog.style.getComputedStyle(b,"borderRightWidth");e=goog.style.getComputedStyle(b,"borderTopWidth");b=goog.style.getComputedStyle(b,"borderBottomWidth");return new goog.math.Box(parseFloat(e),
+parseFloat(d),parseFloat(b),parseFloat(c))}};goog.style.getFontFamily=function(b){var c=goog.dom.getOwnerDocument(b),d="";if(c.createTextRange){d=c.body.createTextRange();d.moveToElementText(b);d=d.queryCommandValue("FontName")}if(!d){d=goog.style.getStyle_(b,"fontFamily");if(goog.userAgent.OPERA&&goog.userAgent.LINUX)d=d.replace(/ \[[^\]]*\]/,"")}b=d.split(",");if(b.length>1)d=b[0];return goog.string.stripQuotes(d,"\"'")};goog.style.lengthUnitRegex_=/[^\d]+$/;
+goog.style.getLengthUnits=function(b){return(b=b.match(goog.style.lengthUnitRegex_))&&b[0]||null};goog.style.ABSOLUTE_CSS_LENGTH_UNITS_={cm:1,"in":1,mm:1,pc:1,pt:1};goog.style.CONVERTIBLE_RELATIVE_CSS_UNITS_={em:1,ex:1};
+goog.style.getFontSize=function(b){var c=goog.style.getStyle_(b,"fontSize"),d=goog.style.getLengthUnits(c);if(c&&"px"==d)return parseInt(c,10);if(goog.userAgent.IE)if(d in goog.style.ABSOLUTE_CSS_LENGTH_UNITS_)return goog.style.getIePixelValue_(b,c,"left","pixelLeft");else if(b.parentNode&&b.parentNode.nodeType==goog.dom.NodeType.ELEMENT&&d in goog.style.CONVERTIBLE_RELATIVE_CSS_UNITS_){b=b.parentNode;d=goog.style.getStyle_(b,"fontSize");return goog.style.getIePixelValue_(b,c==d?"1em":c,"left","pixelLeft")}d=
+goog.dom.createDom("span",{style:"visibility:hidden;position:absolute;line-height:0;padding:0;margin:0;border:0;height:1em;"});goog.dom.appendChild(b,d);c=d.offsetHeight;goog.dom.removeNode(d);return c};goog.style.parseStyleAttribute=function(b){var c={};goog.array.forEach(b.split(/\s*;\s*/),function(d){d=d.split(/\s*:\s*/);if(d.length==2)c[goog.style.toCamelCase(d[0].toLowerCase())]=d[1]});return c};
+goog.style.toStyleAttribute=function(b){var c=[];goog.object.forEach(b,function(d,e){c.push(goog.style.toSelectorCase(e),":",d,";")});return c.join("")};goog.style.setFloat=function(b,c){b.style[goog.userAgent.IE?"styleFloat":"cssFloat"]=c};goog.style.getFloat=function(b){return b.style[goog.userAgent.IE?"styleFloat":"cssFloat"]||""};goog.ui={};goog.ui.IdGenerator=function(){};goog.addSingletonGetter(goog.ui.IdGenerator);goog.ui.IdGenerator.prototype.nextId_=0;goog.ui.IdGenerator.prototype.getNextUniqueId=function(){return":"+(this.nextId_++).toString(36)};goog.ui.IdGenerator.instance=goog.ui.IdGenerator.getInstance();goog.ui.Component=function(b){goog.events.EventTarget.call(this);this.dom_=b||goog.dom.getDomHelper();this.rightToLeft_=goog.ui.Component.defaultRightToLeft_};goog.inherits(goog.ui.Component,goog.events.EventTarget);goog.ui.Component.prototype.idGenerator_=goog.ui.IdGenerator.getInstance();goog.ui.Component.defaultRightToLeft_=null;
+goog.ui.Component.EventType={BEFORE_SHOW:"beforeshow",SHOW:"show",HIDE:"hide",DISABLE:"disable",ENABLE:"enable",HIGHLIGHT:"highlight",UNHIGHLIGHT:"unhighlight",ACTIVATE:"activate",DEACTIVATE:"deactivate",SELECT:"select",UNSELECT:"unselect",CHECK:"check",UNCHECK:"uncheck",FOCUS:"focus",BLUR:"blur",OPEN:"open",CLOSE:"close",ENTER:"enter",LEAVE:"leave",ACTION:"action",CHANGE:"change"};
+goog.ui.Component.Error={NOT_SUPPORTED:"Method not supported",DECORATE_INVALID:"Invalid element to decorate",ALREADY_RENDERED:"Component already rendered",PARENT_UNABLE_TO_BE_SET:"Unable to set parent component",CHILD_INDEX_OUT_OF_BOUNDS:"Child component index out of bounds",NOT_OUR_CHILD:"Child is not in parent component",NOT_IN_DOCUMENT:"Operation not supported while component is not in document",STATE_INVALID:"Invalid component state"};
+goog.ui.Component.State={ALL:255,DISABLED:1,HOVER:2,ACTIVE:4,SELECTED:8,CHECKED:16,FOCUSED:32,OPENED:64};
+goog.ui.Component.getStateTransitionEvent=function(b,c){switch(b){case goog.ui.Component.State.DISABLED:return c?goog.ui.Component.EventType.DISABLE:goog.ui.Component.EventType.ENABLE;case goog.ui.Component.State.HOVER:return c?goog.ui.Component.EventType.HIGHLIGHT:goog.ui.Component.EventType.UNHIGHLIGHT;case goog.ui.Component.State.ACTIVE:return c?goog.ui.Component.EventType.ACTIVATE:goog.ui.Component.EventType.DEACTIVATE;case goog.ui.Component.State.SELECTED:return c?goog.ui.Component.EventType.SELECT:
+goog.ui.Component.EventType.UNSELECT;case goog.ui.Component.State.CHECKED:return c?goog.ui.Component.EventType.CHECK:goog.ui.Component.EventType.UNCHECK;case goog.ui.Component.State.FOCUSED:return c?goog.ui.Component.EventType.FOCUS:goog.ui.Component.EventType.BLUR;case goog.ui.Component.State.OPENED:return c?goog.ui.Component.EventType.OPEN:goog.ui.Component.EventType.CLOSE;default:}throw Error(goog.ui.Component.Error.STATE_INVALID);};
+goog.ui.Component.setDefaultRightToLeft=function(b){goog.ui.Component.defaultRightToLeft_=b};a=goog.ui.Component.prototype;a.id_=null;a.dom_=null;a.inDocument_=false;a.element_=null;a.rightToLeft_=null;a.model_=null;a.parent_=null;a.children_=null;a.childIndex_=null;a.wasDecorated_=false;a.getId=function(){return this.id_||(this.id_=this.idGenerator_.getNextUniqueId())};
+a.setId=function(b){if(this.parent_&&this.parent_.childIndex_){goog.object.remove(this.parent_.childIndex_,this.id_);goog.object.add(this.parent_.childIndex_,b,this)}this.id_=b};a.getElement=function(){return this.element_};a.setElementInternal=function(b){this.element_=b};a.getHandler=function(){return this.googUiComponentHandler_||(this.googUiComponentHandler_=new goog.events.EventHandler(this))};
+a.setParent=function(b){if(this==b)throw Error(goog.ui.Component.Error.PARENT_UNABLE_TO_BE_SET);if(b&&this.parent_&&this.id_&&this.parent_.getChild(this.id_)&&this.parent_!=b)throw Error(goog.ui.Component.Error.PARENT_UNABLE_TO_BE_SET);this.parent_=b;goog.ui.Component.superClass_.setParentEventTarget.call(this,b)};a.getParent=function(){return this.parent_};
+a.setParentEventTarget=function(b){if(this.parent_&&this.parent_!=b)throw Error(goog.ui.Component.Error.NOT_SUPPORTED);goog.ui.Component.superClass_.setParentEventTarget.call(this,b)};a.getDomHelper=function(){return this.dom_};a.isInDocument=function(){return this.inDocument_};a.createDom=function(){this.element_=this.dom_.createElement("div")};a.render=function(b){this.render_(b)};a.renderBefore=function(b){this.render_(b.parentNode,b)};
+a.render_=function(b,c){if(this.inDocument_)throw Error(goog.ui.Component.Error.ALREADY_RENDERED);this.element_||this.createDom();b?b.insertBefore(this.element_,c||null):this.dom_.getDocument().body.appendChild(this.element_);if(!this.parent_||this.parent_.isInDocument())this.enterDocument()};
+a.decorate=function(b){if(this.inDocument_)throw Error(goog.ui.Component.Error.ALREADY_RENDERED);else if(b&&this.canDecorate(b)){this.wasDecorated_=true;if(!this.dom_||this.dom_.getDocument()!=goog.dom.getOwnerDocument(b))this.dom_=goog.dom.getDomHelper(b);this.decorateInternal(b);this.enterDocument()}else throw Error(goog.ui.Component.Error.DECORATE_INVALID);};a.canDecorate=function(){return true};a.wasDecorated=function(){return this.wasDecorated_};a.decorateInternal=function(b){this.element_=b};
+a.enterDocument=function(){this.inDocument_=true;this.forEachChild(function(b){!b.isInDocument()&&b.getElement()&&b.enterDocument()})};a.exitDocument=function(){this.forEachChild(function(b){b.isInDocument()&&b.exitDocument()});this.googUiComponentHandler_&&this.googUiComponentHandler_.removeAll();this.inDocument_=false};
+a.disposeInternal=function(){goog.ui.Component.superClass_.disposeInternal.call(this);this.inDocument_&&this.exitDocument();if(this.googUiComponentHandler_){this.googUiComponentHandler_.dispose();delete this.googUiComponentHandler_}this.forEachChild(function(b){b.dispose()});!this.wasDecorated_&&this.element_&&goog.dom.removeNode(this.element_);this.parent_=this.model_=this.element_=this.childIndex_=this.children_=null};a.makeId=function(b){return this.getId()+"."+b};a.getModel=function(){return this.model_};
+a.setModel=function(b){this.model_=b};a.getFragmentFromId=function(b){return b.substring(this.getId().length+1)};a.getElementByFragment=function(b){if(!this.inDocument_)throw Error(goog.ui.Component.Error.NOT_IN_DOCUMENT);return this.dom_.getElement(this.makeId(b))};a.addChild=function(b,c){this.addChildAt(b,this.getChildCount(),c)};
+a.addChildAt=function(b,c,d){if(b.inDocument_&&(d||!this.inDocument_))throw Error(goog.ui.Component.Error.ALREADY_RENDERED);if(c<0||c>this.getChildCount())throw Error(goog.ui.Component.Error.CHILD_INDEX_OUT_OF_BOUNDS);if(!this.childIndex_||!this.children_){this.childIndex_={};this.children_=[]}if(b.getParent()==this){goog.object.set(this.childIndex_,b.getId(),b);goog.array.remove(this.children_,b)}else goog.object.add(this.childIndex_,b.getId(),b);b.setParent(this);goog.array.insertAt(this.children_,
+b,c);if(b.inDocument_&&this.inDocument_&&b.getParent()==this){d=this.getContentElement();d.insertBefore(b.getElement(),d.childNodes[c+1]||null)}else if(d){this.element_||this.createDom();c=this.getChildAt(c+1);b.render_(this.getContentElement(),c?c.element_:null)}else this.inDocument_&&!b.inDocument_&&b.element_&&b.enterDocument()};a.getContentElement=function(){return this.element_};
+a.isRightToLeft=function(){if(this.rightToLeft_==null)this.rightToLeft_=goog.style.isRightToLeft(this.inDocument_?this.element_:this.dom_.getDocument().body);return this.rightToLeft_};a.setRightToLeft=function(b){if(this.inDocument_)throw Error(goog.ui.Component.Error.ALREADY_RENDERED);this.rightToLeft_=b};a.hasChildren=function(){return!!this.children_&&this.children_.length!=0};a.getChildCount=function(){return this.children_?this.children_.length:0};
+a.getChildIds=function(){var b=[];this.forEachChild(function(c){b.push(c.getId())});return b};a.getChild=function(b){return this.childIndex_&&b?goog.object.get(this.childIndex_,b)||null:null};a.getChildAt=function(b){return this.children_?this.children_[b]||null:null};a.forEachChild=function(b,c){this.children_&&goog.array.forEach(this.children_,b,c)};a.indexOfChild=function(b){return this.children_&&b?goog.array.indexOf(this.children_,b):-1};
+a.removeChild=function(b,c){if(b){var d=goog.isString(b)?b:b.getId();b=this.getChild(d);if(d&&b){goog.object.remove(this.childIndex_,d);goog.array.remove(this.children_,b);if(c){b.exitDocument();b.element_&&goog.dom.removeNode(b.element_)}b.setParent(null)}}if(!b)throw Error(goog.ui.Component.Error.NOT_OUR_CHILD);return b};a.removeChildAt=function(b,c){return this.removeChild(this.getChildAt(b),c)};a.removeChildren=function(b){for(;this.hasChildren();)this.removeChildAt(0,b)};goog.positioning={};goog.positioning.Corner={TOP_LEFT:0,TOP_RIGHT:2,BOTTOM_LEFT:1,BOTTOM_RIGHT:3,TOP_START:4,TOP_END:6,BOTTOM_START:5,BOTTOM_END:7};goog.positioning.CornerBit={BOTTOM:1,RIGHT:2,FLIP_RTL:4};goog.positioning.Overflow={IGNORE:0,ADJUST_X:1,FAIL_X:2,ADJUST_Y:4,FAIL_Y:8,RESIZE_WIDTH:16,RESIZE_HEIGHT:32};goog.positioning.OverflowStatus={NONE:0,ADJUSTED_X:1,ADJUSTED_Y:2,WIDTH_ADJUSTED:4,HEIGHT_ADJUSTED:8,FAILED_LEFT:16,FAILED_RIGHT:32,FAILED_TOP:64,FAILED_BOTTOM:128,FAILED_OUTSIDE_VIEWPORT:256};
+goog.positioning.OverflowStatus.FAILED=goog.positioning.OverflowStatus.FAILED_LEFT|goog.positioning.OverflowStatus.FAILED_RIGHT|goog.positioning.OverflowStatus.FAILED_TOP|goog.positioning.OverflowStatus.FAILED_BOTTOM|goog.positioning.OverflowStatus.FAILED_OUTSIDE_VIEWPORT;
+goog.positioning.positionAtAnchor=function(b,c,d,e,f,g,h,i){var j,k=d.offsetParent;if(k){var l=k.tagName==goog.dom.TagName.HTML||k.tagName==goog.dom.TagName.BODY;if(!l||goog.style.getComputedPosition(k)!="static"){j=goog.style.getPageOffset(k);l||(j=goog.math.Coordinate.difference(j,new goog.math.Coordinate(k.scrollLeft,k.scrollTop)))}}k=goog.positioning.getVisiblePart_(b);goog.style.translateRectForAnotherFrame(k,goog.dom.getDomHelper(b),goog.dom.getDomHelper(d));b=goog.positioning.getEffectiveCorner(b,
+c);c=new goog.math.Coordinate(b&goog.positioning.CornerBit.RIGHT?k.left+k.width:k.left,b&goog.positioning.CornerBit.BOTTOM?k.top+k.height:k.top);if(j)c=goog.math.Coordinate.difference(c,j);if(f){c.x+=(b&goog.positioning.CornerBit.RIGHT?-1:1)*f.x;c.y+=(b&goog.positioning.CornerBit.BOTTOM?-1:1)*f.y}var m;if(h)if((m=goog.style.getVisibleRectForElement(d))&&j){m.top=Math.max(0,m.top-j.y);m.right-=j.x;m.bottom-=j.y;m.left=Math.max(0,m.left-j.x)}return goog.positioning.positionAtCoordinate(c,d,e,g,m,h,
+i)};goog.positioning.getVisiblePart_=function(b){var c=goog.style.getBounds(b);(b=goog.style.getVisibleRectForElement(b))&&c.intersection(goog.math.Rect.createFromBox(b));return c};
+goog.positioning.positionAtCoordinate=function(b,c,d,e,f,g,h){b=b.clone();var i=goog.positioning.OverflowStatus.NONE;d=goog.positioning.getEffectiveCorner(c,d);var j=goog.style.getSize(c);h=h?h.clone():j;if(e||d!=goog.positioning.Corner.TOP_LEFT){if(d&goog.positioning.CornerBit.RIGHT)b.x-=h.width+(e?e.right:0);else if(e)b.x+=e.left;if(d&goog.positioning.CornerBit.BOTTOM)b.y-=h.height+(e?e.bottom:0);else if(e)b.y+=e.top}if(g){i=f?goog.positioning.adjustForViewport(b,h,f,g):goog.positioning.OverflowStatus.FAILED_OUTSIDE_VIEWPORT;
+if(i&goog.positioning.OverflowStatus.FAILED)return i}goog.style.setPosition(c,b);goog.math.Size.equals(j,h)||goog.style.setSize(c,h);return i};
+goog.positioning.adjustForViewport=function(b,c,d,e){var f=goog.positioning.OverflowStatus.NONE;if(b.x<d.left&&e&goog.positioning.Overflow.ADJUST_X){b.x=d.left;f|=goog.positioning.OverflowStatus.ADJUSTED_X}if(b.x<d.left&&b.x+c.width>d.right&&e&goog.positioning.Overflow.RESIZE_WIDTH){c.width-=b.x+c.width-d.right;f|=goog.positioning.OverflowStatus.WIDTH_ADJUSTED}if(b.x+c.width>d.right&&e&goog.positioning.Overflow.ADJUST_X){b.x=Math.max(d.right-c.width,d.left);f|=goog.positioning.OverflowStatus.ADJUSTED_X}if(e&
+goog.positioning.Overflow.FAIL_X)f|=(b.x<d.left?goog.positioning.OverflowStatus.FAILED_LEFT:0)|(b.x+c.width>d.right?goog.positioning.OverflowStatus.FAILED_RIGHT:0);if(b.y<d.top&&e&goog.positioning.Overflow.ADJUST_Y){b.y=d.top;f|=goog.positioning.OverflowStatus.ADJUSTED_Y}if(b.y>=d.top&&b.y+c.height>d.bottom&&e&goog.positioning.Overflow.RESIZE_HEIGHT){c.height-=b.y+c.height-d.bottom;f|=goog.positioning.OverflowStatus.HEIGHT_ADJUSTED}if(b.y+c.height>d.bottom&&e&goog.positioning.Overflow.ADJUST_Y){b.y=
+Math.max(d.bottom-c.height,d.top);f|=goog.positioning.OverflowStatus.ADJUSTED_Y}if(e&goog.positioning.Overflow.FAIL_Y)f|=(b.y<d.top?goog.positioning.OverflowStatus.FAILED_TOP:0)|(b.y+c.height>d.bottom?goog.positioning.OverflowStatus.FAILED_BOTTOM:0);return f};goog.positioning.getEffectiveCorner=function(b,c){return(c&goog.positioning.CornerBit.FLIP_RTL&&goog.style.isRightToLeft(b)?c^goog.positioning.CornerBit.RIGHT:c)&~goog.positioning.CornerBit.FLIP_RTL};
+goog.positioning.flipCornerHorizontal=function(b){return b^goog.positioning.CornerBit.RIGHT};goog.positioning.flipCornerVertical=function(b){return b^goog.positioning.CornerBit.BOTTOM};goog.positioning.flipCorner=function(b){return b^goog.positioning.CornerBit.BOTTOM^goog.positioning.CornerBit.RIGHT};goog.positioning.AbstractPosition=function(){};goog.positioning.AbstractPosition.prototype.reposition=function(){};goog.positioning.AnchoredPosition=function(b,c){this.element=b;this.corner=c};goog.inherits(goog.positioning.AnchoredPosition,goog.positioning.AbstractPosition);goog.positioning.AnchoredPosition.prototype.reposition=function(b,c,d){goog.positioning.positionAtAnchor(this.element,this.corner,b,c,undefined,d)};goog.dom.a11y={};goog.dom.a11y.State={ACTIVEDESCENDANT:"activedescendant",AUTOCOMPLETE:"autocomplete",CHECKED:"checked",DISABLED:"disabled",EXPANDED:"expanded",HASPOPUP:"haspopup",LABELLEDBY:"labelledby",LEVEL:"level",PRESSED:"pressed",SELECTED:"selected",VALUEMAX:"valuemax",VALUEMIN:"valuemin",VALUENOW:"valuenow"};
+goog.dom.a11y.Role={BUTTON:"button",CHECKBOX:"checkbox",COMBOBOX:"combobox",DIALOG:"dialog",LINK:"link",LISTBOX:"listbox",MAIN:"main",MENU:"menu",MENUBAR:"menubar",MENU_ITEM:"menuitem",MENU_ITEM_CHECKBOX:"menuitemcheckbox",MENU_ITEM_RADIO:"menuitemradio",NAVIGATION:"navigation",OPTION:"option",GROUP:"group",SLIDER:"slider",TAB:"tab",TAB_LIST:"tablist",TAB_PANEL:"tabpanel",TOOLBAR:"toolbar"};
+goog.dom.a11y.setRole=function(b,c){if(goog.userAgent.GECKO||goog.dom.a11y.noBrowserCheck_){b.setAttribute("role",c);b.roleName=c}};goog.dom.a11y.getRole=function(b){return b.roleName||""};goog.dom.a11y.setState=function(b,c,d){if(goog.userAgent.GECKO||goog.dom.a11y.noBrowserCheck_)b.setAttribute("aria-"+c,d)};goog.dom.a11y.getState=function(b,c){return b.getAttribute("aria-"+c)||""};goog.dom.a11y.getNoBrowserCheck=function(){return!!goog.dom.a11y.noBrowserCheck_};
+goog.dom.a11y.setNoBrowserCheck=function(b){goog.dom.a11y.noBrowserCheck_=b};goog.dom.a11y.getActiveDescendant=function(b){var c=goog.dom.a11y.getState(b,goog.dom.a11y.State.ACTIVEDESCENDANT);return goog.dom.getOwnerDocument(b).getElementById(c)};goog.dom.a11y.setActiveDescendant=function(b,c){goog.dom.a11y.setState(b,goog.dom.a11y.State.ACTIVEDESCENDANT,c?c.id:"")};goog.events.KeyCodes={MAC_ENTER:3,BACKSPACE:8,TAB:9,NUM_CENTER:12,ENTER:13,SHIFT:16,CTRL:17,ALT:18,PAUSE:19,CAPS_LOCK:20,ESC:27,SPACE:32,PAGE_UP:33,PAGE_DOWN:34,END:35,HOME:36,LEFT:37,UP:38,RIGHT:39,DOWN:40,PRINT_SCREEN:44,INSERT:45,DELETE:46,ZERO:48,ONE:49,TWO:50,THREE:51,FOUR:52,FIVE:53,SIX:54,SEVEN:55,EIGHT:56,NINE:57,QUESTION_MARK:63,A:65,B:66,C:67,D:68,E:69,F:70,G:71,H:72,I:73,J:74,K:75,L:76,M:77,N:78,O:79,P:80,Q:81,R:82,S:83,T:84,U:85,V:86,W:87,X:88,Y:89,Z:90,META:91,CONTEXT_MENU:93,NUM_ZERO:96,
+NUM_ONE:97,NUM_TWO:98,NUM_THREE:99,NUM_FOUR:100,NUM_FIVE:101,NUM_SIX:102,NUM_SEVEN:103,NUM_EIGHT:104,NUM_NINE:105,NUM_MULTIPLY:106,NUM_PLUS:107,NUM_MINUS:109,NUM_PERIOD:110,NUM_DIVISION:111,F1:112,F2:113,F3:114,F4:115,F5:116,F6:117,F7:118,F8:119,F9:120,F10:121,F11:122,F12:123,NUMLOCK:144,SEMICOLON:186,DASH:189,EQUALS:187,COMMA:188,PERIOD:190,SLASH:191,APOSTROPHE:192,SINGLE_QUOTE:222,OPEN_SQUARE_BRACKET:219,BACKSLASH:220,CLOSE_SQUARE_BRACKET:221,WIN_KEY:224,MAC_FF_META:224,WIN_IME:229};
+goog.events.KeyCodes.isTextModifyingKeyEvent=function(b){if(b.altKey&&!b.ctrlKey||b.metaKey||b.keyCode>=goog.events.KeyCodes.F1&&b.keyCode<=goog.events.KeyCodes.F12)return false;switch(b.keyCode){case goog.events.KeyCodes.ALT:case goog.events.KeyCodes.SHIFT:case goog.events.KeyCodes.CTRL:case goog.events.KeyCodes.PAUSE:case goog.events.KeyCodes.CAPS_LOCK:case goog.events.KeyCodes.ESC:case goog.events.KeyCodes.PAGE_UP:case goog.events.KeyCodes.PAGE_DOWN:case goog.events.KeyCodes.HOME:case goog.events.KeyCodes.END:case goog.events.KeyCodes.LEFT:case goog.events.KeyCodes.RIGHT:case goog.events.KeyCodes.UP:case goog.events.KeyCodes.DOWN:case goog.events.KeyCodes.INSERT:case goog.events.KeyCodes.NUMLOCK:case goog.events.KeyCodes.CONTEXT_MENU:case goog.events.KeyCodes.PRINT_SCREEN:return false;
+default:return true}};goog.events.KeyCodes.firesKeyPressEvent=function(b,c,d,e,f){if(!goog.userAgent.IE&&!(goog.userAgent.WEBKIT&&goog.userAgent.isVersion("525")))return true;if(goog.userAgent.MAC&&f)return goog.events.KeyCodes.isCharacterKey(b);if(f&&!e)return false;if(goog.userAgent.IE&&!d&&(c==goog.events.KeyCodes.CTRL||c==goog.events.KeyCodes.ALT))return false;if(goog.userAgent.IE&&e&&c==b)return false;switch(b){case goog.events.KeyCodes.ENTER:return true;case goog.events.KeyCodes.ESC:return!goog.userAgent.WEBKIT}return goog.events.KeyCodes.isCharacterKey(b)};
+goog.events.KeyCodes.isCharacterKey=function(b){if(b>=goog.events.KeyCodes.ZERO&&b<=goog.events.KeyCodes.NINE)return true;if(b>=goog.events.KeyCodes.NUM_ZERO&&b<=goog.events.KeyCodes.NUM_MULTIPLY)return true;if(b>=goog.events.KeyCodes.A&&b<=goog.events.KeyCodes.Z)return true;switch(b){case goog.events.KeyCodes.SPACE:case goog.events.KeyCodes.QUESTION_MARK:case goog.events.KeyCodes.NUM_PLUS:case goog.events.KeyCodes.NUM_MINUS:case goog.events.KeyCodes.NUM_PERIOD:case goog.events.KeyCodes.NUM_DIVISION:case goog.events.KeyCodes.SEMICOLON:case goog.events.KeyCodes.DASH:case goog.events.KeyCodes.EQUALS:case goog.events.KeyCodes.COMMA:case goog.events.KeyCodes.PERIOD:case goog.events.KeyCodes.SLASH:case goog.events.KeyCodes.APOSTROPHE:case goog.events.KeyCodes.SINGLE_QUOTE:case goog.events.KeyCodes.OPEN_SQUARE_BRACKET:case goog.events.KeyCodes.BACKSLASH:case goog.events.KeyCodes.CLOSE_SQUARE_BRACKET:return true;
+default:return false}};goog.events.KeyHandler=function(b){goog.events.EventTarget.call(this);b&&this.attach(b)};goog.inherits(goog.events.KeyHandler,goog.events.EventTarget);a=goog.events.KeyHandler.prototype;a.element_=null;a.keyPressKey_=null;a.keyDownKey_=null;a.keyUpKey_=null;a.lastKey_=-1;a.keyCode_=-1;goog.events.KeyHandler.EventType={KEY:"key"};
+goog.events.KeyHandler.safariKey_={"3":goog.events.KeyCodes.ENTER,"12":goog.events.KeyCodes.NUMLOCK,"63232":goog.events.KeyCodes.UP,"63233":goog.events.KeyCodes.DOWN,"63234":goog.events.KeyCodes.LEFT,"63235":goog.events.KeyCodes.RIGHT,"63236":goog.events.KeyCodes.F1,"63237":goog.events.KeyCodes.F2,"63238":goog.events.KeyCodes.F3,"63239":goog.events.KeyCodes.F4,"63240":goog.events.KeyCodes.F5,"63241":goog.events.KeyCodes.F6,"63242":goog.events.KeyCodes.F7,"63243":goog.events.KeyCodes.F8,"63244":goog.events.KeyCodes.F9,
+"63245":goog.events.KeyCodes.F10,"63246":goog.events.KeyCodes.F11,"63247":goog.events.KeyCodes.F12,"63248":goog.events.KeyCodes.PRINT_SCREEN,"63272":goog.events.KeyCodes.DELETE,"63273":goog.events.KeyCodes.HOME,"63275":goog.events.KeyCodes.END,"63276":goog.events.KeyCodes.PAGE_UP,"63277":goog.events.KeyCodes.PAGE_DOWN,"63289":goog.events.KeyCodes.NUMLOCK,"63302":goog.events.KeyCodes.INSERT};
+goog.events.KeyHandler.keyIdentifier_={Up:goog.events.KeyCodes.UP,Down:goog.events.KeyCodes.DOWN,Left:goog.events.KeyCodes.LEFT,Right:goog.events.KeyCodes.RIGHT,Enter:goog.events.KeyCodes.ENTER,F1:goog.events.KeyCodes.F1,F2:goog.events.KeyCodes.F2,F3:goog.events.KeyCodes.F3,F4:goog.events.KeyCodes.F4,F5:goog.events.KeyCodes.F5,F6:goog.events.KeyCodes.F6,F7:goog.events.KeyCodes.F7,F8:goog.events.KeyCodes.F8,F9:goog.events.KeyCodes.F9,F10:goog.events.KeyCodes.F10,F11:goog.events.KeyCodes.F11,F12:goog.events.KeyCodes.F12,
+"U+007F":goog.events.KeyCodes.DELETE,Home:goog.events.KeyCodes.HOME,End:goog.events.KeyCodes.END,PageUp:goog.events.KeyCodes.PAGE_UP,PageDown:goog.events.KeyCodes.PAGE_DOWN,Insert:goog.events.KeyCodes.INSERT};goog.events.KeyHandler.mozKeyCodeToKeyCodeMap_={61:187,59:186};goog.events.KeyHandler.USES_KEYDOWN_=goog.userAgent.IE||goog.userAgent.WEBKIT&&goog.userAgent.isVersion("525");a=goog.events.KeyHandler.prototype;
+a.handleKeyDown_=function(b){if(goog.events.KeyHandler.USES_KEYDOWN_&&!goog.events.KeyCodes.firesKeyPressEvent(b.keyCode,this.lastKey_,b.shiftKey,b.ctrlKey,b.altKey))this.handleEvent(b);else this.keyCode_=goog.userAgent.GECKO&&b.keyCode in goog.events.KeyHandler.mozKeyCodeToKeyCodeMap_?goog.events.KeyHandler.mozKeyCodeToKeyCodeMap_[b.keyCode]:b.keyCode};a.handleKeyup_=function(){this.keyCode_=this.lastKey_=-1};
+a.handleEvent=function(b){var c=b.getBrowserEvent(),d,e;if(goog.userAgent.IE&&b.type==goog.events.EventType.KEYPRESS){d=this.keyCode_;e=d!=goog.events.KeyCodes.ENTER&&d!=goog.events.KeyCodes.ESC?c.keyCode:0}else if(goog.userAgent.WEBKIT&&b.type==goog.events.EventType.KEYPRESS){d=this.keyCode_;e=c.charCode>=0&&c.charCode<63232&&goog.events.KeyCodes.isCharacterKey(d)?c.charCode:0}else if(goog.userAgent.OPERA){d=this.keyCode_;e=goog.events.KeyCodes.isCharacterKey(d)?c.keyCode:0}else{d=c.keyCode||this.keyCode_;
+e=c.charCode||0;if(goog.userAgent.MAC&&e==goog.events.KeyCodes.QUESTION_MARK&&!d)d=goog.events.KeyCodes.SLASH}var f=d,g=c.keyIdentifier;if(d)if(d>=63232&&d in goog.events.KeyHandler.safariKey_)f=goog.events.KeyHandler.safariKey_[d];else{if(d==25&&b.shiftKey)f=9}else if(g&&g in goog.events.KeyHandler.keyIdentifier_)f=goog.events.KeyHandler.keyIdentifier_[g];b=f==this.lastKey_;this.lastKey_=f;c=new goog.events.KeyEvent(f,e,b,c);try{this.dispatchEvent(c)}finally{c.dispose()}};
+a.attach=function(b){this.keyUpKey_&&this.detach();this.element_=b;this.keyPressKey_=goog.events.listen(this.element_,goog.events.EventType.KEYPRESS,this);this.keyDownKey_=goog.events.listen(this.element_,goog.events.EventType.KEYDOWN,this.handleKeyDown_,false,this);this.keyUpKey_=goog.events.listen(this.element_,goog.events.EventType.KEYUP,this.handleKeyup_,false,this)};
+a.detach=function(){if(this.keyPressKey_){goog.events.unlistenByKey(this.keyPressKey_);goog.events.unlistenByKey(this.keyDownKey_);goog.events.unlistenByKey(this.keyUpKey_);this.keyUpKey_=this.keyDownKey_=this.keyPressKey_=null}this.element_=null;this.lastKey_=-1};a.disposeInternal=function(){goog.events.KeyHandler.superClass_.disposeInternal.call(this);this.detach()};
+goog.events.KeyEvent=function(b,c,d,e){goog.events.BrowserEvent.call(this,e);this.type=goog.events.KeyHandler.EventType.KEY;this.keyCode=b;this.charCode=c;this.repeat=d};goog.inherits(goog.events.KeyEvent,goog.events.BrowserEvent);goog.ui.DatePicker=function(b,c){goog.events.EventTarget.call(this);b=goog.isObject(b)?new goog.date.Date(b):new goog.date.Date;this.symbols_=c||goog.i18n.DateTimeSymbols;this.wdayNames_=this.symbols_.SHORTWEEKDAYS;b.setFirstWeekCutOffDay(this.symbols_.FIRSTWEEKCUTOFFDAY);b.setFirstDayOfWeek(this.symbols_.FIRSTDAYOFWEEK);this.date_=b;this.activeMonth_=this.date_.clone();this.activeMonth_.setDate(1);this.wdayStyles_=["","","","","","",""];this.wdayStyles_[this.symbols_.WEEKENDRANGE[0]]="goog-date-picker-wkend-start";
+this.wdayStyles_[this.symbols_.WEEKENDRANGE[1]]="goog-date-picker-wkend-end";this.eventHandler_=new goog.events.EventHandler(this);this.keyHandlers_={}};goog.inherits(goog.ui.DatePicker,goog.events.EventTarget);goog.ui.DatePicker.prototype.showFixedNumWeeks_=true;goog.ui.DatePicker.DATE_FORMATTER_=new goog.i18n.DateTimeFormat(goog.i18n.DateTimeFormat.Format.FULL_DATE);a=goog.ui.DatePicker.prototype;a.showOtherMonths_=true;a.extraWeekAtEnd_=true;a.showWeekNum_=true;a.showWeekdays_=true;
+a.allowNone_=true;a.showToday_=true;a.simpleNavigation_=false;a.created_=false;a.decoratorFunction_=null;goog.ui.DatePicker.nextId_=0;goog.ui.DatePicker.Events={CHANGE:"change",SELECT:"select"};a=goog.ui.DatePicker.prototype;a.isCreated=function(){return this.created_};a.getFirstWeekday=function(){return this.activeMonth_.getFirstDayOfWeek()};a.getWeekdayClass=function(b){return this.wdayStyles_[b]};a.getShowFixedNumWeeks=function(){return this.showFixedNumWeeks_};a.getShowOtherMonths=function(){return this.showOtherMonths_};
+a.getExtraWeekAtEnd=function(){return this.extraWeekAtEnd_};a.getShowWeekNum=function(){return this.showWeekNum_};a.getShowWeekdayNames=function(){return this.showWeekdays_};a.getAllowNone=function(){return this.allowNone_};a.getShowToday=function(){return this.showToday_};a.setFirstWeekday=function(b){this.activeMonth_.setFirstDayOfWeek(b);this.updateCalendarGrid_();this.redrawWeekdays_()};a.setWeekdayClass=function(b,c){this.wdayStyles_[b]=c;this.redrawCalendarGrid_()};
+a.setShowFixedNumWeeks=function(b){this.showFixedNumWeeks_=b;this.updateCalendarGrid_()};a.setShowOtherMonths=function(b){this.showOtherMonths_=b;this.redrawCalendarGrid_()};a.setUseSimpleNavigationMenu=function(b){this.simpleNavigation_=b;this.updateNavigationRow_();this.updateCalendarGrid_()};a.setExtraWeekAtEnd=function(b){this.extraWeekAtEnd_=b;this.updateCalendarGrid_()};a.setShowWeekNum=function(b){this.showWeekNum_=b;this.updateNavigationRow_();this.updateCalendarGrid_()};
+a.setShowWeekdayNames=function(b){this.showWeekdays_=b;this.redrawCalendarGrid_()};a.setUseNarrowWeekdayNames=function(b){this.wdayNames_=b?this.symbols_.NARROWWEEKDAYS:this.symbols_.SHORTWEEKDAYS;this.redrawWeekdays_()};a.setAllowNone=function(b){this.allowNone_=b;this.elNone_&&this.updateTodayAndNone_()};a.setShowToday=function(b){this.showToday_=b;this.elToday_&&this.updateTodayAndNone_()};
+a.updateTodayAndNone_=function(){goog.style.showElement(this.elToday_,this.showToday_);goog.style.showElement(this.elNone_,this.allowNone_);goog.style.showElement(this.tableFoot_,this.showToday_||this.allowNone_)};a.setDecorator=function(b){this.decoratorFunction_=b};a.previousMonth=function(){this.activeMonth_.add(new goog.date.Interval(goog.date.Interval.MONTHS,-1));this.updateCalendarGrid_()};a.nextMonth=function(){this.activeMonth_.add(new goog.date.Interval(goog.date.Interval.MONTHS,1));this.updateCalendarGrid_()};
+a.previousYear=function(){this.activeMonth_.add(new goog.date.Interval(goog.date.Interval.YEARS,-1));this.updateCalendarGrid_()};a.nextYear=function(){this.activeMonth_.add(new goog.date.Interval(goog.date.Interval.YEARS,1));this.updateCalendarGrid_()};a.selectToday=function(){this.setDate(new goog.date.Date)};a.selectNone=function(){this.allowNone_&&this.setDate(null)};a.getDate=function(){return this.date_};
+a.setDate=function(b){var c=false;if(b==null&&this.date_!=null||b!=null&&this.date_==null)c=true;else if(b==null)c=false;else if(b.getDate()!=this.date_.getDate()||b.getMonth()!=this.date_.getMonth()||b.getFullYear()!=this.date_.getFullYear())c=true;this.date_=goog.isObject(b)?new goog.date.Date(b):null;if(b){this.activeMonth_.set(this.date_);this.activeMonth_.setDate(1)}this.updateCalendarGrid_();b=new goog.ui.DatePickerEvent(goog.ui.DatePicker.Events.SELECT,this,this.date_?this.date_:null);this.dispatchEvent(b);
+if(c){c=new goog.ui.DatePickerEvent(goog.ui.DatePicker.Events.CHANGE,this,this.date_?this.date_:null);this.dispatchEvent(c)}};
+a.updateNavigationRow_=function(){if(this.elNavRow_){for(var b=this.elNavRow_;b.firstChild;)b.removeChild(b.firstChild);var c=goog.dom.getDomHelper(b),d;if(this.simpleNavigation_){d=c.createElement("td");d.colSpan=this.showWeekNum_?1:2;this.createButton_(d,"\u00ab",this.previousMonth);b.appendChild(d);d=c.createElement("td");d.colSpan=this.showWeekNum_?6:5;d.className="goog-date-picker-monthyear";b.appendChild(d);this.elMonthYear_=d;d=c.createElement("td");this.createButton_(d,"\u00bb",this.nextMonth);
+b.appendChild(d)}else{var e=this.symbols_.DATEFORMATS[goog.i18n.DateTimeFormat.Format.FULL_DATE].toLowerCase();d=c.createElement("td");d.colSpan=5;this.createButton_(d,"\u00ab",this.previousMonth);this.elMonth_=this.createButton_(d,"",this.showMonthMenu_,"goog-date-picker-month");this.createButton_(d,"\u00bb",this.nextMonth);c=c.createElement("td");c.colSpan=3;this.createButton_(c,"\u00ab",this.previousYear);this.elYear_=this.createButton_(c,"",this.showYearMenu_,"goog-date-picker-year");this.createButton_(c,
+"\u00bb",this.nextYear);if(e.indexOf("y")<e.indexOf("m")){b.appendChild(c);b.appendChild(d)}else{b.appendChild(d);b.appendChild(c)}}}};
+a.create=function(b){this.el_=b;var c=goog.dom.getDomHelper(b);b.className="goog-date-picker";var d=c.createElement("table"),e=c.createElement("thead"),f=c.createElement("tbody"),g=c.createElement("tfoot");goog.dom.a11y.setRole(f,"grid");f.tabIndex="0";this.tableBody_=f;this.tableFoot_=g;var h=c.createDom("tr","goog-date-picker-head");this.elNavRow_=h;this.updateNavigationRow_();e.appendChild(h);var i;this.elTable_=[];for(var j=0;j<7;j++){h=c.createElement("tr");this.elTable_[j]=[];for(var k=0;k<
+8;k++){i=c.createElement(k==0||j==0?"th":"td");if((k==0||j==0)&&k!=j){i.className=k==0?"goog-date-picker-week":"goog-date-picker-wday";goog.dom.a11y.setRole(i,k==0?"rowheader":"columnheader")}h.appendChild(i);this.elTable_[j][k]=i}f.appendChild(h)}h=c.createDom("tr","goog-date-picker-foot");i=c.createDom("td",{colSpan:2,className:"goog-date-picker-today-cont"});j=goog.getMsg("Today");this.elToday_=this.createButton_(i,j,this.selectToday);h.appendChild(i);i=c.createDom("td",{colSpan:4});h.appendChild(i);
+i=c.createElement("td");i.colSpan=2;i.className="goog-date-picker-none-cont";c=goog.getMsg("None");this.elNone_=this.createButton_(i,c,this.selectNone);h.appendChild(i);g.appendChild(h);this.updateTodayAndNone_();d.cellSpacing="0";d.cellPadding="0";d.appendChild(e);d.appendChild(f);d.appendChild(g);b.appendChild(d);this.created_=true;this.redrawWeekdays_();this.updateCalendarGrid_();this.eventHandler_.listen(f,goog.events.EventType.CLICK,this.handleGridClick_);this.eventHandler_.listen(this.getKeyHandlerForElement_(b),
+goog.events.KeyHandler.EventType.KEY,this.handleGridKeyPress_);b.tabIndex=0};
+a.disposeInternal=function(){goog.ui.DatePicker.superClass_.disposeInternal.call(this);this.destroyMenu_();for(var b in this.keyHandlers_)this.keyHandlers_[b].dispose();delete this.keyHandlers_;if(this.eventHandler_){this.eventHandler_.dispose();delete this.eventHandler_}this.el_.innerHTML="";this.elNone_=this.elToday_=this.elYear_=this.elMonthYear_=this.elMonth_=this.elNavRow_=this.tableFoot_=this.tableBody_=this.elTable_=this.el_=null};
+a.handleGridClick_=function(b){if(b.target.tagName=="TD"){var c,d=-2,e=-2;for(c=b.target;c;c=c.previousSibling,d++);for(c=b.target.parentNode;c;c=c.previousSibling,e++);b=this.grid_[e][d];this.setDate(b.clone())}};
+a.handleGridKeyPress_=function(b){var c,d;switch(b.keyCode){case 33:b.preventDefault();c=-1;break;case 34:b.preventDefault();c=1;break;case 37:b.preventDefault();d=-1;break;case 39:b.preventDefault();d=1;break;case 38:b.preventDefault();d=-7;break;case 40:b.preventDefault();d=7;break;case 36:b.preventDefault();this.selectToday();case 46:b.preventDefault();this.selectNone();default:return}if(this.date_){b=this.date_.clone();b.add(new goog.date.Interval(0,c,d))}else{b=this.activeMonth_.clone();b.setDate(1)}this.setDate(b)};
+a.showMonthMenu_=function(b){b.stopPropagation();b=[];for(var c=0;c<12;c++)b.push(this.symbols_.MONTHS[c]);this.createMenu_(this.elMonth_,b,this.handleMonthMenuClick_,this.symbols_.MONTHS[this.activeMonth_.getMonth()])};a.showYearMenu_=function(b){b.stopPropagation();b=[];for(var c=this.activeMonth_.getFullYear()-5,d=0;d<11;d++)b.push(String(c+d));this.createMenu_(this.elYear_,b,this.handleYearMenuClick_,String(this.activeMonth_.getFullYear()))};
+a.handleMonthMenuClick_=function(b){b=b;for(var c=-1;b;b=goog.dom.getPreviousElementSibling(b),c++);this.activeMonth_.setMonth(c);this.updateCalendarGrid_();this.elMonth_.focus&&this.elMonth_.focus()};a.handleYearMenuClick_=function(b){if(b.firstChild.nodeType==goog.dom.NodeType.TEXT){this.activeMonth_.setFullYear(Number(b.firstChild.nodeValue));this.updateCalendarGrid_()}this.elYear_.focus()};
+a.createMenu_=function(b,c,d,e){this.destroyMenu_();var f=goog.dom.getDomHelper(b),g=f.createDom("div","goog-date-picker-menu");this.menuSelected_=null;for(var h=f.createElement("ul"),i=0;i<c.length;i++){var j=f.createDom("li",null,c[i]);if(c[i]==e)this.menuSelected_=j;h.appendChild(j)}g.appendChild(h);g.style.left=b.offsetLeft+b.parentNode.offsetLeft+"px";g.style.top=b.offsetTop+"px";g.style.width=b.clientWidth+"px";this.elMonth_.parentNode.appendChild(g);this.menu_=g;if(!this.menuSelected_)this.menuSelected_=
+h.firstChild;this.menuSelected_.className="goog-date-picker-menu-selected";this.menuCallback_=d;this.eventHandler_.listen(this.menu_,goog.events.EventType.CLICK,this.handleMenuClick_);this.eventHandler_.listen(this.getKeyHandlerForElement_(this.menu_),goog.events.KeyHandler.EventType.KEY,this.handleMenuKeyPress_);this.eventHandler_.listen(f.getDocument(),goog.events.EventType.CLICK,this.destroyMenu_);g.tabIndex=0;g.focus()};
+a.handleMenuClick_=function(b){b.stopPropagation();this.destroyMenu_();this.menuCallback_&&this.menuCallback_(b.target)};
+a.handleMenuKeyPress_=function(b){b.stopPropagation();var c,d=this.menuSelected_;switch(b.keyCode){case 35:b.preventDefault();c=d.parentNode.lastChild;break;case 36:b.preventDefault();c=d.parentNode.firstChild;break;case 38:b.preventDefault();c=d.previousSibling;break;case 40:b.preventDefault();c=d.nextSibling;break;case 13:case 9:case 0:b.preventDefault();this.destroyMenu_();this.menuCallback_(d);break}if(c&&c!=d){d.className="";c.className="goog-date-picker-menu-selected";this.menuSelected_=c}};
+a.destroyMenu_=function(){if(this.menu_){var b=goog.dom.getDomHelper(this.menu_);this.eventHandler_.unlisten(this.menu_,goog.events.EventType.CLICK,this.handleMenuClick_);this.eventHandler_.unlisten(this.getKeyHandlerForElement_(this.menu_),goog.events.KeyHandler.EventType.KEY,this.handleMenuKeyPress_);this.eventHandler_.unlisten(b.getDocument(),goog.events.EventType.CLICK,this.destroyMenu_);b.removeNode(this.menu_);delete this.menu_}};
+a.createButton_=function(b,c,d,e){var f=["goog-date-picker-btn"];e&&f.push(e);e=goog.dom.getDomHelper(b);var g=e.createElement("button");g.className=f.join(" ");g.appendChild(e.createTextNode(c));b.appendChild(g);this.eventHandler_.listen(g,goog.events.EventType.CLICK,d);return g};
+a.updateCalendarGrid_=function(){if(this.created_){var b=this.activeMonth_.clone();b.setDate(1);this.elMonthYear_&&goog.dom.setTextContent(this.elMonthYear_,goog.date.formatMonthAndYear(this.symbols_.MONTHS[b.getMonth()],b.getFullYear()));this.elMonth_&&goog.dom.setTextContent(this.elMonth_,this.symbols_.MONTHS[b.getMonth()]);this.elYear_&&goog.dom.setTextContent(this.elYear_,String(b.getFullYear()));var c=b.getWeekday(),d=b.getNumberOfDaysInMonth();b.add(new goog.date.Interval(goog.date.Interval.MONTHS,
+-1));b.setDate(b.getNumberOfDaysInMonth()-(c-1));this.showFixedNumWeeks_&&!this.extraWeekAtEnd_&&d+c<33&&b.add(new goog.date.Interval(goog.date.Interval.DAYS,-7));c=new goog.date.Interval(goog.date.Interval.DAYS,1);this.grid_=[];for(d=0;d<6;d++){this.grid_[d]=[];for(var e=0;e<7;e++){this.grid_[d][e]=b.clone();b.add(c)}}this.redrawCalendarGrid_()}};
+a.redrawCalendarGrid_=function(){if(this.created_){var b=this.activeMonth_.getMonth(),c=new goog.date.Date,d=c.getFullYear(),e=c.getMonth();c=c.getDate();for(var f=0;f<6;f++){if(this.showWeekNum_){goog.dom.setTextContent(this.elTable_[f+1][0],this.grid_[f][0].getWeekNumber());goog.dom.classes.set(this.elTable_[f+1][0],"goog-date-picker-week")}else{goog.dom.setTextContent(this.elTable_[f+1][0],"");goog.dom.classes.set(this.elTable_[f+1][0],"")}this.tableBody_.title=this.date_?goog.ui.DatePicker.DATE_FORMATTER_.format(this.date_):
+"";for(var g=0;g<7;g++){var h=this.grid_[f][g],i=this.elTable_[f+1][g+1];if(!i.id)i.id="goog-dp-"+goog.ui.DatePicker.nextId_++;goog.dom.a11y.setRole(i,"gridcell");var j=["goog-date-picker-date"];if(this.showOtherMonths_||h.getMonth()==b){h.getMonth()!=b&&j.push("goog-date-picker-other-month");var k=(g+this.activeMonth_.getFirstDayOfWeek()+7)%7;this.wdayStyles_[k]&&j.push(this.wdayStyles_[k]);if(h.getDate()==c&&h.getMonth()==e&&h.getFullYear()==d){j.push("goog-date-picker-today");k=goog.getMsg("Today");
+i.title=k}if(this.date_&&h.getDate()==this.date_.getDate()&&h.getMonth()==this.date_.getMonth()&&h.getFullYear()==this.date_.getFullYear()){j.push("goog-date-picker-selected");goog.dom.a11y.setState(this.tableBody_,"activedescendant",i.id)}if(this.decoratorFunction_)(k=this.decoratorFunction_(h))&&j.push(k);goog.dom.setTextContent(i,h.getDate())}else goog.dom.setTextContent(i,"");goog.dom.classes.set(i,j.join(" "))}if(f>=4)goog.style.showElement(this.elTable_[f+1][0].parentNode,this.grid_[f][0].getMonth()==
+b||this.showFixedNumWeeks_)}}};a.redrawWeekdays_=function(){if(this.created_){if(this.showWeekdays_)for(var b=0;b<7;b++){var c=this.elTable_[0][b+1],d=(b+this.activeMonth_.getFirstDayOfWeek()+7)%7;goog.dom.setTextContent(c,this.wdayNames_[(d+1)%7])}goog.style.showElement(this.elTable_[0][0].parentNode,this.showWeekdays_)}};a.getKeyHandlerForElement_=function(b){var c=goog.getHashCode(b);c in this.keyHandlers_||(this.keyHandlers_[c]=new goog.events.KeyHandler(b));return this.keyHandlers_[c]};
+goog.ui.DatePickerEvent=function(b,c,d){goog.events.Event.call(this,b);this.target=c;this.date=d};goog.inherits(goog.ui.DatePickerEvent,goog.events.Event);goog.positioning.AbsolutePosition=function(b,c){this.coordinate=b instanceof goog.math.Coordinate?b:new goog.math.Coordinate(b,c)};goog.inherits(goog.positioning.AbsolutePosition,goog.positioning.AbstractPosition);goog.positioning.AbsolutePosition.prototype.reposition=function(b,c,d,e){goog.positioning.positionAtCoordinate(this.coordinate,b,c,d,null,null,e)};goog.positioning.AnchoredViewportPosition=function(b,c,d){goog.positioning.AnchoredPosition.call(this,b,c);this.adjust_=d};goog.inherits(goog.positioning.AnchoredViewportPosition,goog.positioning.AnchoredPosition);
+goog.positioning.AnchoredViewportPosition.prototype.reposition=function(b,c,d,e){var f=goog.positioning.positionAtAnchor(this.element,this.corner,b,c,null,d,goog.positioning.Overflow.FAIL_X|goog.positioning.Overflow.FAIL_Y,e)&goog.positioning.OverflowStatus.FAILED;if(f)if(f=goog.positioning.positionAtAnchor(this.element,c,b,this.corner,null,d,goog.positioning.Overflow.FAIL_X|goog.positioning.Overflow.FAIL_Y,e)&goog.positioning.OverflowStatus.FAILED)this.adjust_?goog.positioning.positionAtAnchor(this.element,
+this.corner,b,c,null,d,goog.positioning.Overflow.ADJUST_X|goog.positioning.Overflow.ADJUST_Y,e):goog.positioning.positionAtAnchor(this.element,this.corner,b,c,null,d,goog.positioning.Overflow.IGNORE,e)};goog.positioning.ClientPosition=function(b,c){this.coordinate=b instanceof goog.math.Coordinate?b:new goog.math.Coordinate(b,c)};goog.inherits(goog.positioning.ClientPosition,goog.positioning.AbstractPosition);goog.positioning.ClientPosition.prototype.reposition=function(b,c,d,e){var f=goog.style.getClientViewportElement(b),g=new goog.math.Coordinate(this.coordinate.x+f.scrollLeft,this.coordinate.y+f.scrollTop);goog.positioning.positionAtAnchor(f,goog.positioning.Corner.TOP_LEFT,b,c,g,d,null,e)};goog.positioning.ViewportClientPosition=function(b,c){goog.positioning.ClientPosition.call(this,b,c)};goog.inherits(goog.positioning.ViewportClientPosition,goog.positioning.ClientPosition);
+goog.positioning.ViewportClientPosition.prototype.reposition=function(b,c,d,e){var f=goog.style.getClientViewportElement(b);f=goog.style.getVisibleRectForElement(f);var g=goog.dom.getDomHelper(b).getDocumentScrollElement();g=new goog.math.Coordinate(this.coordinate.x+g.scrollLeft,this.coordinate.y+g.scrollTop);var h=goog.positioning.Overflow.FAIL_X|goog.positioning.Overflow.FAIL_Y,i=c,j=goog.positioning.positionAtCoordinate(g,b,i,d,f,h,e);if((j&goog.positioning.OverflowStatus.FAILED)!=0){if(j&goog.positioning.OverflowStatus.FAILED_LEFT||
+j&goog.positioning.OverflowStatus.FAILED_RIGHT)i=goog.positioning.flipCornerHorizontal(i);if(j&goog.positioning.OverflowStatus.FAILED_TOP||j&goog.positioning.OverflowStatus.FAILED_BOTTOM)i=goog.positioning.flipCornerVertical(i);j=goog.positioning.positionAtCoordinate(g,b,i,d,f,h,e);(j&goog.positioning.OverflowStatus.FAILED)!=0&&goog.positioning.positionAtCoordinate(g,b,c,d,f,undefined,e)}};goog.positioning.ViewportPosition=function(b,c){this.coordinate=b instanceof goog.math.Coordinate?b:new goog.math.Coordinate(b,c)};goog.inherits(goog.positioning.ViewportPosition,goog.positioning.AbstractPosition);goog.positioning.ViewportPosition.prototype.reposition=function(b,c,d,e){goog.positioning.positionAtAnchor(goog.style.getClientViewportElement(b),goog.positioning.Corner.TOP_LEFT,b,c,this.coordinate,d,null,e)};goog.Timer=function(b,c){goog.events.EventTarget.call(this);this.interval_=b||1;this.timerObject_=c||goog.Timer.defaultTimerObject;this.boundTick_=goog.bind(this.tick_,this);this.last_=goog.now()};goog.inherits(goog.Timer,goog.events.EventTarget);goog.Timer.MAX_TIMEOUT_=2147483647;goog.Timer.prototype.enabled=false;goog.Timer.defaultTimerObject=goog.global.window;goog.Timer.intervalScale=0.8;a=goog.Timer.prototype;a.timer_=null;a.getInterval=function(){return this.interval_};
+a.setInterval=function(b){this.interval_=b;if(this.timer_&&this.enabled){this.stop();this.start()}else this.timer_&&this.stop()};a.tick_=function(){if(this.enabled){var b=goog.now()-this.last_;if(b>0&&b<this.interval_*goog.Timer.intervalScale)this.timer_=this.timerObject_.setTimeout(this.boundTick_,this.interval_-b);else{this.dispatchTick();if(this.enabled){this.timer_=this.timerObject_.setTimeout(this.boundTick_,this.interval_);this.last_=goog.now()}}}};a.dispatchTick=function(){this.dispatchEvent(goog.Timer.TICK)};
+a.start=function(){this.enabled=true;if(!this.timer_){this.timer_=this.timerObject_.setTimeout(this.boundTick_,this.interval_);this.last_=goog.now()}};a.stop=function(){this.enabled=false;if(this.timer_){this.timerObject_.clearTimeout(this.timer_);this.timer_=null}};a.disposeInternal=function(){goog.Timer.superClass_.disposeInternal.call(this);this.stop();delete this.timerObject_};goog.Timer.TICK="tick";
+goog.Timer.callOnce=function(b,c,d){if(goog.isFunction(b)){if(d)b=goog.bind(b,d)}else if(b&&typeof b.handleEvent=="function")b=goog.bind(b.handleEvent,b);else throw Error("Invalid listener argument");return c>goog.Timer.MAX_TIMEOUT_?-1:goog.Timer.defaultTimerObject.setTimeout(b,c||0)};goog.Timer.clear=function(b){goog.Timer.defaultTimerObject.clearTimeout(b)};goog.ui.PopupBase=function(b,c){this.handler_=new goog.events.EventHandler(this);this.setElement(b||null);c&&this.setType(c)};goog.inherits(goog.ui.PopupBase,goog.events.EventTarget);goog.ui.PopupBase.Type={TOGGLE_DISPLAY:"toggle_display",MOVE_OFFSCREEN:"move_offscreen"};a=goog.ui.PopupBase.prototype;a.element_=null;a.autoHide_=true;a.autoHideRegion_=null;a.isVisible_=false;a.shouldHideAsync_=false;a.lastShowTime_=-1;a.lastHideTime_=-1;a.hideOnEscape_=false;a.enableCrossIframeDismissal_=true;
+a.type_=goog.ui.PopupBase.Type.TOGGLE_DISPLAY;goog.ui.PopupBase.EventType={BEFORE_SHOW:"beforeshow",SHOW:"show",BEFORE_HIDE:"beforehide",HIDE:"hide"};goog.ui.PopupBase.DEBOUNCE_DELAY_MS=150;a=goog.ui.PopupBase.prototype;a.getType=function(){return this.type_};a.setType=function(b){this.type_=b};a.shouldHideAsync=function(){return this.shouldHideAsync_};a.setShouldHideAsync=function(b){this.shouldHideAsync_=b};a.getElement=function(){return this.element_};
+a.setElement=function(b){this.ensureNotVisible_();this.element_=b};a.getAutoHide=function(){return this.autoHide_};a.setAutoHide=function(b){this.ensureNotVisible_();this.autoHide_=b};a.getHideOnEscape=function(){return this.hideOnEscape_};a.setHideOnEscape=function(b){this.ensureNotVisible_();this.hideOnEscape_=b};a.getEnableCrossIframeDismissal=function(){return this.enableCrossIframeDismissal_};a.setEnableCrossIframeDismissal=function(b){this.enableCrossIframeDismissal_=b};
+a.getAutoHideRegion=function(){return this.autoHideRegion_};a.setAutoHideRegion=function(b){this.autoHideRegion_=b};a.getLastShowTime=function(){return this.lastShowTime_};a.getLastHideTime=function(){return this.lastHideTime_};a.ensureNotVisible_=function(){if(this.isVisible_)throw Error("Can not change this state of the popup while showing.");};a.isVisible=function(){return this.isVisible_};a.isOrWasRecentlyVisible=function(){return this.isVisible_||goog.now()-this.lastHideTime_<goog.ui.PopupBase.DEBOUNCE_DELAY_MS};
+a.setVisible=function(b){b?this.show_():this.hide_()};a.reposition=function(){};
+a.show_=function(){if(!this.isVisible_)if(this.onBeforeShow()){if(!this.element_)throw Error("Caller must call setElement before trying to show the popup");this.reposition();var b=goog.dom.getOwnerDocument(this.element_);this.hideOnEscape_&&this.handler_.listen(b,goog.events.EventType.KEYDOWN,this.onDocumentKeyDown_,true);if(this.autoHide_){this.handler_.listen(b,goog.events.EventType.MOUSEDOWN,this.onDocumentMouseDown_,true);if(goog.userAgent.IE){for(var c=b.activeElement;c&&c.nodeName=="IFRAME";){try{var d=
+goog.dom.getFrameContentDocument(c)}catch(e){break}b=d;c=b.activeElement}this.handler_.listen(b,goog.events.EventType.MOUSEDOWN,this.onDocumentMouseDown_,true);this.handler_.listen(b,goog.events.EventType.DEACTIVATE,this.onDocumentBlur_)}else this.handler_.listen(b,goog.events.EventType.BLUR,this.onDocumentBlur_)}if(this.type_==goog.ui.PopupBase.Type.TOGGLE_DISPLAY)this.showPopupElement();else this.type_==goog.ui.PopupBase.Type.MOVE_OFFSCREEN&&this.reposition();this.isVisible_=true;this.onShow_()}};
+a.hide_=function(b){if(!this.isVisible_||!this.onBeforeHide_(b))return false;this.handler_&&this.handler_.removeAll();if(this.type_==goog.ui.PopupBase.Type.TOGGLE_DISPLAY)this.shouldHideAsync_?goog.Timer.callOnce(this.hidePopupElement_,0,this):this.hidePopupElement_();else this.type_==goog.ui.PopupBase.Type.MOVE_OFFSCREEN&&this.moveOffscreen_();this.isVisible_=false;this.onHide_(b);return true};
+a.showPopupElement=function(){this.element_.style.visibility="visible";goog.style.showElement(this.element_,true)};a.hidePopupElement_=function(){this.element_.style.visibility="hidden";goog.style.showElement(this.element_,false)};a.moveOffscreen_=function(){this.element_.style.left="-200px";this.element_.style.top="-200px"};a.onBeforeShow=function(){return this.dispatchEvent(goog.ui.PopupBase.EventType.BEFORE_SHOW)};a.onShow_=function(){this.lastShowTime_=goog.now();this.lastHideTime_=-1;this.dispatchEvent(goog.ui.PopupBase.EventType.SHOW)};
+a.onBeforeHide_=function(b){return this.dispatchEvent({type:goog.ui.PopupBase.EventType.BEFORE_HIDE,target:b})};a.onHide_=function(b){this.lastHideTime_=goog.now();this.dispatchEvent({type:goog.ui.PopupBase.EventType.HIDE,target:b})};a.onDocumentMouseDown_=function(b){b=b.target;if(!goog.dom.contains(this.element_,b)&&(!this.autoHideRegion_||goog.dom.contains(this.autoHideRegion_,b))&&!this.shouldDebounce_())this.hide_(b)};
+a.onDocumentKeyDown_=function(b){if(b.keyCode==goog.events.KeyCodes.ESC)if(this.hide_(b.target)){b.preventDefault();b.stopPropagation()}};a.onDocumentBlur_=function(b){if(this.enableCrossIframeDismissal_){var c=goog.dom.getOwnerDocument(this.element_);if(goog.userAgent.IE||goog.userAgent.OPERA){if((b=c.activeElement)&&goog.dom.contains(this.element_,b))return}else if(b.target!=c)return;this.shouldDebounce_()||this.hide_()}};a.shouldDebounce_=function(){return goog.now()-this.lastShowTime_<goog.ui.PopupBase.DEBOUNCE_DELAY_MS};
+a.disposeInternal=function(){goog.ui.PopupBase.superClass_.disposeInternal.call(this);this.handler_.dispose();delete this.element_;delete this.handler_};goog.ui.Popup=function(b,c){this.popupCorner_=goog.positioning.Corner.TOP_START;this.position_=c||undefined;goog.ui.PopupBase.call(this,b)};goog.inherits(goog.ui.Popup,goog.ui.PopupBase);goog.ui.Popup.Corner=goog.positioning.Corner;goog.ui.Popup.Overflow=goog.positioning.Overflow;a=goog.ui.Popup.prototype;a.getPinnedCorner=function(){return this.popupCorner_};a.setPinnedCorner=function(b){this.popupCorner_=b;this.isVisible()&&this.reposition()};a.getPosition=function(){return this.position_||null};
+a.setPosition=function(b){this.position_=b||undefined;this.isVisible()&&this.reposition()};a.getMargin=function(){return this.margin_||null};a.setMargin=function(b,c,d,e){this.margin_=b==null||b instanceof goog.math.Box?b:new goog.math.Box(b,c,d,e);this.isVisible()&&this.reposition()};
+a.reposition=function(){if(this.position_){var b=!this.isVisible()&&this.getType()!=goog.ui.PopupBase.Type.MOVE_OFFSCREEN,c=this.getElement();if(b){c.style.visibility="hidden";goog.style.showElement(c,true)}this.position_.reposition(c,this.popupCorner_,this.margin_);b&&goog.style.showElement(c,false)}};goog.ui.Popup.positionPopup=function(b,c,d,e,f,g,h){return(goog.positioning.positionAtAnchor(b,c,d,e,f,g,h)&goog.positioning.OverflowStatus.FAILED)==0};
+goog.ui.Popup.positionAtCoordinate=function(b,c,d,e){goog.positioning.positionAtCoordinate(b,c,d,e);return true};goog.ui.Popup.AnchoredPosition=goog.positioning.AnchoredPosition;goog.ui.Popup.AnchoredViewPortPosition=goog.positioning.AnchoredViewportPosition;goog.ui.Popup.AbsolutePosition=goog.positioning.AbsolutePosition;goog.ui.Popup.ViewPortPosition=goog.positioning.ViewportPosition;goog.ui.Popup.ClientPosition=goog.positioning.ClientPosition;goog.ui.Popup.ViewPortClientPosition=goog.positioning.ViewportClientPosition;goog.ui.PopupDatePicker=function(b,c){goog.ui.Component.call(this,c);this.datePicker_=b||new goog.ui.DatePicker};goog.inherits(goog.ui.PopupDatePicker,goog.ui.Component);a=goog.ui.PopupDatePicker.prototype;a.datePicker_=null;a.popup_=null;a.lastTarget_=null;a.allowAutoFocus_=true;a.createDom=function(){goog.ui.PopupDatePicker.superClass_.createDom.call(this);this.getElement().className="goog-popupdatepicker";this.popup_=new goog.ui.Popup(this.getElement())};
+a.enterDocument=function(){goog.ui.PopupDatePicker.superClass_.enterDocument.call(this);if(!this.datePicker_.isCreated()){var b=this.getElement();this.datePicker_.create(b);b.style.visibility="hidden";goog.style.showElement(b,false)}this.getHandler().listen(this.datePicker_,goog.ui.DatePicker.Events.CHANGE,this.onDateChanged_)};a.disposeInternal=function(){goog.ui.PopupDatePicker.superClass_.disposeInternal.call(this);this.datePicker_.dispose();this.lastTarget_=this.datePicker_=null};
+a.canDecorate=function(){return false};a.getDatePicker=function(){return this.datePicker_};a.getDate=function(){return this.datePicker_.getDate()};a.setDate=function(b){this.datePicker_.setDate(b)};a.getLastTarget=function(){return this.lastTarget_};a.attach=function(b){this.getHandler().listen(b,goog.events.EventType.MOUSEDOWN,this.showPopup_)};a.detach=function(b){this.getHandler().unlisten(b,goog.events.EventType.MOUSEDOWN,this.showPopup_)};
+a.setAllowAutoFocus=function(b){this.allowAutoFocus_=b};a.getAllowAutoFocus=function(){return this.allowAutoFocus_};
+a.showPopup=function(b){this.lastTarget_=b;this.popup_.setPosition(new goog.positioning.AnchoredPosition(b,goog.positioning.Corner.BOTTOM_START));this.getHandler().unlisten(this.datePicker_,goog.ui.DatePicker.Events.CHANGE,this.onDateChanged_);this.datePicker_.setDate(null);this.dispatchEvent(goog.ui.PopupBase.EventType.SHOW);this.getHandler().listen(this.datePicker_,goog.ui.DatePicker.Events.CHANGE,this.onDateChanged_);this.popup_.setVisible(true);this.allowAutoFocus_&&this.getElement().focus()};
+a.showPopup_=function(b){this.showPopup(b.currentTarget)};a.hidePopup=function(){this.popup_.setVisible(false);this.allowAutoFocus_&&this.lastTarget_&&this.lastTarget_.focus()};a.onDateChanged_=function(b){this.hidePopup();this.dispatchEvent(b)};goog.ui.InputDatePicker=function(b,c,d,e){goog.ui.Component.call(this,e);this.dateTimeFormatter_=b;this.dateTimeParser_=c;this.popupDatePicker_=new goog.ui.PopupDatePicker(d,e);this.addChild(this.popupDatePicker_);this.popupDatePicker_.setAllowAutoFocus(false)};goog.inherits(goog.ui.InputDatePicker,goog.ui.Component);a=goog.ui.InputDatePicker.prototype;a.dateTimeFormatter_=null;a.dateTimeParser_=null;a.popupDatePicker_=null;a.popupParentElement_=null;a.getDatePicker=function(){return this.popupDatePicker_.getDatePicker()};
+a.getDate=function(){var b=this.getInputValueAsDate_(),c=this.popupDatePicker_.getDate();if(b&&c)b.equals(c)||this.popupDatePicker_.setDate(b);else this.popupDatePicker_.setDate(null);return b};a.setDate=function(b){this.popupDatePicker_.setDate(b)};a.setInputValue=function(b){var c=this.getElement();if(c.labelInput_)c.labelInput_.setValue(b);else c.value=b};a.getInputValue=function(){var b=this.getElement();return b.labelInput_?b.labelInput_.getValue():b.value};
+a.getInputValueAsDate_=function(){var b=goog.string.trim(this.getInputValue());if(b){var c=new goog.date.DateTime;if(this.dateTimeParser_.strictParse(b,c)>0)return c}return null};a.createDom=function(){this.setElementInternal(this.getDomHelper().createDom("input",{type:"text"}));this.popupDatePicker_.createDom()};a.setPopupParentElement=function(b){this.popupParentElement_=b};
+a.enterDocument=function(){goog.ui.InputDatePicker.superClass_.enterDocument.call(this);var b=this.getElement();(this.popupParentElement_||this.getDomHelper().getDocument().body).appendChild(this.popupDatePicker_.getElement());this.popupDatePicker_.enterDocument();this.popupDatePicker_.attach(b);this.popupDatePicker_.setDate(this.getInputValueAsDate_());b=this.getHandler();b.listen(this.popupDatePicker_,goog.ui.DatePicker.Events.CHANGE,this.onDateChanged_);b.listen(this.popupDatePicker_,goog.ui.PopupBase.EventType.SHOW,
+this.onPopup_)};a.exitDocument=function(){goog.ui.InputDatePicker.superClass_.exitDocument.call(this);var b=this.getElement();this.popupDatePicker_.detach(b);this.popupDatePicker_.exitDocument();goog.dom.removeNode(this.popupDatePicker_.getElement())};a.decorateInternal=function(b){goog.ui.InputDatePicker.superClass_.decorateInternal.call(this,b);this.popupDatePicker_.createDom()};
+a.disposeInternal=function(){goog.ui.InputDatePicker.superClass_.disposeInternal.call(this);this.popupDatePicker_.dispose();this.popupParentElement_=this.popupDatePicker_=null};a.showForElement=function(b){this.popupDatePicker_.showPopup(b)};a.hidePopup=function(){this.popupDatePicker_.hidePopup()};a.onPopup_=function(){this.setDate(this.getInputValueAsDate_())};a.onDateChanged_=function(b){this.setInputValue(b.date?this.dateTimeFormatter_.format(b.date):"")};(function(){var b="MM'/'dd'/'yyyy",c=new goog.i18n.DateTimeFormat(b);b=new goog.i18n.DateTimeParse(b);for(var d=["nomination_start","nomination_end","vote_start","vote_end"],e=0;e<d.length;e++){var f=goog.dom.$(d[e]);if(f){var g=new goog.ui.InputDatePicker(c,b);g.decorate(f)}}})();
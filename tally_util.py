@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+
+"""Ranked-choice tallying for elections.
+
+A ballot is a sequence of candidate indices in order of preference, where
+the index is the candidate's position in Election.nominees.  Ballots are
+stored packed into a single string: one length byte followed by that many
+candidate bytes per ballot.  Nothing in here touches the datastore, so the
+whole count runs over plain arrays.
+"""
+
+import array
+
+
+MAX_CANDIDATES = 255
+
+
+class Error(Exception):
+    """Base error class for this module."""
+
+
+class BallotError(Error):
+    """Raised when a ballot can't be packed or is malformed."""
+
+
+def PackBallot(ranking, num_candidates):
+    """Packs a single ranked ballot.
+
+    Args:
+      ranking: sequence of int, candidate indices in order of preference.
+      num_candidates: int, number of candidates in the election.
+    Returns:
+      str, the packed ballot.
+    """
+    if num_candidates > MAX_CANDIDATES:
+        raise BallotError('Too many candidates for a packed ballot.')
+    if len(ranking) > num_candidates:
+        raise BallotError('Ballot ranks more candidates than exist.')
+    seen = set()
+    for index in ranking:
+        if not 0 <= index < num_candidates:
+            raise BallotError('Invalid candidate index: %r' % index)
+        if index in seen:
+            raise BallotError('Candidate ranked twice: %r' % index)
+        seen.add(index)
+    return chr(len(ranking)) + array.array('B', ranking).tostring()
+
+
+def PackBallots(rankings, num_candidates):
+    """Packs a list of ranked ballots.
+
+    Args:
+      rankings: list of sequences of int.
+      num_candidates: int, number of candidates in the election.
+    Returns:
+      str
+    """
+    return ''.join([PackBallot(r, num_candidates) for r in rankings])
+
+
+def UnpackBallots(packed):
+    """Unpacks ballots packed by PackBallots.
+
+    Args:
+      packed: str
+    Returns:
+      list of tuples of int.
+    """
+    data = array.array('B', packed or '')
+    ballots = []
+    pos = 0
+    end = len(data)
+    while pos < end:
+        length = data[pos]
+        pos += 1
+        if pos + length > end:
+            raise BallotError('Truncated ballot data.')
+        ballots.append(tuple(data[pos:pos + length]))
+        pos += length
+    return ballots
+
+
+class Round(object):
+    """The state of a single counting round.
+
+    Attributes:
+      tallies: list of float, votes held by each candidate this round.
+      elected: list of int, candidates elected at the end of this round.
+      eliminated: int or None, the candidate eliminated this round.
+      exhausted: float, weight of ballots with no continuing candidate.
+    """
+
+    def __init__(self, tallies, exhausted):
+        self.tallies = tallies
+        self.exhausted = exhausted
+        self.elected = []
+        self.eliminated = None
+
+
+class TallyResult(object):
+    """The outcome of a ranked count.
+
+    Attributes:
+      winners: list of int, elected candidates in order of election.
+      rounds: list of Round.
+      first_preferences: list of int, first-choice votes per candidate.
+    """
+
+    def __init__(self, winners, rounds, first_preferences):
+        self.winners = winners
+        self.rounds = rounds
+        self.first_preferences = first_preferences
+
+
+def _GroupBallots(ballots):
+    """Collapses identical rankings so each is counted once per round.
+
+    Returns:
+      (rankings, weights): parallel lists of tuple and float.
+    """
+    counts = {}
+    for ballot in ballots:
+        ballot = tuple(ballot)
+        if ballot:
+            counts[ballot] = counts.get(ballot, 0) + 1
+    rankings = counts.keys()
+    rankings.sort()
+    return rankings, [float(counts[r]) for r in rankings]
+
+
+def _PickLoser(tallies, continuing, rounds):
+    """Chooses the continuing candidate to eliminate.
+
+    Ties on the current tally are broken by looking back through earlier
+    rounds, and finally by eliminating the highest candidate index.
+    """
+    lowest = min([tallies[c] for c in continuing])
+    tied = [c for c in continuing if tallies[c] == lowest]
+    for previous in reversed(rounds):
+        if len(tied) == 1:
+            break
+        lowest = min([previous.tallies[c] for c in tied])
+        tied = [c for c in tied if previous.tallies[c] == lowest]
+    return max(tied)
+
+
+def SingleTransferableVote(ballots, num_candidates, seats=1):
+    """Counts ranked ballots with the single transferable vote.
+
+    Uses the Droop quota and fractional (Gregory) surplus transfers.  With
+    one seat this is an instant-runoff count.
+
+    Args:
+      ballots: list of sequences of int, candidate indices by preference.
+      num_candidates: int, number of candidates.
+      seats: int, number of seats to fill.
+    Returns:
+      TallyResult
+    """
+    if seats < 1:
+        raise Error('At least one seat must be filled.')
+
+    rankings, weights = _GroupBallots(ballots)
+    positions = [0] * len(rankings)
+    first_preferences = [0] * num_candidates
+    # piles[c] holds the indices of the ballot groups currently sitting
+    # with candidate c, so each round only touches transferred ballots.
+    piles = [[] for _ in xrange(num_candidates)]
+    tallies = [0.0] * num_candidates
+    for i in xrange(len(rankings)):
+        first = rankings[i][0]
+        first_preferences[first] += int(weights[i])
+        piles[first].append(i)
+        tallies[first] += weights[i]
+
+    continuing = set(range(num_candidates))
+    winners = []
+    rounds = []
+    exhausted = 0.0
+    quota = int(sum(weights) / (seats + 1)) + 1
+
+    def Transfer(candidate, factor):
+        """Moves a candidate's pile to each ballot's next preference."""
+        transferred = 0.0
+        for i in piles[candidate]:
+            weight = weights[i] * factor
+            weights[i] = weight
+            ranking = rankings[i]
+            pos = positions[i] + 1
+            while pos < len(ranking) and ranking[pos] not in continuing:
+                pos += 1
+            positions[i] = pos
+            if pos < len(ranking):
+                piles[ranking[pos]].append(i)
+                tallies[ranking[pos]] += weight
+            else:
+                transferred += weight
+        piles[candidate] = []
+        return transferred
+
+    while continuing and len(winners) < seats:
+        current = Round(list(tallies), exhausted)
+        rounds.append(current)
+
+        if len(continuing) <= seats - len(winners):
+            # Everyone left fills the remaining seats.
+            remaining = sorted(continuing, key=lambda c: -tallies[c])
+            current.elected.extend(remaining)
+            winners.extend(remaining)
+            break
+
+        if seats == 1:
+            # Instant runoff: a majority of the ballots still in play wins.
+            threshold = sum([tallies[c] for c in continuing]) / 2.0
+            elected = [c for c in continuing if tallies[c] > threshold]
+        else:
+            elected = [c for c in continuing if tallies[c] >= quota]
+
+        if elected:
+            elected.sort(key=lambda c: -tallies[c])
+            elected = elected[:seats - len(winners)]
+            current.elected.extend(elected)
+            winners.extend(elected)
+            if len(winners) == seats:
+                break
+            continuing.difference_update(elected)
+            for candidate in elected:
+                surplus = tallies[candidate] - quota
+                tallies[candidate] = float(quota)
+                exhausted += Transfer(candidate, surplus / (surplus + quota))
+        else:
+            loser = _PickLoser(tallies, continuing, rounds[:-1])
+            current.eliminated = loser
+            continuing.discard(loser)
+            exhausted += Transfer(loser, 1.0)
+            tallies[loser] = 0.0
+
+    return TallyResult(winners, rounds, first_preferences)
+
+
+def InstantRunoff(ballots, num_candidates):
+    """Counts ranked ballots for a single seat.
+
+    Args:
+      ballots: list of sequences of int, candidate indices by preference.
+      num_candidates: int, number of candidates.
+    Returns:
+      TallyResult
+    """
+    return SingleTransferableVote(ballots, num_candidates, seats=1)
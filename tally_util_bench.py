@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+"""Benchmark for tally_util.py.
+
+Usage: python tally_util_bench.py [ballots] [candidates] [seats]
+"""
+
+import random
+import sys
+import time
+
+import tally_util
+
+
+def RandomBallots(num_ballots, num_candidates, rng):
+    """Makes ballots that rank a random prefix of a popularity-skewed order."""
+    popularity = [rng.random() for _ in xrange(num_candidates)]
+    ballots = []
+    for _ in xrange(num_ballots):
+        order = sorted(xrange(num_candidates),
+                       key=lambda c: popularity[c] * rng.random(),
+                       reverse=True)
+        ballots.append(order[:rng.randint(1, num_candidates)])
+    return ballots
+
+
+def Time(fn, *args):
+    start = time.time()
+    result = fn(*args)
+    return result, (time.time() - start) * 1000.0
+
+
+def main(argv):
+    num_ballots = int(argv[1]) if len(argv) > 1 else 5000
+    num_candidates = int(argv[2]) if len(argv) > 2 else 30
+    seats = int(argv[3]) if len(argv) > 3 else 5
+    rng = random.Random(42)
+
+    ballots = RandomBallots(num_ballots, num_candidates, rng)
+    packed, pack_ms = Time(tally_util.PackBallots, ballots, num_candidates)
+    unpacked, unpack_ms = Time(tally_util.UnpackBallots, packed)
+    irv, irv_ms = Time(tally_util.InstantRunoff, unpacked, num_candidates)
+    stv, stv_ms = Time(
+        tally_util.SingleTransferableVote, unpacked, num_candidates, seats)
+
+    print '%d ballots, %d candidates, %d bytes packed' % (
+        num_ballots, num_candidates, len(packed))
+    print 'pack:   %8.2f ms' % pack_ms
+    print 'unpack: %8.2f ms' % unpack_ms
+    print 'irv:    %8.2f ms (%d rounds)' % (irv_ms, len(irv.rounds))
+    print 'stv:    %8.2f ms (%d rounds, %d seats)' % (
+        stv_ms, len(stv.rounds), seats)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
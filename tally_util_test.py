@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+"""Unittest for tally_util.py"""
+
+import unittest
+
+import tally_util
+
+
+class PackingTest(unittest.TestCase):
+
+    def testRoundTrip(self):
+        rankings = [(0, 2, 1), (1,), (), (2, 0)]
+        packed = tally_util.PackBallots(rankings, 3)
+        self.assertEquals(len(packed), sum([len(r) + 1 for r in rankings]))
+        self.assertEquals(rankings, tally_util.UnpackBallots(packed))
+
+    def testUnpackEmpty(self):
+        self.assertEquals([], tally_util.UnpackBallots(None))
+
+    def testInvalidBallots(self):
+        self.assertRaises(tally_util.BallotError,
+                          tally_util.PackBallot, (0, 3), 3)
+        self.assertRaises(tally_util.BallotError,
+                          tally_util.PackBallot, (1, 1), 3)
+        self.assertRaises(tally_util.BallotError,
+                          tally_util.UnpackBallots, '\x03\x00')
+
+
+class InstantRunoffTest(unittest.TestCase):
+
+    def testMajorityFirstRound(self):
+        result = tally_util.InstantRunoff([(0,), (0,), (1,)], 2)
+        self.assertEquals([0], result.winners)
+        self.assertEquals(1, len(result.rounds))
+        self.assertEquals([2, 1], result.first_preferences)
+
+    def testTransfers(self):
+        # Candidate 2 is eliminated and its ballots elect candidate 1.
+        ballots = [(0,)] * 4 + [(1,)] * 3 + [(2, 1)] * 2
+        result = tally_util.InstantRunoff(ballots, 3)
+        self.assertEquals([1], result.winners)
+        self.assertEquals(2, result.rounds[0].eliminated)
+        self.assertEquals([4.0, 5.0, 0.0], result.rounds[1].tallies)
+
+    def testExhaustedBallots(self):
+        ballots = [(0,)] * 3 + [(1,)] * 2 + [(2,)] * 2
+        result = tally_util.InstantRunoff(ballots, 3)
+        self.assertEquals([0], result.winners)
+        self.assertEquals(2.0, result.rounds[-1].exhausted)
+
+    def testTieBreakUsesEarlierRounds(self):
+        # 1 and 2 tie in round two, but 2 had fewer votes in round one.
+        ballots = ([(0,)] * 5 + [(1,)] * 3 + [(2,)] * 2 +
+                   [(3, 2)])
+        result = tally_util.InstantRunoff(ballots, 4)
+        self.assertEquals(3, result.rounds[0].eliminated)
+        self.assertEquals(2, result.rounds[1].eliminated)
+
+
+class SingleTransferableVoteTest(unittest.TestCase):
+
+    def testSurplusTransfer(self):
+        # Quota is 4; candidate 0's surplus of 2 goes to candidate 1.
+        ballots = [(0, 1)] * 6 + [(2,)] * 3 + [(3,)] * 2
+        result = tally_util.SingleTransferableVote(ballots, 4, seats=2)
+        self.assertEquals([0, 2], result.winners)
+        self.assertAlmostEqual(2.0, result.rounds[1].tallies[1])
+
+    def testFillsRemainingSeats(self):
+        result = tally_util.SingleTransferableVote([(0,), (1,)], 2, seats=2)
+        self.assertEquals(set([0, 1]), set(result.winners))
+
+    def testInvalidSeats(self):
+        self.assertRaises(tally_util.Error,
+                          tally_util.SingleTransferableVote, [], 2, seats=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
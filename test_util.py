@@ -9,6 +9,7 @@ import unittest
 from google.appengine.api import apiproxy_stub_map
 from google.appengine.api import datastore_file_stub
 from google.appengine.api import mail_stub
+from google.appengine.api.memcache import memcache_stub
 from google.appengine.api import urlfetch_stub
 from google.appengine.api import user_service_stub
 
@@ -49,5 +50,9 @@ class AppEngineTestBase(unittest.TestCase):
         apiproxy_stub_map.apiproxy.RegisterStub(
             'mail', mail_stub.MailServiceStub())
 
+        # Use a fresh memcache stub.
+        apiproxy_stub_map.apiproxy.RegisterStub(
+            'memcache', memcache_stub.MemcacheServiceStub())
+
     def tearDown(self):
         self.__datastore_stub.Clear()